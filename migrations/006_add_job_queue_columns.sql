@@ -0,0 +1,29 @@
+-- =============================================================================
+-- Migration: 006_add_job_queue_columns
+-- Description: Add lease and checkpoint columns for the DB-backed job queue
+-- =============================================================================
+
+-- Worker currently holding the job (NULL when unclaimed)
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(128) DEFAULT NULL;
+
+-- Lease expiry; NULL for jobs that are not queued
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMPTZ DEFAULT NULL;
+
+-- Number of times the job has been claimed
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+
+-- Last completed workflow phase and its outputs
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS checkpoint JSONB DEFAULT NULL;
+
+-- Claim scans only queued jobs, oldest first
+CREATE INDEX IF NOT EXISTS idx_jobs_queue ON jobs(lease_expires_at, created_at)
+WHERE lease_expires_at IS NOT NULL;
+
+COMMENT ON COLUMN jobs.lease_owner IS 'Worker holding the job lease (host:pid:id)';
+COMMENT ON COLUMN jobs.lease_expires_at IS 'Queued jobs are claimable once this has passed; NULL when not queued';
+COMMENT ON COLUMN jobs.attempts IS 'Number of times a worker claimed the job';
+COMMENT ON COLUMN jobs.checkpoint IS 'Last completed skill creation phase and its outputs, used to resume after restarts';
@@ -137,8 +137,29 @@ class RecommendationEngine:
 
         recommendations = []
 
-        # 1. Recommend dependencies of most used skills that aren't mounted/frequently used
+        # 1. Recommend dependencies of most used skills that aren't mounted/frequently used.
+        # With the taxonomy's dependency graph, indirect (transitive) dependencies
+        # are recommended too.
+        graph = getattr(self.taxonomy, "dependency_graph", None)
         for skill_id in most_used:
+            if graph is not None and skill_id in graph:
+                direct = graph.dependencies(skill_id)
+                for dep_id in sorted(graph.dependencies(skill_id, transitive=True)):
+                    if dep_id in most_used:
+                        continue
+                    recommendations.append(
+                        {
+                            "skill_id": dep_id,
+                            "reason": (
+                                f"Required by frequently used skill: {skill_id}"
+                                if dep_id in direct
+                                else f"Indirectly required by frequently used skill: {skill_id}"
+                            ),
+                            "priority": "high" if dep_id in direct else "medium",
+                        }
+                    )
+                continue
+
             meta = self.taxonomy.get_skill_metadata(skill_id)
             if meta:
                 for dep_id in meta.dependencies:
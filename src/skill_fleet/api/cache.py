@@ -1,15 +1,19 @@
 """
 Caching layer for API performance optimization.
 
-This module provides a simple in-memory cache with TTL support
-that can be extended to use Redis in production environments.
+This module provides a simple in-memory cache with TTL support, the
+`CacheBackend` protocol it implements, and `TieredCache`, which layers it as
+an L1 in front of a shared backend such as `cache_redis.RedisCache` for
+multi-worker deployments.
 
 Features:
 - In-memory cache with configurable TTL
 - Cache key generation with prefix support
-- Automatic invalidation
-- Thread-safe operations
-- Redis-compatible interface for future migration
+- Automatic invalidation, by key, glob pattern or tag (reverse tag -> keys index)
+- Thread-safe operations on lock-striped shards with heap-based TTL expiry
+- Memory budget: approximate deep byte size per entry, size-weighted LRU eviction
+- Redis-backed L2 with pub/sub invalidation fan-out (see `cache_redis`)
+- Single-flight misses and stale-while-revalidate (`get_or_compute`)
 
 Usage:
     >>> from skill_fleet.api.cache import cache_manager
@@ -23,6 +27,10 @@ Usage:
     >>> # Invalidate a cache entry
     >>> cache_manager.invalidate("taxonomy:global")
     >>>
+    >>> # Tag entries and invalidate them as a group
+    >>> cache_manager.set("taxonomy:user:alice", view, tags=["taxonomy", "user:alice"])
+    >>> cache_manager.invalidate_tags("taxonomy")
+    >>>
     >>> # Clear all cache
     >>> cache_manager.clear()
 """
@@ -30,66 +38,304 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import fnmatch
 import functools
 import hashlib
+import heapq
 import json
 import logging
+import sys
+import threading
 import time
+import uuid
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, cast, runtime_checkable
 
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable, Iterable
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
+_STAT_NAMES = ("hits", "misses", "evictions", "expirations", "invalidations", "rejections")
+
+# Default memory budget of the global cache (per process).
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+# Least recently used entries considered when evicting for space; the largest goes.
+_EVICTION_SAMPLE = 4
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate the memory held by a value, including everything it references.
+
+    Walks containers, pydantic models and plain objects, counting each object
+    once (`sys.getsizeof`). Shared immutables such as small ints and interned
+    strings are counted too, so this over- rather than under-estimates.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Approximate size in bytes
+
+    """
+    seen: set[int] = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, str | bytes | bytearray | int | float | bool) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset):
+            stack.extend(obj)
+        elif isinstance(obj, BaseModel):
+            stack.append(obj.__dict__)
+        elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+            stack.append(vars(obj))
+    return total
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """
+    Interface shared by cache implementations (in-process, Redis, tiered).
+
+    Values must be JSON-serializable to be stored in shared backends.
+    """
+
+    default_ttl: int
+
+    async def get(self, key: str) -> Any | None:
+        """Get a value, or None if missing/expired."""
+
+    async def get_entry(self, key: str) -> tuple[Any, frozenset[str]] | None:
+        """Get a (value, tags) tuple, or None if missing/expired."""
+
+    async def set(
+        self, key: str, value: Any, ttl: int | None = None, tags: Iterable[str] = ()
+    ) -> None:
+        """Store a value with an optional TTL and invalidation tags."""
+
+    async def invalidate(self, key: str) -> bool:
+        """Remove a key; return whether it was cached."""
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Remove every entry carrying any of the tags; return the count."""
+
+    async def invalidate_pattern(self, pattern: str) -> int:
+        """Remove every key matching a glob pattern; return the count."""
+
+    async def clear(self) -> int:
+        """Remove every entry; return the count."""
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get backend statistics."""
+
+    async def cleanup_expired(self) -> int:
+        """Purge expired entries; return the count."""
+
+
+class InvalidationBus(Protocol):
+    """Broadcast channel carrying cache invalidations between worker processes."""
+
+    async def publish(self, message: dict[str, Any]) -> None:
+        """Send an invalidation message to every subscribed worker."""
+
+    async def start(self, handler: Callable[[dict[str, Any]], Awaitable[None]]) -> None:
+        """Start delivering messages from other workers to `handler`."""
+
+    async def stop(self) -> None:
+        """Stop delivering messages."""
+
+
 class CacheEntry:
     """A cached value with expiration."""
 
-    def __init__(self, value: Any, ttl: int):
+    __slots__ = ("value", "expires_at", "tags", "size")
+
+    def __init__(self, value: Any, ttl: int, tags: frozenset[str] = frozenset(), size: int = 0):
         """
         Initialize a cache entry.
 
         Args:
             value: The cached value
             ttl: Time to live in seconds
+            tags: Invalidation tags the entry is indexed under
+            size: Approximate bytes held by the value (0 when not tracked)
 
         """
         self.value = value
-        self.expires_at = time.time() + ttl
+        self.expires_at = time.monotonic() + ttl
+        self.tags = tags
+        self.size = size
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: float | None = None) -> bool:
         """Check if the cache entry has expired."""
-        return time.time() > self.expires_at
+        return (time.monotonic() if now is None else now) > self.expires_at
+
+
+class _CacheShard:
+    """
+    One independently locked LRU segment of `InMemoryCache`.
+
+    Expiry is tracked in a min-heap of (expires_at, seq, key, entry), so
+    purging expired entries costs O(expired * log n) instead of a full scan.
+    Heap items for keys that were overwritten or removed are skipped lazily
+    (the entry identity no longer matches) and compacted when they pile up.
+    A reverse tag -> keys index makes tag invalidation O(keys with the tag).
+    `bytes` tracks the approximate size of resident values against
+    `max_bytes` (None for no byte budget).
+    """
+
+    __slots__ = (
+        "bytes",
+        "capacity",
+        "entries",
+        "expiry",
+        "lock",
+        "max_bytes",
+        "seq",
+        "stats",
+        "tags",
+    )
+
+    def __init__(self, capacity: int, max_bytes: int | None = None):
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.expiry: list[tuple[float, int, str, CacheEntry]] = []
+        self.lock = threading.Lock()
+        self.seq = 0
+        self.stats = dict.fromkeys(_STAT_NAMES, 0)
+        self.tags: dict[str, set[str]] = {}
+
+    def store(self, key: str, entry: CacheEntry) -> None:
+        """Insert or replace an entry as most recently used; callers must hold the lock."""
+        self.remove(key)
+        self.entries[key] = entry
+        self.bytes += entry.size
+        for tag in entry.tags:
+            self.tags.setdefault(tag, set()).add(key)
+        self.push_expiry(key, entry)
+
+    def remove(self, key: str) -> CacheEntry | None:
+        """Drop an entry and its tag index links; callers must hold the lock."""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+            for tag in entry.tags:
+                keys = self.tags.get(tag)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self.tags[tag]
+        return entry
+
+    def make_room(self, size: int) -> None:
+        """
+        Evict until one more entry of `size` bytes fits; callers must hold the lock.
+
+        Count pressure evicts the least recently used entry. Byte pressure
+        evicts the largest of the few least recently used entries, so one big
+        cold value goes before several small ones.
+        """
+        while self.entries:
+            over_bytes = self.max_bytes is not None and self.bytes + size > self.max_bytes
+            if not over_bytes and len(self.entries) < self.capacity:
+                return
+            victim = next(iter(self.entries))
+            if over_bytes:
+                sample = []
+                for candidate in self.entries:
+                    sample.append(candidate)
+                    if len(sample) == _EVICTION_SAMPLE:
+                        break
+                victim = max(sample, key=lambda k: self.entries[k].size)
+            self.remove(victim)
+            self.stats["evictions"] += 1
+            logger.debug(f"LRU evicted key: {victim}")
+
+    def push_expiry(self, key: str, entry: CacheEntry) -> None:
+        """Schedule an entry's expiry; callers must hold the lock."""
+        self.seq += 1
+        heapq.heappush(self.expiry, (entry.expires_at, self.seq, key, entry))
+        if len(self.expiry) > 2 * len(self.entries) + 64:
+            self.expiry = [item for item in self.expiry if self.entries.get(item[2]) is item[3]]
+            heapq.heapify(self.expiry)
+
+    def purge_expired(self, now: float) -> int:
+        """Drop entries whose TTL has passed; callers must hold the lock."""
+        removed = 0
+        expiry = self.expiry
+        while expiry and expiry[0][0] < now:
+            _, _, key, entry = heapq.heappop(expiry)
+            if self.entries.get(key) is entry:
+                self.remove(key)
+                removed += 1
+        self.stats["expirations"] += removed
+        return removed
 
 
 class InMemoryCache:
-    """Thread-safe in-memory cache with TTL support and LRU eviction."""
+    """
+    In-memory cache with TTL support and LRU eviction, sharded for concurrency.
 
-    def __init__(self, default_ttl: int = 300, max_size: int = 1000):
+    Keys are spread over `num_shards` segments by hash. Each segment has its
+    own lock, LRU order and expiry heap, so concurrent reads of different
+    keys (from coroutines or worker threads) do not contend on a single lock.
+    LRU eviction is per segment, i.e. approximate across the whole cache.
+
+    With `max_bytes`, each value's approximate deep size is recorded on `set`
+    and every segment holds at most its share of the budget; values larger
+    than a segment's share are not cached.
+    """
+
+    def __init__(
+        self,
+        default_ttl: int = 300,
+        max_size: int = 1000,
+        num_shards: int = 16,
+        max_bytes: int | None = None,
+    ):
         """
         Initialize the in-memory cache.
 
         Args:
             default_ttl: Default time-to-live in seconds (default: 5 minutes)
             max_size: Maximum number of entries in cache (default: 1000)
+            num_shards: Number of independently locked segments (capped at
+                `max_size` so every segment holds at least one entry)
+            max_bytes: Memory budget for cached values in bytes (None: bounded
+                by entry count only)
 
         """
         self.default_ttl = default_ttl
         self.max_size = max_size
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._lock = asyncio.Lock()
-        self._stats = {
-            "hits": 0,
-            "misses": 0,
-            "evictions": 0,
-            "invalidations": 0,
-        }
+        self.max_bytes = max_bytes
+        count = max(1, min(num_shards, max_size))
+        base, extra = divmod(max_size, count)
+        shard_bytes = None if max_bytes is None else max(1, max_bytes // count)
+        self._shards = [
+            _CacheShard(base + (1 if i < extra else 0), shard_bytes) for i in range(count)
+        ]
+
+    def _shard(self, key: str) -> _CacheShard:
+        """Select the segment that owns a key."""
+        return self._shards[hash(key) % len(self._shards)]
 
     async def get(self, key: str) -> Any | None:
         """
@@ -102,23 +348,45 @@ class InMemoryCache:
             Cached value or None if not found/expired
 
         """
-        async with self._lock:
-            entry = self._cache.get(key)
+        found = await self.get_entry(key)
+        return found[0] if found is not None else None
+
+    async def get_entry(self, key: str) -> tuple[Any, frozenset[str]] | None:
+        """
+        Get a value together with its tags.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, tags) tuple, or None if not found/expired
+
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
             if entry is None:
-                self._stats["misses"] += 1
+                shard.stats["misses"] += 1
                 return None
 
             if entry.is_expired():
-                del self._cache[key]
-                self._stats["evictions"] += 1
+                shard.remove(key)
+                shard.stats["expirations"] += 1
+                shard.stats["misses"] += 1
                 return None
 
             # Move to end to mark as recently used (LRU)
-            self._cache.move_to_end(key)
-            self._stats["hits"] += 1
-            return entry.value
-
-    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+            shard.entries.move_to_end(key)
+            shard.stats["hits"] += 1
+            return entry.value, entry.tags
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+        tags: Iterable[str] = (),
+    ) -> None:
         """
         Set a value in the cache with LRU eviction.
 
@@ -126,22 +394,27 @@ class InMemoryCache:
             key: Cache key
             value: Value to cache
             ttl: Time-to-live in seconds (uses default if not specified)
+            tags: Tags to index the entry under for `invalidate_tags()`
 
         """
         if ttl is None:
             ttl = self.default_ttl
 
-        async with self._lock:
-            # Evict oldest entries if at capacity and key is new
-            if key not in self._cache and len(self._cache) >= self.max_size:
-                # Remove oldest item (FIFO from OrderedDict)
-                oldest_key, _ = self._cache.popitem(last=False)
-                self._stats["evictions"] += 1
-                logger.debug(f"LRU evicted key: {oldest_key}")
-
-            self._cache[key] = CacheEntry(value, ttl)
-            # Move to end to mark as recently used
-            self._cache.move_to_end(key)
+        size = estimate_size(value) if self.max_bytes is not None else 0
+        entry = CacheEntry(value, ttl, frozenset(tags), size)
+        shard = self._shard(key)
+        with shard.lock:
+            # The new value supersedes the old one even if it can't be cached.
+            shard.remove(key)
+            if shard.max_bytes is not None and size > shard.max_bytes:
+                shard.stats["rejections"] += 1
+                logger.debug(f"Not caching {key}: {size} bytes exceeds segment budget")
+                return
+
+            # Expired entries go before live ones are evicted.
+            shard.purge_expired(time.monotonic())
+            shard.make_room(size)
+            shard.store(key, entry)
 
     async def invalidate(self, key: str) -> bool:
         """
@@ -154,13 +427,72 @@ class InMemoryCache:
             True if key was in cache, False otherwise
 
         """
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                self._stats["invalidations"] += 1
+        _pending_writes.void(lambda pending: pending.key == key)
+        shard = self._shard(key)
+        with shard.lock:
+            if shard.remove(key) is not None:
+                shard.stats["invalidations"] += 1
                 return True
             return False
 
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        Invalidate every entry carrying any of the given tags.
+
+        Uses the reverse tag index, so the cost is proportional to the number
+        of tagged entries rather than the size of the cache.
+
+        Args:
+            *tags: Tags to invalidate (e.g. "taxonomy", "user:alice")
+
+        Returns:
+            Number of entries invalidated
+
+        """
+        invalidated = set(tags)
+        _pending_writes.void(lambda pending: not invalidated.isdisjoint(pending.tags))
+        total = 0
+        for shard in self._shards:
+            with shard.lock:
+                keys = set().union(*(shard.tags.get(tag, ()) for tag in tags))
+                for key in keys:
+                    shard.remove(key)
+                shard.stats["invalidations"] += len(keys)
+            total += len(keys)
+        return total
+
+    async def invalidate_pattern(self, pattern: str) -> int:
+        """
+        Invalidate all entries whose key matches a glob pattern.
+
+        Args:
+            pattern: Glob-style pattern (e.g., "skill_fleet:taxonomy:*")
+
+        Returns:
+            Number of entries invalidated
+
+        """
+        head, wildcard, tail = pattern.partition("*")
+        if wildcard and not tail and not any(c in head for c in "?["):
+            # Plain prefix pattern: skip fnmatch for the common "prefix:*" case.
+            def matches(key: str) -> bool:
+                return key.startswith(head)
+        else:
+
+            def matches(key: str) -> bool:
+                return fnmatch.fnmatchcase(key, pattern)
+
+        _pending_writes.void(lambda pending: matches(pending.key))
+        total = 0
+        for shard in self._shards:
+            with shard.lock:
+                keys = [key for key in shard.entries if matches(key)]
+                for key in keys:
+                    shard.remove(key)
+                shard.stats["invalidations"] += len(keys)
+            total += len(keys)
+        return total
+
     async def clear(self) -> int:
         """
         Clear all cache entries.
@@ -169,15 +501,51 @@ class InMemoryCache:
             Number of entries cleared
 
         """
-        async with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            return count
+        _pending_writes.void(lambda pending: True)
+        count = 0
+        for shard in self._shards:
+            with shard.lock:
+                count += len(shard.entries)
+                shard.entries.clear()
+                shard.expiry.clear()
+                shard.tags.clear()
+                shard.bytes = 0
+        return count
+
+    def __len__(self) -> int:
+        """Count entries (including expired ones not yet purged)."""
+        return sum(len(shard.entries) for shard in self._shards)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Totals for hits, misses, evictions, expirations, invalidations and
+            rejections (values over the byte budget), plus `size`, `max_size`,
+            `bytes` (approximate bytes resident), `max_bytes` and a `shards`
+            list with per-segment counters
 
-    async def get_stats(self) -> dict[str, int]:
-        """Get cache statistics."""
-        async with self._lock:
-            return self._stats.copy()
+        """
+        shards: list[dict[str, int]] = []
+        for shard in self._shards:
+            with shard.lock:
+                shards.append(
+                    {
+                        **shard.stats,
+                        "size": len(shard.entries),
+                        "capacity": shard.capacity,
+                        "bytes": shard.bytes,
+                        "tags": len(shard.tags),
+                    }
+                )
+        totals: dict[str, Any] = {name: sum(s[name] for s in shards) for name in _STAT_NAMES}
+        totals["size"] = sum(s["size"] for s in shards)
+        totals["max_size"] = self.max_size
+        totals["bytes"] = sum(s["bytes"] for s in shards)
+        totals["max_bytes"] = self.max_bytes
+        totals["shards"] = shards
+        return totals
 
     async def cleanup_expired(self) -> int:
         """
@@ -187,16 +555,167 @@ class InMemoryCache:
             Number of entries removed
 
         """
-        async with self._lock:
-            expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
-            for key in expired_keys:
-                del self._cache[key]
+        now = time.monotonic()
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += shard.purge_expired(now)
+        return removed
 
-            return len(expired_keys)
+
+class TieredCache:
+    """
+    Two-tier cache: a small in-process L1 in front of a shared L2 backend.
+
+    Reads hit L1 first and fall back to L2, copying hits into L1 for
+    `l1_ttl` seconds. Writes and invalidations go to both tiers, and every
+    invalidation (including overwrites) is published on the optional bus so
+    other workers drop their L1 copies. Values L2 cannot serialize stay
+    L1-only.
+    """
+
+    def __init__(
+        self,
+        l2: CacheBackend,
+        *,
+        l1: InMemoryCache | None = None,
+        l1_ttl: int = 30,
+        bus: InvalidationBus | None = None,
+    ):
+        """
+        Initialize the tiered cache.
+
+        Args:
+            l2: Shared backend (e.g. `cache_redis.RedisCache`)
+            l1: In-process cache (default: a 1000-entry InMemoryCache with the
+                default memory budget)
+            l1_ttl: Maximum seconds a value stays in L1 without revalidation
+            bus: Optional invalidation fan-out between workers
+
+        """
+        self.l2 = l2
+        self.l1 = (
+            l1 if l1 is not None else InMemoryCache(default_ttl=l1_ttl, max_bytes=DEFAULT_MAX_BYTES)
+        )
+        self.l1_ttl = l1_ttl
+        self.default_ttl = l2.default_ttl
+        self.bus = bus
+        self.node_id = uuid.uuid4().hex
+        self._stats = {"l1_hits": 0, "l2_hits": 0, "misses": 0, "remote_invalidations": 0}
+
+    async def start(self) -> None:
+        """Start listening for invalidations from other workers."""
+        if self.bus is not None:
+            await self.bus.start(self._on_invalidation)
+
+    async def stop(self) -> None:
+        """Stop listening for invalidations."""
+        if self.bus is not None:
+            await self.bus.stop()
+
+    async def _publish(self, op: str, *args: str) -> None:
+        """Fan an invalidation out to other workers (best effort)."""
+        if self.bus is None:
+            return
+        try:
+            await self.bus.publish({"origin": self.node_id, "op": op, "args": list(args)})
+        except Exception as e:
+            logger.warning(f"Cache invalidation broadcast failed: {e}")
+
+    async def _on_invalidation(self, message: dict[str, Any]) -> None:
+        """Apply another worker's invalidation to L1."""
+        if message.get("origin") == self.node_id:
+            return
+        op, args = message.get("op"), [str(arg) for arg in message.get("args", [])]
+        self._stats["remote_invalidations"] += 1
+        if op == "key":
+            for key in args:
+                await self.l1.invalidate(key)
+        elif op == "tags":
+            await self.l1.invalidate_tags(*args)
+        elif op == "pattern":
+            for pattern in args:
+                await self.l1.invalidate_pattern(pattern)
+        elif op == "clear":
+            await self.l1.clear()
+
+    async def get(self, key: str) -> Any | None:
+        """Get a value from L1, falling back to L2."""
+        found = await self.get_entry(key)
+        return found[0] if found is not None else None
+
+    async def get_entry(self, key: str) -> tuple[Any, frozenset[str]] | None:
+        """Get a value and its tags from L1, falling back to L2."""
+        found = await self.l1.get_entry(key)
+        if found is not None:
+            self._stats["l1_hits"] += 1
+            return found
+        found = await self.l2.get_entry(key)
+        if found is None:
+            self._stats["misses"] += 1
+            return None
+        self._stats["l2_hits"] += 1
+        await self.l1.set(key, found[0], ttl=self.l1_ttl, tags=found[1])
+        return found
+
+    async def set(
+        self, key: str, value: Any, ttl: int | None = None, tags: Iterable[str] = ()
+    ) -> None:
+        """Write a value to both tiers and drop stale L1 copies elsewhere."""
+        tags = list(tags)
+        ttl = self.default_ttl if ttl is None else ttl
+        try:
+            await self.l2.set(key, value, ttl=ttl, tags=tags)
+        except TypeError as e:
+            logger.debug(f"Keeping {key} in L1 only (not serializable for L2): {e}")
+        await self.l1.set(key, value, ttl=min(ttl, self.l1_ttl), tags=tags)
+        await self._publish("key", key)
+
+    async def invalidate(self, key: str) -> bool:
+        """Invalidate a key in both tiers and on other workers."""
+        in_l1 = await self.l1.invalidate(key)
+        in_l2 = await self.l2.invalidate(key)
+        await self._publish("key", key)
+        return in_l1 or in_l2
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Invalidate tagged entries in both tiers and on other workers."""
+        local = await self.l1.invalidate_tags(*tags)
+        shared = await self.l2.invalidate_tags(*tags)
+        await self._publish("tags", *tags)
+        return max(local, shared)
+
+    async def invalidate_pattern(self, pattern: str) -> int:
+        """Invalidate matching keys in both tiers and on other workers."""
+        local = await self.l1.invalidate_pattern(pattern)
+        shared = await self.l2.invalidate_pattern(pattern)
+        await self._publish("pattern", pattern)
+        return max(local, shared)
+
+    async def clear(self) -> int:
+        """Clear both tiers and other workers' L1."""
+        local = await self.l1.clear()
+        shared = await self.l2.clear()
+        await self._publish("clear")
+        return max(local, shared)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss counters per tier plus each tier's own statistics."""
+        hits = self._stats["l1_hits"] + self._stats["l2_hits"]
+        return {
+            **self._stats,
+            "hits": hits,
+            "l1": await self.l1.get_stats(),
+            "l2": await self.l2.get_stats(),
+        }
+
+    async def cleanup_expired(self) -> int:
+        """Purge expired entries from both tiers."""
+        return await self.l1.cleanup_expired() + await self.l2.cleanup_expired()
 
 
 # Global cache instance
-_cache = InMemoryCache(default_ttl=300)  # 5 minute default TTL
+_cache: CacheBackend = InMemoryCache(default_ttl=300, max_bytes=DEFAULT_MAX_BYTES)  # 5 minute TTL
 
 
 def cache_key(*parts: str, prefix: str = "skill_fleet") -> str:
@@ -244,23 +763,259 @@ def hash_key(value: str | dict | BaseModel) -> str:
     return hashlib.md5(value.encode(), usedforsecurity=False).hexdigest()[:16]
 
 
-def cached(ttl: int = 300, key_prefix: str = ""):
+class SingleFlight:
+    """
+    Coalesce concurrent computations of the same key.
+
+    The first caller for a key starts the computation as a task; callers
+    arriving while it runs await the same task instead of starting their own.
+    Waiters are shielded, so a cancelled caller does not cancel the shared
+    computation for the others.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no computations in flight."""
+        self._tasks: dict[str, asyncio.Task[Any]] = {}
+        self.stats = {"leaders": 0, "coalesced": 0}
+
+    def __contains__(self, key: object) -> bool:
+        """Whether a computation for the key is in flight."""
+        return key in self._tasks
+
+    def __len__(self) -> int:
+        """Count computations in flight."""
+        return len(self._tasks)
+
+    def start(self, key: str, compute: Callable[[], Awaitable[T]]) -> asyncio.Task[T]:
+        """
+        Get the in-flight task for a key, starting one if needed.
+
+        Args:
+            key: Computation key (usually the cache key)
+            compute: Zero-argument coroutine function producing the value
+
+        Returns:
+            Task resolving to the computed value
+
+        """
+        task = self._tasks.get(key)
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            self.stats["coalesced"] += 1
+            return task
+
+        self.stats["leaders"] += 1
+        task = asyncio.ensure_future(compute())
+        self._tasks[key] = task
+
+        def _forget(done: asyncio.Task[Any]) -> None:
+            if self._tasks.get(key) is done:
+                del self._tasks[key]
+            if not done.cancelled():
+                done.exception()  # Mark retrieved; waiters re-raise it themselves.
+
+        task.add_done_callback(_forget)
+        return task
+
+    async def do(self, key: str, compute: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `compute` once per key across concurrent callers.
+
+        Args:
+            key: Computation key
+            compute: Zero-argument coroutine function producing the value
+
+        Returns:
+            The computed value (exceptions propagate to every waiter)
+
+        """
+        return await asyncio.shield(self.start(key, compute))
+
+    def forget(self, key: str) -> None:
+        """Detach the in-flight computation for a key; later callers start a new one."""
+        self._tasks.pop(key, None)
+
+
+_flights = SingleFlight()
+
+
+class _PendingWrite:
+    """A `get_or_compute` result being computed, not yet written to the cache."""
+
+    __slots__ = ("key", "tags", "stale")
+
+    def __init__(self, key: str, tags: frozenset[str]):
+        self.key = key
+        self.tags = tags
+        self.stale = False
+
+
+class _PendingWrites:
+    """
+    Registry of in-flight `get_or_compute` writes.
+
+    A value computed before an invalidation must not be stored after it, or
+    the invalidation is undone for a full TTL. Invalidations void matching
+    pending writes (and detach their single-flight task, so new callers
+    recompute instead of joining the stale computation).
+    """
+
+    def __init__(self) -> None:
+        """Initialize with nothing pending."""
+        self._pending: set[_PendingWrite] = set()
+
+    def begin(self, key: str, tags: Iterable[str]) -> _PendingWrite:
+        """Register a computation for a key about to start."""
+        pending = _PendingWrite(key, frozenset(tags))
+        self._pending.add(pending)
+        return pending
+
+    def end(self, pending: _PendingWrite) -> None:
+        """Unregister a finished computation."""
+        self._pending.discard(pending)
+
+    def void(self, matches: Callable[[_PendingWrite], bool]) -> None:
+        """Mark pending writes selected by `matches` stale."""
+        for pending in list(self._pending):
+            if not pending.stale and matches(pending):
+                pending.stale = True
+                _flights.forget(pending.key)
+
+
+_pending_writes = _PendingWrites()
+
+# Marks stale-while-revalidate envelopes stored by `get_or_compute`.
+_SWR_KEY = "__swr_fresh_until__"
+
+_swr_stats = {"stale_served": 0, "refreshes": 0, "refresh_errors": 0}
+
+
+async def get_or_compute[V](
+    key: str,
+    compute: Callable[[], Awaitable[V]],
+    *,
+    ttl: int | None = None,
+    stale_ttl: int = 0,
+    tags: Iterable[str] = (),
+) -> V:
+    """
+    Get a cached value, computing it at most once per key on a miss.
+
+    Concurrent misses for the same key share one computation (single-flight).
+    With `stale_ttl`, values stay servable for that many seconds past `ttl`:
+    a stale hit returns immediately and refreshes the entry in the background,
+    so TTL boundaries don't stall requests. Explicit invalidation removes the
+    entry outright; stale values are only served after natural expiry. A value
+    whose computation overlapped an invalidation of its key or tags is
+    returned to its callers but not cached.
+
+    Args:
+        key: Cache key
+        compute: Zero-argument coroutine function producing the value
+        ttl: Seconds a value is fresh (backend default if None)
+        stale_ttl: Extra seconds a stale value may be served while refreshing
+        tags: Invalidation tags for the entry
+
+    Returns:
+        Cached or freshly computed value (None results are not cached)
+
+    """
+    cache = _cache
+    fresh_ttl = cache.default_ttl if ttl is None else ttl
+    tags = list(tags)
+
+    async def refresh() -> V:
+        pending = _pending_writes.begin(key, tags)
+        try:
+            value = await compute()
+            if pending.stale:
+                logger.debug(f"Not caching {key}: invalidated while computing")
+            elif value is not None:
+                stored: Any = value
+                if stale_ttl > 0:
+                    stored = {_SWR_KEY: time.time() + fresh_ttl, "value": value}
+                await cache.set(key, stored, ttl=fresh_ttl + stale_ttl, tags=tags)
+                if pending.stale:
+                    # Invalidated while storing: drop what was just written.
+                    await cache.invalidate(key)
+        finally:
+            _pending_writes.end(pending)
+        return value
+
+    cached_value = await cache.get(key)
+    if cached_value is None:
+        logger.debug(f"Cache miss: {key}")
+        return await _flights.do(key, refresh)
+
+    if not (isinstance(cached_value, dict) and _SWR_KEY in cached_value):
+        logger.debug(f"Cache hit: {key}")
+        return cached_value
+
+    if time.time() >= cached_value[_SWR_KEY]:
+        _swr_stats["stale_served"] += 1
+        if key not in _flights:
+            logger.debug(f"Serving stale {key} while revalidating")
+            _swr_stats["refreshes"] += 1
+            _flights.start(key, refresh).add_done_callback(_log_refresh_failure)
+    return cached_value["value"]
+
+
+def _log_refresh_failure(task: asyncio.Task[Any]) -> None:
+    """Report background revalidation errors (the stale value stays cached)."""
+    if not task.cancelled() and task.exception() is not None:
+        _swr_stats["refresh_errors"] += 1
+        logger.warning(f"Background cache refresh failed: {task.exception()}")
+
+
+def get_flight_stats() -> dict[str, int]:
+    """
+    Get single-flight and stale-while-revalidate counters.
+
+    Returns:
+        `leaders` (computations started), `coalesced` (callers that shared one),
+        `in_flight`, and `stale_served` / `refreshes` / `refresh_errors`
+
+    """
+    return {**_flights.stats, "in_flight": len(_flights), **_swr_stats}
+
+
+type CacheTags = Iterable[str] | Callable[..., Iterable[str]]
+
+
+def _resolve_tags(tags: CacheTags, args: tuple[Any, ...], kwargs: dict[str, Any]) -> list[str]:
+    """Evaluate decorator tags, calling them with the wrapped function's arguments if callable."""
+    if callable(tags):
+        # callable() also admits iterables with __call__, whose result type is unknown
+        return list(cast("Callable[..., Iterable[str]]", tags)(*args, **kwargs))
+    return list(tags)
+
+
+def cached(ttl: int = 300, key_prefix: str = "", tags: CacheTags = (), stale_ttl: int = 0):
     """
     Cache async function results.
 
+    Concurrent calls that miss on the same arguments share one call of the
+    function (single-flight).
+
     Args:
         ttl: Time-to-live in seconds
         key_prefix: Prefix for cache keys
+        tags: Invalidation tags for cached results, or a callable receiving the
+            function's arguments and returning them
+        stale_ttl: Seconds past `ttl` an expired result is still returned while
+            it is recomputed in the background (0 disables)
 
     Examples:
-        >>> @cached(ttl=600, key_prefix="taxonomy")
+        >>> @cached(ttl=600, key_prefix="taxonomy", tags=["taxonomy"])
         ... async def get_taxonomy_structure():
         ...     # Expensive operation
         ...     return taxonomy_data
+        >>>
+        >>> @cached(tags=lambda user_id: ["taxonomy", f"user:{user_id}"])
+        ... async def get_user_view(user_id: str): ...
 
     """
 
-    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> T:
             # Generate cache key from function name and arguments
@@ -269,20 +1024,15 @@ def cached(ttl: int = 300, key_prefix: str = ""):
             cache_key_suffix = hash_key(args_str)
             key = cache_key(func_name, cache_key_suffix, prefix=key_prefix)
 
-            # Try to get from cache
-            result = await _cache.get(key)
-            if result is not None:
-                logger.debug(f"Cache hit: {key}")
-                return result
+            return await get_or_compute(
+                key,
+                lambda: func(*args, **kwargs),
+                ttl=ttl,
+                stale_ttl=stale_ttl,
+                tags=_resolve_tags(tags, args, kwargs),
+            )
 
-            # Call function and cache result
-            logger.debug(f"Cache miss: {key}")
-            result = await func(*args, **kwargs)  # type: ignore[await]
-            await _cache.set(key, result, ttl=ttl)
-
-            return result
-
-        return wrapper  # type: ignore[return]
+        return wrapper
 
     return decorator
 
@@ -291,14 +1041,20 @@ def cache_result(
     key_func: Callable[..., str] | None = None,
     ttl: int = 300,
     prefix: str = "",
+    tags: CacheTags = (),
+    stale_ttl: int = 0,
 ):
     """
     Cache async function results with custom key generation.
 
+    Misses are single-flight, as in `cached`.
+
     Args:
         key_func: Optional function to generate cache key
         ttl: Time-to-live in seconds
         prefix: Prefix for cache keys
+        tags: Invalidation tags for cached results (see `cached`)
+        stale_ttl: Stale-while-revalidate window in seconds (see `cached`)
 
     Examples:
         >>> def get_key(user_id: str, skill_type: str) -> str:
@@ -310,7 +1066,7 @@ def cache_result(
 
     """
 
-    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> T:
             # Generate cache key
@@ -325,22 +1081,35 @@ def cache_result(
                     cache_key(func_name, key_suffix) if prefix else cache_key(func_name, key_suffix)
                 )
 
-            # Try to get from cache
-            result = await _cache.get(key)
-            if result is not None:
-                logger.debug(f"Cache hit: {key}")
-                return result
+            return await get_or_compute(
+                key,
+                lambda: func(*args, **kwargs),
+                ttl=ttl,
+                stale_ttl=stale_ttl,
+                tags=_resolve_tags(tags, args, kwargs),
+            )
 
-            # Call function and cache result
-            logger.debug(f"Cache miss: {key}")
-            result = await func(*args, **kwargs)  # type: ignore[await]
-            await _cache.set(key, result, ttl=ttl)
+        return wrapper
 
-            return result
+    return decorator
 
-        return wrapper  # type: ignore[return]
 
-    return decorator
+async def invalidate_tags(*tags: str) -> int:
+    """
+    Invalidate all cache entries carrying any of the given tags.
+
+    Args:
+        *tags: Tags to invalidate
+
+    Returns:
+        Number of entries invalidated
+
+    Examples:
+        >>> await invalidate_tags("taxonomy")  # Every taxonomy view
+        >>> await invalidate_tags("user:alice", "skill:python/async")
+
+    """
+    return await _cache.invalidate_tags(*tags)
 
 
 async def invalidate_pattern(pattern: str) -> int:
@@ -359,36 +1128,36 @@ async def invalidate_pattern(pattern: str) -> int:
         >>> await invalidate_pattern("*")  # Clear all cache
 
     """
-    import fnmatch
-
-    async with _cache._lock:
-        keys_to_delete = [key for key in _cache._cache if fnmatch.fnmatch(key, pattern)]
-        for key in keys_to_delete:
-            del _cache._cache[key]
-
-        _cache._stats["invalidations"] += len(keys_to_delete)
-        return len(keys_to_delete)
+    return await _cache.invalidate_pattern(pattern)
 
 
 # Public API
-def get_cache() -> InMemoryCache:
+def get_cache() -> CacheBackend:
     """Get the global cache instance."""
     return _cache
 
 
-def set_cache(cache: InMemoryCache) -> None:
-    """Set a custom cache instance (useful for testing or Redis replacement)."""
+def set_cache(cache: CacheBackend) -> None:
+    """Set a custom cache instance (useful for testing or a shared backend)."""
     global _cache
     _cache = cache
 
 
 __all__ = [
+    "CacheBackend",
     "InMemoryCache",
+    "InvalidationBus",
+    "TieredCache",
     "cache_key",
+    "estimate_size",
     "hash_key",
     "cached",
     "cache_result",
+    "get_or_compute",
+    "get_flight_stats",
+    "SingleFlight",
     "invalidate_pattern",
+    "invalidate_tags",
     "get_cache",
     "set_cache",
 ]
@@ -0,0 +1,784 @@
+"""
+Redis-backed shared cache for multi-worker deployments.
+
+Components:
+- `RespClient`: minimal asyncio client for the Redis serialization protocol
+  (RESP2) with a small connection pool, pipelining and pub/sub, so no extra
+  dependency is needed
+- `RedisCache`: `CacheBackend` storing JSON values under a namespace, with tag
+  sets for `invalidate_tags()` and SCAN-based pattern invalidation
+- `RedisInvalidationBus`: pub/sub fan-out of invalidations, used by
+  `cache.TieredCache` to drop other workers' L1 copies
+- `LocalRedisServer`: in-process stand-in speaking the same protocol (the
+  subset of commands used here) for tests and single-machine development
+
+Usage:
+    >>> client = RespClient.from_url("redis://localhost:6379/0")
+    >>> cache = TieredCache(RedisCache(client), bus=RedisInvalidationBus(client))
+    >>> await cache.start()
+    >>> set_cache(cache)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fnmatch
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import unquote, urlparse
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+class RespError(Exception):
+    """Error reply returned by the server."""
+
+
+# Failures treated as "backend unavailable": refused/reset connections, a peer
+# closing mid-reply (IncompleteReadError is an EOFError, not an OSError),
+# timeouts and error replies.
+BACKEND_ERRORS: tuple[type[Exception], ...] = (
+    OSError,
+    asyncio.IncompleteReadError,
+    TimeoutError,
+    RespError,
+)
+
+
+# ---------------------------------------------------------------------------
+# Protocol encoding
+# ---------------------------------------------------------------------------
+
+
+def _to_bytes(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, int | float):
+        return str(value).encode("ascii")
+    raise TypeError(f"Unsupported RESP argument type: {type(value).__name__}")
+
+
+def encode_command(*args: Any) -> bytes:
+    """
+    Encode a command as a RESP array of bulk strings.
+
+    Args:
+        *args: Command name and arguments (str, bytes, int or float)
+
+    Returns:
+        Wire bytes
+
+    """
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = _to_bytes(arg)
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """
+    Read one RESP value.
+
+    Args:
+        reader: Stream to read from
+
+    Returns:
+        str (simple string), int, bytes or None (bulk), list (array), or a
+        RespError instance for error replies
+
+    """
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("Connection closed by peer")
+    prefix, payload = line[:1], line[1:-2]
+    if prefix == b"+":
+        return payload.decode("utf-8")
+    if prefix == b"-":
+        return RespError(payload.decode("utf-8"))
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if prefix == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise ConnectionError(f"Invalid RESP prefix: {prefix!r}")
+
+
+def _encode_reply(value: Any) -> bytes:
+    """Encode a server reply."""
+    if isinstance(value, RespError):
+        return b"-%s\r\n" % str(value).encode("utf-8")
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, bool | int):
+        return b":%d\r\n" % int(value)
+    if isinstance(value, str):
+        return b"+%s\r\n" % value.encode("utf-8")
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, list):
+        return b"*%d\r\n" % len(value) + b"".join(_encode_reply(item) for item in value)
+    raise TypeError(f"Unsupported reply type: {type(value).__name__}")
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+class _Connection:
+    """One client connection; commands on it are strictly request/response."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def pipeline(self, commands: list[tuple[Any, ...]]) -> list[Any]:
+        self.writer.write(b"".join(encode_command(*command) for command in commands))
+        await self.writer.drain()
+        return [await read_reply(self.reader) for _ in commands]
+
+    async def close(self) -> None:
+        self.writer.close()
+        with contextlib.suppress(Exception):
+            await self.writer.wait_closed()
+
+
+class Subscription:
+    """Pub/sub connection; async-iterate it for (channel, payload) messages."""
+
+    def __init__(self, connection: _Connection):
+        self._connection = connection
+
+    def __aiter__(self) -> AsyncIterator[tuple[str, bytes]]:
+        """Iterate published messages until the connection drops."""
+        return self._messages()
+
+    async def _messages(self) -> AsyncIterator[tuple[str, bytes]]:
+        while True:
+            message = await read_reply(self._connection.reader)
+            if isinstance(message, list) and len(message) == 3 and message[0] == b"message":
+                yield message[1].decode("utf-8"), message[2]
+
+    async def close(self) -> None:
+        """Close the connection (ends the subscription)."""
+        await self._connection.close()
+
+
+class RespClient:
+    """Pooled asyncio client for Redis-protocol servers."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 6379,
+        *,
+        db: int = 0,
+        password: str | None = None,
+        max_connections: int = 8,
+        timeout: float | None = 5.0,
+    ):
+        """
+        Initialize the client (connections are opened lazily).
+
+        Args:
+            host: Server host
+            port: Server port
+            db: Database index selected on each connection
+            password: Optional AUTH password
+            max_connections: Pool size (concurrent in-flight pipelines)
+            timeout: Seconds allowed for connecting and for each round trip
+                (None waits indefinitely)
+
+        """
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._idle: list[_Connection] = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> RespClient:
+        """
+        Create a client from a `redis://[:password@]host[:port][/db]` URL.
+
+        Args:
+            url: Connection URL
+            **kwargs: Extra constructor arguments
+
+        Returns:
+            RespClient
+
+        """
+        parsed = urlparse(url)
+        if parsed.scheme != "redis":
+            raise ValueError(f"Unsupported cache URL scheme: {parsed.scheme!r}")
+        db = parsed.path.lstrip("/")
+        return cls(
+            parsed.hostname or "127.0.0.1",
+            parsed.port or 6379,
+            db=int(db) if db else 0,
+            password=unquote(parsed.password) if parsed.password else None,
+            **kwargs,
+        )
+
+    async def _connect(self) -> _Connection:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        connection = _Connection(reader, writer)
+        setup: list[tuple[Any, ...]] = []
+        if self.password:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            try:
+                replies = await asyncio.wait_for(connection.pipeline(setup), self.timeout)
+            except BaseException:
+                await connection.close()
+                raise
+            for reply in replies:
+                if isinstance(reply, RespError):
+                    await connection.close()
+                    raise reply
+        return connection
+
+    async def pipeline(self, *commands: tuple[Any, ...]) -> list[Any]:
+        """
+        Send several commands in one round trip.
+
+        Args:
+            *commands: Command tuples, e.g. ("SET", "k", "v")
+
+        Returns:
+            Replies in command order (error replies are returned, not raised)
+
+        Raises:
+            TimeoutError: If connecting or the round trip exceeds `timeout`
+            asyncio.IncompleteReadError: If the server closes mid-reply
+
+        """
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else await self._connect()
+            try:
+                replies = await asyncio.wait_for(connection.pipeline(list(commands)), self.timeout)
+            except BaseException:
+                await connection.close()
+                raise
+            self._idle.append(connection)
+            return replies
+
+    async def execute(self, *args: Any) -> Any:
+        """
+        Run a single command.
+
+        Args:
+            *args: Command name and arguments
+
+        Returns:
+            The reply
+
+        Raises:
+            RespError: If the server returned an error reply
+
+        """
+        (reply,) = await self.pipeline(args)
+        if isinstance(reply, RespError):
+            raise reply
+        return reply
+
+    async def subscribe(self, *channels: str) -> Subscription:
+        """
+        Subscribe to channels on a dedicated connection.
+
+        Args:
+            *channels: Channel names
+
+        Returns:
+            Subscription, confirmed by the server (iterate it for messages)
+
+        """
+        connection = await self._connect()
+
+        async def confirm() -> None:
+            connection.writer.write(encode_command("SUBSCRIBE", *channels))
+            await connection.writer.drain()
+            for _ in channels:
+                reply = await read_reply(connection.reader)
+                if isinstance(reply, RespError):
+                    raise reply
+
+        try:
+            # Only the confirmation is bounded; messages may be arbitrarily far apart.
+            await asyncio.wait_for(confirm(), self.timeout)
+        except BaseException:
+            await connection.close()
+            raise
+        return Subscription(connection)
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await connection.close()
+
+
+# ---------------------------------------------------------------------------
+# Cache backend
+# ---------------------------------------------------------------------------
+
+
+class RedisCache:
+    """
+    Shared `CacheBackend` on a Redis-protocol server.
+
+    Values are stored as JSON envelopes (`{"v": value, "t": tags}`) under
+    `<namespace>:k:<key>` with a native TTL; each tag is a set under
+    `<namespace>:t:<tag>` whose TTL is extended to cover its longest-lived key.
+    """
+
+    def __init__(
+        self, client: RespClient, *, namespace: str = "skill_fleet", default_ttl: int = 300
+    ):
+        """
+        Initialize the backend.
+
+        Args:
+            client: Connected RespClient
+            namespace: Prefix isolating this cache's keys on a shared server
+            default_ttl: Default time-to-live in seconds
+
+        """
+        self.client = client
+        self.namespace = namespace
+        self.default_ttl = default_ttl
+        self._stats = {"hits": 0, "misses": 0, "errors": 0, "invalidations": 0}
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:k:{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.namespace}:t:{tag}"
+
+    async def get(self, key: str) -> Any | None:
+        """Get a value, or None if missing/expired."""
+        found = await self.get_entry(key)
+        return found[0] if found is not None else None
+
+    async def get_entry(self, key: str) -> tuple[Any, frozenset[str]] | None:
+        """Get a (value, tags) tuple, or None if missing/expired."""
+        try:
+            raw = await self.client.execute("GET", self._key(key))
+        except BACKEND_ERRORS as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Redis cache read failed: {e}")
+            return None
+        if raw is None:
+            self._stats["misses"] += 1
+            return None
+        try:
+            envelope = json.loads(raw)
+            entry = envelope["v"], frozenset(envelope.get("t", ()))
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            # Corrupt or foreign payload: a miss (the next set() overwrites it)
+            self._stats["errors"] += 1
+            self._stats["misses"] += 1
+            logger.warning(f"Ignoring unreadable Redis cache entry: {e}")
+            return None
+        self._stats["hits"] += 1
+        return entry
+
+    async def set(
+        self, key: str, value: Any, ttl: int | None = None, tags: Iterable[str] = ()
+    ) -> None:
+        """
+        Store a JSON-serializable value.
+
+        Raises:
+            TypeError: If the value is not JSON-serializable
+
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        tags = sorted(set(tags))
+        payload = json.dumps({"v": value, "t": tags}, separators=(",", ":"))
+        commands: list[tuple[Any, ...]] = [("SET", self._key(key), payload, "EX", max(ttl, 1))]
+        commands += [("SADD", self._tag(tag), key) for tag in tags]
+        commands += [("TTL", self._tag(tag)) for tag in tags]
+        try:
+            replies = await self.client.pipeline(*commands)
+            # Extend tag sets whose TTL would lapse before this key does.
+            extend = [
+                ("EXPIRE", self._tag(tag), ttl)
+                for tag, remaining in zip(tags, replies[1 + len(tags) :], strict=True)
+                if isinstance(remaining, int) and remaining < ttl
+            ]
+            if extend:
+                await self.client.pipeline(*extend)
+        except BACKEND_ERRORS as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Redis cache write failed: {e}")
+
+    async def invalidate(self, key: str) -> bool:
+        """Remove a key; return whether it was cached (False if Redis is unavailable)."""
+        try:
+            removed = await self.client.execute("DEL", self._key(key))
+        except BACKEND_ERRORS as e:
+            self._invalidation_failed(e)
+            return False
+        self._stats["invalidations"] += removed
+        return bool(removed)
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Remove every entry carrying any of the tags; return the count."""
+        if not tags:
+            return 0
+        try:
+            members = await self.client.pipeline(*(("SMEMBERS", self._tag(tag)) for tag in tags))
+            keys = {
+                self._key(member.decode("utf-8")) for reply in members for member in reply or []
+            }
+            replies = await self.client.pipeline(
+                *(("DEL", key) for key in keys), ("DEL", *(self._tag(tag) for tag in tags))
+            )
+        except BACKEND_ERRORS as e:
+            self._invalidation_failed(e)
+            return 0
+        removed = sum(replies[:-1])
+        self._stats["invalidations"] += removed
+        return removed
+
+    async def _scan(self, match: str) -> list[str]:
+        """Collect server keys matching a glob (SCAN, non-blocking on the server)."""
+        cursor, keys = b"0", []
+        while True:
+            cursor, batch = await self.client.execute("SCAN", cursor, "MATCH", match, "COUNT", 500)
+            keys.extend(key.decode("utf-8") for key in batch)
+            if cursor in (b"0", 0):
+                return keys
+
+    async def _delete(self, keys: list[str]) -> int:
+        removed = 0
+        for start in range(0, len(keys), 500):
+            removed += await self.client.execute("DEL", *keys[start : start + 500])
+        return removed
+
+    async def invalidate_pattern(self, pattern: str) -> int:
+        """Remove every key matching a glob pattern; return the count."""
+        try:
+            removed = await self._delete(await self._scan(self._key(pattern)))
+        except BACKEND_ERRORS as e:
+            self._invalidation_failed(e)
+            return 0
+        self._stats["invalidations"] += removed
+        return removed
+
+    async def clear(self) -> int:
+        """Remove every key in the namespace; return the number of cached values."""
+        try:
+            values = await self._scan(self._key("*"))
+            await self._delete(values + await self._scan(self._tag("*")))
+        except BACKEND_ERRORS as e:
+            self._invalidation_failed(e)
+            return 0
+        return len(values)
+
+    def _invalidation_failed(self, error: Exception) -> None:
+        # Entries left behind expire with their TTL; callers must not fail
+        self._stats["errors"] += 1
+        logger.warning(f"Redis cache invalidation failed: {error}")
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get this process's counters for the shared backend."""
+        return {**self._stats, "backend": "redis", "namespace": self.namespace}
+
+    async def cleanup_expired(self) -> int:
+        """Return 0; the server expires keys itself."""
+        return 0
+
+
+class RedisInvalidationBus:
+    """`InvalidationBus` over Redis pub/sub."""
+
+    def __init__(self, client: RespClient, channel: str = "skill_fleet:cache:invalidate"):
+        """
+        Initialize the bus.
+
+        Args:
+            client: Connected RespClient
+            channel: Pub/sub channel shared by all workers
+
+        """
+        self.client = client
+        self.channel = channel
+        self._task: asyncio.Task[None] | None = None
+
+    async def publish(self, message: dict[str, Any]) -> None:
+        """Send an invalidation message to every subscribed worker."""
+        await self.client.execute("PUBLISH", self.channel, json.dumps(message))
+
+    async def start(self, handler: Callable[[dict[str, Any]], Awaitable[None]]) -> None:
+        """
+        Subscribe and deliver messages to `handler` until stopped.
+
+        Returns once the first subscription is confirmed, so invalidations
+        published afterwards are not missed. Lost connections are retried.
+        """
+        if self._task is not None:
+            return
+        subscription = await self.client.subscribe(self.channel)
+
+        async def listen(subscription: Subscription) -> None:
+            while True:
+                try:
+                    async for _channel, payload in subscription:
+                        try:
+                            await handler(json.loads(payload))
+                        except Exception as e:
+                            logger.error(f"Cache invalidation handler failed: {e}")
+                except (OSError, ConnectionError, asyncio.IncompleteReadError) as e:
+                    logger.warning(f"Cache invalidation subscription lost, retrying: {e}")
+                finally:
+                    await subscription.close()
+                while True:
+                    await asyncio.sleep(1.0)
+                    try:
+                        subscription = await self.client.subscribe(self.channel)
+                        break
+                    except BACKEND_ERRORS as e:
+                        logger.warning(f"Cache invalidation resubscribe failed: {e}")
+
+        self._task = asyncio.create_task(listen(subscription), name="cache-invalidation-bus")
+
+    async def stop(self) -> None:
+        """Cancel the subscription."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+# ---------------------------------------------------------------------------
+# Local stand-in server
+# ---------------------------------------------------------------------------
+
+
+class LocalRedisServer:
+    """
+    In-process asyncio server speaking the Redis protocol.
+
+    Implements the commands used by `RespClient`, `RedisCache` and
+    `RedisInvalidationBus` (strings with expiry, sets, SCAN, pub/sub), with
+    lazy expiry. Intended for tests and single-machine development; it is not
+    persistent and not a general Redis replacement.
+
+    Usage:
+        >>> async with LocalRedisServer() as server:
+        ...     client = RespClient.from_url(server.url)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server (call `start()` to listen).
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+
+        """
+        self.host = host
+        self.port = port
+        self._data: dict[bytes, bytes | set[bytes]] = {}
+        self._expires: dict[bytes, float] = {}
+        self._subscribers: dict[bytes, set[asyncio.StreamWriter]] = {}
+        self._server: asyncio.Server | None = None
+        self._clients: set[asyncio.StreamWriter] = set()
+
+    @property
+    def url(self) -> str:
+        """Connection URL for `RespClient.from_url`."""
+        return f"redis://{self.host}:{self.port}/0"
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Close client connections and stop listening."""
+        if self._server is None:
+            return
+        self._server.close()
+        for writer in list(self._clients):
+            writer.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self) -> LocalRedisServer:
+        """Start the server for the duration of the block."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the server."""
+        await self.stop()
+
+    # -- connection handling ------------------------------------------------
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._clients.add(writer)
+        try:
+            while True:
+                try:
+                    command = await read_reply(reader)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    return
+                if not isinstance(command, list) or not command:
+                    writer.write(_encode_reply(RespError("ERR protocol error")))
+                    continue
+                name = command[0].decode("utf-8").upper()
+                if name == "SUBSCRIBE":
+                    for count, channel in enumerate(command[1:], start=1):
+                        self._subscribers.setdefault(channel, set()).add(writer)
+                        writer.write(_encode_reply([b"subscribe", channel, count]))
+                else:
+                    handler = getattr(self, f"_cmd_{name.lower()}", None)
+                    try:
+                        reply = (
+                            handler(*command[1:])
+                            if handler
+                            else RespError(f"ERR unknown command '{name}'")
+                        )
+                    except (TypeError, ValueError) as e:
+                        reply = RespError(f"ERR {e}")
+                    writer.write(_encode_reply(reply))
+                await writer.drain()
+        finally:
+            for subscribers in self._subscribers.values():
+                subscribers.discard(writer)
+            self._clients.discard(writer)
+            writer.close()
+
+    def _live(self, key: bytes) -> bytes | set[bytes] | None:
+        expires = self._expires.get(key)
+        if expires is not None and expires <= time.monotonic():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return self._data.get(key)
+
+    # -- commands -----------------------------------------------------------
+
+    def _cmd_ping(self, *args: bytes) -> str | bytes:
+        return args[0] if args else "PONG"
+
+    def _cmd_auth(self, *args: bytes) -> str:
+        return "OK"
+
+    def _cmd_select(self, db: bytes) -> str:
+        return "OK"
+
+    def _cmd_get(self, key: bytes) -> bytes | RespError | None:
+        value = self._live(key)
+        if isinstance(value, set):
+            return RespError("WRONGTYPE Operation against a key holding the wrong kind of value")
+        return value
+
+    def _cmd_set(self, key: bytes, value: bytes, *options: bytes) -> str:
+        self._data[key] = value
+        self._expires.pop(key, None)
+        if len(options) >= 2 and options[0].upper() == b"EX":
+            self._expires[key] = time.monotonic() + int(options[1])
+        return "OK"
+
+    def _cmd_del(self, *keys: bytes) -> int:
+        removed = 0
+        for key in keys:
+            if self._live(key) is not None:
+                del self._data[key]
+                self._expires.pop(key, None)
+                removed += 1
+        return removed
+
+    def _cmd_exists(self, *keys: bytes) -> int:
+        return sum(1 for key in keys if self._live(key) is not None)
+
+    def _cmd_sadd(self, key: bytes, *members: bytes) -> int | RespError:
+        current = self._live(key)
+        if current is None:
+            current = self._data[key] = set()
+        if not isinstance(current, set):
+            return RespError("WRONGTYPE Operation against a key holding the wrong kind of value")
+        before = len(current)
+        current.update(members)
+        return len(current) - before
+
+    def _cmd_srem(self, key: bytes, *members: bytes) -> int:
+        current = self._live(key)
+        if not isinstance(current, set):
+            return 0
+        before = len(current)
+        current.difference_update(members)
+        if not current:
+            self._cmd_del(key)
+        return before - len(current)
+
+    def _cmd_smembers(self, key: bytes) -> list[bytes]:
+        current = self._live(key)
+        return sorted(current) if isinstance(current, set) else []
+
+    def _cmd_expire(self, key: bytes, seconds: bytes) -> int:
+        if self._live(key) is None:
+            return 0
+        self._expires[key] = time.monotonic() + int(seconds)
+        return 1
+
+    def _cmd_ttl(self, key: bytes) -> int:
+        if self._live(key) is None:
+            return -2
+        expires = self._expires.get(key)
+        return -1 if expires is None else max(0, round(expires - time.monotonic()))
+
+    def _cmd_scan(self, cursor: bytes, *options: bytes) -> list[Any]:
+        match, count = b"*", 10
+        for option, value in zip(options[::2], options[1::2], strict=False):
+            if option.upper() == b"MATCH":
+                match = value
+            elif option.upper() == b"COUNT":
+                count = int(value)
+        keys = sorted(key for key in list(self._data) if self._live(key) is not None)
+        start = int(cursor)
+        batch = keys[start : start + count]
+        following = start + count if start + count < len(keys) else 0
+        pattern = match.decode("utf-8")
+        matched = [key for key in batch if fnmatch.fnmatchcase(key.decode("utf-8"), pattern)]
+        return [str(following).encode("ascii"), matched]
+
+    def _cmd_publish(self, channel: bytes, message: bytes) -> int:
+        subscribers = list(self._subscribers.get(channel, ()))
+        for writer in subscribers:
+            writer.write(_encode_reply([b"message", channel, message]))
+        return len(subscribers)
+
+    def _cmd_flushdb(self, *args: bytes) -> str:
+        self._data.clear()
+        self._expires.clear()
+        return "OK"
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -79,6 +80,157 @@ class APISettings(BaseSettings):
         description="Directory for persisting job sessions",
     )
 
+    # Taxonomy discovery
+    taxonomy_watch_enabled: bool = Field(
+        default=True,
+        description=(
+            "Watch the skills root for changes and update taxonomy caches live "
+            "(falls back to throttled rescans when disabled)"
+        ),
+    )
+    taxonomy_watch_backend: Literal["auto", "native", "polling"] = Field(
+        default="auto",
+        description="Taxonomy watcher backend (auto, native, polling)",
+    )
+    taxonomy_watch_poll_interval: float = Field(
+        default=2.0,
+        ge=0.1,
+        le=300.0,
+        description="Seconds between taxonomy watcher polls (polling backend)",
+    )
+
+    # API cache
+    cache_max_mb: int = Field(
+        default=128,
+        ge=1,
+        description=(
+            "Memory budget in MiB for the in-process API cache (and the L1 tier of "
+            "the shared cache); values are sized approximately"
+        ),
+    )
+    cache_redis_url: str | None = Field(
+        default=None,
+        description=(
+            "Redis URL (redis://[:password@]host:port/db) for a shared L2 API cache "
+            "across workers; unset keeps the cache in-process"
+        ),
+    )
+    cache_redis_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        le=60,
+        description=(
+            "Seconds allowed for connecting to and each round trip with the shared "
+            "cache; a slower server is treated as a cache miss"
+        ),
+    )
+    cache_l1_ttl: int = Field(
+        default=30,
+        ge=1,
+        le=3600,
+        description="Seconds entries stay in the in-process L1 tier in front of the shared cache",
+    )
+
+    # Job persistence
+    job_write_behind_enabled: bool = Field(
+        default=True,
+        description=(
+            "Batch job updates through a write-behind queue on the async engine "
+            "(terminal states are still written before the call returns)"
+        ),
+    )
+    job_write_behind_interval: float = Field(
+        default=0.25,
+        gt=0,
+        le=10,
+        description="Seconds job updates are collected and coalesced before a batch write",
+    )
+    job_write_behind_max_batch: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum number of jobs written per transaction",
+    )
+    job_write_behind_max_pending: int = Field(
+        default=1000,
+        ge=1,
+        description="Jobs that may wait to be written before updates are held back",
+    )
+    job_blob_dir: str | None = Field(
+        default=None,
+        description=(
+            "Directory of a content-addressed blob store for large job payloads; every API "
+            "and worker process must see the same directory (None keeps payloads in rows)"
+        ),
+    )
+    job_blob_threshold: int = Field(
+        default=64 * 1024,
+        ge=1024,
+        description="Serialized size (bytes) from which job payloads are stored as blobs",
+    )
+
+    # Durable job queue
+    job_queue_enabled: bool = Field(
+        default=True,
+        description=(
+            "Queue skill creation jobs in the database and run them on a worker pool "
+            "(jobs resume from their last checkpoint after a restart)"
+        ),
+    )
+    job_workers: int = Field(
+        default=4,
+        ge=0,
+        description="Jobs run concurrently by this process (0 = enqueue only, for external workers)",
+    )
+    job_per_user_limit: int = Field(
+        default=2,
+        ge=0,
+        description="Maximum concurrently running jobs per user across all workers (0 = no cap)",
+    )
+    job_lease_seconds: float = Field(
+        default=60.0,
+        ge=5,
+        description="Lease on a claimed job; renewed by heartbeat, reclaimable once expired",
+    )
+    job_poll_interval: float = Field(
+        default=2.0,
+        gt=0,
+        le=60,
+        description="Seconds between queue polls when no job was submitted locally",
+    )
+    job_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Claims after which a repeatedly interrupted job is marked failed",
+    )
+    job_events_url: str | None = Field(
+        default=None,
+        description=(
+            "Redis URL relaying workflow events, job state and HITL answers between API "
+            "processes and `skill-fleet worker` processes (defaults to cache_redis_url)"
+        ),
+    )
+
+    # Cache warmup
+    warmup_enabled: bool = Field(
+        default=True,
+        description="Preload taxonomy caches at startup before /ready reports ready",
+    )
+    warmup_top_users: int = Field(
+        default=20,
+        ge=0,
+        description="Number of most active users whose taxonomy views are preloaded",
+    )
+    warmup_popular_skills: int = Field(
+        default=50,
+        ge=0,
+        description="Number of most used skills whose metadata is preloaded",
+    )
+    warmup_timeout_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds after which warmup gives up and the app reports ready anyway",
+    )
+
     # MLflow configuration
     mlflow_tracking_uri: str = Field(
         default="sqlite:///mlflow.db",
@@ -105,6 +257,16 @@ class APISettings(BaseSettings):
             raise ValueError(f"Environment must be one of {allowed}, got '{v}'")
         return v_lower
 
+    @field_validator("taxonomy_watch_backend", mode="before")
+    @classmethod
+    def validate_taxonomy_watch_backend(cls, v: str) -> str:
+        """Validate taxonomy watcher backend."""
+        allowed = {"auto", "native", "polling"}
+        v_lower = v.lower()
+        if v_lower not in allowed:
+            raise ValueError(f"Taxonomy watch backend must be one of {allowed}, got '{v}'")
+        return v_lower
+
     @field_validator("log_level", mode="before")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
@@ -153,6 +153,30 @@ def create_app() -> FastAPI:
         """
         return {"status": "ok", "version": settings.api_version}
 
+    @app.get("/ready")
+    async def ready():
+        """
+        Readiness check reflecting startup cache warmup.
+
+        Returns:
+            JSONResponse: 200 once warmup has finished (or is disabled),
+            503 while it is still running, with per-step warmup progress
+            and job write-behind queue metrics
+
+        """
+        from .services.job_manager import get_job_manager
+        from .warmup import get_warmup_state
+
+        state = get_warmup_state()
+        return JSONResponse(
+            status_code=status.HTTP_200_OK if state.ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "status": "ready" if state.ready else "starting",
+                "warmup": state.as_dict(),
+                "job_persistence": get_job_manager().get_persistence_stats(),
+            },
+        )
+
     return app
 
 
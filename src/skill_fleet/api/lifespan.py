@@ -3,8 +3,13 @@ FastAPI lifespan management for job persistence.
 
 Handles:
 1. Initialization of JobManager with database backing at startup
+   (job writes batched through a write-behind queue)
 2. Background cleanup task to remove expired jobs from memory cache
-3. Graceful shutdown
+3. Live taxonomy cache updates from filesystem events
+4. Shared (Redis-backed) API cache when configured
+5. Cache warmup before readiness is reported
+6. Durable job queue and worker pool (interrupted jobs resume after restart)
+7. Graceful shutdown
 """
 
 from __future__ import annotations
@@ -19,6 +24,12 @@ if TYPE_CHECKING:
 
     from fastapi import FastAPI
 
+    from ..taxonomy.manager import TaxonomyManager
+    from .cache import InMemoryCache
+    from .cache_redis import RespClient
+    from .config import APISettings
+    from .services.job_queue import JobWorkerPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,11 +41,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Startup (before yield):
     - Initialize database and create tables
     - Initialize JobManager with database repository
-    - Resume any pending jobs from database
+    - Start the job write-behind queue (if enabled)
+    - Start the job worker pool, which resumes queued and interrupted jobs
+    - Start the job event relay (if a Redis URL is configured)
+    - Start the taxonomy filesystem watcher (if enabled)
+    - Install the shared two-tier API cache (if cache_redis_url is set)
+    - Start cache warmup in the background (GET /ready reports its progress)
     - Start background cleanup task for expired jobs
 
     Shutdown (after yield):
-    - Cancel cleanup task
+    - Cancel cleanup and warmup tasks
+    - Stop the job worker pool (running jobs are requeued)
+    - Stop the job event relay
+    - Stop the taxonomy watcher
+    - Stop cache invalidation fan-out and close the cache client
+    - Flush queued job writes
+    - Flush pending taxonomy_meta.json updates
     - Close database connections
     """
     # =========================================================================
@@ -63,6 +85,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
             # Configure DSPy caching from config.yaml for improved performance
             loader.configure_cache()
+            loader.configure_response_cache()
             logger.info("✅ DSPy configured successfully with caching enabled")
 
             # Store loader on app state for later use
@@ -116,24 +139,75 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app.state.job_manager = get_job_manager()
         logger.info("✅ JobManager registered for dependency injection")
 
-        # Resume any pending jobs from database using a short-lived session
+        if settings.job_write_behind_enabled:
+            app.state.job_manager.start_write_behind(
+                flush_interval=settings.job_write_behind_interval,
+                max_batch=settings.job_write_behind_max_batch,
+                max_pending=settings.job_write_behind_max_pending,
+            )
+            logger.info("✅ Job write-behind persistence started")
+
+        if settings.job_blob_dir:
+            from ..infrastructure.blobs import FileBlobStore
+
+            app.state.job_manager.enable_blob_offload(
+                FileBlobStore(settings.job_blob_dir), threshold=settings.job_blob_threshold
+            )
+
+        # Queued jobs, including those interrupted by the last shutdown, are
+        # claimed again once their leases expire
         with transactional_session() as db:
-            job_repo = JobRepository(db)
-            pending_jobs = job_repo.get_by_status("pending")
-            running_jobs = job_repo.get_by_status("running")
-            pending_hitl_jobs = job_repo.get_by_status("pending_hitl")
-
-            total_resumed = len(pending_jobs) + len(running_jobs) + len(pending_hitl_jobs)
-            if total_resumed > 0:
-                logger.info(f"📋 Resuming {total_resumed} jobs from database")
-                logger.info(f"   - {len(pending_jobs)} pending")
-                logger.info(f"   - {len(running_jobs)} running")
-                logger.info(f"   - {len(pending_hitl_jobs)} waiting for human input")
+            queued = JobRepository(db).count_queued()
+            if queued > 0:
+                logger.info(f"📋 {queued} queued job(s) in database")
 
     except Exception as e:
         logger.error(f"❌ Failed to initialize database/JobManager: {e}")
         raise
 
+    # Keep taxonomy caches current from filesystem events (non-critical)
+    taxonomy_manager = None
+    if settings.taxonomy_watch_enabled:
+        try:
+            taxonomy_manager = await _start_taxonomy_watcher(settings)
+        except Exception as e:
+            logger.warning(f"Taxonomy watcher not started, using throttled rescans: {e}")
+
+    # Size the in-process API cache, then optionally share it between workers
+    # (non-critical: falls back to in-process)
+    from .cache import set_cache
+
+    set_cache(_local_cache(settings))
+    cache_client = None
+    if settings.cache_redis_url:
+        try:
+            cache_client = await _start_shared_cache(settings)
+        except Exception as e:
+            logger.warning(f"Shared API cache not available, using in-process cache: {e}")
+
+    # Preload taxonomy caches into whichever cache was installed above;
+    # /ready returns 503 until this finishes
+    warmup_task = _start_warmup(settings)
+
+    # Run queued skill creation jobs
+    worker_pool = _start_worker_pool(settings)
+
+    # Mirror job events and state of jobs run by other processes (non-critical)
+    event_relay = None
+    events_url = settings.job_events_url or settings.cache_redis_url
+    if events_url:
+        try:
+            from .services.job_events import connect_job_event_relay
+            from .services.job_queue import worker_identity
+
+            event_relay = await connect_job_event_relay(
+                events_url,
+                origin=worker_pool.owner if worker_pool is not None else worker_identity(),
+                runs_job=worker_pool.runs_job if worker_pool is not None else None,
+            )
+        except Exception as e:
+            logger.warning(f"Job event relay not started; jobs of external workers will lag: {e}")
+
     # Start background cleanup task
     cleanup_task = asyncio.create_task(_cleanup_expired_jobs())
     logger.info("✅ Background cleanup task started (runs every 5 minutes)")
@@ -154,6 +228,73 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.error(f"✗ Failed to cancel cleanup task: {e}")
 
+        # Cancel warmup if it is still running
+        if warmup_task is not None and not warmup_task.done():
+            warmup_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await warmup_task
+
+        # Stop taxonomy watcher
+        if taxonomy_manager is not None:
+            try:
+                taxonomy_manager.stop_watching()
+                logger.info("✓ Taxonomy watcher stopped")
+            except Exception as e:
+                logger.error(f"✗ Failed to stop taxonomy watcher: {e}")
+
+        # Stop shared cache fan-out
+        if cache_client is not None:
+            try:
+                from .cache import TieredCache, get_cache
+
+                cache = get_cache()
+                if isinstance(cache, TieredCache):
+                    await cache.stop()
+                await cache_client.close()
+                set_cache(_local_cache(settings))
+                logger.info("✓ Shared API cache closed")
+            except Exception as e:
+                logger.error(f"✗ Failed to close shared API cache: {e}")
+
+        # Stop claiming jobs; running ones go back to the queue
+        if worker_pool is not None:
+            try:
+                from .services.job_queue import set_worker_pool
+
+                await worker_pool.stop()
+                set_worker_pool(None)
+                logger.info("✓ Job worker pool stopped")
+            except Exception as e:
+                logger.error(f"✗ Failed to stop job worker pool: {e}")
+
+        if event_relay is not None:
+            try:
+                from .services.job_events import set_job_event_relay
+
+                await event_relay.stop()
+                set_job_event_relay(None)
+                logger.info("✓ Job event relay stopped")
+            except Exception as e:
+                logger.error(f"✗ Failed to stop job event relay: {e}")
+
+        # Write queued job updates before the engines are disposed
+        try:
+            from .services.job_manager import get_job_manager
+
+            await get_job_manager().stop_write_behind()
+            logger.info("✓ Job updates flushed")
+        except Exception as e:
+            logger.error(f"✗ Failed to flush job updates: {e}")
+
+        # Write coalesced taxonomy_meta.json updates
+        try:
+            from ..taxonomy.meta_writer import flush_all
+
+            flushed = await asyncio.to_thread(flush_all)
+            logger.info(f"✓ Taxonomy stats flushed ({flushed} file(s) written)")
+        except Exception as e:
+            logger.error(f"✗ Failed to flush taxonomy stats: {e}")
+
         # Close database connections
         try:
             from ..infrastructure.db.database import close_async_db, close_db
@@ -167,13 +308,132 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("Shutdown complete")
 
 
+async def _start_taxonomy_watcher(settings: APISettings) -> TaxonomyManager:
+    """
+    Start live filesystem watching on the shared TaxonomyManager.
+
+    Change events patch `metadata_cache` in place of the 30s rescan throttle and
+    invalidate the API's taxonomy caches so promoted skills show up immediately.
+    The initial full reconcile runs in a worker thread.
+    """
+    from .dependencies import get_skills_root, get_taxonomy_manager
+    from .services.cached_taxonomy import get_cached_taxonomy_service
+
+    taxonomy_manager = get_taxonomy_manager(get_skills_root())
+    loop = asyncio.get_running_loop()
+
+    async def _invalidate(skill_ids: set[str]) -> None:
+        cached_service = get_cached_taxonomy_service(taxonomy_manager)
+        await cached_service.invalidate_taxonomy()
+        for skill_id in skill_ids:
+            await cached_service.invalidate_skill(skill_id)
+
+    def _on_taxonomy_change(skill_ids: set[str]) -> None:
+        # Called from the watcher thread; hop onto the event loop.
+        asyncio.run_coroutine_threadsafe(_invalidate(skill_ids), loop)
+
+    taxonomy_manager.add_change_listener(_on_taxonomy_change)
+    watcher = await asyncio.to_thread(
+        taxonomy_manager.start_watching,
+        poll_interval=settings.taxonomy_watch_poll_interval,
+        backend=settings.taxonomy_watch_backend,
+    )
+    logger.info(f"✅ Taxonomy watcher started ({watcher.backend} backend)")
+    return taxonomy_manager
+
+
+def _start_worker_pool(settings: APISettings) -> JobWorkerPool | None:
+    """Start the worker pool that runs queued skill creation jobs (if enabled)."""
+    if not settings.job_queue_enabled:
+        return None
+
+    from .services.job_queue import build_worker_pool, set_worker_pool
+
+    pool = build_worker_pool(settings)
+    set_worker_pool(pool)
+    pool.start()
+    return pool
+
+
+def _start_warmup(settings: APISettings) -> asyncio.Task | None:
+    """Start cache warmup as a background task, or mark readiness immediately if disabled."""
+    from .warmup import SKIPPED, reset_warmup_state, warm_caches
+
+    if not settings.warmup_enabled:
+        reset_warmup_state(SKIPPED)
+        return None
+
+    from .dependencies import get_skills_root, get_taxonomy_manager
+
+    state = reset_warmup_state()
+    try:
+        taxonomy_manager = get_taxonomy_manager(get_skills_root())
+    except Exception as e:
+        logger.warning(f"Cache warmup skipped, taxonomy unavailable: {e}")
+        state.status = SKIPPED
+        return None
+
+    logger.info("Cache warmup started")
+    return asyncio.create_task(
+        warm_caches(
+            taxonomy_manager,
+            top_users=settings.warmup_top_users,
+            popular_skills=settings.warmup_popular_skills,
+            timeout=settings.warmup_timeout_seconds,
+            state=state,
+        )
+    )
+
+
+def _local_cache(settings: APISettings, default_ttl: int = 300) -> InMemoryCache:
+    """Build an in-process API cache bounded by the configured memory budget."""
+    from .cache import InMemoryCache
+
+    return InMemoryCache(default_ttl=default_ttl, max_bytes=settings.cache_max_mb * 1024 * 1024)
+
+
+async def _start_shared_cache(settings: APISettings) -> RespClient:
+    """
+    Install a two-tier API cache backed by Redis.
+
+    Each worker keeps a short-lived in-process L1 in front of the shared L2 and
+    subscribes to invalidations so writes in one worker drop stale L1 copies
+    in the others.
+    """
+    from .cache import TieredCache, set_cache
+    from .cache_redis import RedisCache, RedisInvalidationBus, RespClient
+
+    client = RespClient.from_url(
+        settings.cache_redis_url or "", timeout=settings.cache_redis_timeout
+    )
+    try:
+        await client.execute("PING")
+        cache = TieredCache(
+            RedisCache(client),
+            l1=_local_cache(settings, default_ttl=settings.cache_l1_ttl),
+            l1_ttl=settings.cache_l1_ttl,
+            bus=RedisInvalidationBus(client),
+        )
+        await cache.start()
+    except BaseException:
+        await client.close()
+        raise
+    set_cache(cache)
+    logger.info(
+        f"✅ Shared API cache enabled (L1 TTL {settings.cache_l1_ttl}s, node {cache.node_id})"
+    )
+    return client
+
+
 async def _cleanup_expired_jobs() -> None:
     """
     Background task: Periodically clean up expired jobs from memory cache.
 
     Runs every 5 minutes. Removes jobs from memory that are older than the
     TTL (default: 60 minutes). These jobs remain in the database for durability.
+    Expired API cache entries are purged on the same schedule.
     """
+    from .cache import get_cache
     from .services.job_manager import get_job_manager
 
     while True:
@@ -185,6 +445,10 @@ async def _cleanup_expired_jobs() -> None:
             if cleaned > 0:
                 logger.info(f"🧹 Cleaned {cleaned} expired job(s) from memory cache")
 
+            purged = await get_cache().cleanup_expired()
+            if purged > 0:
+                logger.debug(f"Purged {purged} expired API cache entries")
+
         except asyncio.CancelledError:
             logger.debug("Cleanup task cancelled")
             break
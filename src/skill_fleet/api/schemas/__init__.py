@@ -61,6 +61,8 @@ from .skills import (
 from .taxonomy import (
     AdaptTaxonomyRequest,
     AdaptTaxonomyResponse,
+    TaxonomyPathEntry,
+    TaxonomyPathsResponse,
     TaxonomyResponse,
     UpdateTaxonomyRequest,
     UserTaxonomyResponse,
@@ -96,6 +98,8 @@ __all__ = [
     "UserTaxonomyResponse",
     "AdaptTaxonomyRequest",
     "AdaptTaxonomyResponse",
+    "TaxonomyPathEntry",
+    "TaxonomyPathsResponse",
     # Quality schemas
     "ValidateRequest",
     "ValidateResponse",
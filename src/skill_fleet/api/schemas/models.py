@@ -9,10 +9,18 @@ This keeps models separate from business logic and route handlers.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_serializer,
+    model_validator,
+)
 
 from skill_fleet.core.models import ChecklistState
 
@@ -41,7 +49,15 @@ class DeepUnderstandingState(BaseModel):
 
 
 class JobState(BaseModel):
-    """Represents the current state of a background job."""
+    """
+    Represents the current state of a background job.
+
+    Field assignments are tracked so persistence can write only the columns
+    that changed since the last save (`dirty_fields` / `take_dirty()`). A newly
+    constructed job starts with every field dirty; in-place mutation of
+    containers (e.g. `job.hitl_data[...] = ...`) must be followed by
+    `mark_dirty()` or a reassignment.
+    """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -84,6 +100,9 @@ class JobState(BaseModel):
     user_id: str = "default"
     user_context: dict[str, Any] = Field(default_factory=dict)
 
+    # Last completed workflow phase and its outputs (see SkillService.create_skill)
+    checkpoint: dict[str, Any] | None = None
+
     @field_serializer("hitl_event", "hitl_lock", when_used="json")
     def serialize_sync_objects(self, value: Any) -> None:
         """Exclude asyncio sync objects from JSON serialization."""
@@ -97,3 +116,53 @@ class JobState(BaseModel):
         if self.hitl_lock is None:
             object.__setattr__(self, "hitl_lock", asyncio.Lock())
         return self
+
+    # Immutable so copies made with model_copy() never share tracking state
+    _dirty: frozenset[str] = PrivateAttr(default=frozenset())
+    # Called after `status` or `user_id` is assigned (JobMemoryStore indexes)
+    _index_listener: Callable[[JobState], None] | None = PrivateAttr(default=None)
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Mark every field dirty: a new job has never been persisted."""
+        self._dirty = frozenset(type(self).model_fields)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign a field and record it as changed."""
+        super().__setattr__(name, value)
+        if name in type(self).model_fields and name not in self._dirty:
+            self._dirty = self._dirty | {name}
+        if name in ("status", "user_id") and self._index_listener is not None:
+            self._index_listener(self)
+
+    @property
+    def dirty_fields(self) -> frozenset[str]:
+        """Fields assigned since the job was last persisted."""
+        return self._dirty
+
+    def mark_dirty(self, *fields: str) -> None:
+        """Record fields as changed (after in-place mutation, or a failed write)."""
+        self._dirty = self._dirty.union(fields)
+
+    def take_dirty(self) -> set[str]:
+        """Return the changed fields and reset tracking (call when persisting)."""
+        dirty, self._dirty = self._dirty, frozenset()
+        return set(dirty)
+
+    def apply_persisted(self, values: dict[str, Any]) -> None:
+        """
+        Assign field values another process has already persisted.
+
+        Values are validated like constructor input (e.g. JSON from a relay)
+        and are not marked dirty, so they are not written again from here.
+
+        Args:
+            values: Field values keyed by field name (unknown names are ignored)
+
+        """
+        fields = type(self).model_fields
+        known = {name: value for name, value in values.items() if name in fields}
+        parsed = type(self).model_validate({"job_id": self.job_id, **known})
+        dirty = self._dirty
+        for name in known:
+            setattr(self, name, getattr(parsed, name))
+        self._dirty = dirty.difference(known)
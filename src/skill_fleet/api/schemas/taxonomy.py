@@ -48,3 +48,22 @@ class AdaptTaxonomyResponse(BaseModel):
     adapted_taxonomy: dict[str, Any]
     suggestions: list[str]
     confidence_scores: dict[str, float]
+
+
+class TaxonomyPathEntry(BaseModel):
+    """A skill located at a taxonomy path."""
+
+    path: str = Field(..., description="Canonical taxonomy path")
+    skill_id: str = Field(..., description="Skill identifier stored at the path")
+    source: str = Field(..., description="index, metadata_dir, skill_md or skill_file")
+
+
+class TaxonomyPathsResponse(BaseModel):
+    """Response model for taxonomy path prefix/subtree queries."""
+
+    prefix: str
+    children: list[str] = Field(
+        default_factory=list, description="Immediate child branches of the prefix"
+    )
+    skills: list[TaxonomyPathEntry] = Field(default_factory=list)
+    total: int = Field(..., description="Number of matching skills before truncation")
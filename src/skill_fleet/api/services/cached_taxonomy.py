@@ -6,8 +6,13 @@ improving API response times for read-heavy operations.
 
 Cache Configuration:
 - TTL: 5 minutes (300 seconds) for most data
+- Concurrent misses on one key share a single computation (single-flight), and
+  taxonomy views are served stale for a short window past their TTL while one
+  background refresh runs, so TTL boundaries don't cause recompute spikes
 - Invalidate on skill creation/update
-- Pattern-based invalidation support
+- Tag-based invalidation: "taxonomy" (every taxonomy view), "taxonomy:user"
+  (all per-user views), "user:<id>", and "skill:<path>" for a skill and each
+  of its ancestor paths
 
 Usage:
     >>> from skill_fleet.api.services.cached_taxonomy import cached_taxonomy_service
@@ -30,7 +35,9 @@ from typing import TYPE_CHECKING, Any
 from skill_fleet.api.cache import (
     cache_key,
     get_cache,
-    invalidate_pattern,
+    get_flight_stats,
+    get_or_compute,
+    invalidate_tags,
 )
 from skill_fleet.common.logging_utils import sanitize_for_log
 
@@ -39,6 +46,36 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+TAXONOMY_TAG = "taxonomy"
+USER_TAXONOMY_TAG = "taxonomy:user"
+
+# Seconds an expired taxonomy view may still be served while it is refreshed.
+TAXONOMY_STALE_TTL = 60
+USER_TAXONOMY_STALE_TTL = 30
+
+
+def user_tag(user_id: str) -> str:
+    """Build the invalidation tag for a user's cached views."""
+    return f"user:{user_id}"
+
+
+def skill_tags(skill_id: str) -> list[str]:
+    """
+    Build invalidation tags for a skill and every ancestor path.
+
+    Tagging `a/b/c` with `skill:a`, `skill:a/b` and `skill:a/b/c` lets
+    invalidating a branch drop all cached skills beneath it.
+
+    Args:
+        skill_id: Skill identifier (taxonomy path)
+
+    Returns:
+        Tags from the root branch down to the skill itself
+
+    """
+    parts = skill_id.strip("/").split("/")
+    return [f"skill:{'/'.join(parts[: i + 1])}" for i in range(len(parts))]
+
 
 class CachedTaxonomyService:
     """
@@ -68,28 +105,25 @@ class CachedTaxonomyService:
         """
         cache_key_val = cache_key("taxonomy", "global")
 
-        # Try cache first
-        cached = await get_cache().get(cache_key_val)
-        if cached is not None:
-            logger.debug("Cache hit: global taxonomy")
-            return cached
-
-        # Get from taxonomy manager
-        logger.debug("Cache miss: global taxonomy")
-        taxonomy_meta = self.taxonomy_manager.meta
-
-        result = {
-            "structure": taxonomy_meta.get("taxonomy", {}),
-            "domains": taxonomy_meta.get("domains", []),
-            "categories": list(taxonomy_meta.get("taxonomy", {}).keys()),
-            "total_skills": len(self.taxonomy_manager.metadata_cache),
-            "last_updated": taxonomy_meta.get("last_updated"),
-        }
+        async def compute() -> dict[str, Any]:
+            logger.debug("Computing global taxonomy")
+            taxonomy_meta = self.taxonomy_manager.meta
+            return {
+                "structure": taxonomy_meta.get("taxonomy", {}),
+                "domains": taxonomy_meta.get("domains", []),
+                "categories": list(taxonomy_meta.get("taxonomy", {}).keys()),
+                "total_skills": len(self.taxonomy_manager.metadata_cache),
+                "last_updated": taxonomy_meta.get("last_updated"),
+            }
 
         # Cache for 5 minutes
-        await get_cache().set(cache_key_val, result, ttl=300)
-
-        return result
+        return await get_or_compute(
+            cache_key_val,
+            compute,
+            ttl=300,
+            stale_ttl=TAXONOMY_STALE_TTL,
+            tags=[TAXONOMY_TAG],
+        )
 
     async def get_user_taxonomy(self, user_id: str) -> dict[str, Any]:
         """
@@ -104,41 +138,39 @@ class CachedTaxonomyService:
         """
         cache_key_val = cache_key("taxonomy", "user", user_id)
 
-        # Try cache first
-        cached = await get_cache().get(cache_key_val)
-        if cached is not None:
+        async def compute() -> dict[str, Any]:
             safe_user_id = sanitize_for_log(user_id)
-            logger.debug(f"Cache hit: user taxonomy for {safe_user_id}")
-            return cached
-
-        # Get from taxonomy manager
-        safe_user_id = sanitize_for_log(user_id)
-        logger.debug(f"Cache miss: user taxonomy for {safe_user_id}")
-        mounted_skills = self.taxonomy_manager.get_mounted_skills(user_id)
-        taxonomy_meta = self.taxonomy_manager.meta
-        global_taxonomy = taxonomy_meta.get("taxonomy", {})
-
-        result = {
-            "global_structure": global_taxonomy,
-            "mounted_skills": mounted_skills,
-            "user_id": user_id,
-        }
-
-        # Identify adapted categories
-        adapted_categories = []
-        for skill_path in mounted_skills:
-            parts = skill_path.split("/")
-            if len(parts) > 0:
-                domain = parts[0]
-                if domain not in adapted_categories:
-                    adapted_categories.append(domain)
-
-        result["adapted_categories"] = adapted_categories
+            logger.debug(f"Computing user taxonomy for {safe_user_id}")
+            mounted_skills = self.taxonomy_manager.get_mounted_skills(user_id)
+            taxonomy_meta = self.taxonomy_manager.meta
+            global_taxonomy = taxonomy_meta.get("taxonomy", {})
 
-        # Cache for 2 minutes (user-specific data changes more frequently)
-        await get_cache().set(cache_key_val, result, ttl=120)
+            result = {
+                "global_structure": global_taxonomy,
+                "mounted_skills": mounted_skills,
+                "user_id": user_id,
+            }
 
-        return result
+            # Identify adapted categories
+            adapted_categories = []
+            for skill_path in mounted_skills:
+                parts = skill_path.split("/")
+                if len(parts) > 0:
+                    domain = parts[0]
+                    if domain not in adapted_categories:
+                        adapted_categories.append(domain)
+
+            result["adapted_categories"] = adapted_categories
+            return result
+
+        # Cache for 2 minutes (user-specific data changes more frequently)
+        return await get_or_compute(
+            cache_key_val,
+            compute,
+            ttl=120,
+            stale_ttl=USER_TAXONOMY_STALE_TTL,
+            tags=[TAXONOMY_TAG, USER_TAXONOMY_TAG, user_tag(user_id)],
+        )
 
     async def get_relevant_branches(self, task_description: str) -> dict[str, dict[str, str]]:
         """
@@ -157,20 +189,11 @@ class CachedTaxonomyService:
         key_hash = hash_key(task_description)
         cache_key_val = cache_key("taxonomy", "branches", key_hash)
 
-        # Try cache first
-        cached = await get_cache().get(cache_key_val)
-        if cached is not None:
-            logger.debug("Cache hit: relevant branches for task")
-            return cached
-
-        # Get from taxonomy manager
-        logger.debug("Cache miss: relevant branches for task")
-        result = self.taxonomy_manager.get_relevant_branches(task_description)
+        async def compute() -> dict[str, dict[str, str]]:
+            return self.taxonomy_manager.get_relevant_branches(task_description)
 
         # Cache for 10 minutes (task descriptions often repeat)
-        await get_cache().set(cache_key_val, result, ttl=600)
-
-        return result
+        return await get_or_compute(cache_key_val, compute, ttl=600, tags=[TAXONOMY_TAG])
 
     async def get_skill_metadata_cached(self, skill_id: str) -> dict[str, Any] | None:
         """
@@ -185,36 +208,28 @@ class CachedTaxonomyService:
         """
         cache_key_val = cache_key("skill", "metadata", skill_id)
 
-        # Try cache first
-        cached = await get_cache().get(cache_key_val)
-        if cached is not None:
-            logger.debug(f"Cache hit: skill metadata for {skill_id}")
-            return cached
-
-        # Get from taxonomy manager
-        logger.debug(f"Cache miss: skill metadata for {skill_id}")
-        meta = self.taxonomy_manager.get_skill_metadata(skill_id)
-        if meta is None:
-            return None
-
-        from ...taxonomy.metadata import InfrastructureSkillMetadata
-
-        if isinstance(meta, InfrastructureSkillMetadata):
-            result = {
-                "skill_id": meta.skill_id,
-                "name": meta.name,
-                "description": meta.description,
-                "version": meta.version,
-                "type": meta.type,
-                "path": str(meta.path) if meta.path else None,
-                "weight": meta.weight,
-                "load_priority": meta.load_priority,
-                "dependencies": meta.dependencies,
-                "capabilities": meta.capabilities,
-                "always_loaded": meta.always_loaded,
-            }
-        else:
-            result = {
+        async def compute() -> dict[str, Any] | None:
+            meta = self.taxonomy_manager.get_skill_metadata(skill_id)
+            if meta is None:
+                return None
+
+            from ...taxonomy.metadata import InfrastructureSkillMetadata
+
+            if isinstance(meta, InfrastructureSkillMetadata):
+                return {
+                    "skill_id": meta.skill_id,
+                    "name": meta.name,
+                    "description": meta.description,
+                    "version": meta.version,
+                    "type": meta.type,
+                    "path": str(meta.path) if meta.path else None,
+                    "weight": meta.weight,
+                    "load_priority": meta.load_priority,
+                    "dependencies": meta.dependencies,
+                    "capabilities": meta.capabilities,
+                    "always_loaded": meta.always_loaded,
+                }
+            return {
                 "skill_id": meta.get("skill_id") if meta else None,
                 "name": meta.get("name") if meta else None,
                 "description": meta.get("description") if meta else None,
@@ -222,10 +237,8 @@ class CachedTaxonomyService:
                 "type": meta.get("type") if meta else None,
             }
 
-        # Cache for 5 minutes
-        await get_cache().set(cache_key_val, result, ttl=300)
-
-        return result
+        # Cache for 5 minutes (unknown skills are not cached)
+        return await get_or_compute(cache_key_val, compute, ttl=300, tags=skill_tags(skill_id))
 
     async def invalidate_taxonomy(self) -> int:
         """
@@ -235,7 +248,7 @@ class CachedTaxonomyService:
             Number of cache entries invalidated
 
         """
-        count = await invalidate_pattern("taxonomy:*")
+        count = await invalidate_tags(TAXONOMY_TAG)
         logger.info(f"Invalidated {count} taxonomy cache entries")
         return count
 
@@ -250,24 +263,23 @@ class CachedTaxonomyService:
             Number of cache entries invalidated
 
         """
-        # Invalidate skill metadata
-        count = await invalidate_pattern(f"skill:*:{skill_id}*")
-
-        # Also invalidate any user taxonomies that might reference this skill
-        count += await invalidate_pattern("taxonomy:user:*")
+        # Invalidate metadata of the skill and anything beneath it, plus any
+        # user taxonomies that might reference it
+        count = await invalidate_tags(f"skill:{skill_id.strip('/')}", USER_TAXONOMY_TAG)
 
         logger.info(f"Invalidated {count} cache entries for skill {skill_id}")
         return count
 
-    async def get_cache_stats(self) -> dict[str, int]:
+    async def get_cache_stats(self) -> dict[str, Any]:
         """
         Get cache statistics for monitoring.
 
         Returns:
-            Dictionary with cache statistics
+            Dictionary with cache statistics (totals plus per-shard counters)
+            and `single_flight` coalescing / stale-serving counters
 
         """
-        return await get_cache().get_stats()
+        return {**await get_cache().get_stats(), "single_flight": get_flight_stats()}
 
 
 # Global instance getter
@@ -3,18 +3,46 @@ In-memory registry for workflow event queues.
 
 Maps active job_id -> event queue for real-time streaming to SSE endpoints.
 Event queues are created when workflows start and cleaned up when they complete.
+
+When workflows run in another process (`skill-fleet worker`), the worker's
+registry forwards every event to the job event relay (`set_forwarder()`), and
+the API process feeds relayed events into its own queues with `deliver()`.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from skill_fleet.core.workflows.streaming import WorkflowEvent, WorkflowEventType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-from skill_fleet.core.workflows.streaming import WorkflowEvent
+    EventForwarder = Callable[[str, WorkflowEvent], None]
 
 logger = logging.getLogger(__name__)
 
+# Events buffered per job for relayed streams nobody is consuming yet
+RELAYED_QUEUE_SIZE = 1000
+
+
+class _ForwardingQueue(asyncio.Queue):
+    """Event queue that also hands every event to a forwarder."""
+
+    def __init__(self, job_id: str, forwarder: EventForwarder):
+        super().__init__()
+        self._job_id = job_id
+        self._forwarder = forwarder
+
+    def put_nowait(self, item: WorkflowEvent) -> None:
+        super().put_nowait(item)
+        try:
+            self._forwarder(self._job_id, item)
+        except Exception as e:
+            logger.warning(f"Failed to forward event for job {self._job_id}: {e}")
+
 
 class EventQueueRegistry:
     """
@@ -28,6 +56,17 @@ class EventQueueRegistry:
         """Initialize empty registry."""
         self._queues: dict[str, asyncio.Queue[WorkflowEvent]] = {}
         self._lock = asyncio.Lock()
+        self._forwarder: EventForwarder | None = None
+
+    def set_forwarder(self, forwarder: EventForwarder | None) -> None:
+        """
+        Forward events of queues registered from now on (None stops forwarding).
+
+        Args:
+            forwarder: Called with (job_id, event) for every event put
+
+        """
+        self._forwarder = forwarder
 
     async def register(self, job_id: str) -> asyncio.Queue[WorkflowEvent]:
         """
@@ -45,7 +84,9 @@ class EventQueueRegistry:
                 logger.warning(f"Event queue already exists for job {job_id}, reusing")
                 return self._queues[job_id]
 
-            queue: asyncio.Queue[WorkflowEvent] = asyncio.Queue()
+            queue: asyncio.Queue[WorkflowEvent] = (
+                _ForwardingQueue(job_id, self._forwarder) if self._forwarder else asyncio.Queue()
+            )
             self._queues[job_id] = queue
             logger.info(f"Registered event queue for job {job_id}")
             return queue
@@ -64,6 +105,29 @@ class EventQueueRegistry:
         async with self._lock:
             return self._queues.get(job_id)
 
+    async def deliver(self, job_id: str, event: WorkflowEvent) -> None:
+        """
+        Queue an event relayed from the process running the job's workflow.
+
+        Creates a bounded queue on the first event (dropping the oldest event
+        when nobody consumes it) and removes it after the final event; SSE
+        streams that already hold the queue still drain it.
+
+        Args:
+            job_id: Job identifier
+            event: Relayed workflow event
+
+        """
+        async with self._lock:
+            queue = self._queues.get(job_id)
+            if queue is None:
+                queue = self._queues[job_id] = asyncio.Queue(maxsize=RELAYED_QUEUE_SIZE)
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+            if event.event_type in (WorkflowEventType.COMPLETED, WorkflowEventType.ERROR):
+                del self._queues[job_id]
+
     async def unregister(self, job_id: str) -> bool:
         """
         Unregister event queue for a job.
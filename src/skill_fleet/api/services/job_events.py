@@ -0,0 +1,226 @@
+"""
+Job event relay between API processes and external workers.
+
+With `skill-fleet worker`, skill creation workflows run outside the API
+process. SSE streams, HITL prompts and job status endpoints read in-memory
+state of the API process, so the relay mirrors it over a pub/sub bus (the
+Redis `InvalidationBus` also used by the shared API cache):
+
+- `event`: workflow events from the process running a job, fed into the
+  receiving process's event registry (`EventQueueRegistry.deliver()`).
+- `job`: changed job fields (already persisted by the sender), applied to
+  the receiver's cached job (`JobManager.apply_remote_update()`).
+- `hitl_response`: HITL answers posted to an API process, delivered to the
+  waiting workflow in whichever process holds the job's lease.
+
+Every process publishes what happens locally and ignores its own messages.
+State of jobs a process is running itself is never overwritten by others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from skill_fleet.common.logging_utils import sanitize_for_log
+from skill_fleet.core.workflows.streaming import WorkflowEvent
+
+from .event_registry import get_event_registry
+from .job_manager import get_job_manager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ..cache import InvalidationBus
+    from ..cache_redis import RespClient
+    from ..schemas.models import JobState
+
+logger = logging.getLogger(__name__)
+
+JOB_EVENTS_CHANNEL = "skill_fleet:jobs:events"
+
+# JobState fields not mirrored: process-local sync objects, and HITL answers
+# (relayed as `hitl_response` messages)
+LOCAL_FIELDS = frozenset({"hitl_event", "hitl_lock", "hitl_response"})
+
+
+class JobEventRelay:
+    """Mirrors workflow events, job state and HITL answers between processes."""
+
+    def __init__(
+        self,
+        bus: InvalidationBus,
+        *,
+        origin: str,
+        runs_job: Callable[[str], bool] | None = None,
+        max_pending: int = 10_000,
+        client: RespClient | None = None,
+    ) -> None:
+        """
+        Initialize the relay (call `start()` to connect it).
+
+        Args:
+            bus: Pub/sub bus shared by all API and worker processes
+            origin: Identity of this process (messages from it are ignored)
+            runs_job: Whether this process runs a job's workflow (it then
+                receives HITL answers and keeps its own job state)
+            max_pending: Outgoing messages buffered before new ones are dropped
+            client: Connection behind the bus, closed by `stop()`
+
+        """
+        self.bus = bus
+        self.origin = origin
+        self._runs_job = runs_job or (lambda job_id: False)
+        self._client = client
+        self._outbox: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_pending)
+        self._task: asyncio.Task[None] | None = None
+        self._stats = {"published": 0, "received": 0, "dropped": 0}
+
+    async def start(self) -> None:
+        """Subscribe to the bus and start publishing; hooks into JobManager and events."""
+        await self.bus.start(self._handle)
+        self._task = asyncio.create_task(self._send(), name="job-event-relay")
+        get_job_manager().add_observer(self.publish_job)
+        get_event_registry().set_forwarder(self.publish_event)
+        logger.info(f"Job event relay started (origin {self.origin})")
+
+    async def stop(self) -> None:
+        """Unhook, send what is still buffered and unsubscribe."""
+        get_job_manager().remove_observer(self.publish_job)
+        get_event_registry().set_forwarder(None)
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        while not self._outbox.empty():
+            await self._publish(self._outbox.get_nowait())
+        await self.bus.stop()
+        if self._client is not None:
+            await self._client.close()
+
+    def publish_event(self, job_id: str, event: WorkflowEvent) -> None:
+        """Relay a workflow event (EventQueueRegistry forwarder)."""
+        self._queue({"kind": "event", "job_id": job_id, "event": event.to_dict()})
+
+    def publish_job(self, job: JobState, fields: frozenset[str]) -> None:
+        """Relay changed job fields (JobManager observer)."""
+        fields = fields - LOCAL_FIELDS
+        if fields:
+            values = job.model_dump(mode="json", include=set(fields))
+            self._queue({"kind": "job", "job_id": job.job_id, "values": values})
+
+    def publish_hitl_response(self, job_id: str, response: dict[str, Any]) -> None:
+        """Relay a HITL answer to the process running the job."""
+        self._queue({"kind": "hitl_response", "job_id": job_id, "response": response})
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return message counters and the outgoing buffer depth."""
+        return {**self._stats, "pending": self._outbox.qsize(), "origin": self.origin}
+
+    def _queue(self, message: dict[str, Any]) -> None:
+        """Buffer an outgoing message (dropped with a warning when the buffer is full)."""
+        try:
+            self._outbox.put_nowait({**message, "origin": self.origin})
+        except asyncio.QueueFull:
+            self._stats["dropped"] += 1
+            logger.warning(f"Job event relay buffer full; dropped {message['kind']} message")
+
+    async def _send(self) -> None:
+        """Publish buffered messages in order."""
+        while True:
+            await self._publish(await self._outbox.get())
+
+    async def _publish(self, message: dict[str, Any]) -> None:
+        try:
+            # Event payloads may hold values json cannot encode natively
+            await self.bus.publish(json.loads(json.dumps(message, default=str)))
+            self._stats["published"] += 1
+        except Exception as e:
+            self._stats["dropped"] += 1
+            logger.warning(f"Failed to publish {message['kind']} message: {e}")
+
+    async def _handle(self, message: dict[str, Any]) -> None:
+        """Apply a message published by another process."""
+        if message.get("origin") == self.origin:
+            return
+        self._stats["received"] += 1
+        job_id = message["job_id"]
+        kind = message["kind"]
+
+        if kind == "hitl_response":
+            if self._runs_job(job_id):
+                from .jobs import deliver_hitl_response
+
+                await deliver_hitl_response(job_id, message["response"])
+            return
+        if self._runs_job(job_id):
+            return  # Our own state and events are authoritative
+        if kind == "event":
+            await get_event_registry().deliver(job_id, WorkflowEvent.from_dict(message["event"]))
+        elif kind == "job":
+            try:
+                await get_job_manager().apply_remote_update(job_id, message["values"])
+            except Exception as e:
+                logger.warning(f"Ignoring job update for {sanitize_for_log(job_id)}: {e}")
+
+
+async def connect_job_event_relay(
+    url: str, *, origin: str, runs_job: Callable[[str], bool] | None = None
+) -> JobEventRelay:
+    """
+    Start a relay over Redis pub/sub and install it process-wide.
+
+    Args:
+        url: Redis URL (a `LocalRedisServer` works for single-machine setups)
+        origin: Identity of this process
+        runs_job: Whether this process runs a job's workflow
+
+    Returns:
+        The started relay
+
+    """
+    from ..cache_redis import RedisInvalidationBus, RespClient
+
+    client = RespClient.from_url(url)
+    try:
+        await client.execute("PING")
+        relay = JobEventRelay(
+            RedisInvalidationBus(client, channel=JOB_EVENTS_CHANNEL),
+            origin=origin,
+            runs_job=runs_job,
+            client=client,
+        )
+        await relay.start()
+    except BaseException:
+        await client.close()
+        raise
+    set_job_event_relay(relay)
+    return relay
+
+
+# Global instance (set by the API lifespan or the worker CLI when a bus is configured)
+_relay: JobEventRelay | None = None
+
+
+def get_job_event_relay() -> JobEventRelay | None:
+    """Get the process-wide relay (None when workflows only run in-process)."""
+    return _relay
+
+
+def set_job_event_relay(relay: JobEventRelay | None) -> None:
+    """Install (or clear) the process-wide relay."""
+    global _relay
+    _relay = relay
+
+
+__all__ = [
+    "JOB_EVENTS_CHANNEL",
+    "JobEventRelay",
+    "connect_job_event_relay",
+    "get_job_event_relay",
+    "set_job_event_relay",
+]
@@ -8,29 +8,81 @@ Architecture:
     Memory Layer    -> Fast cache for in-flight jobs (<1 hour old)
     Database Layer  -> Source of truth for all job history
     JobManager      -> Coordinates between both layers using transactional sessions
+
+Once `start_write_behind()` has been called (the API lifespan does this), job
+writes go through a JobWriteBehindQueue and are flushed in batches on the async
+engine; terminal states are awaited until committed. Without the queue, writes
+run in a worker thread so they never block the event loop.
+
+With `enable_blob_offload()`, large JSON payloads (result, hitl_data,
+user_context, checkpoint) are written to a content-addressed blob store and
+the row keeps only a reference and size; they are materialized when a job is
+loaded into memory, so row reads that do not rebuild a JobState stay small.
+
+Observers registered with `add_observer()` are told which fields of a job
+changed (the job event relay uses this to mirror job state into API processes
+when workflows run in a separate worker).
 """
 
 from __future__ import annotations
 
 import asyncio
+import base64
+import builtins
+import functools
 import json
 import logging
+from collections import OrderedDict, defaultdict
 from datetime import UTC, datetime, timedelta
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from skill_fleet.common.logging_utils import sanitize_for_log
 
+from ...infrastructure.blobs import BlobNotFoundError, load_json, offload_json
 from ...infrastructure.db.repositories import JobRepository
 from ...infrastructure.db.session import transactional_session
 from ..schemas.models import DeepUnderstandingState, JobState, TDDWorkflowState
+from .job_persistence import TERMINAL_STATUSES, JobWriteBehindQueue
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Callable, Collection
+
+    from ...infrastructure.blobs import BlobStore
+
+    JobObserver = Callable[[JobState, frozenset[str]], None]
 
 
 logger = logging.getLogger(__name__)
 
+# JobState fields stored in `jobs` columns of the same name
+PERSISTED_FIELDS = frozenset(
+    {
+        "status",
+        "task_description",
+        "progress_percent",
+        "result",
+        "error",
+        "error_stack",
+        "progress_message",
+        "current_phase",
+        "hitl_type",
+        "hitl_data",
+        "started_at",
+        "completed_at",
+        "user_id",
+        "user_context",
+        "checkpoint",
+    }
+)
+# Serialized (potentially large) JSON payload columns
+JSON_FIELDS = frozenset({"result", "hitl_data", "user_context", "checkpoint"})
+# Columns that must not be cleared by a partial UPDATE
+NOT_NULL_FIELDS = frozenset(
+    {"status", "task_description", "progress_percent", "user_id", "user_context"}
+)
+
 # Valid job status values for validation
 VALID_STATUSES = {
     "pending",
@@ -44,25 +96,139 @@ VALID_STATUSES = {
 }
 
 
+# Statuses of jobs waiting for a human (the `pending_hitl()` index)
+HITL_WAITING_STATUSES = frozenset({"pending_hitl", "pending_user_input", "pending_review"})
+
+
 class JobMemoryStore:
     """
-    Hot cache for in-flight jobs.
+    The single in-process cache of live JobState objects.
+
+    Every component (JobManager, the `jobs` helpers and HITL signaling) shares
+    these instances, so a job's `hitl_event` is the same object wherever it is
+    looked up, and a job is loaded from the database at most once while cached.
+
+    Entries are kept in write order and indexed by status and user_id, so
+    listing, HITL lookups and expiry touch only matching entries:
 
-    Stores recently created/active jobs in memory for fast access.
-    Automatically expires entries older than TTL.
+    - Jobs expire `ttl_minutes` after their last write, except jobs waiting
+      for a human: their workflow blocks on the cached `hitl_event`, so they
+      are kept for `hitl_ttl_hours`.
+    - Beyond `max_jobs`, the least recently written jobs are evicted (jobs
+      waiting for a human only once no other job is left to evict).
+
+    Indexes are refreshed whenever a job is stored (`set`/`put`) and whenever
+    the `status` or `user_id` of a cached job is assigned in place, so lookups
+    see every job under its current status.
+
+    All operations are synchronous and run on the event loop thread; the
+    async methods are kept for the JobManager call sites.
     """
 
-    def __init__(self, ttl_minutes: int = 60):
+    def __init__(self, ttl_minutes: int = 60, *, max_jobs: int = 1000, hitl_ttl_hours: int = 24):
         """
         Initialize memory store.
 
         Args:
-            ttl_minutes: Time-to-live for cached jobs (default: 60 minutes)
+            ttl_minutes: Time-to-live for cached jobs after their last write
+            max_jobs: Maximum number of cached jobs
+            hitl_ttl_hours: Time-to-live of jobs waiting for a human response
 
         """
         self.ttl_minutes = ttl_minutes
-        self.store: dict[str, tuple[JobState, datetime]] = {}
-        self._lock = asyncio.Lock()
+        self.max_jobs = max_jobs
+        self.hitl_ttl_hours = hitl_ttl_hours
+        self.store: OrderedDict[str, tuple[JobState, datetime]] = OrderedDict()
+        self._by_status: dict[str, set[str]] = defaultdict(set)
+        self._by_user: dict[str, set[str]] = defaultdict(set)
+        self._indexed: dict[str, tuple[str, str]] = {}
+
+    # Synchronous core
+
+    def peek(self, job_id: str) -> JobState | None:
+        """Get a cached job if it has not expired."""
+        entry = self.store.get(job_id)
+        if entry is None:
+            return None
+        job, written_at = entry
+        if self._expired(job, written_at, datetime.now(UTC)):
+            self.discard(job_id)
+            logger.debug(f"Job {job_id} expired from memory cache")
+            return None
+        return job
+
+    def put(self, job_id: str, job: JobState) -> None:
+        """Cache a job (or refresh its write time and indexes)."""
+        self.store[job_id] = (job, datetime.now(UTC))
+        self.store.move_to_end(job_id)
+        self._index(job_id, job)
+        job._index_listener = functools.partial(self._reindex, job_id)
+        if len(self.store) > self.max_jobs:
+            self._evict(len(self.store) - self.max_jobs)
+
+    def discard(self, job_id: str) -> bool:
+        """Remove a job; return whether it was cached."""
+        if self.store.pop(job_id, None) is None:
+            return False
+        status, user_id = self._indexed.pop(job_id)
+        self._unindex(self._by_status, status, job_id)
+        self._unindex(self._by_user, user_id, job_id)
+        return True
+
+    def prune(self) -> int:
+        """Remove expired jobs; return the count."""
+        now = datetime.now(UTC)
+        cutoff = now - timedelta(minutes=self.ttl_minutes)
+        expired = []
+        # Write order: stop at the first job written within the TTL
+        for job_id, (job, written_at) in self.store.items():
+            if written_at > cutoff:
+                break
+            if self._expired(job, written_at, now):
+                expired.append(job_id)
+        for job_id in expired:
+            self.discard(job_id)
+        return len(expired)
+
+    def find(
+        self, *, statuses: Collection[str] | None = None, user_id: str | None = None
+    ) -> list[JobState]:
+        """
+        Cached jobs matching every given filter, oldest write first.
+
+        Args:
+            statuses: Job statuses to include (None = any)
+            user_id: Owner to include (None = any)
+
+        Returns:
+            Matching jobs (from the indexes, without scanning other jobs)
+
+        """
+        if statuses is not None:
+            candidates = set().union(*(self._by_status.get(s, ()) for s in statuses))
+            if user_id is not None:
+                candidates &= self._by_user.get(user_id, set())
+        elif user_id is not None:
+            candidates = self._by_user.get(user_id, set()).copy()
+        else:
+            candidates = set(self.store)
+
+        jobs = [job for job in map(self.peek, candidates) if job is not None]
+        return sorted(jobs, key=lambda job: self.store[job.job_id][1])
+
+    def pending_hitl(self, user_id: str | None = None) -> list[JobState]:
+        """Cached jobs waiting for a human response."""
+        return self.find(statuses=HITL_WAITING_STATUSES, user_id=user_id)
+
+    def __contains__(self, job_id: str) -> bool:
+        """Whether a job is cached (and not expired)."""
+        return self.peek(job_id) is not None
+
+    def __len__(self) -> int:
+        """Return the number of cached jobs (including not yet pruned expired ones)."""
+        return len(self.store)
+
+    # Async API used by JobManager
 
     async def set(self, job_id: str, job: JobState) -> None:
         """
@@ -73,8 +239,7 @@ class JobMemoryStore:
             job: JobState instance
 
         """
-        async with self._lock:
-            self.store[job_id] = (job, datetime.now(UTC))
+        self.put(job_id, job)
 
     async def get(self, job_id: str) -> JobState | None:
         """
@@ -87,20 +252,7 @@ class JobMemoryStore:
             JobState if found and not expired, None otherwise
 
         """
-        async with self._lock:
-            if job_id not in self.store:
-                return None
-
-            job, created_at = self.store[job_id]
-            age = datetime.now(UTC) - created_at
-
-            if age > timedelta(minutes=self.ttl_minutes):
-                # Expired: remove from memory
-                del self.store[job_id]
-                logger.debug(f"Job {job_id} expired from memory cache (age: {age})")
-                return None
-
-            return job
+        return self.peek(job_id)
 
     async def delete(self, job_id: str) -> bool:
         """
@@ -113,11 +265,7 @@ class JobMemoryStore:
             True if job was deleted, False if not found
 
         """
-        async with self._lock:
-            if job_id in self.store:
-                del self.store[job_id]
-                return True
-            return False
+        return self.discard(job_id)
 
     async def cleanup_expired(self) -> int:
         """
@@ -129,17 +277,7 @@ class JobMemoryStore:
             Number of jobs removed
 
         """
-        async with self._lock:
-            expired_ids = [
-                job_id
-                for job_id, (_, created_at) in self.store.items()
-                if datetime.now(UTC) - created_at > timedelta(minutes=self.ttl_minutes)
-            ]
-
-            for job_id in expired_ids:
-                del self.store[job_id]
-
-            return len(expired_ids)
+        return self.prune()
 
     async def clear(self) -> int:
         """
@@ -149,10 +287,57 @@ class JobMemoryStore:
             Number of jobs cleared
 
         """
-        async with self._lock:
-            count = len(self.store)
-            self.store.clear()
-            return count
+        count = len(self.store)
+        self.store.clear()
+        self._by_status.clear()
+        self._by_user.clear()
+        self._indexed.clear()
+        return count
+
+    # Private helpers
+
+    def _evict(self, count: int) -> None:
+        """Evict the `count` least recently written jobs, sparing HITL waiters."""
+        waiting = self._by_status.keys() & HITL_WAITING_STATUSES
+        spared = set().union(*(self._by_status[s] for s in waiting))
+        victims = list(islice((job_id for job_id in self.store if job_id not in spared), count))
+        if len(victims) < count:
+            victims += list(
+                islice((job_id for job_id in self.store if job_id in spared), count - len(victims))
+            )
+        for job_id in victims:
+            self.discard(job_id)
+
+    def _expired(self, job: JobState, written_at: datetime, now: datetime) -> bool:
+        if job.status in HITL_WAITING_STATUSES:
+            return now - written_at > timedelta(hours=self.hitl_ttl_hours)
+        return now - written_at > timedelta(minutes=self.ttl_minutes)
+
+    def _reindex(self, job_id: str, job: JobState) -> None:
+        """Follow an in-place status/user_id change of a cached job."""
+        entry = self.store.get(job_id)
+        if entry is not None and entry[0] is job:
+            self._index(job_id, job)
+
+    def _index(self, job_id: str, job: JobState) -> None:
+        key = (job.status, job.user_id)
+        previous = self._indexed.get(job_id)
+        if previous == key:
+            return
+        if previous is not None:
+            self._unindex(self._by_status, previous[0], job_id)
+            self._unindex(self._by_user, previous[1], job_id)
+        self._indexed[job_id] = key
+        self._by_status[key[0]].add(job_id)
+        self._by_user[key[1]].add(job_id)
+
+    @staticmethod
+    def _unindex(index: dict[str, builtins.set[str]], value: str, job_id: str) -> None:
+        ids = index.get(value)
+        if ids is not None:
+            ids.discard(job_id)
+            if not ids:
+                del index[value]
 
 
 class JobManager:
@@ -176,20 +361,114 @@ class JobManager:
         """
         self.memory = memory_store or JobMemoryStore(ttl_minutes=60)
         self.persistence_enabled = False
+        self.write_queue: JobWriteBehindQueue | None = None
+        self.blob_store: BlobStore | None = None
+        self.blob_threshold = 0
+        self._observers: list[JobObserver] = []
         self._lock = asyncio.Lock()
+        self._loading: dict[str, asyncio.Future[JobState | None]] = {}
 
     def enable_persistence(self) -> None:
         """Enable database persistence using transactional sessions."""
         self.persistence_enabled = True
         logger.info("JobManager persistence enabled (using transactional sessions)")
 
+    def enable_blob_offload(self, store: BlobStore, *, threshold: int = 64 * 1024) -> None:
+        """
+        Store large JSON payloads in a blob store instead of the `jobs` row.
+
+        Args:
+            store: Blob store shared by every process reading the jobs table
+            threshold: Serialized payload size (bytes) from which it is offloaded
+
+        """
+        self.blob_store = store
+        self.blob_threshold = threshold
+        logger.info(f"Job payloads of {threshold} bytes or more are stored as blobs")
+
+    def start_write_behind(self, **queue_options: Any) -> JobWriteBehindQueue:
+        """
+        Route job writes through a write-behind queue flushed on the async engine.
+
+        Must be called from a running event loop after `enable_persistence()`.
+
+        Args:
+            **queue_options: JobWriteBehindQueue options (flush_interval,
+                max_batch, max_pending, ...)
+
+        Returns:
+            The started queue
+
+        """
+        if self.write_queue is None:
+            self.write_queue = JobWriteBehindQueue(self._write_jobs_async, **queue_options)
+        self.write_queue.start()
+        logger.info("JobManager write-behind persistence started")
+        return self.write_queue
+
+    async def stop_write_behind(self) -> None:
+        """Flush pending job writes and stop the write-behind queue."""
+        if self.write_queue is not None:
+            queue, self.write_queue = self.write_queue, None
+            await queue.stop()
+            logger.info("JobManager write-behind persistence stopped")
+
+    def add_observer(self, observer: JobObserver) -> None:
+        """
+        Call `observer(job, changed_fields)` after every job update or save.
+
+        Observers run synchronously on the event loop and must not block.
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer: JobObserver) -> None:
+        """Stop calling an observer added with `add_observer()`."""
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    async def apply_remote_update(self, job_id: str, values: dict[str, Any]) -> JobState | None:
+        """
+        Mirror field values another process has already persisted.
+
+        Only a job cached in memory is updated (others are loaded from the
+        database when next requested). Nothing is written and observers are
+        not called.
+
+        Args:
+            job_id: Job identifier
+            values: Changed field values (JSON-compatible)
+
+        Returns:
+            The updated cached job, or None if it is not cached
+
+        """
+        job = await self.memory.get(job_id)
+        if job is not None:
+            job.apply_persisted(values)
+        return job
+
+    def get_persistence_stats(self) -> dict[str, Any]:
+        """
+        Get write-behind queue metrics.
+
+        Returns:
+            Queue depth, coalescing, batch and backpressure counters, or
+            `{"mode": "direct"}` when writes are not queued
+
+        """
+        if self.write_queue is None:
+            return {"mode": "direct" if self.persistence_enabled else "memory"}
+        return {"mode": "write_behind", **self.write_queue.get_stats()}
+
     async def get_job(self, job_id: str) -> JobState | None:
         """
         Retrieve job from memory (fast), fall back to DB (durable).
 
         Implements two-tier lookup with proper locking to prevent race conditions:
         1. Check memory cache first (fastest)
-        2. Fall back to database (durable)
+        2. Fall back to database (durable), reading the row and its offloaded
+           payloads in a worker thread; concurrent lookups of the same job
+           share one load, and lookups of other jobs are not held up
         3. Warm memory cache on DB hit
 
         Args:
@@ -216,26 +495,49 @@ class JobManager:
                 if job:
                     logger.debug(f"Job {safe_job_id} retrieved from memory cache (after lock)")
                     return job
+                loading = self._loading.get(job_id)
+                if loading is None:
+                    loading = asyncio.ensure_future(self._load_job(job_id))
+                    self._loading[job_id] = loading
+                    loading.add_done_callback(functools.partial(self._load_finished, job_id))
 
-                try:
-                    with transactional_session() as db:
-                        repo = JobRepository(db)
-                        db_job = repo.get_by_id(UUID(job_id))
-                        if db_job:
-                            # Reconstruct JobState from DB model
-                            job_state = self._db_to_memory(db_job)
-                            # Cache result (safe because we hold the lock)
-                            await self.memory.set(job_id, job_state)
-                            logger.info(f"Job {safe_job_id} loaded from database and cached")
-                            return job_state
-                except ValueError as e:
-                    logger.warning(f"Invalid UUID for job {safe_job_id}: {e}")
-                except Exception as e:
-                    logger.error(f"Unexpected error loading job {safe_job_id} from database: {e}")
+            job = await asyncio.shield(loading)
+            if job is not None:
+                return job
 
         logger.warning(f"Job {safe_job_id} not found in memory or database")
         return None
 
+    async def _load_job(self, job_id: str) -> JobState | None:
+        """Load a job from the database off the event loop and cache it."""
+        job_state = await asyncio.to_thread(self._read_job_from_db, job_id)
+        if job_state is None:
+            return None
+        # A job stored while the row was loading is newer than the row
+        cached = self.memory.peek(job_id)
+        if cached is not None:
+            return cached
+        await self.memory.set(job_id, job_state)
+        logger.info(f"Job {sanitize_for_log(job_id)} loaded from database and cached")
+        return job_state
+
+    def _load_finished(self, job_id: str, loading: asyncio.Future[JobState | None]) -> None:
+        if self._loading.get(job_id) is loading:
+            del self._loading[job_id]
+
+    def _read_job_from_db(self, job_id: str) -> JobState | None:
+        """Internal: Read a job row and materialize its payloads (runs in a worker thread)."""
+        safe_job_id = sanitize_for_log(job_id)
+        try:
+            with transactional_session() as db:
+                db_job = JobRepository(db).get_by_id(UUID(job_id))
+                return self._db_to_memory(db_job) if db_job else None
+        except ValueError as e:
+            logger.warning(f"Invalid UUID for job {safe_job_id}: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error loading job {safe_job_id} from database: {e}")
+        return None
+
     async def create_job(self, job_state: JobState) -> None:
         """
         Create a new job (memory + DB).
@@ -256,7 +558,7 @@ class JobManager:
         # Persist to DB
         if self.persistence_enabled:
             try:
-                self._save_job_to_db(job_state)
+                await self._persist(job_state)
                 logger.info(f"Job {safe_job_id} created (memory + database)")
             except Exception as e:
                 logger.error(f"Failed to create job {safe_job_id} in database: {e}")
@@ -301,11 +603,12 @@ class JobManager:
         # Update memory first (always succeeds)
         await self.memory.set(job_id, job)
         logger.debug(f"Job {safe_job_id} updated in memory")
+        self._notify(job, frozenset(updates).intersection(type(job).model_fields))
 
         # Attempt DB update with explicit failure handling
         if self.persistence_enabled:
             try:
-                self._save_job_to_db(job)
+                await self._persist(job)
                 logger.debug(f"Job {safe_job_id} updated in database")
             except ValueError as e:
                 logger.error(f"Validation failed updating job {safe_job_id}: {e}")
@@ -329,10 +632,11 @@ class JobManager:
         """
         safe_job_id = sanitize_for_log(job.job_id)
         await self.memory.set(job.job_id, job)
+        self._notify(job, job.dirty_fields)
 
         if self.persistence_enabled:
             try:
-                self._save_job_to_db(job)
+                await self._persist(job, durable=True)
                 logger.info(f"Job {safe_job_id} explicitly saved to database")
                 return True
             except Exception as e:
@@ -341,6 +645,53 @@ class JobManager:
 
         return True
 
+    async def list_job_summaries(
+        self,
+        *,
+        job_ids: Collection[str] | None = None,
+        statuses: Collection[str] | None = None,
+        user_id: str | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        List lightweight job summaries, newest first, one page at a time.
+
+        Cached jobs are listed from the cache indexes with their live fields
+        (the cache is ahead of the database while writes are queued, or before
+        a new job's row is inserted). With persistence, the remaining jobs come
+        from a column-restricted database query, and both sources are merged
+        before the page is cut, so filters apply to live values and full pages
+        stay full.
+
+        Args:
+            job_ids: Only these jobs
+            statuses: Only jobs in one of these statuses
+            user_id: Only jobs of this user
+            cursor: `next_cursor` of the previous page
+            limit: Maximum number of summaries
+
+        Returns:
+            Summaries (`JobRepository.SUMMARY_COLUMNS` keys) and the cursor of
+            the next page (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+
+        """
+        statuses = set(statuses) if statuses else None
+        after = _decode_cursor(cursor) if cursor else None
+        rows = self._list_summaries_cached(job_ids, statuses, user_id, after, limit + 1)
+        if self.persistence_enabled:
+            rows += await self._list_uncached_summaries_db(
+                job_ids, statuses, user_id, after, limit + 1
+            )
+            rows.sort(key=_cursor_key, reverse=True)
+
+        page = rows[:limit]
+        next_cursor = _encode_cursor(page[-1]) if len(rows) > limit else None
+        return page, next_cursor
+
     async def delete_job(self, job_id: str) -> bool:
         """
         Delete job from memory (database deletion TBD).
@@ -368,6 +719,169 @@ class JobManager:
 
     # Private methods
 
+    def _notify(self, job: JobState, fields: frozenset[str]) -> None:
+        """Tell observers which fields of a job changed."""
+        if not fields:
+            return
+        for observer in self._observers:
+            try:
+                observer(job, fields)
+            except Exception as e:
+                logger.warning(f"Job observer failed for job {sanitize_for_log(job.job_id)}: {e}")
+
+    async def _persist(self, job: JobState, *, durable: bool = False) -> None:
+        """
+        Write a job to the database without blocking the event loop.
+
+        With the write-behind queue, non-terminal updates are only enqueued;
+        terminal states (and `durable=True`) wait for the commit and fall back
+        to a direct write if the queued write fails.
+
+        Args:
+            job: JobState to persist
+            durable: Wait until the row is committed
+
+        """
+        if job.status not in VALID_STATUSES:
+            raise ValueError(f"Invalid job status: {job.status}. Must be one of {VALID_STATUSES}")
+
+        queue = self.write_queue
+        if queue is None:
+            await asyncio.to_thread(self._save_job_to_db, job)
+            return
+        if not (durable or job.status in TERMINAL_STATUSES):
+            await queue.enqueue(job)
+            return
+        try:
+            await queue.persist(job)
+        except Exception as e:
+            logger.warning(f"Queued write of job {job.job_id} failed, writing directly: {e}")
+            await asyncio.to_thread(self._save_job_to_db, job)
+
+    def _job_row(self, job: JobState, fields: Collection[str] | None = None) -> dict[str, Any]:
+        """
+        Build `jobs` column values for a JobState.
+
+        Args:
+            job: JobState to serialize
+            fields: Changed JobState fields; only their columns are built (JSON
+                payloads are not serialized unless changed). None builds the
+                full row for an INSERT.
+
+        Returns:
+            Column values keyed by column name, always including `job_id`
+
+        """
+        names = PERSISTED_FIELDS if fields is None else PERSISTED_FIELDS.intersection(fields)
+        job_data: dict[str, Any] = {"job_id": UUID(job.job_id)}
+        for name in names:
+            value = getattr(job, name, None)
+            job_data[name] = self._serialize_payload(value) if name in JSON_FIELDS else value
+
+        if fields is None:
+            job_data["updated_at"] = job.updated_at or datetime.now(UTC)
+            # Filter out None values for optional fields
+            return {k: v for k, v in job_data.items() if v is not None or k == "error"}
+        if "updated_at" in fields:
+            job_data["updated_at"] = job.updated_at
+        # Explicit None clears a column, except for NOT NULL ones
+        return {k: v for k, v in job_data.items() if v is not None or k not in NOT_NULL_FIELDS}
+
+    def _changed_row(self, job: JobState, dirty: set[str]) -> dict[str, Any] | None:
+        """
+        Build the UPDATE values for a job's changed fields.
+
+        Args:
+            job: JobState to serialize
+            dirty: Fields changed since the last write
+
+        Returns:
+            Column values (with `job_id`), or None if no persisted column changed
+
+        """
+        row = self._job_row(job, dirty)
+        return row if len(row) > 1 else None
+
+    async def _write_jobs_async(self, jobs: list[JobState]) -> None:
+        """
+        Internal: Upsert a batch of jobs in one transaction on the async engine.
+
+        Existing rows get an UPDATE of only the columns whose fields changed
+        since the last write; new rows are inserted in full as upserts, so a
+        row another process (e.g. a `skill-fleet worker`) inserts after the
+        existence check is overwritten instead of failing the batch. Jobs with
+        an invalid status or ID are logged and skipped so they cannot block
+        the rest of the batch. If the transaction fails, change tracking is
+        restored so the next attempt writes the same columns.
+
+        Args:
+            jobs: Jobs to write (one entry per job)
+
+        """
+        from sqlalchemy import select, update
+
+        from ...infrastructure.db.database import get_database_state
+        from ...infrastructure.db.models import Job
+
+        taken: list[tuple[JobState, set[str]]] = []
+        for job in jobs:
+            if job.status not in VALID_STATUSES:
+                logger.error(
+                    f"Skipping persistence of job {sanitize_for_log(job.job_id)}: "
+                    f"invalid status {job.status}"
+                )
+                continue
+            dirty = job.take_dirty()
+            if dirty:
+                taken.append((job, dirty))
+        if not taken:
+            return
+
+        try:
+            state = get_database_state()
+            ids = [UUID(job.job_id) for job, _ in taken]
+            async with state.async_session_factory() as session:
+                existing = set(
+                    (await session.execute(select(Job.job_id).where(Job.job_id.in_(ids)))).scalars()
+                )
+            # Serializing (and offloading) large payloads blocks; keep it off the loop
+            inserts, updates = await asyncio.to_thread(self._batch_rows, taken, existing)
+            dialect = state.async_engine.dialect.name
+            async with state.async_session_factory() as session, session.begin():
+                for row in inserts:
+                    await session.execute(_insert_job(dialect, row))
+                for job_uuid, row in updates:
+                    await session.execute(update(Job).where(Job.job_id == job_uuid).values(**row))
+        except BaseException:  # Cancellation rolls the transaction back too
+            for job, dirty in taken:
+                job.mark_dirty(*dirty)
+            raise
+
+    def _batch_rows(
+        self, taken: list[tuple[JobState, set[str]]], existing: set[UUID]
+    ) -> tuple[list[dict[str, Any]], list[tuple[UUID, dict[str, Any]]]]:
+        """
+        Internal: Build INSERT rows and column UPDATEs for a batch (runs in a worker thread).
+
+        Args:
+            taken: Jobs with the fields changed since their last write
+            existing: IDs of jobs that already have a row
+
+        Returns:
+            Full rows of new jobs, and (job_id, changed columns) of existing ones
+
+        """
+        inserts: list[dict[str, Any]] = []
+        updates: list[tuple[UUID, dict[str, Any]]] = []
+        for job, dirty in taken:
+            job_uuid = UUID(job.job_id)
+            if job_uuid not in existing:
+                inserts.append(self._job_row(job))
+            elif (row := self._changed_row(job, dirty)) is not None:
+                row.pop("job_id")
+                updates.append((job_uuid, row))
+        return inserts, updates
+
     def _coerce_job_result(self, result: Any) -> Any:
         """
         Coerce persisted result payloads back into richer in-memory objects.
@@ -393,6 +907,89 @@ class JobManager:
         except Exception:
             return result
 
+    def _list_summaries_db(
+        self,
+        job_ids: Collection[str] | None,
+        statuses: set[str] | None,
+        user_id: str | None,
+        after: tuple[datetime, str] | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Internal: Query one page of job summaries (runs in a worker thread)."""
+        uuids = None
+        if job_ids is not None:
+            uuids = []
+            for job_id in dict.fromkeys(job_ids):
+                try:
+                    uuids.append(UUID(job_id))
+                except ValueError:
+                    continue  # Never persisted
+        cursor = None if after is None else (after[0], UUID(after[1]))
+        with transactional_session() as db:
+            rows = JobRepository(db).list_summaries(
+                job_ids=uuids,
+                statuses=sorted(statuses) if statuses else None,
+                user_id=user_id,
+                after=cursor,
+                limit=limit,
+            )
+        for row in rows:
+            row["job_id"] = str(row["job_id"])
+        return rows
+
+    async def _list_uncached_summaries_db(
+        self,
+        job_ids: Collection[str] | None,
+        statuses: set[str] | None,
+        user_id: str | None,
+        after: tuple[datetime, str] | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """
+        Internal: Up to `limit` database summaries of jobs that are not cached.
+
+        Rows of cached jobs are skipped (their live summaries come from the
+        cache), so further pages are read until `limit` rows are left or the
+        query is exhausted.
+        """
+        rows: list[dict[str, Any]] = []
+        while True:
+            batch = await asyncio.to_thread(
+                self._list_summaries_db, job_ids, statuses, user_id, after, limit
+            )
+            rows += [row for row in batch if row["job_id"] not in self.memory]
+            if len(batch) < limit or len(rows) >= limit:
+                return rows[:limit]
+            after = _cursor_key(batch[-1])
+
+    def _list_summaries_cached(
+        self,
+        job_ids: Collection[str] | None,
+        statuses: set[str] | None,
+        user_id: str | None,
+        after: tuple[datetime, str] | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Internal: One page of job summaries from the memory cache."""
+        if job_ids is None:
+            jobs = self.memory.find(statuses=statuses, user_id=user_id)
+        else:
+            jobs = [
+                job
+                for job in map(self.memory.peek, dict.fromkeys(job_ids))
+                if job is not None
+                and (statuses is None or job.status in statuses)
+                and (user_id is None or job.user_id == user_id)
+            ]
+        rows = [
+            {name: getattr(job, name, None) for name in JobRepository.SUMMARY_COLUMNS}
+            for job in jobs
+        ]
+        rows.sort(key=_cursor_key, reverse=True)
+        if after is not None:
+            rows = [row for row in rows if _cursor_key(row) < after]
+        return rows[:limit]
+
     def _save_job_to_db(self, job: JobState) -> None:
         """
         Internal: Save JobState to database.
@@ -414,46 +1011,31 @@ class JobManager:
         if job.status not in VALID_STATUSES:
             raise ValueError(f"Invalid job status: {job.status}. Must be one of {VALID_STATUSES}")
 
+        dirty = job.take_dirty()
+        row = self._changed_row(job, dirty)
+        if row is None:
+            return
+
         # Use short-lived transaction
-        with transactional_session() as db:
-            repo = JobRepository(db)
-            try:
-                # Build job data for database
-                job_data = {
-                    "job_id": UUID(job.job_id),
-                    "status": job.status,
-                    "task_description": getattr(job, "task_description", ""),
-                    "progress_percent": getattr(job, "progress_percent", 0.0),
-                    "result": self._serialize_json(job.result),
-                    "error": job.error,
-                    "error_stack": getattr(job, "error_stack", None),
-                    "progress_message": getattr(job, "progress_message", None),
-                    "current_phase": getattr(job, "current_phase", None),
-                    "hitl_type": getattr(job, "hitl_type", None),
-                    "hitl_data": self._serialize_json(getattr(job, "hitl_data", None)),
-                    "updated_at": job.updated_at or datetime.now(UTC),
-                    "started_at": getattr(job, "started_at", None),
-                    "completed_at": getattr(job, "completed_at", None),
-                }
-
-                # Filter out None values for optional fields
-                job_data = {
-                    k: v
-                    for k, v in job_data.items()
-                    if v is not None or k in ["error", "error_stack"]
-                }
-
-                # Try to fetch existing job
-                existing = repo.get_by_id(UUID(job.job_id))
-                if existing:
-                    repo.update(db_obj=existing, obj_in=job_data)
-                    logger.debug(f"Job {job.job_id} updated in database")
+        try:
+            with transactional_session() as db:
+                repo = JobRepository(db)
+                job_uuid = row.pop("job_id")
+                # Never-written jobs have every field dirty: check for the row
+                # instead of issuing an UPDATE that would match nothing
+                if dirty.issuperset(type(job).model_fields) and repo.get_by_id(job_uuid) is None:
+                    repo.create(obj_in=self._job_row(job))
+                    logger.debug(f"Job {job.job_id} created in database")
+                # Column-targeted UPDATE of changed fields; INSERT if the row is gone
+                elif repo.update_columns(job_uuid, row):
+                    logger.debug(f"Job {job.job_id} updated in database ({sorted(row)})")
                 else:
-                    repo.create(obj_in=job_data)
+                    repo.create(obj_in=self._job_row(job))
                     logger.debug(f"Job {job.job_id} created in database")
-            except Exception as e:
-                logger.error(f"Database upsert failed for job {job.job_id}: {e}")
-                raise
+        except Exception as e:
+            job.mark_dirty(*dirty)
+            logger.error(f"Database upsert failed for job {job.job_id}: {e}")
+            raise
 
     def _serialize_json(self, obj: Any) -> dict | None:
         """
@@ -478,6 +1060,21 @@ class JobManager:
             logger.warning(f"Failed to serialize object: {e}")
             return {}
 
+    def _serialize_payload(self, value: Any) -> Any:
+        """Serialize a JSON payload column, offloading it to blobs when large."""
+        data = self._serialize_json(value)
+        if self.blob_store is None or data is None:
+            return data
+        return offload_json(data, self.blob_store, threshold=self.blob_threshold)
+
+    def _load_payload(self, job_id: str, name: str, value: Any) -> Any:
+        """Materialize a JSON payload column that may hold a blob reference."""
+        try:
+            return load_json(value, self.blob_store)
+        except BlobNotFoundError as e:
+            logger.error(f"Missing {name} blob {e} of job {sanitize_for_log(job_id)}")
+            return None
+
     def _db_to_memory(self, db_job: Any) -> JobState:
         """
         Internal: Reconstruct JobState from database model.
@@ -496,13 +1093,29 @@ class JobManager:
         job_state.status = getattr(db_job, "status", "pending")
         job_state.task_description = getattr(db_job, "task_description", "")
         job_state.user_id = getattr(db_job, "user_id", "default")
-        job_state.result = self._coerce_job_result(getattr(db_job, "result", None))
+        job_state.result = self._coerce_job_result(
+            self._load_payload(job_id, "result", getattr(db_job, "result", None))
+        )
         job_state.error = getattr(db_job, "error", None)
+        created_at = getattr(db_job, "created_at", None)
+        if created_at is not None:
+            # Keeps cached jobs in the same (created_at, job_id) order as their rows
+            job_state.created_at = _as_utc(created_at)
         job_state.updated_at = getattr(db_job, "updated_at", None) or datetime.now(UTC)
 
         # Restore HITL fields
         job_state.hitl_type = getattr(db_job, "hitl_type", None)
-        job_state.hitl_data = getattr(db_job, "hitl_data", None)
+        job_state.hitl_data = self._load_payload(
+            job_id, "hitl_data", getattr(db_job, "hitl_data", None)
+        )
+
+        # Restore resumption state
+        job_state.user_context = (
+            self._load_payload(job_id, "user_context", getattr(db_job, "user_context", None)) or {}
+        )
+        job_state.checkpoint = self._load_payload(
+            job_id, "checkpoint", getattr(db_job, "checkpoint", None)
+        )
 
         # Restore nested state objects if present
         if hasattr(db_job, "deep_understanding_state") and db_job.deep_understanding_state:
@@ -538,9 +1151,54 @@ class JobManager:
         job_state.hitl_event = asyncio.Event()
         job_state.hitl_lock = asyncio.Lock()
 
+        # Loaded state matches the row; only later changes need writing
+        job_state.take_dirty()
         return job_state
 
 
+def _insert_job(dialect: str, row: dict[str, Any]) -> Any:
+    """INSERT of a full job row that updates the row instead if it already exists."""
+    from ...infrastructure.db.models import Job
+
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy import insert
+
+        return insert(Job).values(**row)
+    stmt = insert(Job).values(**row)
+    return stmt.on_conflict_do_update(
+        index_elements=[Job.job_id],
+        set_={name: stmt.excluded[name] for name in row if name != "job_id"},
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite returns naive timestamps; stored values are UTC
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+def _cursor_key(row: dict[str, Any]) -> tuple[datetime, str]:
+    return _as_utc(row["created_at"]), str(row["job_id"])
+
+
+def _encode_cursor(row: dict[str, Any]) -> str:
+    """Opaque keyset cursor pointing after `row`."""
+    created_at, job_id = _cursor_key(row)
+    key = [created_at.isoformat(), job_id]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        created_at, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return _as_utc(datetime.fromisoformat(created_at)), str(job_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid job list cursor") from e
+
+
 # Global instance
 _job_manager: JobManager | None = None
 
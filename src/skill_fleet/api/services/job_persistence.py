@@ -0,0 +1,266 @@
+"""
+Write-behind persistence queue for JobManager.
+
+Workflows update a job many times per run; writing each update through a
+synchronous session blocks the event loop for a database round trip. The
+queue instead records which jobs are dirty and a background task writes them
+in batches:
+
+- Coalescing: a job enqueued again before it is flushed is written once, with
+  its latest state (last write wins for every field).
+- Batching: up to `max_batch` jobs are written per transaction.
+- Durability: `persist()` waits until the job's row is committed; JobManager
+  uses it for terminal states so completed/failed/cancelled jobs are never
+  only in memory when the caller moves on.
+- Backpressure: at most `max_pending` distinct jobs may be waiting; further
+  enqueues wait for the flusher to catch up.
+
+`get_stats()` reports queue depth, coalescing, batch latency and how often
+callers were held back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from ..schemas.models import JobState
+
+logger = logging.getLogger(__name__)
+
+# Job statuses after which the job is never updated by its workflow again
+TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+
+class JobWriteBehindQueue:
+    """Coalescing, batched, bounded write-behind queue for job rows."""
+
+    def __init__(
+        self,
+        write_batch: Callable[[list[JobState]], Awaitable[None]],
+        *,
+        flush_interval: float = 0.25,
+        max_batch: int = 100,
+        max_pending: int = 1000,
+        max_retries: int = 3,
+        retry_backoff: float = 0.1,
+    ) -> None:
+        """
+        Initialize the queue (call `start()` to begin flushing).
+
+        Args:
+            write_batch: Coroutine writing a list of jobs in one transaction
+            flush_interval: Seconds updates are collected before a flush
+            max_batch: Maximum number of jobs written per transaction
+            max_pending: Maximum number of distinct jobs waiting to be written
+            max_retries: Attempts per batch before its jobs are requeued
+            retry_backoff: Initial delay between attempts (doubles each retry)
+
+        """
+        self._write_batch = write_batch
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self._pending: dict[str, JobState] = {}
+        self._waiters: dict[str, list[asyncio.Future[None]]] = {}
+        self._wakeup = asyncio.Event()
+        self._urgent = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+        self._stats: dict[str, Any] = {
+            "enqueued": 0,
+            "coalesced": 0,
+            "flushed": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "retries": 0,
+            "backpressure_waits": 0,
+            "durable_waits": 0,
+            "max_depth": 0,
+            "last_batch_size": 0,
+            "last_batch_ms": 0.0,
+        }
+
+    @property
+    def running(self) -> bool:
+        """Whether the background flusher is running."""
+        return self._task is not None and not self._task.done()
+
+    def __len__(self) -> int:
+        """Return the number of jobs waiting to be written."""
+        return len(self._pending)
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if not self.running:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="job-write-behind")
+
+    async def stop(self) -> None:
+        """Stop the flusher after writing everything still pending."""
+        if self._task is not None:
+            # Not cancelled: a batch being written must be committed or requeued
+            self._stopping.set()
+            self._urgent.set()
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+        if self._pending:
+            logger.error(f"{len(self._pending)} job update(s) could not be persisted at shutdown")
+        for waiters in self._waiters.values():
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(RuntimeError("Job persistence queue stopped"))
+        self._waiters.clear()
+
+    async def enqueue(self, job: JobState) -> None:
+        """
+        Mark a job dirty; its latest state is written by the next flush.
+
+        Waits (backpressure) while `max_pending` other jobs are queued.
+
+        Args:
+            job: Job to persist
+
+        """
+        self._stats["enqueued"] += 1
+        if job.job_id in self._pending:
+            self._pending[job.job_id] = job
+            self._stats["coalesced"] += 1
+            return
+
+        while len(self._pending) >= self.max_pending:
+            self._stats["backpressure_waits"] += 1
+            self._space.clear()
+            self._urgent.set()
+            self._wakeup.set()
+            await self._space.wait()
+            if job.job_id in self._pending:
+                self._pending[job.job_id] = job
+                self._stats["coalesced"] += 1
+                return
+
+        self._pending[job.job_id] = job
+        self._stats["max_depth"] = max(self._stats["max_depth"], len(self._pending))
+        self._wakeup.set()
+
+    async def persist(self, job: JobState) -> None:
+        """
+        Enqueue a job and wait until its current state is committed.
+
+        Args:
+            job: Job to persist
+
+        Raises:
+            Exception: The write error if the batch could not be committed
+
+        """
+        self._stats["durable_waits"] += 1
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(job.job_id, []).append(waiter)
+        await self.enqueue(job)
+        self._urgent.set()
+        self._wakeup.set()
+        if not self.running:
+            await self.flush()
+        await waiter
+
+    async def flush(self) -> None:
+        """Write everything pending now, in batches of `max_batch`."""
+        async with self._flush_lock:
+            while self._pending:
+                batch_ids = list(islice(self._pending, self.max_batch))
+                jobs = [self._pending.pop(job_id) for job_id in batch_ids]
+                waiters = [w for job_id in batch_ids for w in self._waiters.pop(job_id, [])]
+                self._space.set()
+
+                try:
+                    await self._write_with_retry(jobs)
+                except BaseException as e:
+                    # Includes cancellation: the transaction was rolled back,
+                    # so the jobs must stay pending
+                    self._stats["failed_batches"] += 1
+                    logger.error(f"Failed to persist {len(jobs)} job(s); requeued: {e!r}")
+                    for job in jobs:
+                        # A newer state may have been enqueued meanwhile; keep it.
+                        self._pending.setdefault(job.job_id, job)
+                    for waiter in waiters:
+                        if waiter.done():
+                            continue
+                        if isinstance(e, asyncio.CancelledError):
+                            waiter.cancel()
+                        else:
+                            waiter.set_exception(e)
+                    if not isinstance(e, Exception):
+                        raise
+                    break
+
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue depth, coalescing, batch latency and backpressure counters."""
+        return {
+            **self._stats,
+            "depth": len(self._pending),
+            "max_pending": self.max_pending,
+            "running": self.running,
+        }
+
+    async def _write_with_retry(self, jobs: list[JobState]) -> None:
+        """Write one batch, retrying transient failures with exponential backoff."""
+        for attempt in range(self.max_retries):
+            started = time.monotonic()
+            try:
+                await self._write_batch(jobs)
+            except Exception as e:
+                if attempt + 1 == self.max_retries:
+                    raise
+                self._stats["retries"] += 1
+                logger.warning(f"Job batch write failed (attempt {attempt + 1}), retrying: {e}")
+                await asyncio.sleep(self.retry_backoff * 2**attempt)
+                continue
+            self._stats["batches"] += 1
+            self._stats["flushed"] += len(jobs)
+            self._stats["last_batch_size"] = len(jobs)
+            self._stats["last_batch_ms"] = round((time.monotonic() - started) * 1000, 2)
+            return
+
+    async def _run(self) -> None:
+        """Flush pending jobs after each collection window (immediately when urgent)."""
+        while not self._stopping.is_set():
+            await self._wakeup.wait()
+            if not self._urgent.is_set():
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._urgent.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+            self._urgent.clear()
+            if self._stopping.is_set():
+                return  # stop() flushes what is left
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Job write-behind flush failed: {e}")
+            if self._pending:
+                # Failed batches were requeued; retry after the next window.
+                self._wakeup.set()
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.flush_interval)
+
+
+__all__ = ["TERMINAL_STATUSES", "JobWriteBehindQueue"]
@@ -0,0 +1,379 @@
+"""
+Database-backed skill creation queue and bounded worker pool.
+
+Submitting a job stores the creation request on the job row and makes it
+claimable. Workers (in the API process, or `skill-fleet worker`) claim jobs
+through `JobRepository.claim_queued()`:
+
+- PostgreSQL: `SELECT ... FOR UPDATE SKIP LOCKED`, so concurrent workers
+  never contend for the same row.
+- SQLite: a compare-and-swap on `lease_expires_at` (no row locks needed).
+
+A claimed job carries a lease that the worker renews (heartbeat) while it
+runs. If the process dies the lease expires and another worker, or the same
+service after a restart, claims the job again. `SkillService.create_skill`
+then resumes from the last checkpointed phase. Concurrency is bounded by
+`max_workers` per pool and by `per_user_limit` leased jobs per user across
+all workers. Users with fewer running jobs are served first.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from skill_fleet.common.logging_utils import sanitize_for_log
+
+from ...infrastructure.db.repositories import JobRepository
+from ...infrastructure.db.session import transactional_session
+from .job_manager import get_job_manager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ..config import APISettings
+    from ..schemas.skills import CreateSkillRequest
+    from .skill_service import SkillService
+
+logger = logging.getLogger(__name__)
+
+
+async def run_skill_creation_job(
+    skill_service: SkillService, job_id: str, request: CreateSkillRequest
+) -> None:
+    """
+    Run a skill creation job and record its final state.
+
+    Args:
+        skill_service: Service executing the workflow
+        job_id: Job identifier (the job must already exist)
+        request: Original creation request
+
+    """
+    from .jobs import update_job
+
+    try:
+        await update_job(job_id, {"status": "running"})
+        result = await skill_service.create_skill(request, existing_job_id=job_id)
+
+        # Update job status and result upon completion
+        # This ensures the job moves to a terminal state (completed or pending_review)
+        if result.status in ("completed", "pending_review"):
+            await update_job(
+                job_id,
+                {
+                    "status": result.status,
+                    "result": result,
+                    "progress_percent": 100.0,
+                    "progress_message": "Skill creation completed",
+                },
+            )
+
+        logger.info(f"Skill creation job {job_id} completed with status: {result.status}")
+    except Exception as e:
+        logger.error(f"Skill creation job {job_id} failed: {e}")
+        await update_job(job_id, {"status": "failed", "error": str(e)})
+
+
+def worker_identity() -> str:
+    """Build a lease owner ID unique to this process (host:pid:random)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobWorkerPool:
+    """Claims queued skill creation jobs and runs them with bounded concurrency."""
+
+    def __init__(
+        self,
+        service_factory: Callable[[], SkillService],
+        *,
+        max_workers: int = 4,
+        per_user_limit: int | None = 2,
+        lease_seconds: float = 60.0,
+        poll_interval: float = 2.0,
+        max_attempts: int = 3,
+        owner: str | None = None,
+    ) -> None:
+        """
+        Initialize the pool (call `start()` to begin claiming jobs).
+
+        Args:
+            service_factory: Creates the SkillService used for claimed jobs
+            max_workers: Maximum jobs run concurrently by this pool (0 only
+                enqueues, leaving execution to other workers)
+            per_user_limit: Maximum concurrently running jobs per user across
+                all workers (None = no cap)
+            lease_seconds: Lease duration; renewed every third of it
+            poll_interval: Seconds between queue polls when idle
+            max_attempts: Claims after which a job is marked failed instead of
+                being run again
+            owner: Lease owner ID (defaults to host:pid:random)
+
+        """
+        self._service_factory = service_factory
+        self.max_workers = max_workers
+        self.per_user_limit = per_user_limit
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.owner = owner or worker_identity()
+
+        self._service: SkillService | None = None
+        self._services: dict[str, SkillService] = {}
+        self._active: dict[str, asyncio.Task[None]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+        self._stats = {"claimed": 0, "completed": 0, "lost_leases": 0, "exhausted": 0}
+
+    @property
+    def running(self) -> bool:
+        """Whether the pool is claiming jobs."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start claiming jobs on the running event loop."""
+        if not self.running:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run(), name="job-worker-pool")
+            logger.info(
+                f"Job worker pool {self.owner} started "
+                f"(workers={self.max_workers}, per_user_limit={self.per_user_limit})"
+            )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop claiming, then cancel running jobs and hand them back to the queue.
+
+        Args:
+            timeout: Seconds to wait for running jobs to wind down
+
+        """
+        self._stopping = True
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        tasks = list(self._active.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks, timeout=timeout)
+        logger.info(f"Job worker pool {self.owner} stopped ({len(tasks)} job(s) requeued)")
+
+    async def submit(
+        self,
+        job_id: str,
+        request: CreateSkillRequest,
+        *,
+        skill_service: SkillService | None = None,
+    ) -> None:
+        """
+        Queue an existing job for execution.
+
+        Args:
+            job_id: Job identifier (created with `jobs.create_job`)
+            request: Creation request, stored on the row for resumption
+            skill_service: Service to run the job with if this pool claims it
+                (defaults to the pool's service)
+
+        """
+        manager = get_job_manager()
+        job = await manager.get_job(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        # The row must exist before it can be queued
+        if not await manager.save_job(job):
+            raise RuntimeError(f"Job {job_id} could not be persisted for queueing")
+
+        payload = request.model_dump(mode="json")
+        await asyncio.to_thread(self._db, lambda repo: repo.enqueue(job_id, payload))
+        if skill_service is not None and self.max_workers > 0:
+            self._services[job_id] = skill_service
+        self._wakeup.set()
+
+    def runs_job(self, job_id: str) -> bool:
+        """Whether this pool currently holds the lease of a job and runs it."""
+        return job_id in self._active
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return pool configuration, running jobs and claim counters."""
+        return {
+            **self._stats,
+            "owner": self.owner,
+            "running": len(self._active),
+            "max_workers": self.max_workers,
+            "per_user_limit": self.per_user_limit,
+        }
+
+    @staticmethod
+    def _db(operation: Callable[[JobRepository], Any]) -> Any:
+        """Run a repository operation in a short-lived transaction."""
+        with transactional_session() as db:
+            return operation(JobRepository(db))
+
+    async def _run(self) -> None:
+        """Claim jobs whenever workers are free; wake on submit, completion or poll."""
+        while True:
+            free = self.max_workers - len(self._active)
+            if free > 0:
+                try:
+                    claimed = await asyncio.to_thread(
+                        self._db,
+                        lambda repo, limit=free: repo.claim_queued(
+                            owner=self.owner,
+                            limit=limit,
+                            lease_seconds=self.lease_seconds,
+                            per_user_limit=self.per_user_limit,
+                        ),
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to claim queued jobs: {e}")
+                    claimed = []
+                for job in claimed:
+                    self._stats["claimed"] += 1
+                    self._active[job["job_id"]] = asyncio.create_task(
+                        self._execute(job), name=f"job-{job['job_id']}"
+                    )
+
+            self._wakeup.clear()
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+
+    async def _execute(self, job: dict[str, Any]) -> None:
+        """Run one claimed job while renewing its lease."""
+        from ..schemas.skills import CreateSkillRequest
+        from .jobs import update_job
+
+        job_id = job["job_id"]
+        safe_job_id = sanitize_for_log(job_id)
+        service = self._services.pop(job_id, None)
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, asyncio.current_task()))
+        requeue = False
+        try:
+            if job["attempts"] > self.max_attempts:
+                self._stats["exhausted"] += 1
+                await update_job(
+                    job_id,
+                    {"status": "failed", "error": f"Gave up after {self.max_attempts} attempts"},
+                )
+                return
+            if not job.get("request"):
+                await update_job(job_id, {"status": "failed", "error": "Queued without request"})
+                return
+
+            if job["attempts"] > 1:
+                logger.info(f"Resuming job {safe_job_id} (attempt {job['attempts']})")
+            request = CreateSkillRequest.model_validate(job["request"])
+            await run_skill_creation_job(service or self._default_service(), job_id, request)
+            self._stats["completed"] += 1
+        except asyncio.CancelledError:
+            # Shutdown (or lost lease): leave the job for the next claim
+            requeue = self._stopping
+            raise
+        finally:
+            heartbeat.cancel()
+            await self._release(job_id, requeue)
+            self._active.pop(job_id, None)
+            self._wakeup.set()
+
+    async def _release(self, job_id: str, requeue: bool) -> None:
+        """Release a lease, finishing the write even if `stop()` cancels the job meanwhile."""
+        release = asyncio.ensure_future(
+            asyncio.to_thread(
+                self._db, lambda repo: repo.release_lease(job_id, self.owner, requeue=requeue)
+            )
+        )
+        try:
+            try:
+                await asyncio.shield(release)
+            except asyncio.CancelledError:
+                await release
+        except Exception as e:
+            logger.warning(f"Failed to release lease of job {sanitize_for_log(job_id)}: {e}")
+
+    async def _heartbeat(self, job_id: str, task: asyncio.Task[Any] | None) -> None:
+        """Renew the lease every third of its duration; cancel the job if it was lost."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                held = await asyncio.to_thread(
+                    self._db, lambda repo: repo.renew_lease(job_id, self.owner, self.lease_seconds)
+                )
+            except Exception as e:
+                logger.warning(f"Lease heartbeat failed for job {sanitize_for_log(job_id)}: {e}")
+                continue
+            if not held:
+                self._stats["lost_leases"] += 1
+                logger.warning(f"Lost lease on job {sanitize_for_log(job_id)}; stopping it here")
+                if task is not None:
+                    task.cancel()
+                return
+
+    def _default_service(self) -> SkillService:
+        """Create the pool's SkillService on first use."""
+        if self._service is None:
+            self._service = self._service_factory()
+        return self._service
+
+
+def build_worker_pool(settings: APISettings) -> JobWorkerPool:
+    """
+    Create a pool configured from the `job_*` settings.
+
+    Claimed jobs run on a SkillService for the configured skills root.
+    """
+
+    def service_factory() -> SkillService:
+        from ..dependencies import get_skills_root
+        from .skill_service import SkillService
+
+        skills_root = get_skills_root()
+        return SkillService(skills_root=skills_root, drafts_root=skills_root / "_drafts")
+
+    return JobWorkerPool(
+        service_factory,
+        max_workers=settings.job_workers,
+        per_user_limit=settings.job_per_user_limit or None,
+        lease_seconds=settings.job_lease_seconds,
+        poll_interval=settings.job_poll_interval,
+        max_attempts=settings.job_max_attempts,
+    )
+
+
+# Global instance (set by the API lifespan or the worker CLI)
+_worker_pool: JobWorkerPool | None = None
+
+
+def get_worker_pool() -> JobWorkerPool | None:
+    """
+    Get the process-wide worker pool.
+
+    Returns:
+        The pool, or None when jobs are not queued (e.g. scripts and tests
+        that run the API without its lifespan)
+
+    """
+    return _worker_pool
+
+
+def set_worker_pool(pool: JobWorkerPool | None) -> None:
+    """Install (or clear) the process-wide worker pool."""
+    global _worker_pool
+    _worker_pool = pool
+
+
+__all__ = [
+    "JobWorkerPool",
+    "build_worker_pool",
+    "get_worker_pool",
+    "run_skill_creation_job",
+    "set_worker_pool",
+    "worker_identity",
+]
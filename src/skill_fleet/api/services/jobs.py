@@ -7,16 +7,18 @@ import json
 import logging
 import time
 import uuid
-from collections import OrderedDict
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from skill_fleet.common.logging_utils import sanitize_for_log
 
 from ...common.security import resolve_path_within_root
 from ..schemas.models import DeepUnderstandingState, JobState, TDDWorkflowState
 
+if TYPE_CHECKING:
+    from .job_manager import JobMemoryStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,107 +48,53 @@ def _resolve_session_file_path(canonical_job_id: str) -> Path:
     return resolve_path_within_root(SESSION_DIR, f"{canonical_job_id}.json")
 
 
-# In-memory job store with TTL eviction (use Redis in production)
-class JobStore:
+class JobCacheView:
     """
-    Job store with automatic TTL eviction and O(1) LRU using OrderedDict.
+    Dict-style access to the JobManager's job cache (`JobMemoryStore`).
 
-    Prevents memory leaks by evicting old jobs after MAX_AGE_HOURS.
-    Designed for asyncio context (single-threaded event loop).
+    Kept for code that indexes jobs synchronously by ID; there is no separate
+    store behind it, so every lookup sees the same JobState instances as
+    JobManager. Resolves the current global JobManager on each access.
     """
 
-    MAX_JOBS = 1000  # Maximum number of jobs to keep in memory
-    MAX_AGE_HOURS = 24  # Evict jobs older than this
-
-    def __init__(self):
-        # OrderedDict maintains insertion order - we use it for LRU
-        # Most recently accessed items are moved to the end
-        self._jobs: OrderedDict[str, JobState] = OrderedDict()
-        self._access_times: dict[str, float] = {}
-
-    def _evict_if_needed(self):
-        """Evict old jobs if we're over capacity or jobs are too old."""
-        now = time.time()
-        max_age_seconds = self.MAX_AGE_HOURS * 3600
-
-        # Evict by age
-        expired = [
-            job_id
-            for job_id, last_access in self._access_times.items()
-            if now - last_access > max_age_seconds
-        ]
-        for job_id in expired:
-            self._evict_job(job_id)
-
-        # Evict by count (LRU - evict least recently accessed)
-        # OrderedDict keeps items in access order, so oldest is at the beginning
-        while len(self._jobs) > self.MAX_JOBS and self._jobs:
-            oldest_job = next(iter(self._jobs))
-            self._evict_job(oldest_job)
-
-    def _evict_job(self, job_id: str):
-        """Remove a job from memory."""
-        self._jobs.pop(job_id, None)
-        self._access_times.pop(job_id, None)
-        logger.debug(f"Evicted job {job_id} from memory")
-
-    def _touch(self, job_id: str):
-        """Update access time and mark as recently used."""
-        self._access_times[job_id] = time.time()
-        # Move to end to mark as recently used (LRU)
-        if job_id in self._jobs:
-            self._jobs.move_to_end(job_id)
+    @staticmethod
+    def _cache() -> JobMemoryStore:
+        from .job_manager import get_job_manager
+
+        return get_job_manager().memory
 
     def __getitem__(self, job_id: str) -> JobState:
-        """Get job and update access time."""
-        self._touch(job_id)
-        return self._jobs[job_id]
+        """Get a cached job (KeyError if not cached)."""
+        job = self._cache().peek(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        return job
 
-    def __setitem__(self, job_id: str, job: JobState):
-        """Set job and update access time."""
-        self._evict_if_needed()
-        self._jobs[job_id] = job
-        self._access_times[job_id] = time.time()
-        self._jobs.move_to_end(job_id)
+    def __setitem__(self, job_id: str, job: JobState) -> None:
+        """Cache a job."""
+        self._cache().put(job_id, job)
 
     def __contains__(self, job_id: str) -> bool:
-        """Check if job exists."""
-        return job_id in self._jobs
-
-    def get(self, job_id: str, default=None):
-        """Get job with default."""
-        if job_id in self._jobs:
-            self._touch(job_id)
-            return self._jobs[job_id]
-        return default
-
-    def pop(self, job_id: str, default=None):
-        """Remove and return job."""
-        self._access_times.pop(job_id, None)
-        return self._jobs.pop(job_id, default)
-
-    def keys(self):
-        """Return job IDs."""
-        return self._jobs.keys()
+        """Check if a job is cached."""
+        return job_id in self._cache()
 
-    def items(self):
-        """Return job items."""
-        return self._jobs.items()
-
-    def values(self):
-        """Return job values."""
-        return self._jobs.values()
+    def __len__(self) -> int:
+        """Return number of cached jobs."""
+        return len(self._cache())
 
-    def __iter__(self):
-        """Iterate over job IDs."""
-        return iter(self._jobs)
+    def get(self, job_id: str, default: JobState | None = None) -> JobState | None:
+        """Get a cached job with default."""
+        job = self._cache().peek(job_id)
+        return default if job is None else job
 
-    def __len__(self) -> int:
-        """Return number of jobs."""
-        return len(self._jobs)
+    def pop(self, job_id: str, default: JobState | None = None) -> JobState | None:
+        """Remove and return a cached job."""
+        job = self.get(job_id)
+        self._cache().discard(job_id)
+        return default if job is None else job
 
 
-JOBS: JobStore = JobStore()
+JOBS = JobCacheView()
 
 
 async def create_job(task_description: str, user_id: str | None = None) -> str:
@@ -161,25 +109,16 @@ async def create_job(task_description: str, user_id: str | None = None) -> str:
         user_id=user_id or "default",
     )
 
-    # Register in both JOBS dict (for backward compat) and JobManager
-    JOBS[job_id] = job_state
-    manager = get_job_manager()
-    await manager.create_job(job_state)
+    await get_job_manager().create_job(job_state)
 
     return job_id
 
 
 async def get_job(job_id: str) -> JobState | None:
-    """Retrieve a job by its ID, loading from disk if necessary."""
-    job = JOBS.get(job_id)
-    if job:
-        return job
-
-    # Fallback to JobManager for persistence
+    """Retrieve a job by its ID (cache first, database on a miss)."""
     from .job_manager import get_job_manager
 
-    manager = get_job_manager()
-    return await manager.get_job(job_id)
+    return await get_job_manager().get_job(job_id)
 
 
 async def update_job(job_id: str, updates: dict[str, Any]) -> JobState | None:
@@ -196,11 +135,7 @@ async def update_job(job_id: str, updates: dict[str, Any]) -> JobState | None:
     """
     from .job_manager import get_job_manager
 
-    manager = get_job_manager()
-    updated_job = await manager.update_job(job_id, updates)
-    if updated_job:
-        JOBS[job_id] = updated_job
-    return updated_job
+    return await get_job_manager().update_job(job_id, updates)
 
 
 async def wait_for_hitl_response(job_id: str, timeout: float = 3600.0) -> dict[str, Any]:
@@ -211,15 +146,11 @@ async def wait_for_hitl_response(job_id: str, timeout: float = 3600.0) -> dict[s
     - unnecessary latency (poll interval)
     - duplicate prompts in clients that poll immediately after POSTing a response
 
-    Uses asyncio.Event on the JobState instance for atomic signaling.
+    Uses asyncio.Event on the cached JobState instance for atomic signaling.
     """
-    job = JOBS.get(job_id)
+    job = await get_job(job_id)
     if job is None:
-        # Fall back to JobManager-backed lookup (e.g., tests that only use JobManager).
-        job = await get_job(job_id)
-        if job is None:
-            raise KeyError(job_id)
-        JOBS[job_id] = job
+        raise KeyError(job_id)
 
     # Ensure event is initialized (handles loaded sessions)
     if job.hitl_event is None:
@@ -253,40 +184,31 @@ async def notify_hitl_response(job_id: str, response: dict[str, Any]) -> None:
     Notify the in-flight HITL waiter that a response arrived.
 
     This is race-safe: the response is stored before setting the event,
-    ensuring that any waiters will see the new response.
+    ensuring that any waiters will see the new response. When a job event
+    relay is running, the response is also sent to the worker process that
+    runs the job.
     """
-    # Prefer the in-memory JOBS object for signaling, since wait_for_hitl_response()
-    # blocks on JOBS[job_id].hitl_event. JobManager may return a distinct instance
-    # in some persistence paths, so we ensure both are updated.
-    job = JOBS.get(job_id)
-
-    if job is not None:
-        if job.hitl_event is None:
-            job.hitl_event = asyncio.Event()
-        job.hitl_response = response
-        job.hitl_event.set()
-        job.updated_at = datetime.now(UTC)
+    from .job_events import get_job_event_relay
 
+    relay = get_job_event_relay()
+    if relay is not None:
+        relay.publish_hitl_response(job_id, response)
+    await deliver_hitl_response(job_id, response)
+
+
+async def deliver_hitl_response(job_id: str, response: dict[str, Any]) -> None:
+    """Signal a HITL response to waiters in this process (see `notify_hitl_response`)."""
     from .job_manager import get_job_manager
 
+    # One cache holds the instance wait_for_hitl_response() blocks on
     manager = get_job_manager()
-    job_manager_job = await manager.get_job(job_id)
-    if job_manager_job is None:
+    job = await manager.get_job(job_id)
+    if job is None:
         return
-
-    if job_manager_job.hitl_event is None:
-        job_manager_job.hitl_event = asyncio.Event()
-    job_manager_job.hitl_response = response
-    job_manager_job.hitl_event.set()
-    job_manager_job.updated_at = datetime.now(UTC)
-
-    # Keep JOBS in sync even if it didn't exist (e.g., loaded from DB-only paths).
-    JOBS[job_id] = job_manager_job
-
-    await manager.update_job(
-        job_id,
-        {"updated_at": job_manager_job.updated_at, "hitl_response": response},
-    )
+    if job.hitl_event is None:
+        job.hitl_event = asyncio.Event()
+    await manager.update_job(job_id, {"hitl_response": response, "updated_at": datetime.now(UTC)})
+    job.hitl_event.set()
 
 
 # =============================================================================
@@ -534,7 +456,9 @@ def cleanup_old_sessions(max_age_hours: float = 24.0) -> int:
         logger.debug("Failed to cleanup session files: %s", exc)
 
     # Also trigger memory eviction
-    JOBS._evict_if_needed()
+    from .job_manager import get_job_manager
+
+    get_job_manager().memory.prune()
 
     if cleaned > 0:
         logger.info(f"Cleaned up {cleaned} old session(s)")
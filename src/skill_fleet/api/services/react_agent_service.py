@@ -15,11 +15,11 @@ import dspy
 
 from skill_fleet.api.schemas.skills import CreateSkillRequest
 from skill_fleet.api.services.job_manager import get_job_manager
-from skill_fleet.api.services.jobs import create_job, update_job
+from skill_fleet.api.services.job_queue import get_worker_pool, run_skill_creation_job
+from skill_fleet.api.services.jobs import create_job
 from skill_fleet.api.services.skill_service import SkillService
 from skill_fleet.common.logging_utils import sanitize_for_log
 from skill_fleet.dspy import dspy_context
-from skill_fleet.taxonomy.discovery import ensure_all_skills_loaded
 from skill_fleet.taxonomy.manager import TaxonomyManager
 
 logger = logging.getLogger(__name__)
@@ -110,11 +110,7 @@ class ReActAgentService:
             safe_limit = 12
 
         try:
-            ensure_all_skills_loaded(
-                self._taxonomy_manager.skills_root,
-                self._taxonomy_manager.metadata_cache,
-                self._taxonomy_manager._load_skill_dir_metadata,
-            )
+            self._taxonomy_manager.ensure_all_skills_loaded()
         except Exception as exc:  # pragma: no cover
             logger.debug("Skill discovery fallback: %s", exc)
 
@@ -150,24 +146,11 @@ class ReActAgentService:
             ),
         )
 
-        async def run_workflow() -> None:
-            try:
-                result = await self._skill_service.create_skill(request, existing_job_id=job_id)
-                if result.status in {"completed", "pending_review"}:
-                    await update_job(
-                        job_id,
-                        {
-                            "status": result.status,
-                            "result": result,
-                            "progress_percent": 100.0,
-                            "progress_message": "Skill creation completed",
-                        },
-                    )
-            except Exception as exc:
-                logger.error("ReAct workflow execution failed for job=%s: %s", job_id, exc)
-                await update_job(job_id, {"status": "failed", "error": str(exc)})
-
-        asyncio.create_task(run_workflow())
+        pool = get_worker_pool()
+        if pool is not None and pool.running:
+            await pool.submit(job_id, request, skill_service=self._skill_service)
+        else:
+            asyncio.create_task(run_skill_creation_job(self._skill_service, job_id, request))
         return await self.get_job_status(job_id=job_id)
 
     async def get_job_status(self, *, job_id: str) -> dict[str, Any]:
@@ -49,6 +49,9 @@ if TYPE_CHECKING:
 
     from ..schemas.skills import CreateSkillRequest
 
+# Top search hits passed to the understanding workflow as `existing_skills`
+RELATED_SKILLS_LIMIT = 10
+
 
 class SkillService:
     """Service for managing skill creation operations."""
@@ -176,9 +179,16 @@ class SkillService:
         if job and job.deep_understanding.answers:
             previous_answers = {"prior_clarifications": job.deep_understanding.answers}
 
-        # Provide real taxonomy context
+        # Provide real taxonomy context: branches and skills ranked by the local search index
         taxonomy_structure = self.taxonomy_manager.get_relevant_branches(request.task_description)
         mounted_skills = self.taxonomy_manager.get_mounted_skills(request.user_id)
+        related_skills = [
+            hit.skill_id
+            for hit in self.taxonomy_manager.search_skills(
+                request.task_description, limit=RELATED_SKILLS_LIMIT
+            )
+        ]
+        mounted_skills = list(dict.fromkeys([*mounted_skills, *related_skills]))
 
         # Use workflows initialized in __init__
         understanding_workflow = self.understanding_workflow
@@ -207,18 +217,37 @@ class SkillService:
             # Track whether we should auto-save a draft at the end.
             save_draft_requested = False
 
+            # Resume after a restart from the last completed phase (see _save_checkpoint)
+            checkpoint = (job.checkpoint if existing_job_id and job else None) or {}
+            phase1_result: dict[str, Any] | None = checkpoint.get("understanding")
+            resumed_phase1 = phase1_result is not None
+
             # ------------------------------------------------------------------
             # Phase 1: Understanding (+ optional clarify/structure_fix + confirm)
             # ------------------------------------------------------------------
-            if progress_callback:
-                progress_callback("phase1", "Analyzing requirements and planning skill structure")
-
-            user_confirmation = ""
-            phase1_result: dict[str, Any] | None = None
+            if phase1_result is None:
+                if progress_callback:
+                    progress_callback(
+                        "phase1", "Analyzing requirements and planning skill structure"
+                    )
 
-            while True:
-                if enable_mlflow:
-                    with start_child_run("phase1_task_analysis"):
+                user_confirmation = ""
+
+                while True:
+                    if enable_mlflow:
+                        with start_child_run("phase1_task_analysis"):
+                            phase1_result = await understanding_workflow.execute(
+                                task_description=request.task_description,
+                                user_context=user_context,
+                                taxonomy_structure=taxonomy_structure,
+                                existing_skills=mounted_skills,
+                                enable_hitl_confirm=bool(
+                                    getattr(request, "enable_hitl_confirm", False)
+                                ),
+                                user_confirmation=user_confirmation,
+                                manager=streaming_manager,
+                            )
+                    else:
                         phase1_result = await understanding_workflow.execute(
                             task_description=request.task_description,
                             user_context=user_context,
@@ -230,98 +259,112 @@ class SkillService:
                             user_confirmation=user_confirmation,
                             manager=streaming_manager,
                         )
-                else:
-                    phase1_result = await understanding_workflow.execute(
-                        task_description=request.task_description,
-                        user_context=user_context,
-                        taxonomy_structure=taxonomy_structure,
-                        existing_skills=mounted_skills,
-                        enable_hitl_confirm=bool(getattr(request, "enable_hitl_confirm", False)),
-                        user_confirmation=user_confirmation,
-                        manager=streaming_manager,
-                    )
 
-                status = phase1_result.get("status")
-                if status not in {"pending_user_input", "pending_hitl"}:
-                    break
+                    status = phase1_result.get("status")
+                    if status not in {"pending_user_input", "pending_hitl"}:
+                        break
 
-                hitl_type = str(phase1_result.get("hitl_type") or "clarify")
-                raw_hitl_data = phase1_result.get("hitl_data")
-                hitl_data: dict[str, Any] = raw_hitl_data if isinstance(raw_hitl_data, dict) else {}
+                    hitl_type = str(phase1_result.get("hitl_type") or "clarify")
+                    raw_hitl_data = phase1_result.get("hitl_data")
+                    hitl_data: dict[str, Any] = (
+                        raw_hitl_data if isinstance(raw_hitl_data, dict) else {}
+                    )
 
-                pending_status = (
-                    "pending_user_input"
-                    if hitl_type in {"clarify", "structure_fix"}
-                    else "pending_hitl"
-                )
-                await _set_hitl_state(
-                    status=pending_status, hitl_type=hitl_type, hitl_data=hitl_data
-                )
+                    pending_status = (
+                        "pending_user_input"
+                        if hitl_type in {"clarify", "structure_fix"}
+                        else "pending_hitl"
+                    )
+                    await _set_hitl_state(
+                        status=pending_status, hitl_type=hitl_type, hitl_data=hitl_data
+                    )
 
-                response = await wait_for_hitl_response(job_id)
-                await _clear_hitl_state()
+                    response = await wait_for_hitl_response(job_id)
+                    await _clear_hitl_state()
 
-                # Apply response depending on HITL type.
-                action = str(response.get("action") or "").strip().lower()
-                if action == "cancel":
-                    return SkillCreationResult(
-                        job_id=job_id, status="cancelled", message="Cancelled by user"
-                    )
+                    # Apply response depending on HITL type.
+                    action = str(response.get("action") or "").strip().lower()
+                    if action == "cancel":
+                        return SkillCreationResult(
+                            job_id=job_id, status="cancelled", message="Cancelled by user"
+                        )
 
-                if hitl_type == "confirm":
-                    if action in {"", "proceed", "accept", "ok", "okay", "yes"}:
+                    if hitl_type == "confirm":
+                        if action in {"", "proceed", "accept", "ok", "okay", "yes"}:
+                            break
+                        if action == "revise":
+                            user_confirmation = str(response.get("feedback") or "")
+                            continue
+                        # Unknown -> proceed
                         break
-                    if action == "revise":
-                        user_confirmation = str(response.get("feedback") or "")
+
+                    if hitl_type == "structure_fix":
+                        # Store structure overrides for future requirements runs.
+                        fixed_name = response.get("skill_name")
+                        fixed_desc = response.get("description")
+                        if job:
+                            override = dict(job.user_context or {})
+                            override["structure_fix"] = {
+                                "skill_name": fixed_name or "",
+                                "description": fixed_desc or "",
+                            }
+                            job.user_context = override
+                            await job_manager.update_job(job_id, {"user_context": override})
+                            user_context = {
+                                "user_id": request.user_id,
+                                **override,
+                                **previous_answers,
+                            }
                         continue
-                    # Unknown -> proceed
-                    break
 
-                if hitl_type == "structure_fix":
-                    # Store structure overrides for future requirements runs.
-                    fixed_name = response.get("skill_name")
-                    fixed_desc = response.get("description")
+                    # clarify: append response to deep_understanding.answers for future context
                     if job:
-                        override = dict(job.user_context or {})
-                        override["structure_fix"] = {
-                            "skill_name": fixed_name or "",
-                            "description": fixed_desc or "",
+                        job.deep_understanding.answers.append(response)
+                        await job_manager.update_job(
+                            job_id, {"deep_understanding": job.deep_understanding}
+                        )
+                        user_context = {
+                            "user_id": request.user_id,
+                            **(job.user_context or {}),
+                            "prior_clarifications": job.deep_understanding.answers,
                         }
-                        job.user_context = override
-                        await job_manager.update_job(job_id, {"user_context": override})
-                        user_context = {"user_id": request.user_id, **override, **previous_answers}
                     continue
 
-                # clarify: append response to deep_understanding.answers for future context
-                if job:
-                    job.deep_understanding.answers.append(response)
-                    await job_manager.update_job(
-                        job_id, {"deep_understanding": job.deep_understanding}
-                    )
-                    user_context = {
-                        "user_id": request.user_id,
-                        **(job.user_context or {}),
-                        "prior_clarifications": job.deep_understanding.answers,
-                    }
-                continue
-
             assert phase1_result is not None
+            if not resumed_phase1:
+                await self._save_checkpoint(job_id, "understanding", understanding=phase1_result)
 
             # ------------------------------------------------------------------
             # Phase 2: Generation (+ optional preview/refine)
             # ------------------------------------------------------------------
-            if progress_callback:
-                progress_callback("phase2", "Generating skill content")
-
             plan = (
                 phase1_result.get("plan", {}) if isinstance(phase1_result.get("plan"), dict) else {}
             )
             understanding_payload = phase1_result
             current_content: str = ""
 
-            while True:
-                if enable_mlflow:
-                    with start_child_run("phase2_content_generation"):
+            if checkpoint.get("phase") == "generation":
+                current_content = str(checkpoint.get("skill_content") or "")
+                save_draft_requested = bool(checkpoint.get("save_draft_requested"))
+            else:
+                if progress_callback:
+                    progress_callback("phase2", "Generating skill content")
+
+                while True:
+                    if enable_mlflow:
+                        with start_child_run("phase2_content_generation"):
+                            phase2_result = await generation_workflow.execute(
+                                plan=plan,
+                                understanding=understanding_payload,
+                                enable_hitl_preview=bool(
+                                    getattr(request, "enable_hitl_preview", False)
+                                ),
+                                enable_token_streaming=bool(
+                                    getattr(request, "enable_token_streaming", False)
+                                ),
+                                manager=streaming_manager,
+                            )
+                    else:
                         phase2_result = await generation_workflow.execute(
                             plan=plan,
                             understanding=understanding_payload,
@@ -333,80 +376,81 @@ class SkillService:
                             ),
                             manager=streaming_manager,
                         )
-                else:
-                    phase2_result = await generation_workflow.execute(
-                        plan=plan,
-                        understanding=understanding_payload,
-                        enable_hitl_preview=bool(getattr(request, "enable_hitl_preview", False)),
-                        enable_token_streaming=bool(
-                            getattr(request, "enable_token_streaming", False)
-                        ),
-                        manager=streaming_manager,
-                    )
-
-                status = phase2_result.get("status")
-                if status == "completed":
-                    current_content = str(phase2_result.get("skill_content") or "")
-                    break
-
-                if status == "pending_hitl" and phase2_result.get("hitl_type") == "preview":
-                    hitl_data = phase2_result.get("hitl_data", {})
-                    if isinstance(hitl_data, dict):
-                        # Ensure expected shape for API clients.
-                        hitl_data.setdefault(
-                            "content", current_content or hitl_data.get("content") or ""
-                        )
-                        hitl_data.setdefault("highlights", hitl_data.get("highlights") or [])
 
-                    await _set_hitl_state(
-                        status="pending_hitl", hitl_type="preview", hitl_data=hitl_data
-                    )
-                    response = await wait_for_hitl_response(job_id)
-                    await _clear_hitl_state()
+                    status = phase2_result.get("status")
+                    if status == "completed":
+                        current_content = str(phase2_result.get("skill_content") or "")
+                        break
 
-                    action = str(response.get("action") or "proceed").strip().lower()
-                    if action == "cancel":
-                        return SkillCreationResult(
-                            job_id=job_id, status="cancelled", message="Cancelled by user"
-                        )
-                    if action == "refine":
-                        feedback = str(response.get("feedback") or "").strip()
-                        if feedback and isinstance(hitl_data, dict):
-                            base = str(hitl_data.get("content") or current_content or "")
-                            incorporated = await generation_workflow.incorporate_feedback(
-                                base, feedback, [feedback]
+                    if status == "pending_hitl" and phase2_result.get("hitl_type") == "preview":
+                        hitl_data = phase2_result.get("hitl_data", {})
+                        if isinstance(hitl_data, dict):
+                            # Ensure expected shape for API clients.
+                            hitl_data.setdefault(
+                                "content", current_content or hitl_data.get("content") or ""
                             )
-                            current_content = str(incorporated.get("skill_content") or base)
-                        # Re-show preview by looping generation with enable_hitl_preview=True but without regenerating:
-                        # To keep things simple, directly re-suspend with updated content.
-                        preview_data = {
-                            "content": current_content,
-                            "highlights": generation_workflow.extract_highlights(current_content),
-                        }
+                            hitl_data.setdefault("highlights", hitl_data.get("highlights") or [])
+
                         await _set_hitl_state(
-                            status="pending_hitl", hitl_type="preview", hitl_data=preview_data
+                            status="pending_hitl", hitl_type="preview", hitl_data=hitl_data
                         )
-                        response2 = await wait_for_hitl_response(job_id)
+                        response = await wait_for_hitl_response(job_id)
                         await _clear_hitl_state()
-                        action2 = str(response2.get("action") or "proceed").strip().lower()
-                        if action2 == "cancel":
+
+                        action = str(response.get("action") or "proceed").strip().lower()
+                        if action == "cancel":
                             return SkillCreationResult(
                                 job_id=job_id, status="cancelled", message="Cancelled by user"
                             )
-                        if action2 == "refine":
-                            # Keep looping; feedback handled on next iteration.
-                            continue
+                        if action == "refine":
+                            feedback = str(response.get("feedback") or "").strip()
+                            if feedback and isinstance(hitl_data, dict):
+                                base = str(hitl_data.get("content") or current_content or "")
+                                incorporated = await generation_workflow.incorporate_feedback(
+                                    base, feedback, [feedback]
+                                )
+                                current_content = str(incorporated.get("skill_content") or base)
+                            # Re-show preview by looping generation with enable_hitl_preview=True but without regenerating:
+                            # To keep things simple, directly re-suspend with updated content.
+                            preview_data = {
+                                "content": current_content,
+                                "highlights": generation_workflow.extract_highlights(
+                                    current_content
+                                ),
+                            }
+                            await _set_hitl_state(
+                                status="pending_hitl", hitl_type="preview", hitl_data=preview_data
+                            )
+                            response2 = await wait_for_hitl_response(job_id)
+                            await _clear_hitl_state()
+                            action2 = str(response2.get("action") or "proceed").strip().lower()
+                            if action2 == "cancel":
+                                return SkillCreationResult(
+                                    job_id=job_id, status="cancelled", message="Cancelled by user"
+                                )
+                            if action2 == "refine":
+                                # Keep looping; feedback handled on next iteration.
+                                continue
+                            if bool(getattr(request, "auto_save_draft_on_preview_confirm", False)):
+                                save_draft_requested = True
+                            break
+                        # proceed
                         if bool(getattr(request, "auto_save_draft_on_preview_confirm", False)):
                             save_draft_requested = True
+                        current_content = str(hitl_data.get("content") or current_content or "")
                         break
-                    # proceed
-                    if bool(getattr(request, "auto_save_draft_on_preview_confirm", False)):
-                        save_draft_requested = True
-                    current_content = str(hitl_data.get("content") or current_content or "")
+
+                    # Unknown state; break and treat as failure.
                     break
 
-                # Unknown state; break and treat as failure.
-                break
+                if current_content:
+                    await self._save_checkpoint(
+                        job_id,
+                        "generation",
+                        understanding=phase1_result,
+                        skill_content=current_content,
+                        save_draft_requested=save_draft_requested,
+                    )
 
             # ------------------------------------------------------------------
             # Phase 3: Validation (+ optional validate/refine)
@@ -547,6 +591,7 @@ class SkillService:
                     "result": result,
                     "progress_percent": 100.0,
                     "progress_message": "Skill creation completed",
+                    "checkpoint": None,
                     "validation_passed": passed,
                     "validation_score": (
                         validation_report.get("score")
@@ -566,6 +611,22 @@ class SkillService:
             if enable_mlflow and parent_run_id:
                 end_parent_run()
 
+    async def _save_checkpoint(self, job_id: str, phase: str, **outputs: Any) -> None:
+        """
+        Record a completed workflow phase so a restarted job can skip it.
+
+        Args:
+            job_id: Job identifier
+            phase: Completed phase ("understanding" or "generation")
+            **outputs: Phase outputs needed to continue (must be JSON-serializable)
+
+        """
+        try:
+            await get_job_manager().update_job(job_id, {"checkpoint": {"phase": phase, **outputs}})
+        except Exception as e:
+            # Checkpoints only speed up resumption; never fail the workflow.
+            logger.warning("Failed to checkpoint job %s after %s: %s", job_id, phase, e)
+
     async def resume_skill_creation(
         self, job_id: str, answers: dict[str, Any]
     ) -> SkillCreationResult:
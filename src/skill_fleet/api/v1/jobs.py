@@ -6,15 +6,18 @@ These endpoints work with the jobs module which is shared across API versions.
 
 Endpoints:
     GET /api/v1/jobs/{job_id} - Get job status and details
+    POST /api/v1/jobs/batch - Get status summaries of many jobs at once
 """
 
 from __future__ import annotations
 
+from datetime import datetime
+
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
 from ..dependencies import JobManagerDep
-from ..exceptions import NotFoundException
+from ..exceptions import BadRequestException, NotFoundException
 
 router = APIRouter()
 
@@ -43,6 +46,82 @@ class JobDetailResponse(BaseModel):
     hitl_type: str | None = Field(None, description="HITL interaction type")
 
 
+class JobSummary(BaseModel):
+    """Lightweight job status (no results or HITL payloads)."""
+
+    job_id: str = Field(..., description="Job ID")
+    status: str = Field(..., description="Job status")
+    user_id: str = Field(..., description="User ID")
+    current_phase: str | None = Field(None, description="Current phase")
+    progress_percent: float | None = Field(None, description="Progress percentage")
+    progress_message: str | None = Field(None, description="Progress message")
+    hitl_type: str | None = Field(None, description="HITL interaction type")
+    error: str | None = Field(None, description="Error message")
+    created_at: datetime | None = Field(None, description="Creation time")
+    updated_at: datetime | None = Field(None, description="Last update time")
+
+
+class JobBatchRequest(BaseModel):
+    """Request model for batch job status lookups and listings."""
+
+    job_ids: list[str] | None = Field(
+        None, max_length=500, description="Only these jobs (omit to list by filters)"
+    )
+    statuses: list[str] | None = Field(None, description="Only jobs in one of these statuses")
+    user_id: str | None = Field(None, description="Only jobs of this user")
+    cursor: str | None = Field(None, description="next_cursor of the previous page")
+    limit: int = Field(100, ge=1, le=500, description="Maximum number of jobs per page")
+
+
+class JobBatchResponse(BaseModel):
+    """Response model for batch job status lookups, newest jobs first."""
+
+    jobs: list[JobSummary] = Field(default_factory=list, description="Job summaries")
+    next_cursor: str | None = Field(None, description="Cursor of the next page, if any")
+
+
+@router.post(
+    "/batch",
+    responses={
+        400: {"description": "Invalid cursor"},
+        500: {"description": "Internal server error"},
+    },
+)
+async def get_job_statuses(request: JobBatchRequest, manager: JobManagerDep) -> JobBatchResponse:
+    """
+    Get status summaries of many jobs in one request.
+
+    Lets dashboards and clients watching many jobs poll them together instead
+    of one `GET /jobs/{job_id}` per job. Only summary columns are read, and
+    results are paginated by keyset (pass `next_cursor` back as `cursor`).
+
+    Args:
+        request: Job IDs and/or filters, cursor and page size
+        manager: Job manager instance (injected)
+
+    Returns:
+        JobBatchResponse with one page of summaries
+
+    Raises:
+        BadRequestException: If the cursor is invalid (400)
+
+    """
+    try:
+        summaries, next_cursor = await manager.list_job_summaries(
+            job_ids=request.job_ids,
+            statuses=request.statuses,
+            user_id=request.user_id,
+            cursor=request.cursor,
+            limit=request.limit,
+        )
+    except ValueError as e:
+        raise BadRequestException(str(e)) from e
+    return JobBatchResponse(
+        jobs=[JobSummary.model_validate(summary) for summary in summaries],
+        next_cursor=next_cursor,
+    )
+
+
 @router.get(
     "/{job_id}",
     responses={
@@ -63,36 +63,50 @@ async def list_skills(
     """
     List skills in the taxonomy.
 
-    Query params are best-effort filters; currently they are applied client-side.
+    With `search`, skills are ranked by the taxonomy's local search index
+    (name, description and capabilities), followed by any remaining skills
+    whose name contains the search text. Otherwise they are sorted by ID.
     """
     # Load all skills (metadata_cache may be incomplete until discovery runs).
     try:
-        from skill_fleet.taxonomy.discovery import ensure_all_skills_loaded
-
-        ensure_all_skills_loaded(
-            skill_service.taxonomy_manager.skills_root,
-            skill_service.taxonomy_manager.metadata_cache,
-            skill_service.taxonomy_manager._load_skill_dir_metadata,
-        )
+        skill_service.taxonomy_manager.ensure_all_skills_loaded()
     except Exception as exc:
         # If discovery fails, fall back to whatever is already cached.
         logger.debug("Skill discovery failed; using cached metadata: %s", exc)
 
-    items = [
-        SkillListItem(skill_id=skill_id, name=meta.name, description=meta.description)
-        for skill_id, meta in skill_service.taxonomy_manager.metadata_cache.items()
-    ]
-
-    # Apply simple filters.
-    if search:
-        q = search.lower()
-        items = [i for i in items if q in i.name.lower()]
+    metadata_cache = skill_service.taxonomy_manager.metadata_cache
     if status:
         # Status isn't tracked in metadata today; placeholder for future filtering.
         # Currently, status is accepted but not used to filter items.
         pass
 
-    return sorted(items, key=lambda x: x.skill_id)
+    if not search:
+        return [
+            SkillListItem(skill_id=skill_id, name=meta.name, description=meta.description)
+            for skill_id, meta in sorted(metadata_cache.items())
+        ]
+
+    ranked = [
+        hit.skill_id
+        for hit in skill_service.taxonomy_manager.search_index.search(search, k=None)
+        if hit.skill_id in metadata_cache
+    ]
+    # Keep substring matches on partial names ("pd" -> "pdf") that BM25 terms miss.
+    q = search.lower()
+    seen = set(ranked)
+    ranked += sorted(
+        skill_id
+        for skill_id, meta in metadata_cache.items()
+        if q in meta.name.lower() and skill_id not in seen
+    )
+    return [
+        SkillListItem(
+            skill_id=skill_id,
+            name=metadata_cache[skill_id].name,
+            description=metadata_cache[skill_id].description,
+        )
+        for skill_id in ranked
+    ]
 
 
 @router.post("/", response_model=CreateSkillResponse)
@@ -111,7 +125,7 @@ async def create_skill(
 
     Args:
         request: Skill creation request with task description and user ID
-        background_tasks: FastAPI background tasks for async execution
+        background_tasks: FastAPI background tasks (used when no worker pool runs)
         skill_service: Injected SkillService for workflow operations
 
     Returns:
@@ -119,48 +133,21 @@ async def create_skill(
 
     """
     # Import here to avoid circular dependency with job system
-    from ..services.jobs import create_job, get_job
+    from ..services.job_queue import get_worker_pool, run_skill_creation_job
+    from ..services.jobs import create_job
 
     job_id = await create_job(
         task_description=request.task_description,
         user_id=request.user_id,
     )
 
-    async def run_workflow():
-        """Run the skill creation workflow in background."""
-        try:
-            result = await skill_service.create_skill(
-                request,
-                existing_job_id=job_id,
-            )
-
-            # Update job status and result upon completion
-            # This ensures the job moves to a terminal state (completed or pending_review)
-            if result.status in ("completed", "pending_review"):
-                from ..services.jobs import update_job
-
-                await update_job(
-                    job_id,
-                    {
-                        "status": result.status,
-                        "result": result,
-                        "progress_percent": 100.0,
-                        "progress_message": "Skill creation completed",
-                    },
-                )
-
-            logger.info(f"Skill creation job {job_id} completed with status: {result.status}")
-        except Exception as e:
-            logger.error(f"Skill creation job {job_id} failed: {e}")
-            # Update job status to failed
-            job = await get_job(job_id)
-            if job:
-                from ..services.jobs import update_job
-
-                await update_job(job_id, {"status": "failed", "error": str(e)})
-
-    # Add workflow to background tasks and return immediately
-    background_tasks.add_task(run_workflow)
+    # Queue the job durably when a worker pool runs (it survives restarts);
+    # otherwise run it as a background task of this request.
+    pool = get_worker_pool()
+    if pool is not None and pool.running:
+        await pool.submit(job_id, request, skill_service=skill_service)
+    else:
+        background_tasks.add_task(run_skill_creation_job, skill_service, job_id, request)
 
     return CreateSkillResponse(job_id=job_id, status="pending")
 
@@ -9,6 +9,8 @@ Endpoints:
     POST /api/v1/taxonomy - Update taxonomy
     GET  /api/v1/taxonomy/user/{user_id} - Get user-specific taxonomy
     POST /api/v1/taxonomy/user/{user_id}/adapt - Adapt taxonomy to user
+    GET  /api/v1/taxonomy/paths - Prefix/subtree query over taxonomy paths
+    GET  /api/v1/taxonomy/xml - agentskills.io XML (supports ETag/If-None-Match)
 """
 
 from __future__ import annotations
@@ -17,7 +19,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Path
+from fastapi import APIRouter, Header, HTTPException, Path, Query, Response
 from fastapi.responses import PlainTextResponse
 
 from skill_fleet.common.logging_utils import sanitize_for_log
@@ -27,6 +29,8 @@ from ..dependencies import TaxonomyManagerDep
 from ..schemas.taxonomy import (
     AdaptTaxonomyRequest,
     AdaptTaxonomyResponse,
+    TaxonomyPathEntry,
+    TaxonomyPathsResponse,
     TaxonomyResponse,
     UpdateTaxonomyRequest,
     UserTaxonomyResponse,
@@ -144,17 +148,13 @@ async def update_taxonomy(
                 safe_err = sanitize_for_log(str(update_err))
                 logger.warning(f"Taxonomy update failed for {safe_path}: {safe_err}")
 
-        # Update taxonomy meta timestamp
-        meta_path = taxonomy_manager.skills_root / "taxonomy_meta.json"
-        if meta_path.exists():
-            try:
-                meta = json.loads(meta_path.read_text(encoding="utf-8"))
-                from datetime import UTC, datetime
+        # Update taxonomy meta timestamp (written behind with other meta updates)
+        try:
+            from datetime import UTC, datetime
 
-                meta["last_updated"] = datetime.now(UTC).isoformat()
-                meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
-            except Exception as meta_err:
-                logger.warning(f"Failed to update taxonomy_meta.json: {meta_err}")
+            taxonomy_manager.update_meta({"last_updated": datetime.now(UTC).isoformat()})
+        except Exception as meta_err:
+            logger.warning(f"Failed to update taxonomy_meta.json: {meta_err}")
 
         safe_user_id = sanitize_for_log(request.user_id)
         logger.info(
@@ -329,23 +329,77 @@ async def invalidate_taxonomy_cache(
         raise HTTPException(status_code=500, detail="Failed to invalidate cache") from e
 
 
+@router.get("/paths", response_model=TaxonomyPathsResponse)
+async def query_taxonomy_paths(
+    taxonomy_manager: TaxonomyManagerDep,
+    prefix: str = Query(default="", description="Path prefix; the last segment may be partial"),
+    limit: int = Query(default=200, ge=1, le=1000, description="Maximum skills returned"),
+) -> TaxonomyPathsResponse:
+    """
+    Enumerate skills by taxonomy path prefix, served from the in-memory path index.
+
+    Args:
+        taxonomy_manager: Injected TaxonomyManager for taxonomy access
+        prefix: Path prefix (e.g. `technical_skills/prog`); empty lists everything
+        limit: Maximum number of skills to return
+
+    Returns:
+        TaxonomyPathsResponse with child branches of the prefix and matching skills
+
+    """
+    if ".." in prefix or prefix.startswith("/") or "\\" in prefix:
+        raise HTTPException(status_code=400, detail="Invalid taxonomy path prefix")
+
+    taxonomy_manager.ensure_all_skills_loaded()
+    path_index = taxonomy_manager.path_index
+    matches = list(path_index.iter_prefix(prefix))
+    children = path_index.children(prefix) if path_index.has_branch(prefix) else []
+
+    return TaxonomyPathsResponse(
+        prefix=prefix,
+        children=[name for name in children if not name.startswith("_")],
+        skills=[
+            TaxonomyPathEntry(path=entry.path, skill_id=entry.skill_id, source=entry.source)
+            for entry in matches[:limit]
+        ],
+        total=len(matches),
+    )
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
 @router.get("/xml", response_class=PlainTextResponse)
 async def generate_taxonomy_xml(
     taxonomy_manager: TaxonomyManagerDep,
     user_id: str | None = None,
-) -> str:
+    if_none_match: str | None = Header(default=None),
+) -> Response:
     """
     Generate agentskills.io <available_skills> XML for prompt injection.
 
     This endpoint provides a standardized XML representation of the skill taxonomy,
     suitable for embedding in agent prompts. Used by CLI `generate-xml` command.
 
+    The XML is served from the taxonomy manager's in-memory cache with an
+    ETag; clients polling with `If-None-Match` get `304 Not Modified` until a
+    skill changes.
+
     Args:
         taxonomy_manager: Injected TaxonomyManager for taxonomy access
         user_id: Optional user ID for personalized taxonomy (filters mounted skills)
+        if_none_match: ETag(s) from a previous response
 
     Returns:
-        XML string in agentskills.io format with <available_skills> root
+        XML string in agentskills.io format with <available_skills> root,
+        or an empty 304 response when the client's copy is current
 
     Example:
         GET /api/v1/taxonomy/xml?user_id=alice
@@ -366,14 +420,18 @@ async def generate_taxonomy_xml(
     try:
         # Use TaxonomyManager helper so discovery/load behavior is consistent
         # with other taxonomy operations and includes on-disk skills.
-        xml_content = taxonomy_manager.generate_available_skills_xml(user_id=user_id)
+        xml_content, etag = taxonomy_manager.available_skills_xml(user_id=user_id)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
 
         logger.info(
             f"Generated taxonomy XML ({len(xml_content)} bytes)"
             + (f" for user {sanitize_for_log(user_id)}" if user_id else "")
         )
 
-        return xml_content
+        return PlainTextResponse(xml_content, headers=headers)
 
     except Exception as e:
         logger.exception(f"Error generating taxonomy XML: {e}")
@@ -0,0 +1,227 @@
+"""
+Cache warmup at API startup.
+
+After a deploy every cache is cold, so the first wave of requests pays for
+skill discovery and taxonomy aggregation. `warm_caches()` runs once from the
+lifespan and preloads:
+
+1. `TaxonomyManager.metadata_cache` (full skill discovery)
+2. concurrently: the global taxonomy view, the `<available_skills>` XML
+   fragments, taxonomy views and XML for the most active users, and metadata
+   of the most popular skills (both from usage analytics)
+
+Progress is recorded in a `WarmupState` that `GET /ready` reports, returning
+503 until warmup has finished. Warmup failures are logged and reported but do
+not block readiness for longer than the configured timeout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from ..taxonomy.manager import TaxonomyManager
+
+logger = logging.getLogger(__name__)
+
+# Warmup status values
+PENDING = "pending"
+RUNNING = "running"
+READY = "ready"
+DEGRADED = "degraded"
+SKIPPED = "skipped"
+
+
+@dataclass(slots=True)
+class WarmupStep:
+    """Outcome of one warmup step."""
+
+    status: str = PENDING
+    items: int = 0
+    duration_ms: float = 0.0
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class WarmupState:
+    """Warmup progress reported by the readiness endpoint."""
+
+    status: str = PENDING
+    started_at: float | None = None
+    finished_at: float | None = None
+    steps: dict[str, WarmupStep] = field(default_factory=dict)
+
+    @property
+    def ready(self) -> bool:
+        """Whether warmup has finished (successfully, partially, or skipped)."""
+        return self.status in (READY, DEGRADED, SKIPPED)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for the readiness response."""
+        duration = None
+        if self.started_at is not None:
+            duration = round(((self.finished_at or time.monotonic()) - self.started_at) * 1000, 1)
+        return {
+            "status": self.status,
+            "duration_ms": duration,
+            "steps": {
+                name: {
+                    "status": step.status,
+                    "items": step.items,
+                    "duration_ms": step.duration_ms,
+                    **({"error": step.error} if step.error else {}),
+                }
+                for name, step in self.steps.items()
+            },
+        }
+
+
+_state = WarmupState()
+
+
+def get_warmup_state() -> WarmupState:
+    """Get the process-wide warmup state."""
+    return _state
+
+
+def reset_warmup_state(status: str = PENDING) -> WarmupState:
+    """
+    Replace the process-wide warmup state (at startup or in tests).
+
+    Args:
+        status: Initial status (`SKIPPED` marks the app ready immediately)
+
+    Returns:
+        The new state
+
+    """
+    global _state
+    _state = WarmupState(status=status)
+    return _state
+
+
+async def _run_step(state: WarmupState, name: str, func: Callable[[], Awaitable[int]]) -> None:
+    """Run one warmup step, recording its outcome instead of raising."""
+    step = state.steps.setdefault(name, WarmupStep())
+    step.status = RUNNING
+    started = time.monotonic()
+    try:
+        step.items = await func()
+        step.status = READY
+    except Exception as e:
+        step.status = DEGRADED
+        step.error = str(e)
+        logger.warning(f"Cache warmup step {name} failed: {e}")
+    finally:
+        step.duration_ms = round((time.monotonic() - started) * 1000, 1)
+
+
+def _usage_leaders(user_limit: int, skill_limit: int) -> tuple[list[str], list[str]]:
+    """Read the most active users and most used skill paths from usage analytics."""
+    from ..infrastructure.db.repositories import UsageRepository
+    from ..infrastructure.db.session import transactional_session
+
+    with transactional_session() as db:
+        usage = UsageRepository(db)
+        users = [row["user_id"] for row in usage.get_active_users(limit=user_limit)]
+        skills = [row["skill_path"] for row in usage.get_popular_skills(limit=skill_limit)]
+    return users, skills
+
+
+async def warm_caches(
+    taxonomy_manager: TaxonomyManager,
+    *,
+    top_users: int = 20,
+    popular_skills: int = 50,
+    timeout: float = 60.0,
+    usage_leaders: Callable[[int, int], tuple[list[str], list[str]]] | None = None,
+    state: WarmupState | None = None,
+) -> WarmupState:
+    """
+    Preload taxonomy caches before the app reports readiness.
+
+    Args:
+        taxonomy_manager: Shared TaxonomyManager
+        top_users: Number of most active users whose views are preloaded
+        popular_skills: Number of most used skills whose metadata is preloaded
+        timeout: Seconds after which warmup gives up and reports degraded
+        usage_leaders: Callable returning (user_ids, skill_paths) for the
+            limits (defaults to the usage analytics tables)
+        state: State to update (defaults to the process-wide state)
+
+    Returns:
+        Final WarmupState
+
+    """
+    from .services.cached_taxonomy import get_cached_taxonomy_service
+
+    state = state if state is not None else get_warmup_state()
+    state.status = RUNNING
+    state.started_at = time.monotonic()
+    cached_service = get_cached_taxonomy_service(taxonomy_manager)
+    leaders = usage_leaders or _usage_leaders
+
+    async def load_metadata() -> int:
+        await asyncio.to_thread(taxonomy_manager.ensure_all_skills_loaded)
+        return len(taxonomy_manager.metadata_cache)
+
+    async def global_taxonomy() -> int:
+        await cached_service.get_global_taxonomy()
+        return 1
+
+    async def xml_fragments() -> int:
+        await asyncio.to_thread(taxonomy_manager.available_skills_xml)
+        return len(taxonomy_manager.metadata_cache)
+
+    users: list[str] = []
+    skills: list[str] = []
+
+    async def usage() -> int:
+        found = await asyncio.to_thread(leaders, top_users, popular_skills)
+        users.extend(found[0])
+        skills.extend(found[1])
+        return len(users) + len(skills)
+
+    async def user_views() -> int:
+        for user_id in users:
+            await cached_service.get_user_taxonomy(user_id)
+            await asyncio.to_thread(taxonomy_manager.available_skills_xml, user_id)
+        return len(users)
+
+    async def skill_metadata() -> int:
+        results = await asyncio.gather(
+            *(cached_service.get_skill_metadata_cached(path) for path in skills)
+        )
+        return sum(1 for result in results if result is not None)
+
+    async def run() -> None:
+        await _run_step(state, "metadata_cache", load_metadata)
+        await asyncio.gather(
+            _run_step(state, "global_taxonomy", global_taxonomy),
+            _run_step(state, "xml_fragments", xml_fragments),
+            _run_step(state, "usage_analytics", usage),
+        )
+        await asyncio.gather(
+            _run_step(state, "user_taxonomies", user_views),
+            _run_step(state, "skill_metadata", skill_metadata),
+        )
+
+    try:
+        await asyncio.wait_for(run(), timeout=timeout)
+    except TimeoutError:
+        logger.warning(f"Cache warmup timed out after {timeout}s; continuing with partial caches")
+        for step in state.steps.values():
+            if step.status == RUNNING:
+                step.status, step.error = DEGRADED, "timed out"
+
+    state.finished_at = time.monotonic()
+    degraded = any(step.status != READY for step in state.steps.values())
+    state.status = DEGRADED if degraded else READY
+    logger.info(f"Cache warmup {state.status}: {state.as_dict()['steps']}")
+    return state
@@ -0,0 +1,123 @@
+"""
+Standalone worker process for skill creation workflows (`skill-fleet worker`).
+
+Runs the Understanding/Generation/Validation workflows outside the API
+process so long LLM calls do not compete with request handling, and so API
+and workers scale independently across nodes. The worker:
+
+1. Configures DSPy and connects to the same database as the API
+2. Claims queued jobs with a `JobWorkerPool` (leases, per-user caps and
+   checkpoint resumption work exactly as in the API process)
+3. Publishes workflow events and job state through the job event relay, so
+   SSE streams and HITL prompts served by the API stay live, and receives
+   HITL answers for the jobs it runs
+
+Run the API with `SKILL_FLEET_JOB_WORKERS=0` to leave all execution to
+workers, and point both at the same `SKILL_FLEET_JOB_EVENTS_URL`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import APISettings
+
+logger = logging.getLogger(__name__)
+
+
+def _configure_dspy() -> None:
+    """Configure the DSPy LM and caches the same way the API lifespan does."""
+    import dspy
+
+    from ..infrastructure.tracing.config import ConfigModelLoader
+
+    loader = ConfigModelLoader()
+    dspy.configure(lm=loader.get_model_for_task("conversational_agent"))
+    loader.configure_cache()
+    loader.configure_response_cache()
+
+
+async def run_worker(
+    settings: APISettings,
+    *,
+    stop: asyncio.Event | None = None,
+    configure_lm: bool = True,
+    init_schema: bool = True,
+) -> None:
+    """
+    Run queued skill creation jobs until `stop` is set (or SIGINT/SIGTERM).
+
+    Args:
+        settings: API settings (`job_*` options size the pool; the events URL
+            defaults to `cache_redis_url`)
+        stop: Event ending the worker (defaults to one set by signals)
+        configure_lm: Configure DSPy before claiming jobs
+        init_schema: Create missing database tables at startup
+
+    """
+    from ..infrastructure.db.database import close_async_db, close_db, init_database, init_db
+    from .services.job_events import connect_job_event_relay, set_job_event_relay
+    from .services.job_manager import initialize_job_manager
+    from .services.job_queue import build_worker_pool, set_worker_pool
+
+    if configure_lm:
+        _configure_dspy()
+    init_database()
+    if init_schema:
+        init_db()
+
+    manager = initialize_job_manager()
+    if settings.job_write_behind_enabled:
+        manager.start_write_behind(
+            flush_interval=settings.job_write_behind_interval,
+            max_batch=settings.job_write_behind_max_batch,
+            max_pending=settings.job_write_behind_max_pending,
+        )
+    if settings.job_blob_dir:
+        from ..infrastructure.blobs import FileBlobStore
+
+        manager.enable_blob_offload(
+            FileBlobStore(settings.job_blob_dir), threshold=settings.job_blob_threshold
+        )
+
+    pool = build_worker_pool(settings)
+    relay = None
+    events_url = settings.job_events_url or settings.cache_redis_url
+    if events_url:
+        relay = await connect_job_event_relay(events_url, origin=pool.owner, runs_job=pool.runs_job)
+    else:
+        logger.warning(
+            "No job events URL configured: jobs run, but API processes only see their "
+            "state after it is reloaded from the database"
+        )
+    set_worker_pool(pool)
+    pool.start()
+
+    if stop is None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            with suppress(NotImplementedError):  # Windows
+                loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await stop.wait()
+    finally:
+        logger.info("Worker shutting down; requeueing running jobs")
+        await pool.stop()
+        set_worker_pool(None)
+        if relay is not None:
+            await relay.stop()
+            set_job_event_relay(None)
+        await manager.stop_write_behind()
+        close_db()
+        await close_async_db()
+        logger.info("Worker stopped")
+
+
+__all__ = ["run_worker"]
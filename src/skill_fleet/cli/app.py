@@ -27,6 +27,7 @@ from .commands.serve import serve_command
 from .commands.terminal import terminal_command
 from .commands.tui import tui_command
 from .commands.validate import validate_command
+from .commands.worker import worker_command
 from .utils.security import sanitize_user_id, validate_api_url
 
 # Initialize Typer app
@@ -116,6 +117,7 @@ def main_callback(
     Common workflows:
       - Create skills: uv run skill-fleet create "Your task description"
       - Start server: uv run skill-fleet serve
+      - Run workflows in a separate process: uv run skill-fleet worker
       - Validate skills: uv run skill-fleet validate <skill-path>
       - Interactive mode: uv run skill-fleet chat
 
@@ -154,6 +156,7 @@ app.command(name="analytics")(analytics_command)
 app.command(name="migrate")(migrate_command)
 app.command(name="generate-xml")(generate_xml_command)
 app.command(name="promote")(promote_command)
+app.command(name="worker")(worker_command)
 
 # Register database command group
 app.add_typer(db_app, name="db")
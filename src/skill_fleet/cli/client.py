@@ -139,6 +139,29 @@ class SkillFleetClient:
         response.raise_for_status()
         return response.json()
 
+    async def get_jobs(
+        self,
+        job_ids: list[str] | None = None,
+        *,
+        statuses: list[str] | None = None,
+        user_id: str | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> dict[str, Any]:
+        """Fetch status summaries of many jobs in one request (v1 API)."""
+        payload: dict[str, Any] = {"limit": limit}
+        if job_ids is not None:
+            payload["job_ids"] = job_ids
+        if statuses:
+            payload["statuses"] = statuses
+        if user_id:
+            payload["user_id"] = user_id
+        if cursor:
+            payload["cursor"] = cursor
+        response = await self.client.post("/api/v1/jobs/batch", json=payload)
+        response.raise_for_status()
+        return response.json()
+
     async def stream_job_events(self, job_id: str) -> AsyncIterator[dict[str, Any]]:
         """
         Stream events for an existing job via SSE.
@@ -14,4 +14,5 @@ Provides all CLI commands for the Skills Fleet application:
 - generate-xml: Generate XML representations
 - promote: Promote draft skills
 - db: Database management commands
+- worker: Run skill creation jobs outside the API server
 """
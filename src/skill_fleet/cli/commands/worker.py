@@ -0,0 +1,70 @@
+"""CLI command for running skill creation workflows in a worker process."""
+
+from __future__ import annotations
+
+import asyncio
+
+import typer
+from rich.console import Console
+
+console = Console()
+
+
+def worker_command(
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        min=1,
+        help="Jobs run concurrently (default: SKILL_FLEET_JOB_WORKERS, at least 1)",
+    ),
+    per_user_limit: int | None = typer.Option(
+        None,
+        "--per-user-limit",
+        min=0,
+        help="Running jobs per user across all workers, 0 = no cap "
+        "(default: SKILL_FLEET_JOB_PER_USER_LIMIT)",
+    ),
+    events_url: str | None = typer.Option(
+        None,
+        "--events-url",
+        help="Redis URL relaying events to the API "
+        "(default: SKILL_FLEET_JOB_EVENTS_URL or SKILL_FLEET_CACHE_REDIS_URL)",
+    ),
+    skip_db_init: bool = typer.Option(
+        False,
+        "--skip-db-init",
+        help="Skip database initialization (assumes DB already initialized)",
+    ),
+):
+    """
+    Run queued skill creation jobs outside the API server.
+
+    Claims jobs from the database, runs the skill creation workflow and
+    publishes its events back to the API for SSE streams and HITL prompts.
+    Start the API with SKILL_FLEET_JOB_WORKERS=0 to leave all jobs to workers.
+    Stop with Ctrl+C; running jobs are handed back to the queue.
+    """
+    from skill_fleet.api.config import get_settings
+    from skill_fleet.api.worker import run_worker
+
+    settings = get_settings()
+    overrides: dict[str, object] = {
+        "job_workers": workers or max(settings.job_workers, 1),
+    }
+    if per_user_limit is not None:
+        overrides["job_per_user_limit"] = per_user_limit
+    if events_url:
+        overrides["job_events_url"] = events_url
+    settings = settings.model_copy(update=overrides)
+
+    console.print(
+        f"[bold green]⚙️  Starting Skill Fleet worker "
+        f"({settings.job_workers} concurrent job(s))...[/bold green]"
+    )
+    console.print("[dim]Press Ctrl+C to stop[/dim]\n")
+    try:
+        asyncio.run(run_worker(settings, init_schema=not skip_db_init))
+    except Exception as e:
+        console.print(f"[red]❌ Worker failed: {e}[/red]")
+        raise typer.Exit(1) from e
@@ -3,21 +3,72 @@ Base module for all DSPy modules in skill-fleet.
 
 Provides common functionality for error handling, logging, result validation,
 and modern async support with native DSPy 3.1.2+ features.
+
+Subclass `forward()`/`aforward()` methods are wrapped to consult the active
+LM response cache (`skill_fleet.dspy.response_cache`) first; set
+`response_cacheable = False` on modules whose output must never be reused.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
+import inspect
 import logging
 from typing import Any, TypeVar
 
 import dspy
 from dspy.utils.syncify import run_async
 
+from skill_fleet.dspy import response_cache
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=dspy.Prediction)
 
+# Marks wrapped methods so one reused by another subclass is not wrapped twice
+_CACHED_MARKER = "__response_cached__"
+
+
+def _with_response_cache(method: Any) -> Any:
+    """Wrap a subclass forward/aforward with response cache lookup and storage."""
+    if getattr(method, _CACHED_MARKER, False):
+        return method
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def acached(self: BaseModule, *args: Any, **kwargs: Any) -> Any:
+            call = response_cache.prepare_call(self, args, kwargs)
+            if call is None:
+                return await method(self, *args, **kwargs)
+            if call.hit is not None:
+                self.logger.debug("LM response cache hit")
+                return call.hit
+            with response_cache.active_call(self):
+                result = await method(self, *args, **kwargs)
+            call.store(result)
+            return result
+
+        setattr(acached, _CACHED_MARKER, True)
+        return acached
+
+    @functools.wraps(method)
+    def cached(self: BaseModule, *args: Any, **kwargs: Any) -> Any:
+        call = response_cache.prepare_call(self, args, kwargs)
+        if call is None:
+            return method(self, *args, **kwargs)
+        if call.hit is not None:
+            self.logger.debug("LM response cache hit")
+            return call.hit
+        with response_cache.active_call(self):
+            result = method(self, *args, **kwargs)
+        call.store(result)
+        return result
+
+    setattr(cached, _CACHED_MARKER, True)
+    return cached
+
 
 class BaseModule(dspy.Module):
     """
@@ -39,6 +90,16 @@ class BaseModule(dspy.Module):
 
     """
 
+    # Whether results may be served from the LM response cache.
+    response_cacheable: bool = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Route subclass forward/aforward through the LM response cache."""
+        super().__init_subclass__(**kwargs)
+        for name in ("forward", "aforward"):
+            if name in cls.__dict__:
+                setattr(cls, name, _with_response_cache(cls.__dict__[name]))
+
     def __init__(self):
         super().__init__()
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -0,0 +1,190 @@
+"""
+Taxonomy context selection for the taxonomy path finder.
+
+`FindTaxonomyPathModule` stringifies `taxonomy_structure` and `existing_skills`
+into its prompt, so passing the whole taxonomy inflates token count and LLM
+latency. `select_taxonomy_context` runs before the LLM call and keeps only the
+branches and sibling skills most relevant to the task (BM25 over branch paths,
+their children and skill paths), then trims the result to a token budget.
+
+Small inputs that already fit the limits pass through unchanged.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from skill_fleet.taxonomy.search import rank_texts
+
+DEFAULT_MAX_BRANCHES = 5
+DEFAULT_MAX_SKILLS = 25
+DEFAULT_TOKEN_BUDGET = 1500
+
+# Rough chars-per-token ratio for English/JSON-ish prompt text.
+_CHARS_PER_TOKEN = 4
+
+# Skills kept before branches are dropped to meet the budget.
+_MIN_SKILLS = 3
+
+
+def estimate_tokens(value: Any) -> int:
+    """
+    Estimate the prompt tokens a value takes once stringified.
+
+    Args:
+        value: Prompt input (stringified with `str()` like the modules do)
+
+    Returns:
+        Approximate token count
+
+    """
+    text = value if isinstance(value, str) else str(value)
+    return -(-len(text) // _CHARS_PER_TOKEN)
+
+
+def _flatten_text(value: Any) -> str:
+    """Collect the keys and string leaves of a nested structure into one string."""
+    if isinstance(value, dict):
+        return " ".join(f"{key} {_flatten_text(item)}" for key, item in value.items())
+    if isinstance(value, list | tuple | set):
+        return " ".join(_flatten_text(item) for item in value)
+    return value if isinstance(value, str) else ""
+
+
+@dataclass(slots=True)
+class TaxonomyContext:
+    """
+    Pruned taxonomy context plus prompt size metrics.
+
+    Attributes:
+        taxonomy_structure: Selected branches (original values, children may be trimmed)
+        existing_skills: Selected skill paths, most relevant first
+        tokens_before: Estimated tokens of the unpruned inputs
+        tokens_after: Estimated tokens of the selected inputs
+        branches_before: Number of top-level branches received
+        skills_before: Number of existing skills received
+
+    """
+
+    taxonomy_structure: dict[str, Any] = field(default_factory=dict)
+    existing_skills: list[str] = field(default_factory=list)
+    tokens_before: int = 0
+    tokens_after: int = 0
+    branches_before: int = 0
+    skills_before: int = 0
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Prompt size metrics for logging and workflow events."""
+        saved = self.tokens_before - self.tokens_after
+        return {
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "token_reduction": round(saved / self.tokens_before, 3) if self.tokens_before else 0.0,
+            "branches_before": self.branches_before,
+            "branches_after": len(self.taxonomy_structure),
+            "skills_before": self.skills_before,
+            "skills_after": len(self.existing_skills),
+        }
+
+
+def _by_relevance(query: str, texts: dict[str, str]) -> list[str]:
+    """Order keys by BM25 relevance, keeping unmatched keys after in input order."""
+    ranked = [hit.skill_id for hit in rank_texts(query, texts)]
+    matched = set(ranked)
+    return ranked + [key for key in texts if key not in matched]
+
+
+def _trim_children(value: Any, query: str) -> Any:
+    """Halve a branch's children, keeping the most relevant; None if it can't shrink."""
+    if isinstance(value, dict) and len(value) > 1:
+        order = _by_relevance(
+            query, {str(key): f"{key} {_flatten_text(v)}" for key, v in value.items()}
+        )
+        keep = set(order[: len(order) // 2])
+        return {key: item for key, item in value.items() if str(key) in keep}
+    if isinstance(value, list) and len(value) > 1:
+        order = _by_relevance(query, {str(item): _flatten_text(item) for item in value})
+        keep = set(order[: len(order) // 2])
+        return [item for item in value if str(item) in keep]
+    return None
+
+
+def select_taxonomy_context(
+    task_description: str,
+    requirements: dict[str, Any] | None = None,
+    taxonomy_structure: dict[str, Any] | None = None,
+    existing_skills: list[str] | None = None,
+    *,
+    max_branches: int = DEFAULT_MAX_BRANCHES,
+    max_skills: int = DEFAULT_MAX_SKILLS,
+    token_budget: int | None = DEFAULT_TOKEN_BUDGET,
+) -> TaxonomyContext:
+    """
+    Select the taxonomy branches and skills relevant to a task.
+
+    Branches are ranked against the task description and requirements, and
+    skills under a selected branch (siblings of the new skill) rank ahead of
+    other matching skills. If the selection still exceeds `token_budget`, the
+    least relevant skills, then branches, then children of the last branch
+    are dropped.
+
+    Args:
+        task_description: User's task description
+        requirements: Requirements from GatherRequirementsModule
+        taxonomy_structure: Taxonomy structure keyed by branch path
+        existing_skills: Existing skill paths
+        max_branches: Maximum number of top-level branches to keep
+        max_skills: Maximum number of skills to keep
+        token_budget: Estimated token ceiling for both inputs (None disables trimming)
+
+    Returns:
+        TaxonomyContext with the selected inputs and size metrics
+
+    """
+    structure = dict(taxonomy_structure or {})
+    skills = list(dict.fromkeys(existing_skills or []))
+    query = f"{task_description} {_flatten_text(requirements or {})}"
+
+    branch_order = _by_relevance(
+        query, {str(key): f"{key} {_flatten_text(value)}" for key, value in structure.items()}
+    )[:max_branches]
+    selected = {key: structure[key] for key in branch_order}
+
+    ranked_skills = _by_relevance(query, {skill: skill for skill in skills})
+    siblings = [s for s in ranked_skills if any(s.startswith(f"{b}/") for b in selected)]
+    kept_skills = list(dict.fromkeys([*siblings, *ranked_skills]))[:max_skills]
+
+    context = TaxonomyContext(
+        taxonomy_structure=selected,
+        existing_skills=kept_skills,
+        tokens_before=estimate_tokens(structure) + estimate_tokens(skills),
+        branches_before=len(structure),
+        skills_before=len(skills),
+    )
+
+    def size() -> int:
+        return estimate_tokens(context.taxonomy_structure) + estimate_tokens(
+            context.existing_skills
+        )
+
+    if token_budget is not None:
+        while size() > token_budget:
+            if len(context.existing_skills) > _MIN_SKILLS:
+                context.existing_skills.pop()
+            elif len(context.taxonomy_structure) > 1:
+                context.taxonomy_structure.pop(next(reversed(context.taxonomy_structure)))
+            elif context.existing_skills:
+                context.existing_skills.pop()
+            else:
+                last = next(reversed(context.taxonomy_structure), None)
+                if last is None:
+                    break
+                trimmed = _trim_children(context.taxonomy_structure[last], query)
+                if trimmed is None:
+                    break
+                context.taxonomy_structure[last] = trimmed
+
+    context.tokens_after = size()
+    return context
@@ -47,6 +47,8 @@ class BestOfNValidator(BaseModule):
 
     """
 
+    response_cacheable = False
+
     def __init__(self, n: int = 3, temperature: float = 0.7):
         """
         Initialize BestOfN validator.
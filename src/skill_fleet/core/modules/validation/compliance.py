@@ -25,6 +25,8 @@ class ValidateComplianceModule(BaseModule):
     Checks YAML frontmatter, structure, and naming conventions.
     """
 
+    response_cacheable = False
+
     def __init__(self):
         super().__init__()
         self.validate = dspy.ChainOfThought(ValidateCompliance)
@@ -125,6 +127,8 @@ class ValidateComplianceModule(BaseModule):
 class AssessQualityModule(BaseModule):
     """Assess overall skill quality including size and conciseness."""
 
+    response_cacheable = False
+
     def __init__(self):
         super().__init__()
         self.assess = dspy.ChainOfThought(AssessQuality)
@@ -332,6 +336,8 @@ class AssessQualityModule(BaseModule):
 class RefineSkillModule(BaseModule):
     """Refine skill based on quality assessment."""
 
+    response_cacheable = False
+
     def __init__(self):
         super().__init__()
         self.refine = dspy.ChainOfThought(RefineSkill)
@@ -51,6 +51,8 @@ class MetricsCollectorModule(BaseModule):
 
     """
 
+    response_cacheable = False
+
     def __init__(self):
         super().__init__()
         self.baseline_collector = dspy.ChainOfThought(CollectBaselineMetrics)
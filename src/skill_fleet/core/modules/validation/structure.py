@@ -72,6 +72,8 @@ class ValidateStructureModule(BaseModule):
         "say",
     ]
 
+    response_cacheable = False
+
     def __init__(self) -> None:
         super().__init__()
         self.validator = dspy.ChainOfThought(ValidateSkillStructure)
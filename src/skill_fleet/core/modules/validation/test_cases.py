@@ -82,6 +82,8 @@ class GenerateTestCasesModule(BaseModule):
 
     """
 
+    response_cacheable = False
+
     def __init__(self) -> None:
         super().__init__()
         self.generator = dspy.ChainOfThought(GenerateTestCases)
@@ -1,82 +1,253 @@
 """
 Workflow caching and optimization helpers.
 
-Note: This module uses pickle for caching workflow results. The cached data
-is generated and consumed by the same application, not from untrusted sources.
-The MD5 hash is used only for cache key generation (non-cryptographic purpose).
+Step outputs are stored in a single SQLite file under the cache directory,
+addressed by a SHA-256 digest of the step name and its canonicalized inputs.
+Values are serialized as compact JSON (zlib-compressed when large); pydantic
+models are stored as their JSON dump and rebuilt on load. Values that cannot
+be represented this way are not cached. Nothing is unpickled, and model
+classes are only resolved from `skill_fleet` modules or modules that are
+already imported, so a tampered cache file cannot execute code.
+
+The store is bounded by entry count and payload bytes with least-recently-used
+eviction, and keeps running totals so `get_cache_stats()` never scans.
 """
 
 from __future__ import annotations
 
 import hashlib
+import importlib
 import json
-import pickle  # nosec B403 - Used for internal caching only, not untrusted data
+import logging
+import sqlite3
+import sys
+import threading
+import time
+import zlib
 from pathlib import Path
 from typing import Any
 
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Payloads at least this large are zlib-compressed.
+_COMPRESS_THRESHOLD = 1024
+
+# Model codecs may import modules from this package; others must already be loaded.
+_IMPORTABLE_MODEL_PACKAGE = "skill_fleet"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS step_cache (
+    key TEXT PRIMARY KEY,
+    step TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS step_cache_accessed ON step_cache (accessed);
+"""
+
+
+def _encode(value: Any) -> tuple[str, bytes]:
+    """
+    Serialize a step output.
+
+    Returns:
+        (codec, payload); codec is "json" or "model:<module>:<qualname>",
+        suffixed with "+zlib" when compressed
+
+    Raises:
+        TypeError: If the value is neither JSON-serializable nor a pydantic model
+
+    """
+    if isinstance(value, BaseModel):
+        cls = type(value)
+        codec = f"model:{cls.__module__}:{cls.__qualname__}"
+        payload = value.model_dump_json().encode("utf-8")
+    else:
+        codec = "json"
+        payload = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if len(payload) >= _COMPRESS_THRESHOLD:
+        return f"{codec}+zlib", zlib.compress(payload)
+    return codec, payload
+
+
+def _decode(codec: str, payload: bytes) -> Any:
+    """
+    Rebuild a step output stored by `_encode`.
+
+    Raises:
+        LookupError: If a model codec names a module outside `skill_fleet`
+            that has not been imported yet
+        TypeError: If a model codec does not name a pydantic model
+
+    """
+    if codec.endswith("+zlib"):
+        codec, payload = codec[: -len("+zlib")], zlib.decompress(payload)
+    if codec == "json":
+        return json.loads(payload)
+    _, module_name, qualname = codec.split(":", 2)
+    target: Any = sys.modules.get(module_name)
+    if target is None:
+        if module_name.partition(".")[0] != _IMPORTABLE_MODEL_PACKAGE:
+            raise LookupError(f"Refusing to import {module_name} for a cached model")
+        target = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        target = getattr(target, attr)
+    if not (isinstance(target, type) and issubclass(target, BaseModel)):
+        raise TypeError(f"{module_name}.{qualname} is not a pydantic model")
+    return target.model_validate_json(payload)
+
 
 class WorkflowOptimizer:
     """Caches workflow step outputs to speed up repeated runs."""
 
-    def __init__(self, cache_dir: Path) -> None:
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """
+        Open (or create) the step cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            max_entries: Maximum number of cached step outputs
+            max_bytes: Maximum total size of stored payloads
+
+        """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / "step_cache.sqlite3"
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
         self.hit_rate = {"hits": 0, "misses": 0}
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._entries, self._bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM step_cache"
+        ).fetchone()
 
     def cache_key(self, step: str, inputs: dict[str, Any]) -> str:
-        """
-        Generate a cache key from step name and inputs.
-
-        Note: MD5 is used for cache key generation only (non-cryptographic).
-        """
-        payload = json.dumps(inputs, sort_keys=True, default=str)
-        # MD5 is sufficient for cache keys (not used for security)
-        digest = hashlib.md5(f"{step}::{payload}".encode(), usedforsecurity=False).hexdigest()  # nosec B324
-        return digest
+        """Generate the content address of a step's inputs."""
+        payload = json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(f"{step}::{payload}".encode()).hexdigest()
 
     def get_cached(self, step: str, inputs: dict[str, Any]) -> Any | None:
-        """
-        Retrieve cached result if available, otherwise return None.
-
-        Note: Only loads pickle files created by this application.
-        """
+        """Retrieve cached result if available, otherwise return None."""
         key = self.cache_key(step, inputs)
-        cache_file = self.cache_dir / f"{key}.pkl"
-        if not cache_file.exists():
-            self.hit_rate["misses"] += 1
-            return None
-        try:
-            with cache_file.open("rb") as handle:
-                self.hit_rate["hits"] += 1
-                # Only loading our own cached data, not untrusted input
-                return pickle.load(handle)  # nosec B301
-        except Exception:
-            self.hit_rate["misses"] += 1
-            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT codec, data FROM step_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.hit_rate["misses"] += 1
+                return None
+            try:
+                value = _decode(row[0], row[1])
+            except Exception as e:
+                logger.debug(f"Dropping unreadable cache entry for step {step}: {e}")
+                self._delete(key)
+                self._conn.commit()
+                self.hit_rate["misses"] += 1
+                return None
+            self._conn.execute(
+                "UPDATE step_cache SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            self.hit_rate["hits"] += 1
+            return value
 
     def cache_result(self, step: str, inputs: dict[str, Any], result: Any) -> None:
         """Cache a result for a given step and inputs."""
+        try:
+            codec, payload = _encode(result)
+        except (TypeError, ValueError) as e:
+            # Unsupported outputs are simply not cached.
+            logger.debug(f"Not caching output of step {step}: {e}")
+            return
+        if len(payload) > self.max_bytes:
+            return
+
         key = self.cache_key(step, inputs)
-        cache_file = self.cache_dir / f"{key}.pkl"
         try:
-            with cache_file.open("wb") as handle:
-                pickle.dump(result, handle)
-        except Exception:
+            with self._lock:
+                self._delete(key)
+                self._evict(len(payload))
+                self._conn.execute(
+                    "INSERT INTO step_cache (key, step, codec, data, size, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, step, codec, payload, len(payload), time.time()),
+                )
+                self._conn.commit()
+                self._entries += 1
+                self._bytes += len(payload)
+        except sqlite3.Error as e:
             # Ignore cache failures; they should not break the workflow.
-            return
+            logger.debug(f"Failed to cache output of step {step}: {e}")
+
+    def _delete(self, key: str) -> None:
+        """Remove one entry and update the totals; callers must hold the lock."""
+        row = self._conn.execute("SELECT size FROM step_cache WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM step_cache WHERE key = ?", (key,))
+            self._entries -= 1
+            self._bytes -= row[0]
+
+    def _evict(self, incoming: int) -> None:
+        """Evict least recently used entries so one more payload fits; callers hold the lock."""
+        while self._entries and (
+            self._entries + 1 > self.max_entries or self._bytes + incoming > self.max_bytes
+        ):
+            rows = self._conn.execute(
+                "SELECT key, size FROM step_cache ORDER BY accessed, rowid LIMIT 64"
+            ).fetchall()
+            for key, size in rows:
+                self._conn.execute("DELETE FROM step_cache WHERE key = ?", (key,))
+                self._entries -= 1
+                self._bytes -= size
+                self.evictions += 1
+                if self._entries + 1 <= self.max_entries and (
+                    self._bytes + incoming <= self.max_bytes
+                ):
+                    break
 
     def clear_cache(self) -> None:
-        """Remove all cached files from the cache directory."""
+        """Remove all cached step outputs (including legacy pickle files)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM step_cache")
+            self._conn.commit()
+            self._entries = self._bytes = 0
         for cache_file in self.cache_dir.glob("*.pkl"):
             cache_file.unlink()
 
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
+
     def get_cache_stats(self) -> dict[str, Any]:
-        """Return basic cache hit/miss stats and current cache file count."""
+        """Return cache hit/miss stats, entry count and stored bytes (no scan)."""
         total = self.hit_rate["hits"] + self.hit_rate["misses"]
         hit_rate = self.hit_rate["hits"] / total if total else 0
         return {
             "hits": self.hit_rate["hits"],
             "misses": self.hit_rate["misses"],
             "hit_rate": hit_rate,
-            "cache_size": len(list(self.cache_dir.glob("*.pkl"))),
+            "cache_size": self._entries,
+            "cache_bytes": self._bytes,
+            "evictions": self.evictions,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
         }
@@ -14,6 +14,12 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from skill_fleet.core.modules.hitl.questions import GenerateClarifyingQuestionsModule
+from skill_fleet.core.modules.understanding.context import (
+    DEFAULT_MAX_BRANCHES,
+    DEFAULT_MAX_SKILLS,
+    DEFAULT_TOKEN_BUDGET,
+    select_taxonomy_context,
+)
 from skill_fleet.core.modules.understanding.dependencies import AnalyzeDependenciesModule
 from skill_fleet.core.modules.understanding.intent import AnalyzeIntentModule
 from skill_fleet.core.modules.understanding.plan import SynthesizePlanModule
@@ -46,6 +52,10 @@ class UnderstandingWorkflow:
 
     Can suspend for HITL clarification if ambiguities found.
 
+    Before the taxonomy path finder runs, the taxonomy structure and existing
+    skills are pruned to the branches and siblings relevant to the task (see
+    `select_taxonomy_context`) to keep its prompt small.
+
     Example:
         workflow = UnderstandingWorkflow()
 
@@ -57,7 +67,26 @@ class UnderstandingWorkflow:
 
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        context_token_budget: int | None = DEFAULT_TOKEN_BUDGET,
+        context_max_branches: int = DEFAULT_MAX_BRANCHES,
+        context_max_skills: int = DEFAULT_MAX_SKILLS,
+    ):
+        """
+        Initialize the workflow.
+
+        Args:
+            context_token_budget: Estimated token ceiling for the taxonomy context
+                given to the path finder (None disables trimming)
+            context_max_branches: Maximum taxonomy branches given to the path finder
+            context_max_skills: Maximum existing skills given to the path finder
+
+        """
+        self.context_token_budget = context_token_budget
+        self.context_max_branches = context_max_branches
+        self.context_max_skills = context_max_skills
         self.requirements = GatherRequirementsModule()
         self.intent = AnalyzeIntentModule()
         self.taxonomy = FindTaxonomyPathModule()
@@ -215,6 +244,22 @@ class UnderstandingWorkflow:
                     "Analyzing intent, taxonomy, and dependencies (parallel)",
                 )
 
+                taxonomy_context = select_taxonomy_context(
+                    task_description,
+                    requirements,
+                    taxonomy_structure,
+                    existing_skills,
+                    max_branches=self.context_max_branches,
+                    max_skills=self.context_max_skills,
+                    token_budget=self.context_token_budget,
+                )
+                logger.info(f"Taxonomy context selected: {taxonomy_context.metrics}")
+                await manager.emit(
+                    WorkflowEventType.PROGRESS,
+                    "Selected relevant taxonomy context",
+                    taxonomy_context.metrics,
+                )
+
                 intent_task = manager.execute_module(
                     "intent_analyzer",
                     self.intent.aforward,
@@ -226,8 +271,8 @@ class UnderstandingWorkflow:
                     self.taxonomy.aforward,
                     task_description=task_description,
                     requirements=requirements,
-                    taxonomy_structure=taxonomy_structure or {},
-                    existing_skills=existing_skills or [],
+                    taxonomy_structure=taxonomy_context.taxonomy_structure,
+                    existing_skills=taxonomy_context.existing_skills,
                 )
                 dependencies_task = manager.execute_module(
                     "dependency_analyzer",
@@ -70,6 +70,18 @@ class WorkflowEvent:
             "sequence": self.sequence,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WorkflowEvent:
+        """Rebuild an event serialized with `to_dict()` (e.g. relayed from a worker)."""
+        return cls(
+            event_type=WorkflowEventType(data["type"]),
+            phase=data.get("phase", ""),
+            message=data.get("message", ""),
+            data=data.get("data") or {},
+            timestamp=data.get("timestamp", 0.0),
+            sequence=data.get("sequence", 0),
+        )
+
 
 class StreamingWorkflowManager:
     """
@@ -26,12 +26,20 @@ from skill_fleet.dspy.config import (
     get_default_adapter,
     get_task_lm,
 )
+from skill_fleet.dspy.response_cache import (
+    ResponseCache,
+    configure_response_cache,
+    get_response_cache,
+)
 
 __all__ = [
     "DSPyConfig",
+    "ResponseCache",
     "configure_dspy",
+    "configure_response_cache",
     "create_adapter",
     "dspy_context",
     "get_default_adapter",
+    "get_response_cache",
     "get_task_lm",
 ]
@@ -17,9 +17,13 @@ import dspy
 import yaml
 from dspy.adapters import ChatAdapter, JSONAdapter
 
+from .response_cache import get_response_cache, response_cache_scope
+
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from .response_cache import ResponseCache
+
 
 def _in_async_task() -> bool:
     try:
@@ -183,6 +187,7 @@ def dspy_context(
     lm: dspy.LM | None = None,
     adapter: dspy.Adapter | None = None,
     rm: dspy.Retrieve | None = None,
+    response_cache: ResponseCache | None = None,
 ) -> Generator[None, None, None]:
     """
     Context manager for temporary DSPy configuration.
@@ -194,6 +199,8 @@ def dspy_context(
         lm: Language model override
         adapter: Adapter override
         rm: Retriever override
+        response_cache: Module response cache override (defaults to the
+            process-wide cache from `configure_response_cache`)
 
     Example:
         >>> with dspy_context(lm=fast_lm):
@@ -202,10 +209,15 @@ def dspy_context(
     """
     config = DSPyConfig()
 
-    with dspy.context(
-        lm=lm or config.get_lm() or _create_default_lm(),
-        adapter=adapter or config.get_adapter(),
-        rm=rm or config.get_rm(),
+    with (
+        dspy.context(
+            lm=lm or config.get_lm() or _create_default_lm(),
+            adapter=adapter or config.get_adapter(),
+            rm=rm or config.get_rm(),
+        ),
+        response_cache_scope(
+            response_cache if response_cache is not None else get_response_cache()
+        ),
     ):
         yield
 
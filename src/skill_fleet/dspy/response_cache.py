@@ -0,0 +1,436 @@
+"""
+Module-level LM response cache for skill-fleet DSPy modules.
+
+`BaseModule` subclasses consult the active `ResponseCache` before running
+`aforward()`/`forward()`. Entries are keyed by the module and its predictors'
+signatures and state (instructions, demos), the normalized call inputs, and
+the active LM's model and temperature, so a task processed minutes earlier skips every LM call of that
+module. DSPy's own LM cache only matches byte-identical prompts for a single
+predictor; this layer works on the module's inputs and can optionally match
+near-duplicate inputs by local embedding similarity.
+
+Usage:
+    >>> from skill_fleet.dspy.response_cache import ResponseCache, configure_response_cache
+    >>> configure_response_cache(ResponseCache(max_entries=512, ttl=3600))
+    >>>
+    >>> # Or scoped, e.g. per request
+    >>> with dspy_context(response_cache=ResponseCache(near_duplicate_threshold=0.95)):
+    ...     result = await module.aforward(task_description="...")
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import dspy
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+logger = logging.getLogger(__name__)
+
+_STAT_NAMES = ("hits", "near_hits", "misses", "stores")
+
+
+def normalize_inputs(value: Any) -> Any:
+    """
+    Canonicalize module inputs for cache keys.
+
+    Strings are kept verbatim (indentation and line breaks are meaningful in
+    YAML frontmatter and code); mappings are key-sorted; sets are sorted;
+    pydantic models and predictions become plain dicts; bytes-like values are
+    replaced by their SHA-256 digest.
+
+    Args:
+        value: Call inputs (any nesting of the above)
+
+    Returns:
+        JSON-serializable canonical form
+
+    Raises:
+        TypeError: For any other value (its `str()` may embed an object
+            address, which would give a key that never hits)
+
+    """
+    if value is None or isinstance(value, str | bool | int | float):
+        return value
+    if isinstance(value, BaseModel):
+        return normalize_inputs(value.model_dump(mode="json"))
+    if isinstance(value, dspy.Prediction):
+        return normalize_inputs(value.toDict())
+    if isinstance(value, bytes | bytearray | memoryview):
+        return {"__bytes__": hashlib.sha256(bytes(value)).hexdigest()}
+    if isinstance(value, Mapping):
+        return {str(key): normalize_inputs(item) for key, item in sorted(value.items(), key=str)}
+    if isinstance(value, list | tuple):
+        return [normalize_inputs(item) for item in value]
+    if isinstance(value, set | frozenset):
+        return sorted((normalize_inputs(item) for item in value), key=repr)
+    raise TypeError(f"Cannot canonicalize {type(value).__name__} for the response cache")
+
+
+def lm_identity(lm: Any | None = None) -> tuple[str, float | None] | None:
+    """
+    Describe the LM a call would use.
+
+    Args:
+        lm: LM to describe (defaults to `dspy.settings.lm`)
+
+    Returns:
+        (model, temperature), or None if no LM is configured
+
+    """
+    lm = lm if lm is not None else dspy.settings.lm
+    if lm is None:
+        return None
+    kwargs = getattr(lm, "kwargs", None) or {}
+    temperature = kwargs.get("temperature")
+    return str(getattr(lm, "model", type(lm).__name__)), temperature
+
+
+def _text_of(value: Any) -> str:
+    """Collect the string leaves of normalized inputs for embedding."""
+    if isinstance(value, dict):
+        return " ".join(f"{key} {_text_of(item)}" for key, item in value.items())
+    if isinstance(value, list):
+        return " ".join(_text_of(item) for item in value)
+    return value if isinstance(value, str) else ""
+
+
+class _Entry:
+    __slots__ = ("expires_at", "outputs", "scope", "vector")
+
+    def __init__(self, outputs: dict[str, Any], expires_at: float, scope: str, vector: Any):
+        self.outputs = outputs
+        self.expires_at = expires_at
+        self.scope = scope
+        self.vector = vector
+
+
+class ResponseCache:
+    """
+    Bounded, TTL-based cache of module predictions.
+
+    Exact lookups hash the scope (module, signatures, model, temperature) and
+    normalized inputs. With `near_duplicate_threshold`, a miss falls back to
+    the most similar cached inputs in the same scope (cosine similarity of
+    local hashing embeddings) when the similarity reaches the threshold.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 512,
+        ttl: float = 3600.0,
+        near_duplicate_threshold: float | None = None,
+        embedder: Any | None = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached predictions (least recently used evicted)
+            ttl: Seconds a cached prediction stays valid
+            near_duplicate_threshold: Cosine similarity (0-1] required for a
+                near-duplicate hit; None for exact matches only
+            embedder: Callable embedding a list of texts (defaults to the
+                taxonomy search `HashingEmbedder`; requires NumPy)
+
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.embedder = embedder
+        if near_duplicate_threshold is not None and embedder is None:
+            try:
+                from skill_fleet.taxonomy.search import HashingEmbedder
+
+                self.embedder = HashingEmbedder()
+            except ImportError:
+                logger.warning("Near-duplicate LM cache disabled: numpy is not installed")
+                self.near_duplicate_threshold = None
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        """Count cached predictions (including expired ones not yet purged)."""
+        return len(self._entries)
+
+    @staticmethod
+    def scope(module: str, identity: tuple[str, float | None]) -> str:
+        """Build the lookup scope for a module under an LM identity."""
+        model, temperature = identity
+        return f"{module}|{model}|{temperature}"
+
+    @staticmethod
+    def key(scope: str, inputs: Any) -> str:
+        """Hash a scope and normalized inputs into an entry key."""
+        payload = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{scope}\n{payload}".encode()).hexdigest()
+
+    def _count(self, module: str, stat: str) -> None:
+        self._stats.setdefault(module, dict.fromkeys(_STAT_NAMES, 0))[stat] += 1
+
+    def _embed(self, inputs: Any) -> Any:
+        if self.embedder is None:
+            return None
+        import numpy as np
+
+        vector = np.asarray(self.embedder([_text_of(inputs)])[0], dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def get(self, module: str, scope: str, inputs: Any) -> dict[str, Any] | None:
+        """
+        Look up cached outputs.
+
+        Args:
+            module: Module name (for metrics)
+            scope: Lookup scope from `scope()`
+            inputs: Normalized inputs
+
+        Returns:
+            A copy of the cached output fields, or None
+
+        """
+        key = self.key(scope, inputs)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._count(module, "hits")
+                return copy.deepcopy(entry.outputs)
+            if self.near_duplicate_threshold is None:
+                self._count(module, "misses")
+                return None
+            candidates = [
+                (k, e)
+                for k, e in self._entries.items()
+                if e.scope == scope and e.vector is not None and e.expires_at > now
+            ]
+
+        match = None
+        if candidates:
+            vector = self._embed(inputs)
+            best_key, best = max(candidates, key=lambda item: float(vector @ item[1].vector))
+            if float(vector @ best.vector) >= self.near_duplicate_threshold:
+                match = (best_key, best)
+
+        with self._lock:
+            if match is None:
+                self._count(module, "misses")
+                return None
+            if match[0] in self._entries:
+                self._entries.move_to_end(match[0])
+            self._count(module, "near_hits")
+            return copy.deepcopy(match[1].outputs)
+
+    def set(self, module: str, scope: str, inputs: Any, outputs: dict[str, Any]) -> None:
+        """
+        Store a module's output fields.
+
+        Args:
+            module: Module name (for metrics)
+            scope: Lookup scope from `scope()`
+            inputs: Normalized inputs
+            outputs: Prediction fields to cache
+
+        """
+        vector = self._embed(inputs) if self.near_duplicate_threshold is not None else None
+        entry = _Entry(copy.deepcopy(outputs), time.monotonic() + self.ttl, scope, vector)
+        key = self.key(scope, inputs)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._count(module, "stores")
+
+    def clear(self) -> None:
+        """Drop every cached prediction (metrics are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache metrics.
+
+        Returns:
+            `size`, `max_entries`, totals for hits/near_hits/misses/stores and a
+            `modules` mapping with the same counters per module
+
+        """
+        with self._lock:
+            modules = {name: dict(stats) for name, stats in self._stats.items()}
+            size = len(self._entries)
+        totals: dict[str, Any] = {
+            name: sum(stats[name] for stats in modules.values()) for name in _STAT_NAMES
+        }
+        return {**totals, "size": size, "max_entries": self.max_entries, "modules": modules}
+
+
+_default_cache: ResponseCache | None = None
+_scoped_cache: ContextVar[ResponseCache | None] = ContextVar("lm_response_cache", default=None)
+
+# Modules currently executing through the cache in this context (no re-entry).
+_active_calls: ContextVar[frozenset[int]] = ContextVar(
+    "lm_response_cache_calls", default=frozenset()
+)
+
+
+def configure_response_cache(cache: ResponseCache | None) -> None:
+    """
+    Set the process-wide response cache (None disables it).
+
+    Args:
+        cache: Cache used when no scoped cache is active
+
+    """
+    global _default_cache
+    _default_cache = cache
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Get the response cache active in this context, if any."""
+    scoped = _scoped_cache.get()
+    return scoped if scoped is not None else _default_cache
+
+
+@contextmanager
+def response_cache_scope(cache: ResponseCache | None) -> Generator[None, None, None]:
+    """
+    Use a specific response cache within a block.
+
+    Args:
+        cache: Cache to use
+
+    """
+    token = _scoped_cache.set(cache)
+    try:
+        yield
+    finally:
+        _scoped_cache.reset(token)
+
+
+def module_cache_name(module: Any) -> str:
+    """
+    Name a module for cache scoping.
+
+    The name combines the module class, its predictors' signatures and a hash
+    of the predictors' state (instructions, demos, per-predictor LM), so an
+    optimized or recompiled program never reuses outputs of its earlier
+    version.
+
+    Args:
+        module: Module instance
+
+    Returns:
+        Scope name of the module
+
+    Raises:
+        TypeError: If a predictor's state cannot be canonicalized
+
+    """
+    predictors = list(module.named_predictors())
+    name = type(module).__qualname__
+    if not predictors:
+        return name
+    signatures = sorted({predictor.signature.__name__ for _, predictor in predictors})
+    state = normalize_inputs({path: predictor.dump_state() for path, predictor in predictors})
+    digest = hashlib.sha256(
+        json.dumps(state, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+    return f"{name}[{','.join(signatures)}]@{digest[:16]}"
+
+
+@dataclass(slots=True)
+class CachedCall:
+    """A module call prepared for the response cache (see `prepare_call`)."""
+
+    cache: ResponseCache
+    module: str
+    scope: str
+    inputs: Any
+    hit: dspy.Prediction | None
+
+    def store(self, result: Any) -> None:
+        """Cache the call's result unless it is empty, a fallback, or not serializable."""
+        if not isinstance(result, dspy.Prediction):
+            return
+        outputs = result.toDict()
+        if outputs.get("fallback"):
+            return
+        try:
+            json.dumps(outputs, default=_plain)
+        except TypeError:
+            return
+        self.cache.set(self.module, self.scope, self.inputs, outputs)
+
+
+def _plain(value: Any) -> Any:
+    """JSON fallback accepting pydantic models only."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Not cacheable: {type(value).__name__}")
+
+
+def prepare_call(module: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> CachedCall | None:
+    """
+    Look up a module call in the active response cache.
+
+    Args:
+        module: Module instance being called
+        args: Positional call arguments
+        kwargs: Keyword call arguments
+
+    Returns:
+        CachedCall (with `hit` set on a cache hit), or None when caching does
+        not apply: no active cache, no LM configured, a nested call of a
+        module already executing, a module with `response_cacheable = False`,
+        or inputs or predictor state that cannot be canonicalized
+
+    """
+    cache = get_response_cache()
+    if cache is None or not getattr(module, "response_cacheable", True):
+        return None
+    if id(module) in _active_calls.get():
+        return None
+    identity = lm_identity()
+    if identity is None:
+        return None
+    try:
+        scope = cache.scope(module_cache_name(module), identity)
+        inputs = normalize_inputs({"args": list(args), "kwargs": kwargs})
+    except TypeError:
+        return None
+    name = type(module).__name__
+    outputs = cache.get(name, scope, inputs)
+    hit = dspy.Prediction(**outputs) if outputs is not None else None
+    return CachedCall(cache, name, scope, inputs, hit)
+
+
+@contextmanager
+def active_call(module: Any) -> Generator[None, None, None]:
+    """Mark a module as executing so nested forward/aforward calls bypass the cache."""
+    token = _active_calls.set(_active_calls.get() | {id(module)})
+    try:
+        yield
+    finally:
+        _active_calls.reset(token)
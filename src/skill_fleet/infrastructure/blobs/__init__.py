@@ -0,0 +1,30 @@
+"""
+Blob storage for large payloads kept out of database rows.
+
+This package provides:
+- A content-addressed `BlobStore` interface (pluggable for object storage)
+- `FileBlobStore`, a filesystem store with hash-sharded directories
+- Helpers offloading large JSON values to references and back
+"""
+
+from .store import (
+    BLOB_REF_KEY,
+    BlobNotFoundError,
+    BlobStore,
+    FileBlobStore,
+    blob_ref,
+    is_blob_ref,
+    load_json,
+    offload_json,
+)
+
+__all__ = [
+    "BLOB_REF_KEY",
+    "BlobNotFoundError",
+    "BlobStore",
+    "FileBlobStore",
+    "blob_ref",
+    "is_blob_ref",
+    "load_json",
+    "offload_json",
+]
@@ -0,0 +1,185 @@
+"""
+Content-addressed blob storage for large payloads kept out of database rows.
+
+Blobs are addressed by the SHA-256 of their bytes (`sha256:<hex>`), so
+storing the same payload twice is a no-op and references never go stale
+while a blob exists. `BlobStore` is the pluggable interface (an object
+storage implementation only needs `put`/`get`/`exists`/`delete`);
+`FileBlobStore` keeps blobs on a local or shared filesystem.
+
+JSON payloads are offloaded with `offload_json()`, which replaces values at
+or above a size threshold by a small reference (`{"$blob": ref, "size": n}`),
+and restored with `load_json()`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+
+BLOB_REF_KEY = "$blob"
+_ALGORITHM = "sha256"
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+class BlobNotFoundError(KeyError):
+    """A referenced blob is not in the store."""
+
+
+@runtime_checkable
+class BlobStore(Protocol):
+    """Content-addressed byte storage."""
+
+    def put(self, data: bytes) -> str:
+        """Store bytes and return their reference (`sha256:<hex>`)."""
+
+    def get(self, ref: str) -> bytes:
+        """Return the bytes of a reference (BlobNotFoundError if missing)."""
+
+    def exists(self, ref: str) -> bool:
+        """Whether a reference is stored."""
+
+    def delete(self, ref: str) -> bool:
+        """Remove a blob; return whether it existed."""
+
+
+def blob_ref(data: bytes) -> str:
+    """Return the content address of `data`."""
+    return f"{_ALGORITHM}:{hashlib.sha256(data).hexdigest()}"
+
+
+class FileBlobStore:
+    """
+    Filesystem blob store with hash-sharded directories.
+
+    A blob with digest `abcdef...` is stored at `<root>/ab/cd/abcdef...`, so
+    no directory holds more than a small fraction of all blobs. Writes go to
+    a temporary file that is renamed into place, so readers (including other
+    processes sharing the directory) never see partial blobs.
+    """
+
+    def __init__(self, root: str | Path):
+        """
+        Initialize the store (the root directory is created on first write).
+
+        Args:
+            root: Directory holding the blobs
+
+        """
+        self.root = Path(root)
+
+    def put(self, data: bytes) -> str:
+        """
+        Store bytes (skipped when the same content is already stored).
+
+        Args:
+            data: Blob content
+
+        Returns:
+            Reference of the content
+
+        """
+        ref = blob_ref(data)
+        path = self._path(ref)
+        if path.exists():
+            return ref
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return ref
+
+    def get(self, ref: str) -> bytes:
+        """
+        Read a blob.
+
+        Args:
+            ref: Blob reference
+
+        Returns:
+            Blob content
+
+        Raises:
+            BlobNotFoundError: If the blob is not stored
+
+        """
+        try:
+            return self._path(ref).read_bytes()
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(ref) from e
+
+    def exists(self, ref: str) -> bool:
+        """Whether a blob is stored."""
+        return self._path(ref).exists()
+
+    def delete(self, ref: str) -> bool:
+        """Remove a blob; return whether it existed."""
+        try:
+            self._path(ref).unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _path(self, ref: str) -> Path:
+        algorithm, _, digest = ref.partition(":")
+        if algorithm != _ALGORITHM or len(digest) != 64 or not set(digest) <= _HEX_DIGITS:
+            raise ValueError(f"Invalid blob reference: {ref!r}")
+        return self.root / digest[:2] / digest[2:4] / digest
+
+
+def is_blob_ref(value: Any) -> bool:
+    """Whether a JSON value is a reference written by `offload_json()`."""
+    return isinstance(value, dict) and len(value) == 2 and BLOB_REF_KEY in value and "size" in value
+
+
+def offload_json(value: Any, store: BlobStore, *, threshold: int) -> Any:
+    """
+    Move a large JSON-compatible value into the blob store.
+
+    Args:
+        value: JSON-compatible value
+        store: Blob store receiving large values
+        threshold: Serialized size (bytes) from which values are offloaded
+
+    Returns:
+        `{"$blob": ref, "size": n}` for large values, `value` otherwise
+
+    """
+    if value is None:
+        return None
+    data = json.dumps(value, separators=(",", ":"), sort_keys=True).encode()
+    if len(data) < threshold:
+        return value
+    return {BLOB_REF_KEY: store.put(data), "size": len(data)}
+
+
+def load_json(value: Any, store: BlobStore | None) -> Any:
+    """
+    Materialize a value that may be a blob reference.
+
+    Args:
+        value: Stored JSON value or reference
+        store: Blob store the reference points into
+
+    Returns:
+        The original value (unchanged if it is not a reference)
+
+    Raises:
+        BlobNotFoundError: If the referenced blob is missing or no store is configured
+
+    """
+    if not is_blob_ref(value):
+        return value
+    ref = value[BLOB_REF_KEY]
+    if store is None:
+        raise BlobNotFoundError(ref)
+    return json.loads(store.get(ref))
@@ -888,6 +888,17 @@ class Job(Base):
     hitl_type: Mapped[str | None] = mapped_column(String(32), nullable=True)
     hitl_data: Mapped[dict | None] = mapped_column(JSONType(), nullable=True)
 
+    # Work queue fields: lease_expires_at is NULL for jobs that are not queued;
+    # a queued job can be claimed once its lease has expired (or immediately
+    # after enqueue), and workers extend the lease while the job runs.
+    lease_owner: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # Last completed workflow phase and its outputs, for resumption after restarts
+    checkpoint: Mapped[dict | None] = mapped_column(JSONType(), nullable=True)
+
     # Relationships
     hitl_interactions: Mapped[list["HITLInteraction"]] = relationship(
         "HITLInteraction", back_populates="job", cascade="all, delete-orphan"
@@ -900,6 +911,7 @@ class Job(Base):
         Index("idx_jobs_type", "job_type"),
         Index("idx_jobs_promoted", "promoted"),
         Index("idx_jobs_polling", "user_id", "created_at"),
+        Index("idx_jobs_queue", "lease_expires_at", "created_at"),
     )
 
 
@@ -5,9 +5,9 @@ Repository layer for common CRUD operations on skills fleet entities.
 """
 
 from datetime import UTC, datetime
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, TypeVar, cast
 
-from sqlalchemy import asc, desc
+from sqlalchemy import CursorResult, asc, desc
 from sqlalchemy.orm import Session, joinedload
 
 from .models import (
@@ -371,6 +371,34 @@ class JobRepository(BaseRepository[Job]):
             job_id = UUID(job_id)
         return self.db.query(Job).filter(Job.job_id == job_id).first()
 
+    def update_columns(self, job_id: Any, values: dict[str, Any]) -> bool:
+        """
+        Update only the given columns of a job, without loading the row.
+
+        Emits a single `UPDATE jobs SET <columns> WHERE job_id = ?`, so
+        unchanged (possibly large JSON) columns are neither read nor rewritten.
+
+        Args:
+            job_id: UUID of the job
+            values: Column values to set
+
+        Returns:
+            True if the job exists (and was updated), False otherwise
+
+        """
+        from uuid import UUID
+
+        from sqlalchemy import update
+
+        if isinstance(job_id, str):
+            job_id = UUID(job_id)
+        result = cast(
+            CursorResult[Any],
+            self.db.execute(update(Job).where(Job.job_id == job_id).values(**values)),
+        )
+        self.db.commit()
+        return result.rowcount > 0
+
     def get_by_status(self, status: str, *, limit: int = 100) -> list[Job]:
         """
         Get all jobs with a specific status.
@@ -417,6 +445,66 @@ class JobRepository(BaseRepository[Job]):
             .all()
         )
 
+    # Columns returned by `list_summaries` (no JSON payload columns)
+    SUMMARY_COLUMNS = (
+        "job_id",
+        "status",
+        "user_id",
+        "current_phase",
+        "progress_percent",
+        "progress_message",
+        "hitl_type",
+        "error",
+        "created_at",
+        "updated_at",
+    )
+
+    def list_summaries(
+        self,
+        *,
+        job_ids: list[Any] | None = None,
+        statuses: list[str] | None = None,
+        user_id: str | None = None,
+        after: tuple[datetime, Any] | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """
+        List lightweight job summaries, newest first, with keyset pagination.
+
+        Only `SUMMARY_COLUMNS` are selected, so large JSON columns (result,
+        hitl_data, checkpoint, ...) are never loaded.
+
+        Args:
+            job_ids: Only these jobs (UUIDs)
+            statuses: Only jobs in one of these statuses
+            user_id: Only jobs of this user
+            after: `(created_at, job_id)` of the last row of the previous page
+            limit: Maximum number of rows
+
+        Returns:
+            Summary dicts keyed by column name
+
+        """
+        from sqlalchemy import and_, or_, select
+
+        stmt = select(*(getattr(Job, name) for name in self.SUMMARY_COLUMNS))
+        if job_ids is not None:
+            stmt = stmt.where(Job.job_id.in_(job_ids))
+        if statuses:
+            stmt = stmt.where(Job.status.in_(statuses))
+        if user_id is not None:
+            stmt = stmt.where(Job.user_id == user_id)
+        if after is not None:
+            created_at, job_id = after
+            stmt = stmt.where(
+                or_(
+                    Job.created_at < created_at,
+                    and_(Job.created_at == created_at, Job.job_id < job_id),
+                )
+            )
+        stmt = stmt.order_by(Job.created_at.desc(), Job.job_id.desc()).limit(limit)
+        return [dict(row._mapping) for row in self.db.execute(stmt)]
+
     def update_status(self, job_id: str, status: str, **updates: Any) -> Job | None:
         """Update job status and optionally other fields."""
         job = self.db.query(Job).filter(Job.job_id == job_id).first()
@@ -458,6 +546,187 @@ class JobRepository(BaseRepository[Job]):
             self.db.refresh(job)
         return job
 
+    # -------------------------------------------------------------------------
+    # Work queue (leases)
+    # -------------------------------------------------------------------------
+
+    # Statuses of queued jobs that a worker may (re)start
+    CLAIMABLE_STATUSES = ("pending", "running", "pending_hitl", "pending_user_input")
+
+    def enqueue(self, job_id: Any, payload: dict[str, Any]) -> bool:
+        """
+        Make a job claimable by workers.
+
+        Args:
+            job_id: UUID of the job
+            payload: Data the worker needs to run the job (stored under
+                `job_metadata["request"]`)
+
+        Returns:
+            True if the job exists
+
+        """
+        job = self.get_by_id(job_id)
+        if job is None:
+            return False
+        job.job_metadata = {**(job.job_metadata or {}), "request": payload}
+        job.lease_owner = None
+        job.lease_expires_at = datetime.now(UTC)
+        self.db.commit()
+        return True
+
+    def claim_queued(
+        self,
+        *,
+        owner: str,
+        limit: int,
+        lease_seconds: float,
+        per_user_limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Claim up to `limit` queued jobs whose lease is free or expired.
+
+        On PostgreSQL candidate rows are locked with `FOR UPDATE SKIP LOCKED` so
+        concurrent workers never see the same row. Every claim is also a
+        compare-and-swap on the lease that was read, which is what makes the
+        scheme safe on SQLite (no row locks). Users with fewer active jobs are
+        served first, and users at `per_user_limit` active jobs are skipped.
+
+        Args:
+            owner: Worker identity stored in `lease_owner`
+            limit: Maximum number of jobs to claim
+            lease_seconds: Lease duration; the worker must renew before expiry
+            per_user_limit: Maximum concurrently leased jobs per user (None = no cap)
+
+        Returns:
+            Claimed jobs as dicts with job_id, user_id, attempts and request
+
+        """
+        from datetime import timedelta
+
+        from sqlalchemy import func, update
+
+        if limit <= 0:
+            return []
+        now = datetime.now(UTC)
+        active: dict[str, int] = {
+            row.user_id: row.leased
+            for row in self.db.query(Job.user_id, func.count(Job.job_id).label("leased"))
+            .filter(Job.lease_owner.isnot(None), Job.lease_expires_at > now)
+            .group_by(Job.user_id)
+        }
+        query = (
+            self.db.query(Job.job_id, Job.user_id, Job.lease_expires_at, Job.created_at)
+            .filter(
+                Job.lease_expires_at.isnot(None),
+                Job.lease_expires_at <= now,
+                Job.status.in_(self.CLAIMABLE_STATUSES),
+            )
+            .order_by(Job.created_at.asc())
+            .limit(limit * 4)
+        )
+        if self.db.get_bind().dialect.name == "postgresql":
+            query = query.with_for_update(skip_locked=True)
+        candidates = query.all()
+
+        claimed: list[Any] = []
+        expires = now + timedelta(seconds=lease_seconds)
+        for row in sorted(candidates, key=lambda r: (active.get(r.user_id, 0), r.created_at)):
+            if len(claimed) >= limit:
+                break
+            if per_user_limit is not None and active.get(row.user_id, 0) >= per_user_limit:
+                continue
+            result = cast(
+                CursorResult[Any],
+                self.db.execute(
+                    update(Job)
+                    .where(Job.job_id == row.job_id, Job.lease_expires_at == row.lease_expires_at)
+                    .values(lease_owner=owner, lease_expires_at=expires, attempts=Job.attempts + 1)
+                ),
+            )
+            if result.rowcount:
+                claimed.append(row.job_id)
+                active[row.user_id] = active.get(row.user_id, 0) + 1
+        self.db.commit()
+
+        if not claimed:
+            return []
+        jobs = {job.job_id: job for job in self.db.query(Job).filter(Job.job_id.in_(claimed))}
+        return [
+            {
+                "job_id": str(job.job_id),
+                "user_id": job.user_id,
+                "attempts": job.attempts,
+                "request": (job.job_metadata or {}).get("request"),
+            }
+            for job in (jobs[job_id] for job_id in claimed)
+        ]
+
+    def renew_lease(self, job_id: Any, owner: str, lease_seconds: float) -> bool:
+        """
+        Extend a lease held by `owner` (heartbeat).
+
+        Returns:
+            False if the lease was lost (expired and claimed by another worker)
+
+        """
+        from datetime import timedelta
+
+        from sqlalchemy import update
+
+        result = cast(
+            CursorResult[Any],
+            self.db.execute(
+                update(Job)
+                .where(Job.job_id == self._uuid(job_id), Job.lease_owner == owner)
+                .values(lease_expires_at=datetime.now(UTC) + timedelta(seconds=lease_seconds))
+            ),
+        )
+        self.db.commit()
+        return result.rowcount > 0
+
+    def release_lease(self, job_id: Any, owner: str, *, requeue: bool = False) -> bool:
+        """
+        Release a lease held by `owner`.
+
+        Args:
+            job_id: UUID of the job
+            owner: Worker that holds the lease
+            requeue: Make the job immediately claimable again (e.g. on
+                shutdown) instead of removing it from the queue
+
+        Returns:
+            True if the lease was held by `owner`
+
+        """
+        from sqlalchemy import update
+
+        result = cast(
+            CursorResult[Any],
+            self.db.execute(
+                update(Job)
+                .where(Job.job_id == self._uuid(job_id), Job.lease_owner == owner)
+                .values(lease_owner=None, lease_expires_at=datetime.now(UTC) if requeue else None)
+            ),
+        )
+        self.db.commit()
+        return result.rowcount > 0
+
+    def count_queued(self) -> int:
+        """Count queued jobs that are not yet finished."""
+        return (
+            self.db.query(Job)
+            .filter(Job.lease_expires_at.isnot(None), Job.status.in_(self.CLAIMABLE_STATUSES))
+            .count()
+        )
+
+    @staticmethod
+    def _uuid(job_id: Any) -> Any:
+        """Coerce string job IDs to UUIDs."""
+        from uuid import UUID
+
+        return UUID(job_id) if isinstance(job_id, str) else job_id
+
 
 class TaxonomyRepository(BaseRepository[TaxonomyCategory]):
     """Repository for TaxonomyCategory entity."""
@@ -698,6 +967,28 @@ class UsageRepository:
             for r in results
         ]
 
+    def get_active_users(self, *, days: int = 30, limit: int = 20) -> list[dict]:
+        """Get the users with the most skill usage events."""
+        from datetime import timedelta
+
+        from sqlalchemy import desc, func
+
+        since = datetime.now(UTC) - timedelta(days=days)
+
+        results = (
+            self.db.query(
+                UsageEvent.user_id,
+                func.count(UsageEvent.event_id).label("usage_count"),
+            )
+            .filter(UsageEvent.occurred_at >= since)
+            .group_by(UsageEvent.user_id)
+            .order_by(desc("usage_count"))
+            .limit(limit)
+            .all()
+        )
+
+        return [{"user_id": r.user_id, "usage_count": r.usage_count} for r in results]
+
 
 def get_skill_repository(db: Session) -> SkillRepository:
     """Get a SkillRepository instance."""
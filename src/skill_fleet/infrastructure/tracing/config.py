@@ -266,6 +266,42 @@ class ConfigModelLoader:
         except Exception as e:
             logger.warning("Failed to configure DSPy cache: %s", e)
 
+    def configure_response_cache(self) -> None:
+        """
+        Configure the module-level LM response cache from config.yaml.
+
+        Example config.yaml:
+            dspy:
+              response_cache:
+                enabled: true
+                max_entries: 512
+                ttl_seconds: 3600
+                near_duplicate_threshold: 0.95
+
+        If no configuration is found, the cache is enabled with exact matching.
+        """
+        from ...dspy.response_cache import ResponseCache, configure_response_cache
+
+        cache_config = self.config.get("dspy", {}).get("response_cache", {}) or {}
+        if not cache_config.get("enabled", True):
+            configure_response_cache(None)
+            logger.debug("LM response cache disabled")
+            return
+
+        threshold = cache_config.get("near_duplicate_threshold")
+        configure_response_cache(
+            ResponseCache(
+                max_entries=int(cache_config.get("max_entries", 512)),
+                ttl=float(cache_config.get("ttl_seconds", 3600)),
+                near_duplicate_threshold=float(threshold) if threshold is not None else None,
+            )
+        )
+        logger.debug(
+            "LM response cache configured: max_entries=%s, near_duplicate_threshold=%s",
+            cache_config.get("max_entries", 512),
+            threshold,
+        )
+
 
 # Singleton instance
 _config_loader: ConfigModelLoader | None = None
@@ -4,12 +4,18 @@ from __future__ import annotations
 
 # Export submodules for direct access if needed
 from . import (
+    dependency_graph,
     discovery,
+    meta_writer,
     metadata,
+    metadata_index,
     naming,
+    path_index,
     path_resolver,
+    search,
     skill_loader,
     skill_registration,
+    watcher,
 )
 from .manager import TaxonomyManager
 from .metadata import InfrastructureSkillMetadata
@@ -22,10 +28,16 @@ __all__ = [
     "name_to_skill_id",
     "validate_skill_name",
     # Submodules
+    "dependency_graph",
     "discovery",
     "metadata",
+    "meta_writer",
+    "metadata_index",
     "naming",
+    "path_index",
     "path_resolver",
+    "search",
     "skill_loader",
     "skill_registration",
+    "watcher",
 ]
@@ -0,0 +1,359 @@
+"""
+In-memory skill dependency graph.
+
+`DependencyGraph` maps skill IDs to dense integer ids and keeps forward
+(skill -> dependency) and reverse adjacency arrays, so cycle detection and
+closure queries run in O(V + E) without touching disk:
+
+- Tarjan's algorithm for strongly connected components (all cycles at once)
+- colour-marking DFS for "is there a cycle reachable from this skill"
+- memoized transitive dependency/dependent closures
+
+`TaxonomyManager` keeps the graph in sync with its metadata cache and inserts
+edges incrementally when a skill is registered.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .metadata import InfrastructureSkillMetadata
+
+_WHITE, _GREY, _BLACK = 0, 1, 2
+
+
+class DependencyGraph:
+    """Directed dependency graph over integer skill ids (edge: skill -> dependency)."""
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._out: list[list[int]] = []
+        self._in: list[list[int]] = []
+        self._defined: list[bool] = []
+        self._closures: dict[tuple[int, bool], frozenset[int]] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_metadata(
+        cls, metadata_cache: dict[str, InfrastructureSkillMetadata]
+    ) -> DependencyGraph:
+        """
+        Build a graph from a metadata cache.
+
+        Args:
+            metadata_cache: Dictionary mapping skill IDs to InfrastructureSkillMetadata
+
+        Returns:
+            Populated DependencyGraph
+
+        """
+        graph = cls()
+        graph.update_skills(metadata_cache, metadata_cache)
+        return graph
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _intern(self, skill_id: str) -> int:
+        """Get or allocate the integer id of a skill; callers must hold the lock."""
+        node = self._ids.get(skill_id)
+        if node is None:
+            node = self._ids[skill_id] = len(self._names)
+            self._names.append(skill_id)
+            self._out.append([])
+            self._in.append([])
+            self._defined.append(False)
+        return node
+
+    def set_dependencies(self, skill_id: str, dependencies: Iterable[str]) -> None:
+        """
+        Replace the outgoing edges of a skill.
+
+        Args:
+            skill_id: Skill whose dependencies changed
+            dependencies: Its full dependency list
+
+        """
+        with self._lock:
+            node = self._intern(skill_id)
+            for dep in self._out[node]:
+                self._in[dep].remove(node)
+            targets = list(dict.fromkeys(self._intern(dep_id) for dep_id in dependencies))
+            self._out[node] = targets
+            for dep in targets:
+                self._in[dep].append(node)
+            self._defined[node] = True
+            self._closures.clear()
+
+    def add_dependency(self, skill_id: str, dependency: str) -> list[str] | None:
+        """
+        Insert a single edge.
+
+        Args:
+            skill_id: Dependent skill
+            dependency: Skill it depends on
+
+        Returns:
+            The cycle the new edge closes (e.g. [a, b, a]), or None
+
+        """
+        with self._lock:
+            node, dep = self._intern(skill_id), self._intern(dependency)
+            if dep not in self._out[node]:
+                self._out[node].append(dep)
+                self._in[dep].append(node)
+                self._closures.clear()
+            self._defined[node] = True
+            path = self._path(dep, node)
+            return [self._names[n] for n in (node, *path)] if path else None
+
+    def remove_skill(self, skill_id: str) -> None:
+        """Drop a skill's outgoing edges; edges pointing at it are kept as unresolved."""
+        with self._lock:
+            node = self._ids.get(skill_id)
+            if node is None:
+                return
+            for dep in self._out[node]:
+                self._in[dep].remove(node)
+            self._out[node] = []
+            self._defined[node] = False
+            self._closures.clear()
+
+    def update_skills(
+        self,
+        skill_ids: Iterable[str],
+        metadata_cache: dict[str, InfrastructureSkillMetadata],
+    ) -> None:
+        """
+        Re-sync edges for skills that changed in the metadata cache.
+
+        Args:
+            skill_ids: Skill IDs that were added, changed or removed
+            metadata_cache: Dictionary mapping skill IDs to InfrastructureSkillMetadata
+
+        """
+        with self._lock:
+            for skill_id in list(skill_ids):
+                metadata = metadata_cache.get(skill_id)
+                if metadata is None:
+                    self.remove_skill(skill_id)
+                else:
+                    self.set_dependencies(skill_id, metadata.dependencies)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __contains__(self, skill_id: object) -> bool:
+        """Whether a skill's own dependency list is known to the graph."""
+        node = self._ids.get(skill_id) if isinstance(skill_id, str) else None
+        return node is not None and self._defined[node]
+
+    def _path(self, start: int, goal: int) -> list[int] | None:
+        """Find a dependency path start -> goal (inclusive); callers must hold the lock."""
+        parents = {start: start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node == goal:
+                path = [node]
+                while node != start:
+                    node = parents[node]
+                    path.append(node)
+                return path[::-1]
+            for dep in self._out[node]:
+                if dep not in parents:
+                    parents[dep] = node
+                    stack.append(dep)
+        return None
+
+    def find_cycle(
+        self, skill_id: str, dependencies: Iterable[str] | None = None
+    ) -> list[str] | None:
+        """
+        Find a dependency cycle reachable from a skill.
+
+        Args:
+            skill_id: Skill to start from
+            dependencies: Proposed dependency list for `skill_id` (overrides the
+                stored edges, e.g. to validate a skill before registering it)
+
+        Returns:
+            Cycle as a path that starts and ends with the same skill, or None
+
+        """
+        with self._lock:
+            start = self._ids.get(skill_id)
+            override = None
+            if dependencies is not None:
+                dependencies = list(dependencies)
+                if skill_id in dependencies:
+                    return [skill_id, skill_id]
+                override = [self._ids.get(dep_id, -1) for dep_id in dependencies]
+            if start is None:
+                if override is None:
+                    return None
+                start = -1  # Unregistered skill: only the proposed edges leave it.
+
+            def successors(node: int) -> list[int]:
+                if node == start and override is not None:
+                    return [dep for dep in override if dep != -1]
+                return self._out[node]
+
+            colour: dict[int, int] = {start: _GREY}
+            trail = [start]
+            work = [iter(successors(start))]
+            while work:
+                dep = next(work[-1], None)
+                if dep is None:
+                    colour[trail.pop()] = _BLACK
+                    work.pop()
+                    continue
+                state = colour.get(dep, _WHITE)
+                if state == _GREY:
+                    cycle = trail[trail.index(dep) :] + [dep]
+                    return [skill_id if n == -1 else self._names[n] for n in cycle]
+                if state == _WHITE:
+                    colour[dep] = _GREY
+                    trail.append(dep)
+                    work.append(iter(successors(dep)))
+            return None
+
+    def strongly_connected_components(self) -> list[list[str]]:
+        """
+        Compute strongly connected components with Tarjan's algorithm (iterative).
+
+        Returns:
+            Components in reverse topological order (dependencies first)
+
+        """
+        with self._lock:
+            count = len(self._names)
+            index = [-1] * count
+            low = [0] * count
+            on_stack = [False] * count
+            stack: list[int] = []
+            components: list[list[str]] = []
+            counter = 0
+
+            for root in range(count):
+                if index[root] != -1:
+                    continue
+                index[root] = low[root] = counter
+                counter += 1
+                stack.append(root)
+                on_stack[root] = True
+                work = [(root, 0)]
+
+                while work:
+                    node, position = work[-1]
+                    successors = self._out[node]
+                    if position < len(successors):
+                        work[-1] = (node, position + 1)
+                        dep = successors[position]
+                        if index[dep] == -1:
+                            index[dep] = low[dep] = counter
+                            counter += 1
+                            stack.append(dep)
+                            on_stack[dep] = True
+                            work.append((dep, 0))
+                        elif on_stack[dep]:
+                            low[node] = min(low[node], index[dep])
+                        continue
+
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        component: list[str] = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(self._names[member])
+                            if member == node:
+                                break
+                        components.append(component)
+            return components
+
+    def find_cycles(self) -> list[list[str]]:
+        """
+        Find every group of mutually dependent skills.
+
+        Returns:
+            Strongly connected components that contain a cycle (including
+            skills that depend on themselves)
+
+        """
+        with self._lock:
+            return [
+                component
+                for component in self.strongly_connected_components()
+                if len(component) > 1
+                or self._ids[component[0]] in self._out[self._ids[component[0]]]
+            ]
+
+    def _closure(self, node: int, reverse: bool) -> frozenset[int]:
+        """Memoized reachability set (excluding `node`); callers must hold the lock."""
+        key = (node, reverse)
+        cached = self._closures.get(key)
+        if cached is not None:
+            return cached
+
+        adjacency = self._in if reverse else self._out
+        seen: set[int] = set()
+        stack = list(adjacency[node])
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            stack.extend(adjacency[current])
+        seen.discard(node)
+        closure = self._closures[key] = frozenset(seen)
+        return closure
+
+    def dependencies(self, skill_id: str, *, transitive: bool = False) -> set[str]:
+        """
+        Get the skills a skill depends on.
+
+        Args:
+            skill_id: Skill identifier
+            transitive: Include indirect dependencies (transitive closure)
+
+        Returns:
+            Dependency skill IDs (empty for unknown skills)
+
+        """
+        with self._lock:
+            node = self._ids.get(skill_id)
+            if node is None:
+                return set()
+            targets = self._closure(node, False) if transitive else self._out[node]
+            return {self._names[dep] for dep in targets}
+
+    def dependents(self, skill_id: str, *, transitive: bool = False) -> set[str]:
+        """
+        Get the skills that depend on a skill.
+
+        Args:
+            skill_id: Skill identifier
+            transitive: Include indirect dependents
+
+        Returns:
+            Dependent skill IDs (empty for unknown skills)
+
+        """
+        with self._lock:
+            node = self._ids.get(skill_id)
+            if node is None:
+                return set()
+            sources = self._closure(node, True) if transitive else self._in[node]
+            return {self._names[src] for src in sources}
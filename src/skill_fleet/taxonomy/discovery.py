@@ -3,24 +3,34 @@ Skill discovery and agentskills.io integration utilities.
 
 Provides XML generation for agent context injection and skill discovery
 capabilities following the agentskills.io integration standard.
+
+`AvailableSkillsXmlCache` keeps pre-escaped per-skill `<skill>` fragments and
+memoized documents (with ETags), so repeated XML requests are served from
+memory and a skill change only re-escapes that skill.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
 import threading
 import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
+from .metadata_index import IndexedSkill, skill_dir_fingerprint
 from .naming import skill_id_to_name
+from .skill_loader import iter_load_parallel
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from .metadata import InfrastructureSkillMetadata
+    from .metadata_index import SkillMetadataIndex
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +38,34 @@ _DISCOVERY_SCAN_INTERVAL_SECONDS = 30.0
 _last_discovery_scan: dict[str, float] = {}
 _discovery_scan_lock = threading.Lock()
 
+# Per-user documents are keyed by user, so keep only the most recently used.
+DEFAULT_MAX_XML_DOCUMENTS = 256
+
+
+@dataclass
+class DiscoveryReport:
+    """
+    Outcome and per-phase timings of a discovery refresh.
+
+    Attributes:
+        discovered: Skill directories found by the walk
+        parsed: Directories re-parsed because they were new or changed
+        reused: Directories served from the metadata index unchanged
+        removed: Indexed directories that no longer exist
+        failed: Directories that failed to parse
+        changed_ids: Skill IDs that were added, changed or removed in the cache
+        timings: Seconds spent per phase (walk, fingerprint, parse, index_write)
+
+    """
+
+    discovered: int = 0
+    parsed: int = 0
+    reused: int = 0
+    removed: int = 0
+    failed: int = 0
+    changed_ids: set[str] = field(default_factory=set)
+    timings: dict[str, float] = field(default_factory=dict)
+
 
 def _should_scan(skills_root: Path) -> bool:
     """
@@ -67,64 +105,348 @@ def generate_available_skills_xml(
 
     """
     xml_parts = ["<available_skills>"]
+    xml_parts.extend(
+        _skill_xml_fragment(skill_id, meta) for skill_id, meta in sorted(metadata_cache.items())
+    )
+    xml_parts.append("</available_skills>")
+    return "\n".join(xml_parts)
 
-    for skill_id, meta in sorted(metadata_cache.items()):
-        # Get the SKILL.md path
-        if meta.path.name == "metadata.json":
-            skill_md_location = meta.path.parent / "SKILL.md"
-        else:
-            # Single-file skill (JSON), no SKILL.md
-            skill_md_location = meta.path
 
-        # Escape XML special characters
-        name = _xml_escape(meta.name or skill_id_to_name(skill_id))
-        description = _xml_escape(meta.description or "")
-        location = _xml_escape(str(skill_md_location))
+def _skill_xml_fragment(skill_id: str, meta: InfrastructureSkillMetadata) -> str:
+    """Render the escaped `<skill>` element for one skill."""
+    # Get the SKILL.md path
+    if meta.path.name == "metadata.json":
+        skill_md_location = meta.path.parent / "SKILL.md"
+    else:
+        # Single-file skill (JSON), no SKILL.md
+        skill_md_location = meta.path
+
+    # Escape XML special characters
+    name = _xml_escape(meta.name or skill_id_to_name(skill_id))
+    description = _xml_escape(meta.description or "")
+    location = _xml_escape(str(skill_md_location))
 
-        xml_parts.append(f"""  <skill>
+    return f"""  <skill>
     <name>{name}</name>
     <description>{description}</description>
     <location>{location}</location>
-  </skill>""")
+  </skill>"""
 
-    xml_parts.append("</available_skills>")
-    return "\n".join(xml_parts)
+
+def xml_etag(xml: str) -> str:
+    """Compute a strong HTTP ETag (quoted) for an XML document."""
+    return f'"{hashlib.blake2b(xml.encode("utf-8"), digest_size=16).hexdigest()}"'
+
+
+class AvailableSkillsXmlCache:
+    """
+    Memory-resident store for `<available_skills>` XML.
+
+    Holds one pre-escaped fragment per skill plus fully joined documents keyed
+    by caller-chosen view (e.g. global or per-user); documents are evicted
+    least-recently-used beyond `max_documents`. `invalidate()` drops the
+    fragments of changed skills and all documents; the next `render()` re-escapes
+    only those skills and re-joins the rest from memory. Fragments are also
+    checked against the metadata object they were built from, so a cache entry
+    replaced without an `invalidate()` call is never served stale.
+    """
+
+    def __init__(self, max_documents: int = DEFAULT_MAX_XML_DOCUMENTS) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_documents: Maximum number of memoized view documents
+
+        """
+        self.max_documents = max_documents
+        self._fragments: dict[str, tuple[InfrastructureSkillMetadata, str]] = {}
+        self._documents: OrderedDict[str, tuple[str, str]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every invalidation."""
+        return self._generation
+
+    def get(self, key: str) -> tuple[str, str] | None:
+        """
+        Get a memoized document.
+
+        Args:
+            key: Document view key
+
+        Returns:
+            (xml, etag) tuple, or None if the view must be rendered
+
+        """
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+            return document
+
+    def invalidate(self, skill_ids: Iterable[str] | None = None) -> None:
+        """
+        Drop cached XML affected by changed skills.
+
+        Args:
+            skill_ids: Changed skill IDs (None drops every fragment)
+
+        """
+        with self._lock:
+            if skill_ids is None:
+                self._fragments.clear()
+            else:
+                for skill_id in skill_ids:
+                    self._fragments.pop(skill_id, None)
+            self._documents.clear()
+            self._generation += 1
+
+    def render(
+        self,
+        key: str,
+        metadata_cache: dict[str, InfrastructureSkillMetadata],
+        skill_ids: Iterable[str] | None = None,
+    ) -> tuple[str, str]:
+        """
+        Render (or fetch) the document for a view.
+
+        Args:
+            key: Document view key to memoize under
+            metadata_cache: Dictionary mapping skill IDs to InfrastructureSkillMetadata
+            skill_ids: Skills to include (None includes every cached skill)
+
+        Returns:
+            (xml, etag) tuple
+
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        generation = self._generation
+        selected = sorted(metadata_cache if skill_ids is None else set(skill_ids))
+        xml_parts = ["<available_skills>"]
+        for skill_id in selected:
+            meta = metadata_cache.get(skill_id)
+            if meta is None:
+                continue
+            entry = self._fragments.get(skill_id)
+            if entry is None or entry[0] is not meta:
+                entry = (meta, _skill_xml_fragment(skill_id, meta))
+                self._fragments[skill_id] = entry
+            xml_parts.append(entry[1])
+        xml_parts.append("</available_skills>")
+
+        xml = "\n".join(xml_parts)
+        document = (xml, xml_etag(xml))
+        with self._lock:
+            # Don't memoize a document built from a cache that changed mid-render.
+            if generation == self._generation:
+                self._documents[key] = document
+                self._documents.move_to_end(key)
+                while len(self._documents) > self.max_documents:
+                    self._documents.popitem(last=False)
+        return document
+
+
+def is_ignored_segment(name: str) -> bool:
+    """Return True for system/internal (`_drafts`) or hidden (`.cache`) path segments."""
+    return name.startswith(("_", "."))
+
+
+def _find_skill_dirs(scope: Path, *, include_scope: bool = False) -> list[Path]:
+    """
+    Find discoverable skill directories under `scope`.
+
+    A directory is a skill when it contains `metadata.json` or SKILL.md. System,
+    internal and hidden branches (e.g. `_drafts`, `.cache`) are pruned during the
+    walk rather than filtered afterwards.
+    """
+    skill_dirs: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(scope):
+        dirnames[:] = [name for name in dirnames if not is_ignored_segment(name)]
+        if dirpath == str(scope) and not include_scope:
+            continue
+        if "metadata.json" in filenames or "SKILL.md" in filenames:
+            skill_dirs.append(Path(dirpath))
+    return sorted(skill_dirs)
 
 
 def ensure_all_skills_loaded(
     skills_root: Path,
     metadata_cache: dict[str, InfrastructureSkillMetadata],
     load_dir_func: Callable,
-) -> None:
+    metadata_index: SkillMetadataIndex | None = None,
+    *,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+) -> DiscoveryReport | None:
     """
     Load all skills from disk into the metadata cache.
 
+    Without an index, only skills missing from the cache are loaded. With a
+    `metadata_index`, each skill directory is fingerprinted and only changed
+    directories are re-parsed (in parallel, see `refresh_skill_dirs`);
+    unchanged ones are served from the index and removed ones are evicted from
+    both the cache and the index.
+
     Args:
         skills_root: Root directory of the taxonomy
         metadata_cache: Dictionary mapping skill IDs to InfrastructureSkillMetadata
         load_dir_func: Function to load skill directory metadata
+        metadata_index: Optional persistent index used for incremental refresh
+        max_workers: Parse pool size for indexed refreshes
+        use_processes: Parse in a process pool for indexed refreshes
+
+    Returns:
+        DiscoveryReport for indexed refreshes, None when throttled or unindexed
 
     """
     if not _should_scan(skills_root):
-        return
-
-    # Single directory traversal to find both metadata.json and SKILL.md files
-    candidate_dirs: set[Path] = set()
-    for file_path in skills_root.rglob("*"):
-        if file_path.is_file() and file_path.name in ("metadata.json", "SKILL.md"):
-            candidate_dirs.add(file_path.parent)
+        return None
 
-    for skill_dir in sorted(candidate_dirs):
+    if metadata_index is not None:
+        return refresh_skill_dirs(
+            skills_root,
+            metadata_cache,
+            load_dir_func,
+            metadata_index,
+            max_workers=max_workers,
+            use_processes=use_processes,
+        )
+
+    for skill_dir in _find_skill_dirs(skills_root):
         skill_id = skill_dir.relative_to(skills_root).as_posix()
-        # Skip system/internal branches (e.g. _drafts) from discoverable XML output.
-        if any(part.startswith("_") for part in skill_dir.relative_to(skills_root).parts):
-            continue
         if skill_id not in metadata_cache:
             try:
                 load_dir_func(skill_dir)
             except (OSError, ValueError, KeyError) as exc:
                 # Skip invalid skills - they may have malformed metadata
                 logger.debug("Skipping invalid skill %s: %s", skill_dir, exc)
+    return None
+
+
+def refresh_skill_dirs(
+    skills_root: Path,
+    metadata_cache: dict[str, InfrastructureSkillMetadata],
+    load_dir_func: Callable,
+    metadata_index: SkillMetadataIndex,
+    scope: Path | None = None,
+    *,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+) -> DiscoveryReport:
+    """
+    Reconcile the metadata cache with disk, re-parsing only changed directories.
+
+    Changed directories are parsed across a bounded worker pool (see
+    `skill_loader.iter_load_parallel`) and applied to the cache as each parse
+    completes; cache and index mutations stay on the calling thread, so
+    `load_dir_func` must be side-effect free.
+
+    Args:
+        skills_root: Root directory of the taxonomy
+        metadata_cache: Dictionary mapping skill IDs to InfrastructureSkillMetadata
+        load_dir_func: Function parsing a skill directory into metadata
+        metadata_index: Persistent index holding fingerprints of parsed directories
+        scope: Optional subtree to reconcile (defaults to the whole taxonomy)
+        max_workers: Parse pool size (1 parses serially)
+        use_processes: Parse in a process pool instead of a thread pool
+
+    Returns:
+        DiscoveryReport with counts, changed skill IDs and per-phase timings
+
+    """
+    report = DiscoveryReport()
+    scope = scope or skills_root
+    try:
+        rel_scope = scope.relative_to(skills_root).parts
+    except ValueError:
+        return report
+    if any(is_ignored_segment(part) for part in rel_scope):
+        return report
+
+    prefix = "/".join(rel_scope)
+    started = time.perf_counter()
+    indexed = {
+        rel_dir: entry
+        for rel_dir, entry in metadata_index.entries().items()
+        if not prefix or rel_dir == prefix or rel_dir.startswith(f"{prefix}/")
+    }
+    skill_dirs = _find_skill_dirs(scope, include_scope=bool(prefix))
+    report.discovered = len(skill_dirs)
+    report.timings["walk"] = time.perf_counter() - started
+
+    # Phase 2: fingerprint and split into reusable vs. to-parse directories.
+    started = time.perf_counter()
+    seen: set[str] = set()
+    pending: dict[Path, tuple[str, str]] = {}
+    for skill_dir in skill_dirs:
+        rel_dir = skill_dir.relative_to(skills_root).as_posix()
+        seen.add(rel_dir)
+        fingerprint = skill_dir_fingerprint(skill_dir)
+
+        entry = indexed.get(rel_dir)
+        if entry is not None and entry.fingerprint == fingerprint:
+            report.reused += 1
+            if entry.metadata.skill_id not in metadata_cache:
+                metadata_cache[entry.metadata.skill_id] = entry.metadata
+                report.changed_ids.add(entry.metadata.skill_id)
+            continue
+        pending[skill_dir] = (rel_dir, fingerprint)
+    report.timings["fingerprint"] = time.perf_counter() - started
+
+    # Phase 3: parse new/changed directories, applying results as they complete.
+    started = time.perf_counter()
+    upserts: list[IndexedSkill] = []
+    for skill_dir, metadata, error in iter_load_parallel(
+        pending, load_dir_func, max_workers=max_workers, use_processes=use_processes
+    ):
+        if error is not None:
+            # Skip invalid skills - they may have malformed metadata
+            logger.debug("Skipping invalid skill %s: %s", skill_dir, error)
+            report.failed += 1
+            continue
+        if metadata is None:
+            continue
+
+        rel_dir, fingerprint = pending[skill_dir]
+        entry = indexed.get(rel_dir)
+        if entry is not None and entry.metadata.skill_id != metadata.skill_id:
+            metadata_cache.pop(entry.metadata.skill_id, None)
+            report.changed_ids.add(entry.metadata.skill_id)
+        metadata_cache[metadata.skill_id] = metadata
+        report.changed_ids.add(metadata.skill_id)
+        upserts.append(IndexedSkill(rel_dir, fingerprint, metadata))
+    report.parsed = len(upserts)
+    report.timings["parse"] = time.perf_counter() - started
+
+    removed = [rel_dir for rel_dir in indexed if rel_dir not in seen]
+    for rel_dir in removed:
+        stale = indexed[rel_dir].metadata
+        if metadata_cache.get(stale.skill_id) == stale:
+            del metadata_cache[stale.skill_id]
+            report.changed_ids.add(stale.skill_id)
+    report.removed = len(removed)
+
+    started = time.perf_counter()
+    metadata_index.update(upserts, removed)
+    report.timings["index_write"] = time.perf_counter() - started
+
+    if upserts or removed or report.failed:
+        logger.debug(
+            "Skill index refresh under %s: %d re-parsed, %d removed, %d unchanged, %d failed (%s)",
+            prefix or ".",
+            report.parsed,
+            report.removed,
+            report.reused,
+            report.failed,
+            ", ".join(f"{phase}={secs:.3f}s" for phase, secs in report.timings.items()),
+        )
+    return report
 
 
 def get_skill_for_prompt(
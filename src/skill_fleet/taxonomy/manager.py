@@ -5,7 +5,7 @@ The taxonomy is stored on disk under a configurable `skills_root` directory.
 This manager provides:
 - Metadata loading for always-loaded skills (core, essential MCP, memory blocks)
 - Minimal branch selection for task keyword routing
-- Dependency validation and circular dependency detection
+- Dependency validation and circular dependency detection (in-memory graph)
 - Skill registration (writes metadata + content, updates taxonomy stats)
 - agentskills.io compliance (YAML frontmatter, XML discovery)
 """
@@ -15,32 +15,49 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import threading
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import ValidationError
 
 from ..analytics.engine import UsageTracker
 from ..common.security import resolve_path_within_root, sanitize_taxonomy_path
+from .dependency_graph import DependencyGraph
 from .discovery import (
+    AvailableSkillsXmlCache,
+    DiscoveryReport,
     ensure_all_skills_loaded,
-    generate_available_skills_xml,
     get_skill_for_prompt,
+    refresh_skill_dirs,
 )
-from .metadata import InfrastructureSkillMetadata
+from .meta_writer import MetaWriter
+from .metadata_index import SkillMetadataIndex, skill_dir_fingerprint
 from .models import TaxonomyIndex
-from .naming import skill_id_to_name
+from .path_index import TaxonomyPathIndex
 from .path_resolver import get_parent_skills, resolve_skill_location
+from .search import SkillSearchIndex
 from .skill_loader import (
+    iter_load_parallel,
     load_skill_dir_metadata,
     load_skill_file,
+    load_skill_for_discovery,
     parse_skill_frontmatter,
 )
 from .skill_registration import (
     register_skill,
 )
+from .watcher import TaxonomyWatcher, WatcherBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from .metadata import InfrastructureSkillMetadata
+    from .search import Embedder, SearchHit
 
 logger = logging.getLogger(__name__)
 
@@ -106,12 +123,27 @@ class TaxonomyManager:
 
     _ALWAYS_LOADED_DIRS = ("_core", "mcp_capabilities", "memory_blocks")
 
-    def __init__(self, skills_root: Path) -> None:
+    def __init__(
+        self,
+        skills_root: Path,
+        *,
+        load_workers: int | None = None,
+        meta_flush_interval: float = 1.0,
+        meta_flush_threshold: int = 50,
+        search_embedder: Embedder | None = None,
+    ) -> None:
         """
         Initialize the taxonomy manager.
 
         Args:
             skills_root: Path to the root directory containing skills.
+            load_workers: Worker pool size for bulk metadata loads (None uses the
+                executor default, 1 loads serially).
+            meta_flush_interval: Seconds to coalesce taxonomy_meta.json updates
+                before writing (0 writes on every update).
+            meta_flush_threshold: Pending updates that force an early write.
+            search_embedder: Optional local embedding function for hybrid skill
+                search (e.g. `search.HashingEmbedder()`); None uses BM25 only.
 
         """
         # Treat skills_root as configuration input; resolve it once for consistent
@@ -120,9 +152,27 @@ class TaxonomyManager:
         self.meta_path = self.skills_root / "taxonomy_meta.json"
         self.index_path = self.skills_root / "taxonomy_index.json"
         self.metadata_cache: dict[str, InfrastructureSkillMetadata] = {}
+        self.load_workers = load_workers
         self.meta: dict[str, Any] = {}
         self.index: TaxonomyIndex = TaxonomyIndex()
         self._cache_lock = asyncio.Lock()
+        self.metadata_index = SkillMetadataIndex(
+            self.skills_root / ".cache" / "skill_metadata_index.sqlite3",
+            self.skills_root,
+        )
+        self._watcher: TaxonomyWatcher | None = None
+        self._refresh_lock = threading.Lock()
+        self._change_listeners: list[Callable[[set[str]], None]] = []
+        self.xml_cache = AvailableSkillsXmlCache()
+        self.path_index = TaxonomyPathIndex()
+        self.dependency_graph = DependencyGraph()
+        self.search_index = SkillSearchIndex(embedder=search_embedder)
+        self.meta_writer = MetaWriter(
+            self.meta_path,
+            lambda: self.meta,
+            interval=meta_flush_interval,
+            max_pending=meta_flush_threshold,
+        )
 
         self.usage_tracker = UsageTracker(
             self.skills_root / "_analytics",
@@ -132,6 +182,10 @@ class TaxonomyManager:
         self.load_taxonomy_meta()
         self.load_index()
         self._load_always_loaded_skills()
+        self._hydrate_from_metadata_index()
+        self.path_index.update_skills(self.metadata_cache, self.metadata_cache, self.skills_root)
+        self.dependency_graph.update_skills(self.metadata_cache, self.metadata_cache)
+        self.search_index.update_skills(self.metadata_cache, self.metadata_cache)
 
     async def track_usage(
         self,
@@ -144,24 +198,60 @@ class TaxonomyManager:
         """Track skill usage and update taxonomy stats."""
         self.usage_tracker.track_usage(skill_id, user_id, success, task_id, metadata)
 
-        # Update high-level stats in taxonomy_meta.json
-        usage_stats = self.meta.setdefault("usage_stats", {})
-        skill_stats = usage_stats.setdefault(skill_id, {"count": 0, "successes": 0})
-        skill_stats["count"] += 1
-        if success:
-            skill_stats["successes"] += 1
+        # Update high-level stats in taxonomy_meta.json (written behind, batched)
+        with self.meta_writer.lock:
+            usage_stats = self.meta.setdefault("usage_stats", {})
+            skill_stats = usage_stats.setdefault(skill_id, {"count": 0, "successes": 0})
+            skill_stats["count"] += 1
+            if success:
+                skill_stats["successes"] += 1
+        await self._meta_updated()
+
+    async def _meta_updated(self) -> None:
+        """Queue a taxonomy_meta.json write for in-memory meta changes."""
+        if self.meta_writer.interval > 0:
+            self.meta_writer.mark_dirty()
+        else:
+            await asyncio.to_thread(self.meta_writer.mark_dirty)
 
-        # Async-safe file write
-        await asyncio.to_thread(
-            self.meta_path.write_text, json.dumps(self.meta, indent=2) + "\n", encoding="utf-8"
-        )
+    def update_meta(self, updates: dict[str, Any]) -> None:
+        """
+        Merge top-level fields into taxonomy meta and queue a write.
+
+        Args:
+            updates: Fields to set (e.g. `{"last_updated": ...}`)
+
+        """
+        with self.meta_writer.lock:
+            self.meta.update(updates)
+        self.meta_writer.mark_dirty()
+
+    def flush_meta(self) -> bool:
+        """
+        Write pending taxonomy_meta.json updates now.
+
+        Returns:
+            True if pending updates were written
+
+        """
+        return self.meta_writer.flush()
 
     def load_taxonomy_meta(self) -> dict[str, Any]:
-        """Load taxonomy metadata from disk."""
+        """Load taxonomy metadata from disk (pending in-memory updates are written first)."""
         if not self.meta_path.exists():
             raise FileNotFoundError(f"Taxonomy metadata not found: {self.meta_path}")
 
-        self.meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+        # flush() takes the writer's flush lock before `lock`, so it must not be
+        # called while holding `lock`; reload only once nothing is pending.
+        for _ in range(3):
+            self.meta_writer.flush()
+            with self.meta_writer.lock:
+                if self.meta_writer.pending == 0:
+                    self.meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+                    return self.meta
+        logger.warning(
+            f"Keeping in-memory taxonomy metadata: {self.meta_path} has unwritten updates"
+        )
         return self.meta
 
     def load_index(self) -> TaxonomyIndex:
@@ -175,6 +265,7 @@ class TaxonomyManager:
                 self.index = TaxonomyIndex()
         else:
             self.index = TaxonomyIndex()
+        self.path_index.set_taxonomy_index(self.index)
         return self.index
 
     def resolve_skill_location(self, skill_identifier: str) -> str:
@@ -185,7 +276,9 @@ class TaxonomyManager:
         1. Check Index (canonical ID or alias).
         2. Fallback to Filesystem (legacy support).
         """
-        return resolve_skill_location(skill_identifier, self.skills_root, self.index)
+        return resolve_skill_location(
+            skill_identifier, self.skills_root, self.index, self.path_index
+        )
 
     async def aresolve_skill_location(
         self, skill_identifier: str, progress_callback: Any | None = None
@@ -205,7 +298,11 @@ class TaxonomyManager:
             await progress_callback(f"Resolving skill: {skill_identifier}")
 
         result = await asyncio.to_thread(
-            resolve_skill_location, skill_identifier, self.skills_root, self.index
+            resolve_skill_location,
+            skill_identifier,
+            self.skills_root,
+            self.index,
+            self.path_index,
         )
 
         if progress_callback:
@@ -215,18 +312,268 @@ class TaxonomyManager:
 
     def _load_always_loaded_skills(self) -> None:
         """Load always-loaded skill files into the metadata cache."""
+        started = time.perf_counter()
+        skill_files: list[Path] = []
         for relative_dir in self._ALWAYS_LOADED_DIRS:
             skills_dir = resolve_path_within_root(self.skills_root, relative_dir)
             if not skills_dir.exists():
                 continue
+            skill_files.extend(skills_dir.glob("*.json"))
+        glob_secs = time.perf_counter() - started
+
+        started = time.perf_counter()
+        first_error: Exception | None = None
+        for skill_file, metadata, error in iter_load_parallel(
+            skill_files, load_skill_file, max_workers=self.load_workers
+        ):
+            if error is not None:
+                first_error = first_error or error
+                logger.error(f"Failed to load always-loaded skill {skill_file}: {error}")
+            elif metadata is not None:
+                self.metadata_cache[metadata.skill_id] = metadata
+        if first_error is not None:
+            # Always-loaded skills are required; keep failing loudly as before.
+            raise first_error
+
+        logger.debug(
+            f"Loaded {len(skill_files)} always-loaded skill(s) "
+            f"(glob={glob_secs:.3f}s, parse={time.perf_counter() - started:.3f}s)"
+        )
+
+    def _hydrate_from_metadata_index(self) -> None:
+        """
+        Warm the metadata cache from the persistent discovery index.
+
+        Only entries whose directory still has the indexed stat fingerprint are
+        used, so skills deleted or edited while the process was down are not
+        served from stale rows (the next discovery scan parses them again).
+        """
+        for entry in self.metadata_index.entries().values():
+            if skill_dir_fingerprint(self.skills_root / entry.skill_dir) != entry.fingerprint:
+                continue
+            self.metadata_cache.setdefault(entry.metadata.skill_id, entry.metadata)
+
+    def ensure_all_skills_loaded(self) -> None:
+        """
+        Discover on-disk skills, re-parsing only directories changed since the last scan.
+
+        While a filesystem watcher is running the cache is kept current by change
+        events, so this is a no-op; otherwise a throttled rescan runs.
+        """
+        if self.is_watching:
+            return
+        with self._refresh_lock:
+            updated = dict(self.metadata_cache)
+            report = ensure_all_skills_loaded(
+                self.skills_root,
+                updated,
+                self._discovery_loader(),
+                metadata_index=self.metadata_index,
+                max_workers=self.load_workers,
+            )
+            if report is None or not report.changed_ids:
+                return
+            self.metadata_cache = updated
+            self._metadata_changed(report.changed_ids)
+        self._notify_change_listeners(report.changed_ids)
+
+    def _discovery_loader(self) -> Callable[[Path], InfrastructureSkillMetadata]:
+        """Build a picklable, side-effect-free loader for parallel discovery."""
+        return partial(load_skill_for_discovery, skills_root=self.skills_root)
+
+    def bulk_load_skills(
+        self,
+        *,
+        max_workers: int | None = None,
+        use_processes: bool = False,
+    ) -> DiscoveryReport:
+        """
+        Reconcile the whole taxonomy with disk, bypassing the scan throttle.
+
+        New and changed skill directories are parsed across a worker pool and
+        merged into the cache as they complete. Intended for startup and admin
+        reloads on large trees.
+
+        Args:
+            max_workers: Worker pool size (defaults to `load_workers`)
+            use_processes: Parse in a process pool (for YAML-heavy trees)
+
+        Returns:
+            DiscoveryReport with counts and per-phase timings
+
+        """
+        with self._refresh_lock:
+            updated = dict(self.metadata_cache)
+            report = refresh_skill_dirs(
+                self.skills_root,
+                updated,
+                self._discovery_loader(),
+                self.metadata_index,
+                max_workers=max_workers or self.load_workers,
+                use_processes=use_processes,
+            )
+            if report.changed_ids:
+                self.metadata_cache = updated
+                self._metadata_changed(report.changed_ids)
+
+        logger.info(
+            f"Bulk-loaded {report.discovered} skill dir(s): {report.parsed} parsed, "
+            f"{report.reused} reused, {report.removed} removed, {report.failed} failed ("
+            + ", ".join(f"{phase}={secs:.3f}s" for phase, secs in report.timings.items())
+            + ")"
+        )
+        if report.changed_ids:
+            self._notify_change_listeners(report.changed_ids)
+        return report
+
+    async def abulk_load_skills(
+        self,
+        *,
+        max_workers: int | None = None,
+        use_processes: bool = False,
+    ) -> DiscoveryReport:
+        """Async version of bulk_load_skills (runs in a worker thread)."""
+        return await asyncio.to_thread(
+            self.bulk_load_skills, max_workers=max_workers, use_processes=use_processes
+        )
+
+    # ========================================================================
+    # Live filesystem watching
+    # ========================================================================
+
+    @property
+    def is_watching(self) -> bool:
+        """Whether a filesystem watcher is keeping the metadata cache current."""
+        return self._watcher is not None and self._watcher.is_running
+
+    def add_change_listener(self, listener: Callable[[set[str]], None]) -> None:
+        """
+        Register a callback invoked with the skill IDs affected by a cache update.
+
+        Listeners run on the thread that applied the change (the watcher thread
+        for filesystem events) and must be thread-safe.
+        """
+        self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[set[str]], None]) -> None:
+        """Unregister a callback added with `add_change_listener`."""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def _notify_change_listeners(self, skill_ids: set[str]) -> None:
+        """Fan out a cache change to listeners, isolating listener failures."""
+        for listener in list(self._change_listeners):
+            try:
+                listener(skill_ids)
+            except Exception as e:
+                logger.error(f"Taxonomy change listener failed: {e}", exc_info=True)
+
+    def apply_filesystem_changes(self, changed_paths: Iterable[Path]) -> set[str]:
+        """
+        Reconcile the metadata cache for changed directories.
+
+        The cache is updated copy-on-write: changes are applied to a copy which
+        then replaces `metadata_cache`, so readers iterating the previous dict
+        on another thread never observe a mid-update state.
+
+        Args:
+            changed_paths: Directories (or subtrees) reported as changed
+
+        Returns:
+            Skill IDs that were added, changed or removed
+
+        """
+        scopes: list[Path] = []
+        for path in sorted({Path(p) for p in changed_paths}, key=lambda p: len(p.parts)):
+            if not any(path == scope or scope in path.parents for scope in scopes):
+                scopes.append(path)
+
+        with self._refresh_lock:
+            updated = dict(self.metadata_cache)
+            changed_ids: set[str] = set()
+            for scope in scopes:
+                report = refresh_skill_dirs(
+                    self.skills_root,
+                    updated,
+                    self._discovery_loader(),
+                    self.metadata_index,
+                    scope=scope,
+                    max_workers=self.load_workers,
+                )
+                changed_ids |= report.changed_ids
+            if changed_ids:
+                self.metadata_cache = updated
+                self._metadata_changed(changed_ids)
+
+        if changed_ids:
+            logger.info(f"Taxonomy watcher applied changes to {len(changed_ids)} skill(s)")
+            self._notify_change_listeners(changed_ids)
+        return changed_ids
+
+    def start_watching(
+        self,
+        *,
+        poll_interval: float = 2.0,
+        backend: WatcherBackend = "auto",
+    ) -> TaxonomyWatcher:
+        """
+        Start a filesystem watcher that keeps `metadata_cache` current.
 
-            for skill_file in skills_dir.glob("*.json"):
-                self._load_skill_file(skill_file)
+        Performs one full reconcile first so events only need to carry deltas.
+
+        Args:
+            poll_interval: Poll/stop-check interval in seconds
+            backend: Watcher backend ("auto", "native" or "polling")
+
+        Returns:
+            The running TaxonomyWatcher
+
+        """
+        if self._watcher is not None and self._watcher.is_running:
+            return self._watcher
+
+        self.apply_filesystem_changes([self.skills_root])
+        self._watcher = TaxonomyWatcher(
+            self.skills_root,
+            self.apply_filesystem_changes,
+            poll_interval=poll_interval,
+            backend=backend,
+        )
+        self._watcher.start()
+        return self._watcher
+
+    def stop_watching(self) -> None:
+        """Stop the filesystem watcher, reverting to throttled rescans."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def _cache_metadata(self, metadata: InfrastructureSkillMetadata) -> None:
+        """
+        Store metadata in the cache and patch the derived views.
+
+        Serialized with watcher refreshes and bulk loads, and applied
+        copy-on-write like them, so an entry stored while a refresh runs is not
+        lost when the refreshed copy replaces `metadata_cache`.
+        """
+        with self._refresh_lock:
+            updated = dict(self.metadata_cache)
+            updated[metadata.skill_id] = metadata
+            self.metadata_cache = updated
+            self._metadata_changed([metadata.skill_id])
+
+    def _metadata_changed(self, skill_ids: Iterable[str]) -> None:
+        """Patch derived views (XML, path trie, dependency graph, search) after cache changes."""
+        skill_ids = set(skill_ids)
+        self.xml_cache.invalidate(skill_ids)
+        self.path_index.update_skills(skill_ids, self.metadata_cache, self.skills_root)
+        self.dependency_graph.update_skills(skill_ids, self.metadata_cache)
+        self.search_index.update_skills(skill_ids, self.metadata_cache)
 
     def _load_skill_file(self, skill_file: Path) -> InfrastructureSkillMetadata:
         """Load a skill definition stored as a single JSON file."""
         metadata = load_skill_file(skill_file)
-        self.metadata_cache[metadata.skill_id] = metadata
+        self._cache_metadata(metadata)
         return metadata
 
     def _load_skill_dir_metadata(self, skill_dir: Path) -> InfrastructureSkillMetadata:
@@ -237,7 +584,7 @@ class TaxonomyManager:
         compliant skills.
         """
         metadata = load_skill_dir_metadata(skill_dir)
-        self.metadata_cache[metadata.skill_id] = metadata
+        self._cache_metadata(metadata)
         return metadata
 
     def _load_skill_for_discovery(self, skill_dir: Path) -> InfrastructureSkillMetadata:
@@ -246,39 +593,8 @@ class TaxonomyManager:
 
         Supports both legacy/extended skills with metadata.json and v2 SKILL.md-only skills.
         """
-        metadata_path = skill_dir / "metadata.json"
-        if metadata_path.exists():
-            return self._load_skill_dir_metadata(skill_dir)
-
-        skill_md_path = skill_dir / "SKILL.md"
-        if not skill_md_path.exists():
-            raise FileNotFoundError(f"No skill metadata files found in {skill_dir}")
-
-        skill_id = skill_dir.relative_to(self.skills_root).as_posix()
-        frontmatter = self.parse_skill_frontmatter(skill_md_path)
-        frontmatter_name = frontmatter.get("name")
-        if isinstance(frontmatter_name, str) and frontmatter_name:
-            name = frontmatter_name
-        else:
-            name = skill_id_to_name(skill_id)
-
-        frontmatter_description = frontmatter.get("description")
-        description = frontmatter_description if isinstance(frontmatter_description, str) else ""
-
-        metadata = InfrastructureSkillMetadata(
-            skill_id=skill_id,
-            version="1.0.0",
-            type="technical",
-            weight="medium",
-            load_priority="on_demand",
-            dependencies=[],
-            capabilities=[],
-            path=skill_md_path,
-            always_loaded=False,
-            name=name,
-            description=description,
-        )
-        self.metadata_cache[metadata.skill_id] = metadata
+        metadata = load_skill_for_discovery(skill_dir, self.skills_root)
+        self._cache_metadata(metadata)
         return metadata
 
     async def aload_skill_dir_metadata(self, skill_dir: Path) -> InfrastructureSkillMetadata:
@@ -322,13 +638,50 @@ class TaxonomyManager:
         _ = user_id
         return [skill_id for skill_id, meta in self.metadata_cache.items() if meta.always_loaded]
 
-    def get_relevant_branches(self, task_description: str) -> dict[str, dict[str, str]]:
+    def search_skills(self, query: str, limit: int | None = 10) -> list[SearchHit]:
+        """
+        Rank taxonomy skills against a free-text query.
+
+        Args:
+            query: Search text (task description, keywords, skill name)
+            limit: Maximum number of hits (None returns every match)
+
+        Returns:
+            Hits ordered by descending relevance
+
+        """
+        self.ensure_all_skills_loaded()
+        return self.search_index.search(query, limit)
+
+    def get_relevant_branches(
+        self, task_description: str, max_branches: int = 3
+    ) -> dict[str, dict[str, str]]:
         """
         Get relevant taxonomy branches for a task.
 
-        Returns a subset of taxonomy structure based on simple keyword matching.
+        Branches are the parents of the best-matching skills from the search
+        index. When nothing matches (e.g. an empty taxonomy), a small keyword
+        table picks well-known top-level branches instead.
+
+        Args:
+            task_description: Task to route
+            max_branches: Maximum number of branches to return
+
+        Returns:
+            Mapping of branch path to its child structure
+
         """
         branches: dict[str, dict[str, str]] = {}
+        for hit in self.search_skills(task_description, limit=max_branches * 4):
+            branch = hit.skill_id.rpartition("/")[0]
+            if not branch or branch.startswith("_") or branch in branches:
+                continue
+            branches[branch] = self._get_branch_structure(branch)
+            if len(branches) >= max_branches:
+                return branches
+        if branches:
+            return branches
+
         keywords = task_description.lower().split()
 
         if any(k in keywords for k in ["code", "program", "develop", "script"]):
@@ -345,24 +698,22 @@ class TaxonomyManager:
         return branches
 
     def _get_branch_structure(self, branch_path: str) -> dict[str, str]:
-        """Get directory structure of a taxonomy branch."""
+        """Get the child branches of a taxonomy branch from the path index."""
         safe_branch_path = sanitize_taxonomy_path(branch_path)
         if safe_branch_path is None:
             return {}
 
-        full_path = resolve_path_within_root(self.skills_root, safe_branch_path)
-        if not full_path.exists():
-            return {}
-
-        structure: dict[str, str] = {}
-        for item in full_path.iterdir():
-            if item.is_dir() and not item.name.startswith("_"):
-                structure[item.name] = "available"
-        return structure
+        self.ensure_all_skills_loaded()
+        return {
+            name: "available"
+            for name in self.path_index.children(safe_branch_path)
+            if not name.startswith("_")
+        }
 
     def get_parent_skills(self, taxonomy_path: str) -> list[dict[str, Any]]:
         """Get parent and sibling skills for context."""
-        return get_parent_skills(taxonomy_path, self.skills_root)
+        self.ensure_all_skills_loaded()
+        return get_parent_skills(taxonomy_path, self.skills_root, self.path_index)
 
     async def register_skill(
         self,
@@ -389,9 +740,16 @@ class TaxonomyManager:
                 extra_files=extra_files,
                 overwrite=overwrite,
             )
-            # Update cache with lock protection
+            # Update cache with lock protection (off the loop: a watcher
+            # refresh may hold the refresh lock while it parses)
             async with self._cache_lock:
-                self.metadata_cache[skill_metadata.skill_id] = skill_metadata
+                await asyncio.to_thread(self._cache_metadata, skill_metadata)
+            cycle = self.dependency_graph.find_cycle(skill_metadata.skill_id)
+            if cycle:
+                logger.warning(
+                    f"Registered skill {skill_metadata.skill_id} closes a dependency cycle: "
+                    + " -> ".join(cycle)
+                )
             # Update taxonomy stats
             await self._update_taxonomy_stats(metadata)
             return True
@@ -415,22 +773,33 @@ class TaxonomyManager:
         Returns:
             XML string following agentskills.io format
 
+        """
+        return self.available_skills_xml(user_id)[0]
+
+    def available_skills_xml(self, user_id: str | None = None) -> tuple[str, str]:
+        """
+        Get <available_skills> XML together with its ETag.
+
+        Documents are served from `xml_cache` and only re-rendered after a
+        skill changes, re-escaping just the changed skills.
+
+        Args:
+            user_id: Optional user ID to filter skills to currently mounted entries
+
+        Returns:
+            (xml, etag) tuple; the ETag is a quoted strong validator
+
         """
         # Load all skills from disk if cache is incomplete
-        ensure_all_skills_loaded(
-            self.skills_root, self.metadata_cache, self._load_skill_for_discovery
-        )
+        self.ensure_all_skills_loaded()
 
-        if user_id is None:
-            return generate_available_skills_xml(self.metadata_cache, self.skills_root, user_id)
+        key = "*" if user_id is None else f"user:{user_id}"
+        cached = self.xml_cache.get(key)
+        if cached is not None:
+            return cached
 
-        mounted_skills = set(self.get_mounted_skills(user_id))
-        filtered_cache = {
-            skill_id: metadata
-            for skill_id, metadata in self.metadata_cache.items()
-            if skill_id in mounted_skills
-        }
-        return generate_available_skills_xml(filtered_cache, self.skills_root, user_id)
+        mounted_skills = None if user_id is None else self.get_mounted_skills(user_id)
+        return self.xml_cache.render(key, self.metadata_cache, mounted_skills)
 
     def get_skill_for_prompt(self, skill_id: str) -> str | None:
         """
@@ -451,7 +820,13 @@ class TaxonomyManager:
         return get_skill_for_prompt(skill_id, self.metadata_cache)
 
     async def _update_taxonomy_stats(self, metadata: dict[str, Any]) -> None:
-        """Update taxonomy statistics and persist taxonomy_meta.json."""
+        """Update taxonomy statistics and queue a taxonomy_meta.json write."""
+        with self.meta_writer.lock:
+            self._apply_registration_stats(metadata)
+        await self._meta_updated()
+
+    def _apply_registration_stats(self, metadata: dict[str, Any]) -> None:
+        """Bump registration counters in taxonomy meta; callers must hold the writer lock."""
         stats = self.meta.setdefault("statistics", {})
         by_type = stats.setdefault("by_type", {})
         by_weight = stats.setdefault("by_weight", {})
@@ -470,16 +845,11 @@ class TaxonomyManager:
         skill_priority = str(metadata.get("load_priority", "unknown"))
         by_priority[skill_priority] = int(by_priority.get(skill_priority, 0)) + 1
 
-        # Async-safe file write
-        await asyncio.to_thread(
-            self.meta_path.write_text, json.dumps(self.meta, indent=2) + "\n", encoding="utf-8"
-        )
-
     def validate_dependencies(self, dependencies: list[str]) -> tuple[bool, list[str]]:
         """Validate that all dependencies can be resolved."""
         missing: list[str] = []
         for dep_id in dependencies:
-            if dep_id in self.metadata_cache:
+            if dep_id in self.dependency_graph:
                 continue
 
             if self._try_load_skill_by_id(dep_id) is None:
@@ -510,28 +880,43 @@ class TaxonomyManager:
         self,
         skill_id: str,
         dependencies: list[str],
-        visited: set[str] | None = None,
+        visited: Sequence[str] | None = None,
     ) -> tuple[bool, list[str] | None]:
-        """Detect circular dependency chains."""
-        if visited is None:
-            visited = set()
-
-        if skill_id in visited:
-            return True, [*visited, skill_id]
+        """
+        Detect circular dependency chains reachable from a skill.
 
-        visited.add(skill_id)
+        Runs a single O(V + E) walk over the in-memory dependency graph, using
+        `dependencies` as the (proposed) edges of `skill_id`. Dependencies not
+        yet in the graph are loaded from disk at most once each.
 
-        for dep_id in dependencies:
-            dep_meta = self.get_skill_metadata(dep_id) or self._try_load_skill_by_id(dep_id)
-            if dep_meta is None:
-                continue
+        Args:
+            skill_id: Skill to check
+            dependencies: Its (proposed) dependency list
+            visited: Skills on the caller's DFS path, in visiting order (legacy
+                recursion hook)
 
-            has_cycle, cycle_path = self.detect_circular_dependencies(
-                dep_id,
-                dep_meta.dependencies,
-                visited.copy(),
-            )
-            if has_cycle:
-                return True, cycle_path
+        Returns:
+            (has_cycle, cycle_path) where cycle_path starts and ends with the
+            same skill
 
-        return False, None
+        """
+        if visited and skill_id in visited:
+            path = list(visited)
+            return True, [*path[path.index(skill_id) :], skill_id]
+
+        self._load_dependency_closure(dependencies)
+        cycle = self.dependency_graph.find_cycle(skill_id, dependencies)
+        return (True, cycle) if cycle else (False, None)
+
+    def _load_dependency_closure(self, dependencies: Iterable[str]) -> None:
+        """Load every transitively reachable dependency missing from the graph."""
+        pending = list(dependencies)
+        seen: set[str] = set()
+        while pending:
+            dep_id = pending.pop()
+            if dep_id in seen:
+                continue
+            seen.add(dep_id)
+            if dep_id not in self.dependency_graph and self._try_load_skill_by_id(dep_id) is None:
+                continue
+            pending.extend(self.dependency_graph.dependencies(dep_id))
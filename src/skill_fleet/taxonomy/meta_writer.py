@@ -0,0 +1,179 @@
+"""
+Write-behind persistence for `taxonomy_meta.json`.
+
+Usage tracking and skill registration update counters in the in-memory
+taxonomy meta on every event. Rewriting the whole file each time is slow and,
+with concurrent writers, racy (interleaved `write_text` calls can leave a
+truncated file). `MetaWriter` instead coalesces updates: callers mutate the
+meta under `lock` and call `mark_dirty()`, and the file is rewritten once per
+interval (or sooner when enough updates pile up) via an atomic
+temp-file-and-rename.
+
+`flush_all()` flushes every live writer; the API calls it on shutdown and it
+is also registered with `atexit` for CLI processes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import weakref
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+_writers: weakref.WeakSet[MetaWriter] = weakref.WeakSet()
+
+
+def atomic_write_text(path: Path, payload: str) -> None:
+    """
+    Write text to `path` atomically (temp file in the same directory + rename).
+
+    Readers never observe a partially written file, and a crash mid-write
+    leaves the previous version intact.
+
+    Args:
+        path: Destination file
+        payload: File contents
+
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+class MetaWriter:
+    """
+    Coalescing, atomic writer for a JSON document held in memory.
+
+    Mutate the document while holding `lock`, then call `mark_dirty()`. A
+    background flush happens `interval` seconds after the first pending
+    update, or as soon as `max_pending` updates have accumulated.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        get_data: Callable[[], Any],
+        *,
+        interval: float = 1.0,
+        max_pending: int = 50,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            path: File to persist to
+            get_data: Zero-argument callable returning the current document
+            interval: Seconds to wait before flushing pending updates (0 flushes
+                synchronously on every update)
+            max_pending: Pending update count that triggers an immediate flush
+
+        """
+        self.path = Path(path)
+        self._get_data = get_data
+        self.interval = interval
+        self.max_pending = max_pending
+        self.lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._pending = 0
+        self._timer: threading.Timer | None = None
+        self._timer_immediate = False
+        self.flush_count = 0
+        _writers.add(self)
+
+    @property
+    def pending(self) -> int:
+        """Number of updates not yet written to disk."""
+        return self._pending
+
+    def mark_dirty(self) -> None:
+        """
+        Record an update and schedule a background flush.
+
+        Never blocks on I/O unless `interval` is 0 (synchronous mode), so it is
+        safe to call from the event loop.
+        """
+        with self.lock:
+            self._pending += 1
+            if self.interval > 0:
+                overdue = self._pending >= self.max_pending
+                if self._timer is None or (overdue and not self._timer_immediate):
+                    self._schedule(0.0 if overdue else self.interval)
+                return
+        self.flush()
+
+    def _schedule(self, delay: float) -> None:
+        """(Re)arm the flush timer; callers must hold `lock`."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer_immediate = delay == 0
+        self._timer.start()
+
+    def flush(self) -> bool:
+        """
+        Write pending updates to disk.
+
+        Returns:
+            True if a write happened, False if nothing was pending or it failed
+
+        """
+        with self._flush_lock:
+            with self.lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if self._pending == 0:
+                    return False
+                pending = self._pending
+                # Serialize under the lock so concurrent mutations can't race the dump.
+                payload = json.dumps(self._get_data(), indent=2) + "\n"
+                self._pending = 0
+
+            try:
+                atomic_write_text(self.path, payload)
+            except OSError as e:
+                logger.error(f"Failed to write {self.path}: {e}")
+                with self.lock:
+                    self._pending += pending
+                    # Retry later instead of waiting for the next update
+                    if self.interval > 0 and self._timer is None:
+                        self._schedule(self.interval)
+                return False
+
+            self.flush_count += 1
+            logger.debug(f"Flushed {pending} coalesced update(s) to {self.path}")
+            return True
+
+
+def flush_all() -> int:
+    """
+    Flush every live writer.
+
+    Returns:
+        Number of writers that wrote pending updates
+
+    """
+    return sum(1 for writer in list(_writers) if writer.flush())
+
+
+atexit.register(flush_all)
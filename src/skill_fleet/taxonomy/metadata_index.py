@@ -0,0 +1,246 @@
+"""
+Persistent on-disk index of discovered skill metadata.
+
+Discovery walks the taxonomy tree and parses every `metadata.json` and SKILL.md
+frontmatter it finds. On large trees that parse dominates list/XML latency, so
+this module keeps a SQLite index keyed by skill directory that records a
+stat fingerprint (mtime, size, inode) of both files alongside the parsed
+metadata. Rescans only re-parse directories whose fingerprint changed, and a
+cold start hydrates the whole metadata cache with one sequential read.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .metadata import InfrastructureSkillMetadata
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+# Bump when the row layout or payload format changes; stale indexes are rebuilt.
+_SCHEMA_VERSION = 1
+
+_INDEXED_FILES = ("metadata.json", "SKILL.md")
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedSkill:
+    """
+    A skill directory entry in the metadata index.
+
+    Attributes:
+        skill_dir: Skill directory relative to the skills root (POSIX form)
+        fingerprint: Stat fingerprint of the directory's metadata files
+        metadata: Parsed skill metadata
+
+    """
+
+    skill_dir: str
+    fingerprint: str
+    metadata: InfrastructureSkillMetadata
+
+
+def skill_dir_fingerprint(skill_dir: Path) -> str:
+    """
+    Build a stat fingerprint for the metadata files in a skill directory.
+
+    Any change to mtime, size or inode of `metadata.json` or SKILL.md (including
+    creation or deletion of either file) yields a different fingerprint.
+
+    Args:
+        skill_dir: Absolute path to the skill directory
+
+    Returns:
+        Opaque fingerprint string
+
+    """
+    parts: list[str] = []
+    for file_name in _INDEXED_FILES:
+        try:
+            st = os.stat(skill_dir / file_name)
+        except OSError:
+            parts.append("-")
+            continue
+        parts.append(f"{st.st_mtime_ns}:{st.st_size}:{st.st_ino}")
+    return "|".join(parts)
+
+
+def _metadata_to_payload(metadata: InfrastructureSkillMetadata, skills_root: Path) -> str:
+    """Serialize metadata to a JSON payload with a root-relative path."""
+    try:
+        path = metadata.path.relative_to(skills_root).as_posix()
+    except ValueError:
+        path = str(metadata.path)
+    return json.dumps(
+        {
+            "skill_id": metadata.skill_id,
+            "version": metadata.version,
+            "type": metadata.type,
+            "weight": metadata.weight,
+            "load_priority": metadata.load_priority,
+            "dependencies": list(metadata.dependencies),
+            "capabilities": list(metadata.capabilities),
+            "path": path,
+            "always_loaded": metadata.always_loaded,
+            "name": metadata.name,
+            "description": metadata.description,
+        },
+        separators=(",", ":"),
+    )
+
+
+def _payload_to_metadata(payload: str, skills_root: Path) -> InfrastructureSkillMetadata:
+    """Deserialize a JSON payload produced by `_metadata_to_payload`."""
+    data = json.loads(payload)
+    return InfrastructureSkillMetadata(
+        skill_id=data["skill_id"],
+        version=data["version"],
+        type=data["type"],
+        weight=data["weight"],
+        load_priority=data["load_priority"],
+        dependencies=list(data["dependencies"]),
+        capabilities=list(data["capabilities"]),
+        path=skills_root / data["path"],
+        always_loaded=bool(data["always_loaded"]),
+        name=data["name"],
+        description=data["description"],
+    )
+
+
+class SkillMetadataIndex:
+    """
+    SQLite-backed index of skill directory fingerprints and parsed metadata.
+
+    The index is loaded lazily into memory on first access and kept in sync by
+    `update()`. All failures are logged and degrade to "no index" so a
+    read-only or corrupt index never breaks discovery.
+    """
+
+    def __init__(self, db_path: Path, skills_root: Path) -> None:
+        """
+        Initialize the metadata index.
+
+        Args:
+            db_path: Location of the SQLite index file
+            skills_root: Root directory of the taxonomy (paths are stored relative to it)
+
+        """
+        self.db_path = Path(db_path)
+        self.skills_root = Path(skills_root)
+        self._entries: dict[str, IndexedSkill] | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating or rebuilding the schema as needed."""
+        conn = sqlite3.connect(self.db_path)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != _SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS skill_dirs")
+            conn.execute(
+                "CREATE TABLE skill_dirs ("
+                "skill_dir TEXT PRIMARY KEY, "
+                "fingerprint TEXT NOT NULL, "
+                "payload TEXT NOT NULL)"
+            )
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            conn.commit()
+        return conn
+
+    def _read_all(self) -> dict[str, IndexedSkill]:
+        """Read every index row in a single sequential scan."""
+        if not self.db_path.exists():
+            return {}
+
+        entries: dict[str, IndexedSkill] = {}
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute("SELECT skill_dir, fingerprint, payload FROM skill_dirs")
+                for skill_dir, fingerprint, payload in rows:
+                    try:
+                        metadata = _payload_to_metadata(payload, self.skills_root)
+                    except (KeyError, TypeError, ValueError) as exc:
+                        logger.debug("Dropping unreadable index row %s: %s", skill_dir, exc)
+                        continue
+                    entries[skill_dir] = IndexedSkill(skill_dir, fingerprint, metadata)
+        except sqlite3.Error as exc:
+            logger.warning(f"Failed to read skill metadata index {self.db_path}: {exc}")
+            return {}
+        return entries
+
+    def entries(self) -> dict[str, IndexedSkill]:
+        """
+        Get all indexed skill directories.
+
+        Returns:
+            Mapping of relative skill directory to its index entry (a snapshot copy)
+
+        """
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read_all()
+            return dict(self._entries)
+
+    def update(self, upserts: Iterable[IndexedSkill], deletes: Iterable[str] = ()) -> None:
+        """
+        Apply changed and removed skill directories to the index.
+
+        Args:
+            upserts: Entries to insert or replace
+            deletes: Relative skill directories to remove
+
+        """
+        upserts = list(upserts)
+        deletes = list(deletes)
+        if not upserts and not deletes:
+            return
+
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read_all()
+            for entry in upserts:
+                self._entries[entry.skill_dir] = entry
+            for skill_dir in deletes:
+                self._entries.pop(skill_dir, None)
+
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                with closing(self._connect()) as conn, conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO skill_dirs (skill_dir, fingerprint, payload) "
+                        "VALUES (?, ?, ?)",
+                        [
+                            (
+                                entry.skill_dir,
+                                entry.fingerprint,
+                                _metadata_to_payload(entry.metadata, self.skills_root),
+                            )
+                            for entry in upserts
+                        ],
+                    )
+                    conn.executemany(
+                        "DELETE FROM skill_dirs WHERE skill_dir = ?",
+                        [(skill_dir,) for skill_dir in deletes],
+                    )
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning(f"Failed to persist skill metadata index {self.db_path}: {exc}")
+
+    def clear(self) -> None:
+        """Remove every entry from the index (memory and disk)."""
+        with self._lock:
+            self._entries = {}
+            try:
+                if self.db_path.exists():
+                    self.db_path.unlink()
+            except OSError as exc:
+                logger.warning(f"Failed to remove skill metadata index {self.db_path}: {exc}")
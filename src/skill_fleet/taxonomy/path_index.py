@@ -0,0 +1,362 @@
+"""
+In-memory trie over taxonomy paths.
+
+`TaxonomyPathIndex` is a radix tree keyed by path segment (one edge per
+`/`-separated segment) holding every canonical path from `taxonomy_index.json`
+plus every skill discovered into the metadata cache, and a flat alias table.
+It answers exact, alias, prefix and subtree queries from memory so path
+resolution, existence checks, parent lookups and branch listings do not probe
+the filesystem.
+
+The index is kept in sync by `TaxonomyManager`: `set_taxonomy_index()` when
+`taxonomy_index.json` is (re)loaded and `update_skills()` whenever skills in
+the metadata cache change.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from .metadata import InfrastructureSkillMetadata
+    from .models import TaxonomyIndex
+
+# Where a path entry came from:
+# - "index": canonical path in taxonomy_index.json
+# - "metadata_dir": directory skill with metadata.json
+# - "skill_md": v2 directory skill with SKILL.md only
+# - "skill_file": single-file JSON skill (`<path>.json`)
+PathSource = Literal["index", "metadata_dir", "skill_md", "skill_file"]
+
+
+@dataclass(frozen=True, slots=True)
+class PathEntry:
+    """
+    A skill located at a taxonomy path.
+
+    Attributes:
+        path: Canonical taxonomy path (POSIX, relative to the skills root)
+        skill_id: Skill identifier stored at the path
+        source: Where the entry came from (see `PathSource`)
+
+    """
+
+    path: str
+    skill_id: str
+    source: PathSource
+
+
+@dataclass(slots=True)
+class _Node:
+    """Trie node; `discovered` takes precedence over `indexed` on lookups."""
+
+    children: dict[str, _Node] = field(default_factory=dict)
+    discovered: PathEntry | None = None
+    indexed: PathEntry | None = None
+
+    @property
+    def entry(self) -> PathEntry | None:
+        return self.discovered or self.indexed
+
+
+def _split(path: str) -> list[str]:
+    """Split a taxonomy path into non-empty segments."""
+    return [segment for segment in path.strip("/").split("/") if segment]
+
+
+def metadata_taxonomy_path(
+    metadata: InfrastructureSkillMetadata, skills_root: Path
+) -> tuple[str, PathSource] | None:
+    """
+    Derive the taxonomy path of a loaded skill from its metadata file location.
+
+    Args:
+        metadata: Loaded skill metadata
+        skills_root: Root directory of the taxonomy
+
+    Returns:
+        (path, source) tuple, or None if the skill lives outside the root
+
+    """
+    try:
+        relative = metadata.path.relative_to(skills_root)
+    except ValueError:
+        return None
+
+    if metadata.path.name == "metadata.json":
+        return relative.parent.as_posix(), "metadata_dir"
+    if metadata.path.name == "SKILL.md":
+        return relative.parent.as_posix(), "skill_md"
+    return relative.with_suffix("").as_posix(), "skill_file"
+
+
+class TaxonomyPathIndex:
+    """Thread-safe segment trie over canonical taxonomy paths and aliases."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._root = _Node()
+        self._aliases: dict[str, str] = {}
+        self._indexed_paths: set[str] = set()
+        self._discovered_paths: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(
+        cls,
+        index: TaxonomyIndex,
+        metadata_cache: dict[str, InfrastructureSkillMetadata],
+        skills_root: Path,
+    ) -> TaxonomyPathIndex:
+        """
+        Build an index from the taxonomy index and the metadata cache.
+
+        Args:
+            index: Parsed `taxonomy_index.json`
+            metadata_cache: Dictionary mapping skill IDs to InfrastructureSkillMetadata
+            skills_root: Root directory of the taxonomy
+
+        Returns:
+            Populated TaxonomyPathIndex
+
+        """
+        path_index = cls()
+        path_index.set_taxonomy_index(index)
+        path_index.update_skills(metadata_cache, metadata_cache, skills_root)
+        return path_index
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _node(self, segments: list[str]) -> _Node | None:
+        """Find the node for `segments`; callers must hold the lock."""
+        node = self._root
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                return None
+            node = child
+        return node
+
+    def _ensure_node(self, segments: list[str]) -> _Node:
+        """Find or create the node for `segments`; callers must hold the lock."""
+        node = self._root
+        for segment in segments:
+            node = node.children.setdefault(segment, _Node())
+        return node
+
+    def _prune(self, segments: list[str]) -> None:
+        """Remove empty leaf nodes left behind along `segments`."""
+        trail = [self._root]
+        for segment in segments:
+            child = trail[-1].children.get(segment)
+            if child is None:
+                return
+            trail.append(child)
+        for depth in range(len(segments), 0, -1):
+            node = trail[depth]
+            if node.children or node.entry is not None:
+                return
+            del trail[depth - 1].children[segments[depth - 1]]
+
+    def set_taxonomy_index(self, index: TaxonomyIndex) -> None:
+        """
+        Replace all entries and aliases that came from `taxonomy_index.json`.
+
+        Args:
+            index: Parsed `taxonomy_index.json`
+
+        """
+        with self._lock:
+            for path in self._indexed_paths:
+                segments = _split(path)
+                node = self._node(segments)
+                if node is not None:
+                    node.indexed = None
+                    self._prune(segments)
+            self._indexed_paths.clear()
+            self._aliases.clear()
+
+            for skill_id, entry in index.skills.items():
+                segments = _split(entry.canonical_path)
+                if not segments:
+                    continue
+                path = "/".join(segments)
+                node = self._ensure_node(segments)
+                node.indexed = PathEntry(path, skill_id, "index")
+                self._indexed_paths.add(path)
+                for alias in entry.aliases:
+                    self._aliases[alias] = path
+
+    def update_skills(
+        self,
+        skill_ids: Iterable[str],
+        metadata_cache: dict[str, InfrastructureSkillMetadata],
+        skills_root: Path,
+    ) -> None:
+        """
+        Re-sync discovered entries for skills that changed in the metadata cache.
+
+        Skills missing from `metadata_cache` are removed from the index.
+
+        Args:
+            skill_ids: Skill IDs that were added, changed or removed
+            metadata_cache: Dictionary mapping skill IDs to InfrastructureSkillMetadata
+            skills_root: Root directory of the taxonomy
+
+        """
+        with self._lock:
+            for skill_id in list(skill_ids):
+                old_path = self._discovered_paths.pop(skill_id, None)
+                if old_path is not None:
+                    segments = _split(old_path)
+                    node = self._node(segments)
+                    if (
+                        node is not None
+                        and node.discovered
+                        and node.discovered.skill_id == skill_id
+                    ):
+                        node.discovered = None
+                        self._prune(segments)
+
+                metadata = metadata_cache.get(skill_id)
+                located = metadata_taxonomy_path(metadata, skills_root) if metadata else None
+                if located is None:
+                    continue
+                path, source = located
+                segments = _split(path)
+                if not segments:
+                    continue
+                node = self._ensure_node(segments)
+                node.discovered = PathEntry("/".join(segments), skill_id, source)
+                self._discovered_paths[skill_id] = node.discovered.path
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Count distinct skill paths in the index."""
+        with self._lock:
+            return len(self._indexed_paths | set(self._discovered_paths.values()))
+
+    def lookup(self, path: str) -> PathEntry | None:
+        """
+        Exact lookup of a canonical path.
+
+        Args:
+            path: Taxonomy path
+
+        Returns:
+            The entry stored at `path`, or None
+
+        """
+        with self._lock:
+            node = self._node(_split(path))
+            return node.entry if node is not None else None
+
+    def resolve_alias(self, alias: str) -> str | None:
+        """Get the canonical path an alias points to, if any."""
+        return self._aliases.get(alias)
+
+    def has_branch(self, path: str) -> bool:
+        """Whether any skill lives at or below `path`."""
+        with self._lock:
+            return self._node(_split(path)) is not None
+
+    def children(self, path: str) -> list[str]:
+        """
+        List the immediate child segments under a path.
+
+        Args:
+            path: Taxonomy path ("" for the root)
+
+        Returns:
+            Sorted child segment names (empty if the path is unknown)
+
+        """
+        with self._lock:
+            node = self._node(_split(path))
+            return sorted(node.children) if node is not None else []
+
+    def ancestors(self, path: str) -> list[PathEntry]:
+        """
+        Get the skills stored at proper ancestors of a path.
+
+        Args:
+            path: Taxonomy path
+
+        Returns:
+            Ancestor entries, nearest first
+
+        """
+        segments = _split(path)
+        found: list[PathEntry] = []
+        with self._lock:
+            node = self._root
+            for segment in segments[:-1]:
+                child = node.children.get(segment)
+                if child is None:
+                    break
+                node = child
+                if node.entry is not None:
+                    found.append(node.entry)
+        found.reverse()
+        return found
+
+    def iter_subtree(self, path: str = "") -> Iterator[PathEntry]:
+        """
+        Enumerate every skill at or below a path, in path order.
+
+        Args:
+            path: Taxonomy path ("" for the whole taxonomy)
+
+        Yields:
+            Path entries (a snapshot taken under the lock)
+
+        """
+        with self._lock:
+            node = self._node(_split(path))
+            entries = list(self._walk(node)) if node is not None else []
+        yield from entries
+
+    def iter_prefix(self, prefix: str) -> Iterator[PathEntry]:
+        """
+        Enumerate skills whose path starts with a string prefix.
+
+        The final segment may be partial, e.g. `"technical/prog"` matches
+        `technical/programming/...`.
+
+        Args:
+            prefix: Path prefix
+
+        Yields:
+            Path entries in path order
+
+        """
+        segments = prefix.split("/")
+        head, partial = _split("/".join(segments[:-1])), segments[-1]
+        with self._lock:
+            parent = self._node(head)
+            entries: list[PathEntry] = []
+            if parent is not None:
+                for name in sorted(parent.children):
+                    if name.startswith(partial):
+                        entries.extend(self._walk(parent.children[name]))
+        yield from entries
+
+    @staticmethod
+    def _walk(node: _Node) -> Iterator[PathEntry]:
+        """Pre-order walk yielding entries; callers must hold the lock."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.entry is not None:
+                yield current.entry
+            stack.extend(current.children[name] for name in sorted(current.children, reverse=True))
@@ -3,6 +3,9 @@ Path resolution utilities for taxonomy management.
 
 Provides methods for resolving skill identifiers to their canonical storage paths,
 with support for aliases and filesystem fallback for legacy support.
+
+When a `TaxonomyPathIndex` is supplied, alias and path lookups are answered
+from memory and the filesystem is only probed for identifiers it does not know.
 """
 
 from __future__ import annotations
@@ -19,6 +22,7 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     from .models import TaxonomyIndex
+    from .path_index import TaxonomyPathIndex
 
 logger = logging.getLogger(__name__)
 
@@ -27,18 +31,21 @@ def resolve_skill_location(
     skill_identifier: str,
     skills_root: Path,
     index: TaxonomyIndex,
+    path_index: TaxonomyPathIndex | None = None,
 ) -> str:
     """
     Resolve a skill identifier (ID, path, or alias) to its canonical storage path.
 
     This implements the polyfill strategy:
     1. Check Index (canonical ID or alias).
-    2. Fallback to Filesystem (legacy support).
+    2. Check the in-memory path index (known canonical/discovered paths).
+    3. Fallback to Filesystem (legacy support).
 
     Args:
         skill_identifier: The skill ID, path, or alias to resolve
         skills_root: Root directory of the taxonomy
         index: Taxonomy index containing canonical paths and aliases
+        path_index: Optional in-memory path trie used before probing disk
 
     Returns:
         Canonical storage path for the skill
@@ -52,17 +59,39 @@ def resolve_skill_location(
         return index.skills[skill_identifier].canonical_path
 
     # 1b. Check Index aliases
-    for skill_id, entry in index.skills.items():
-        if skill_identifier in entry.aliases:
+    if path_index is not None:
+        alias_target = path_index.resolve_alias(skill_identifier)
+        if alias_target is not None:
+            entry = path_index.lookup(alias_target)
             logger.warning(
                 f"Deprecation Warning: Accessing skill via alias '{skill_identifier}'. "
-                f"Use canonical ID '{skill_id}' instead."
+                f"Use canonical ID '{entry.skill_id if entry else alias_target}' instead."
             )
-            return entry.canonical_path
+            return alias_target
+    else:
+        for skill_id, entry in index.skills.items():
+            if skill_identifier in entry.aliases:
+                logger.warning(
+                    f"Deprecation Warning: Accessing skill via alias '{skill_identifier}'. "
+                    f"Use canonical ID '{skill_id}' instead."
+                )
+                return entry.canonical_path
 
-    # 2. Filesystem Fallback
-    # Check if the identifier looks like a valid path that exists on disk
     safe_path = sanitize_taxonomy_path(skill_identifier)
+
+    # 2. In-memory path index
+    if safe_path and path_index is not None:
+        path_entry = path_index.lookup(safe_path)
+        if path_entry is not None:
+            if path_entry.source != "index" and "_drafts" not in safe_path:
+                logger.warning(
+                    f"Legacy Access: Skill '{skill_identifier}' found on disk "
+                    f"({path_entry.source}) but missing from Taxonomy Index."
+                )
+            return path_entry.path
+
+    # 3. Filesystem Fallback
+    # Check if the identifier looks like a valid path that exists on disk
     if safe_path:
         full_path = resolve_path_within_root(skills_root, safe_path)
 
@@ -90,15 +119,19 @@ def resolve_skill_location(
 def get_parent_skills(
     taxonomy_path: str,
     skills_root: Path,
+    path_index: TaxonomyPathIndex | None = None,
 ) -> list[dict[str, Any]]:
     """
     Get parent and sibling skills for context.
 
     Walks up the taxonomy tree, searching for metadata.json or single-file JSON skills.
+    With a `path_index`, ancestors are found in memory and only their metadata
+    files are read.
 
     Args:
         taxonomy_path: The taxonomy path to get parents for
         skills_root: Root directory of the taxonomy
+        path_index: Optional in-memory path trie of discovered skills
 
     Returns:
         List of parent skill metadata dictionaries with 'path' and 'metadata' keys
@@ -112,8 +145,25 @@ def get_parent_skills(
     if safe_taxonomy_path is None:
         return []
 
-    path_parts = safe_taxonomy_path.split("/")
     parent_skills: list[dict[str, Any]] = []
+    if path_index is not None:
+        for entry in path_index.ancestors(safe_taxonomy_path):
+            if entry.source == "metadata_dir":
+                metadata_path = resolve_path_within_root(skills_root, entry.path) / "metadata.json"
+            elif entry.source == "skill_file":
+                metadata_path = resolve_path_within_root(skills_root, f"{entry.path}.json")
+            else:
+                # SKILL.md-only and index-only entries carry no JSON metadata.
+                continue
+            try:
+                metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError) as e:
+                logger.debug(f"Skipping unreadable parent skill {entry.path}: {e}")
+                continue
+            parent_skills.append({"path": entry.path, "metadata": metadata})
+        return parent_skills
+
+    path_parts = safe_taxonomy_path.split("/")
 
     # Walk up the tree, searching for metadata.json or single-file JSON skills.
     for i in range(len(path_parts) - 1, 0, -1):
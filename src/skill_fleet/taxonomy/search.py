@@ -0,0 +1,454 @@
+"""
+Local skill search.
+
+`SkillSearchIndex` ranks skills in the metadata cache against free-text
+queries without any network calls:
+
+- a BM25 inverted index over skill name, description, capabilities and
+  taxonomy path segments (fields are weighted by repeating their terms)
+- optional dense embeddings computed by a local `embedder` callable and kept
+  as a NumPy matrix; when present, cosine similarity is blended into the
+  BM25 score so paraphrased queries still find related skills
+
+`TaxonomyManager` keeps the index in sync with its metadata cache (the same
+`update_skills()` hook used by the path trie and dependency graph), so
+registrations and filesystem changes are reflected without a rebuild.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+    import numpy as np
+
+    from .metadata import InfrastructureSkillMetadata
+else:
+    # Optional: only embedding search needs numpy (checked where it is used)
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - exercised only without numpy
+        np = None
+
+# Embedder: maps a batch of documents to one vector per document.
+type Embedder = Callable[[list[str]], Sequence[Sequence[float]]]
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = frozenset(
+    [
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "how",
+        "i",
+        "in",
+        "is",
+        "it",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "this",
+        "to",
+        "use",
+        "used",
+        "using",
+        "when",
+        "with",
+        "you",
+        "your",
+    ]
+)
+
+# Endings after which a plural takes "es" ("boxes", "matches", "wishes")
+_SIBILANTS = ("s", "x", "z", "ch", "sh")
+
+# Term repetitions per field (BM25F-style weighting on a single document).
+_FIELD_WEIGHTS = {"name": 3, "capabilities": 2, "path": 1, "description": 1}
+
+
+def _stem(token: str) -> str:
+    """
+    Strip common English suffixes so inflections of a word share a term.
+
+    "testing"/"tests"/"test", "names"/"name" and "caches"/"caching"/"cache"
+    each map to one stem. "es" is only a suffix after a sibilant ("boxes",
+    "matches"); otherwise just "s" is stripped, and a final "e" is dropped
+    so singular and plural forms agree.
+    """
+    if token.endswith("ies") and len(token) >= 6:
+        return token[:-3] + "y"
+    stem = token
+    if token.endswith(("ing", "ed")):
+        suffix = 3 if token.endswith("ing") else 2
+        if len(token) - suffix >= 3:
+            stem = token[:-suffix]
+    elif token.endswith("es") and token[:-2].endswith(_SIBILANTS) and len(token) >= 5:
+        stem = token[:-2]
+    elif token.endswith("s") and not token.endswith("ss") and len(token) >= 4:
+        stem = token[:-1]
+    if stem.endswith("e") and len(stem) >= 4:
+        stem = stem[:-1]
+    return stem
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into normalized search terms.
+
+    Args:
+        text: Free text, skill name or taxonomy path
+
+    Returns:
+        Lower-cased, stemmed terms with stopwords removed
+
+    """
+    return [_stem(token) for token in _TOKEN_RE.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def skill_document(metadata: InfrastructureSkillMetadata) -> dict[str, str]:
+    """
+    Extract the searchable fields of a skill.
+
+    Args:
+        metadata: Skill metadata
+
+    Returns:
+        Mapping of field name to text
+
+    """
+    return {
+        "name": metadata.name or metadata.skill_id.rsplit("/", 1)[-1],
+        "description": metadata.description,
+        "capabilities": " ".join(metadata.capabilities),
+        "path": metadata.skill_id,
+    }
+
+
+def _weighted_terms(fields: dict[str, str]) -> Counter[str]:
+    """Count a document's terms, repeating each field's terms by its weight."""
+    terms: Counter[str] = Counter()
+    for field_name, weight in _FIELD_WEIGHTS.items():
+        for term in tokenize(fields[field_name]):
+            terms[term] += weight
+    return terms
+
+
+def _document_text(fields: dict[str, str]) -> str:
+    """Flatten document fields into the text handed to an embedder."""
+    return " ".join(
+        fields[name] for name in ("name", "capabilities", "description") if fields[name]
+    )
+
+
+class HashingEmbedder:
+    """
+    Dependency-free local embedder using the hashing trick.
+
+    Each term and character trigram is hashed into a fixed-size vector, so
+    documents that share vocabulary or word fragments (e.g. "postgres" and
+    "postgresql") end up close in cosine space. Requires NumPy.
+    """
+
+    def __init__(self, dim: int = 256) -> None:
+        """
+        Initialize the embedder.
+
+        Args:
+            dim: Embedding dimensionality
+
+        """
+        if np is None:
+            raise ImportError("HashingEmbedder requires numpy")
+        self.dim = dim
+
+    def _bucket(self, feature: str) -> tuple[int, float]:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        return value % self.dim, 1.0 if value >> 63 else -1.0
+
+    def __call__(self, texts: list[str]) -> Any:
+        """Embed a batch of texts into an (n, dim) float32 matrix."""
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in tokenize(text):
+                column, sign = self._bucket(token)
+                matrix[row, column] += 2.0 * sign
+                padded = f"#{token}#"
+                for i in range(len(padded) - 2):
+                    column, sign = self._bucket(padded[i : i + 3])
+                    matrix[row, column] += sign
+        return matrix
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    """
+    A ranked search result.
+
+    Attributes:
+        skill_id: Matching skill
+        score: Relevance score (higher is better; only comparable within a query)
+
+    """
+
+    skill_id: str
+    score: float
+
+
+class SkillSearchIndex:
+    """Thread-safe BM25 index over skill metadata with optional embedding re-scoring."""
+
+    def __init__(
+        self,
+        *,
+        embedder: Embedder | None = None,
+        embedding_weight: float = 0.35,
+        min_similarity: float = 0.2,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            embedder: Optional local embedding function (needs NumPy); None
+                disables dense scoring
+            embedding_weight: Share of the final score taken from cosine
+                similarity when an embedder is configured (0..1)
+            min_similarity: Cosine similarity below which a skill gets no
+                semantic credit (keeps unrelated skills out of the results)
+            k1: BM25 term-frequency saturation
+            b: BM25 document-length normalization
+
+        """
+        if embedder is not None and np is None:
+            raise ImportError("Embedding search requires numpy")
+        self.embedder = embedder
+        self.embedding_weight = embedding_weight
+        self.min_similarity = min_similarity
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._doc_terms: dict[str, Counter[str]] = {}
+        self._doc_lengths: dict[str, int] = {}
+        self._total_length = 0
+        self._vectors: dict[str, Any] = {}
+        self._matrix: Any = None
+        self._matrix_ids: list[str] = []
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_metadata(
+        cls,
+        metadata_cache: dict[str, InfrastructureSkillMetadata],
+        **kwargs: Any,
+    ) -> SkillSearchIndex:
+        """
+        Build an index from a metadata cache.
+
+        Args:
+            metadata_cache: Dictionary mapping skill IDs to InfrastructureSkillMetadata
+            **kwargs: Forwarded to the constructor
+
+        Returns:
+            Populated SkillSearchIndex
+
+        """
+        index = cls(**kwargs)
+        index.update_skills(metadata_cache, metadata_cache)
+        return index
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _remove(self, skill_id: str) -> None:
+        """Drop a document's postings; callers must hold the lock."""
+        terms = self._doc_terms.pop(skill_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            del postings[skill_id]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(skill_id)
+        if self._vectors.pop(skill_id, None) is not None:
+            self._matrix = None
+
+    def _add(self, skill_id: str, terms: Counter[str]) -> None:
+        """Index a document's term counts; callers must hold the lock."""
+        self._doc_terms[skill_id] = terms
+        length = sum(terms.values())
+        self._doc_lengths[skill_id] = length
+        self._total_length += length
+        for term, count in terms.items():
+            self._postings.setdefault(term, {})[skill_id] = count
+
+    def update_skills(
+        self,
+        skill_ids: Iterable[str],
+        metadata_cache: dict[str, InfrastructureSkillMetadata],
+    ) -> None:
+        """
+        Re-index skills that changed in the metadata cache.
+
+        Skills missing from `metadata_cache` are removed from the index.
+
+        Args:
+            skill_ids: Skill IDs that were added, changed or removed
+            metadata_cache: Dictionary mapping skill IDs to InfrastructureSkillMetadata
+
+        """
+        embedder = self.embedder
+        to_embed: dict[str, str] = {}
+        with self._lock:
+            for skill_id in list(skill_ids):
+                self._remove(skill_id)
+                metadata = metadata_cache.get(skill_id)
+                if metadata is None:
+                    continue
+                fields = skill_document(metadata)
+                self._add(skill_id, _weighted_terms(fields))
+                if embedder is not None:
+                    to_embed[skill_id] = _document_text(fields)
+
+        if embedder is not None and to_embed:
+            # Embed outside the lock; a local model may take a while per batch.
+            vectors = np.asarray(embedder(list(to_embed.values())), dtype=np.float32)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1.0, norms)
+            with self._lock:
+                for skill_id, vector in zip(to_embed, vectors, strict=True):
+                    if skill_id in self._doc_terms:
+                        self._vectors[skill_id] = vector
+                self._matrix = None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Count indexed skills."""
+        return len(self._doc_terms)
+
+    def __contains__(self, skill_id: object) -> bool:
+        """Whether a skill is indexed."""
+        return skill_id in self._doc_terms
+
+    def _bm25(self, terms: list[str]) -> dict[str, float]:
+        """Score every document containing a query term; callers must hold the lock."""
+        count = len(self._doc_terms)
+        if count == 0:
+            return {}
+        avg_length = self._total_length / count
+        scores: dict[str, float] = {}
+        for term in dict.fromkeys(terms):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1.0 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for skill_id, tf in postings.items():
+                norm = self.k1 * (1.0 - self.b + self.b * self._doc_lengths[skill_id] / avg_length)
+                scores[skill_id] = scores.get(skill_id, 0.0) + idf * tf * (self.k1 + 1.0) / (
+                    tf + norm
+                )
+        return scores
+
+    def _cosine(self, query: str) -> dict[str, float]:
+        """Cosine similarity of the query against every embedded skill."""
+        with self._lock:
+            if self._matrix is None and self._vectors:
+                self._matrix_ids = list(self._vectors)
+                self._matrix = np.stack([self._vectors[i] for i in self._matrix_ids])
+            matrix, ids = self._matrix, self._matrix_ids
+        if matrix is None or self.embedder is None:
+            return {}
+        vector = np.asarray(self.embedder([query]), dtype=np.float32)[0]
+        norm = float(np.linalg.norm(vector))
+        if norm == 0:
+            return {}
+        similarities = matrix @ (vector / norm)
+        return {
+            skill_id: float(sim)
+            for skill_id, sim in zip(ids, similarities, strict=True)
+            if sim >= self.min_similarity
+        }
+
+    def search(
+        self,
+        query: str,
+        k: int | None = 10,
+        *,
+        min_score: float = 0.0,
+    ) -> list[SearchHit]:
+        """
+        Rank skills against a free-text query.
+
+        Args:
+            query: Search text
+            k: Maximum number of hits (None returns every match)
+            min_score: Drop hits scoring at or below this value
+
+        Returns:
+            Hits ordered by descending score (ties broken by skill ID)
+
+        """
+        terms = tokenize(query)
+        with self._lock:
+            scores = self._bm25(terms)
+
+        if self.embedder is not None and self._vectors:
+            weight = self.embedding_weight
+            top = max(scores.values(), default=0.0)
+            lexical = {skill_id: score / top for skill_id, score in scores.items()}
+            semantic = self._cosine(query)
+            scores = {
+                skill_id: (1.0 - weight) * lexical.get(skill_id, 0.0)
+                + weight * semantic.get(skill_id, 0.0)
+                for skill_id in lexical.keys() | semantic.keys()
+            }
+
+        ranked = ((score, skill_id) for skill_id, score in scores.items() if score > min_score)
+        if k is None:
+            best = sorted(ranked, key=lambda item: (-item[0], item[1]))
+        else:
+            best = heapq.nsmallest(k, ranked, key=lambda item: (-item[0], item[1]))
+        return [SearchHit(skill_id, score) for score, skill_id in best]
+
+
+def rank_texts(query: str, texts: Mapping[str, str]) -> list[SearchHit]:
+    """
+    Rank ad-hoc documents against a query with BM25, without keeping an index.
+
+    Args:
+        query: Search text
+        texts: Mapping of document key to document text
+
+    Returns:
+        Hits for documents sharing at least one term with the query, best first
+
+    """
+    index = SkillSearchIndex()
+    for key, text in texts.items():
+        index._add(key, Counter(tokenize(text)))
+    return index.search(query, k=None)
@@ -5,18 +5,27 @@ Handles loading skill metadata from various storage formats:
 - Single-file JSON skills
 - Directory-based skills with metadata.json
 - agentskills.io compliant skills with YAML frontmatter
+
+Bulk loads can be fanned out across a bounded worker pool with
+`iter_load_parallel`, which yields results as they complete.
+
+SKILL.md frontmatter is read line by line up to the closing `---` only, so the
+(often large) markdown body is never loaded during discovery, and flat
+`key: value` headers are parsed without PyYAML.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, Any
 
 import yaml
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator
 
 
 from .metadata import InfrastructureSkillMetadata
@@ -27,6 +36,29 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Below this many items the pool start-up cost outweighs parallel parsing.
+PARALLEL_LOAD_THRESHOLD = 16
+
+# Errors that mark a single skill as invalid without aborting a bulk load.
+SKILL_LOAD_ERRORS = (OSError, ValueError, KeyError, yaml.YAMLError)
+
+LoadResult = tuple["Path", "InfrastructureSkillMetadata | None", "Exception | None"]
+
+# Upper bound on bytes read while looking for the closing frontmatter marker.
+MAX_FRONTMATTER_BYTES = 64 * 1024
+
+_FRONTMATTER_DELIMITER = b"---"
+
+# `key: value` where both sides are plain scalars PyYAML would load as strings.
+_FLAT_FIELD_RE = re.compile(r"([A-Za-z][\w-]*):(?: +(\S.*))?")
+
+# Plain scalars PyYAML resolves to bool/None instead of str (YAML 1.1 rules).
+_YAML_NON_STRING_WORDS = frozenset(
+    word
+    for base in ("yes", "no", "true", "false", "on", "off", "null")
+    for word in (base, base.capitalize(), base.upper())
+)
+
 
 def load_skill_file(skill_file: Path) -> InfrastructureSkillMetadata:
     """
@@ -106,10 +138,139 @@ def load_skill_dir_metadata(skill_dir: Path) -> InfrastructureSkillMetadata:
     return metadata
 
 
+def load_skill_for_discovery(skill_dir: Path, skills_root: Path) -> InfrastructureSkillMetadata:
+    """
+    Load metadata for discovery from a skill directory.
+
+    Supports both legacy/extended skills with metadata.json and v2 SKILL.md-only
+    skills. Unlike the TaxonomyManager wrappers this has no side effects, so it
+    is safe to call from worker threads.
+
+    Args:
+        skill_dir: Path to the skill directory
+        skills_root: Root directory of the taxonomy (used to derive the skill ID)
+
+    Returns:
+        InfrastructureSkillMetadata object containing the skill's metadata
+
+    Raises:
+        FileNotFoundError: If the directory has neither metadata.json nor SKILL.md
+
+    """
+    if (skill_dir / "metadata.json").exists():
+        return load_skill_dir_metadata(skill_dir)
+
+    skill_md_path = skill_dir / "SKILL.md"
+    if not skill_md_path.exists():
+        raise FileNotFoundError(f"No skill metadata files found in {skill_dir}")
+
+    skill_id = skill_dir.relative_to(skills_root).as_posix()
+    frontmatter = parse_skill_frontmatter(skill_md_path)
+    frontmatter_name = frontmatter.get("name")
+    if isinstance(frontmatter_name, str) and frontmatter_name:
+        name = frontmatter_name
+    else:
+        name = skill_id_to_name(skill_id)
+
+    frontmatter_description = frontmatter.get("description")
+    description = frontmatter_description if isinstance(frontmatter_description, str) else ""
+
+    return InfrastructureSkillMetadata(
+        skill_id=skill_id,
+        version="1.0.0",
+        type="technical",
+        weight="medium",
+        load_priority="on_demand",
+        dependencies=[],
+        capabilities=[],
+        path=skill_md_path,
+        always_loaded=False,
+        name=name,
+        description=description,
+    )
+
+
+def read_frontmatter_block(
+    skill_md_path: Path, max_bytes: int = MAX_FRONTMATTER_BYTES
+) -> str | None:
+    """
+    Read the raw YAML frontmatter of a SKILL.md without reading the body.
+
+    The file is consumed line by line through a buffered binary reader and
+    reading stops at the closing `---` line, so cost is proportional to the
+    header size rather than the file size.
+
+    Args:
+        skill_md_path: Path to the SKILL.md file
+        max_bytes: Give up if no closing marker is found within this many bytes
+
+    Returns:
+        Frontmatter text between the markers, or None if the file has no
+        (bounded) frontmatter block
+
+    Raises:
+        OSError: If the file cannot be read
+
+    """
+    with skill_md_path.open("rb") as handle:
+        first = handle.readline(max_bytes)
+        if not first.startswith(_FRONTMATTER_DELIMITER):
+            return None
+
+        # Content on the opening line after `---` belongs to the block.
+        lines = [first[len(_FRONTMATTER_DELIMITER) :]]
+        consumed = len(first)
+        while consumed < max_bytes:
+            line = handle.readline(max_bytes - consumed)
+            if not line:
+                return None
+            if line.startswith(_FRONTMATTER_DELIMITER):
+                return b"".join(lines).decode("utf-8")
+            lines.append(line)
+            consumed += len(line)
+
+    logger.warning(f"Frontmatter in {skill_md_path} exceeds {max_bytes} bytes; ignoring it")
+    return None
+
+
+def _parse_flat_frontmatter(text: str) -> dict[str, str] | None:
+    """
+    Parse frontmatter made only of `key: plain string` lines without PyYAML.
+
+    Returns None as soon as anything would need real YAML semantics (nesting,
+    quoting, comments, block scalars, non-string scalars), so callers can fall
+    back to `yaml.safe_load` and get identical results.
+    """
+    fields: dict[str, str] = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        match = _FLAT_FIELD_RE.fullmatch(line.rstrip())
+        if match is None:
+            return None
+        key, value = match.groups()
+        if key in _YAML_NON_STRING_WORDS or value is None:
+            return None
+        if (
+            not value[0].isalpha()
+            or value in _YAML_NON_STRING_WORDS
+            or value.endswith(":")
+            or ": " in value
+            or " #" in value
+            or "\t" in value
+        ):
+            return None
+        fields[key] = value
+    return fields
+
+
 def parse_skill_frontmatter(skill_md_path: Path) -> dict[str, Any]:
     """
     Parse YAML frontmatter from a SKILL.md file.
 
+    Only the frontmatter block is read (see `read_frontmatter_block`); flat
+    headers skip PyYAML entirely.
+
     Args:
         skill_md_path: Path to the SKILL.md file
 
@@ -119,23 +280,19 @@ def parse_skill_frontmatter(skill_md_path: Path) -> dict[str, Any]:
 
     """
     try:
-        content = skill_md_path.read_text(encoding="utf-8")
-
-        # Check for YAML frontmatter (starts with ---)
-        if not content.startswith("---"):
+        yaml_content = read_frontmatter_block(skill_md_path)
+        if yaml_content is None:
             return {}
 
-        # Find the closing ---
-        end_marker = content.find("---", 3)
-        if end_marker == -1:
-            return {}
+        flat = _parse_flat_frontmatter(yaml_content)
+        if flat is not None:
+            return flat
 
-        yaml_content = content[3:end_marker].strip()
-        frontmatter = yaml.safe_load(yaml_content) or {}
+        frontmatter = yaml.safe_load(yaml_content.strip()) or {}
 
         return frontmatter
 
-    except (OSError, yaml.YAMLError) as e:
+    except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
         logger.warning(f"Failed to parse frontmatter from {skill_md_path}: {e}")
         return {}
 
@@ -177,3 +334,52 @@ def try_load_skill_by_id(
         return load_skill_file(skill_file)
 
     return None
+
+
+def iter_load_parallel(
+    paths: Iterable[Path],
+    load_func: Callable[[Path], InfrastructureSkillMetadata],
+    *,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+) -> Iterator[LoadResult]:
+    """
+    Load many skills across a bounded worker pool, yielding results as they complete.
+
+    Parsing is dominated by file reads and JSON/YAML decoding, so a thread pool
+    overlaps I/O well; `use_processes` sidesteps the GIL for YAML-heavy trees
+    (`load_func` must then be picklable, e.g. a module-level function or
+    `functools.partial`). Small batches are loaded inline.
+
+    Args:
+        paths: Skill files or directories to load
+        load_func: Side-effect-free loader for a single path
+        max_workers: Pool size (defaults to the executor's own default)
+        use_processes: Use a process pool instead of a thread pool
+
+    Yields:
+        (path, metadata, error) tuples; exactly one of metadata/error is set
+
+    """
+    paths = list(paths)
+    if len(paths) < PARALLEL_LOAD_THRESHOLD or max_workers == 1:
+        for path in paths:
+            try:
+                yield path, load_func(path), None
+            except SKILL_LOAD_ERRORS as exc:
+                yield path, None, exc
+        return
+
+    executor: Executor = (
+        ProcessPoolExecutor(max_workers=max_workers)
+        if use_processes
+        else ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="skill-loader")
+    )
+    with executor:
+        futures = {executor.submit(load_func, path): path for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                yield path, future.result(), None
+            except SKILL_LOAD_ERRORS as exc:
+                yield path, None, exc
@@ -0,0 +1,210 @@
+"""
+Filesystem watching for live taxonomy updates.
+
+`TaxonomyWatcher` reports directories under the skills root whose skill
+metadata may have changed, so `TaxonomyManager` can patch its metadata cache
+incrementally instead of re-walking the tree on a timer.
+
+Two backends are supported:
+- native: OS change notifications (inotify/FSEvents/ReadDirectoryChangesW)
+  via the optional `watchfiles` package
+- polling: periodic walk diffing directory mtimes and skill file fingerprints,
+  used when `watchfiles` is unavailable or explicitly requested
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from .discovery import is_ignored_segment
+from .metadata_index import skill_dir_fingerprint
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+WatcherBackend = Literal["auto", "native", "polling"]
+
+_SKILL_FILES = ("metadata.json", "SKILL.md")
+
+
+def _scope_for_path(path: Path) -> Path:
+    """Map a changed file path to the directory whose skills should be re-checked."""
+    if path.name in _SKILL_FILES:
+        return path.parent
+    return path
+
+
+class TaxonomyWatcher:
+    """
+    Background watcher that reports changed directories under a skills root.
+
+    The `on_change` callback runs on the watcher thread with a set of absolute
+    directory paths; each path should be treated as a subtree to reconcile.
+    """
+
+    def __init__(
+        self,
+        skills_root: Path,
+        on_change: Callable[[set[Path]], object],
+        *,
+        poll_interval: float = 2.0,
+        backend: WatcherBackend = "auto",
+    ) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            skills_root: Root directory of the taxonomy
+            on_change: Callback receiving the set of changed directories (its return value is ignored)
+            poll_interval: Seconds between polls (polling backend) or between
+                stop checks (native backend)
+            backend: "native", "polling", or "auto" (native when available)
+
+        """
+        self.skills_root = Path(skills_root)
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.backend = self._select_backend(backend)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._dir_mtimes: dict[str, int] = {}
+        self._fingerprints: dict[str, str] = {}
+
+    @staticmethod
+    def _select_backend(backend: WatcherBackend) -> Literal["native", "polling"]:
+        """Resolve the requested backend against what is installed."""
+        if backend == "polling":
+            return "polling"
+        try:
+            import watchfiles  # noqa: F401
+        except ImportError:
+            if backend == "native":
+                raise
+            return "polling"
+        return "native"
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the watcher thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start watching in a daemon thread."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        if self.backend == "polling":
+            self._dir_mtimes, self._fingerprints = self._snapshot()
+        self._thread = threading.Thread(
+            target=self._run_native if self.backend == "native" else self._run_polling,
+            name=f"taxonomy-watcher-{self.backend}",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"Taxonomy watcher started ({self.backend}) for {self.skills_root}")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the watcher thread and wait for it to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _dispatch(self, changed: Iterable[Path]) -> None:
+        """Invoke the change callback, isolating watcher from callback failures."""
+        scopes = set(changed)
+        if not scopes:
+            return
+        try:
+            self.on_change(scopes)
+        except Exception as e:
+            logger.error(f"Taxonomy change handler failed: {e}", exc_info=True)
+
+    def _is_relevant(self, path: Path) -> bool:
+        """Filter out paths inside ignored branches (drafts, caches, VCS metadata)."""
+        try:
+            parts = path.relative_to(self.skills_root).parts
+        except ValueError:
+            return False
+        return bool(parts) and not any(is_ignored_segment(part) for part in parts)
+
+    # ------------------------------------------------------------------
+    # Native backend
+    # ------------------------------------------------------------------
+
+    def _run_native(self) -> None:
+        """Consume OS change notifications until stopped."""
+        from watchfiles import watch
+
+        try:
+            for changes in watch(
+                self.skills_root,
+                watch_filter=lambda _change, path: self._is_relevant(Path(path)),
+                stop_event=self._stop_event,
+                rust_timeout=int(self.poll_interval * 1000),
+                yield_on_timeout=False,
+            ):
+                self._dispatch(_scope_for_path(Path(path)) for _change, path in changes)
+        except Exception as e:
+            if not self._stop_event.is_set():
+                logger.error(f"Native taxonomy watcher failed, falling back to polling: {e}")
+                self.backend = "polling"
+                self._dir_mtimes, self._fingerprints = self._snapshot()
+                self._run_polling()
+
+    # ------------------------------------------------------------------
+    # Polling backend
+    # ------------------------------------------------------------------
+
+    def _snapshot(self) -> tuple[dict[str, int], dict[str, str]]:
+        """Walk the tree recording directory mtimes and skill file fingerprints."""
+        dir_mtimes: dict[str, int] = {}
+        fingerprints: dict[str, str] = {}
+        for dirpath, dirnames, filenames in os.walk(self.skills_root):
+            dirnames[:] = [name for name in dirnames if not is_ignored_segment(name)]
+            try:
+                dir_mtimes[dirpath] = os.stat(dirpath).st_mtime_ns
+            except OSError:
+                continue
+            if any(name in filenames for name in _SKILL_FILES):
+                fingerprints[dirpath] = skill_dir_fingerprint(Path(dirpath))
+        return dir_mtimes, fingerprints
+
+    def poll_once(self) -> set[Path]:
+        """
+        Diff the tree against the previous snapshot.
+
+        Directories whose mtime changed (entries added, removed or renamed) and
+        skill directories whose metadata fingerprint changed are reported.
+
+        Returns:
+            Set of changed directories (absolute paths)
+
+        """
+        dir_mtimes, fingerprints = self._snapshot()
+        changed: set[Path] = set()
+
+        for dirpath in dir_mtimes.keys() | self._dir_mtimes.keys():
+            if dir_mtimes.get(dirpath) != self._dir_mtimes.get(dirpath):
+                changed.add(Path(dirpath))
+        for dirpath in fingerprints.keys() | self._fingerprints.keys():
+            if fingerprints.get(dirpath) != self._fingerprints.get(dirpath):
+                changed.add(Path(dirpath))
+
+        self._dir_mtimes, self._fingerprints = dir_mtimes, fingerprints
+        changed.discard(self.skills_root)
+        return changed
+
+    def _run_polling(self) -> None:
+        """Poll the tree until stopped."""
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self._dispatch(self.poll_once())
+            except Exception as e:
+                logger.error(f"Taxonomy polling failed: {e}", exc_info=True)
@@ -0,0 +1,111 @@
+"""Tests for the indexed in-memory job cache shared by JobManager and the jobs helpers."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from skill_fleet.api.schemas.models import JobState
+from skill_fleet.api.services import job_manager as job_manager_module
+from skill_fleet.api.services import jobs as jobs_module
+from skill_fleet.api.services.job_manager import JobManager, JobMemoryStore
+
+
+def _age(store: JobMemoryStore, job_id: str, **delta: float) -> None:
+    job, written_at = store.store[job_id]
+    store.store[job_id] = (job, written_at - timedelta(**delta))
+
+
+def test_find_uses_indexes_and_follows_in_place_mutations():
+    store = JobMemoryStore()
+    for job_id, status, user_id in [
+        ("a", "running", "alice"),
+        ("b", "pending_hitl", "alice"),
+        ("c", "pending_hitl", "bob"),
+        ("d", "completed", "bob"),
+    ]:
+        store.put(job_id, JobState(job_id=job_id, status=status, user_id=user_id))
+
+    assert [job.job_id for job in store.find(user_id="alice")] == ["a", "b"]
+    assert [job.job_id for job in store.pending_hitl()] == ["b", "c"]
+    assert [job.job_id for job in store.pending_hitl(user_id="bob")] == ["c"]
+
+    # Workflows mutate cached jobs directly; the new status is found first
+    # thing, without an earlier lookup visiting the job
+    job_b = store.peek("b")
+    assert job_b is not None
+    job_b.status = "running"
+    assert [job.job_id for job in store.find(statuses={"running"})] == ["a", "b"]
+    assert [job.job_id for job in store.pending_hitl()] == ["c"]
+    job_b.user_id = "bob"
+    assert [job.job_id for job in store.find(user_id="bob")] == ["b", "c", "d"]
+
+    # A copy of a cached job does not move the cached one in the indexes
+    copy = job_b.model_copy()
+    copy.status = "failed"
+    assert store.find(statuses={"failed"}) == []
+
+    assert store.discard("c")
+    assert store.pending_hitl() == []
+    assert store.find(user_id="nobody") == []
+
+
+def test_prune_keeps_jobs_waiting_for_a_human_longer():
+    store = JobMemoryStore(ttl_minutes=60, hitl_ttl_hours=24)
+    store.put("old", JobState(job_id="old", status="running"))
+    store.put("waiting", JobState(job_id="waiting", status="pending_hitl"))
+    store.put("stale", JobState(job_id="stale", status="pending_hitl"))
+    store.put("fresh", JobState(job_id="fresh", status="running"))
+    _age(store, "old", minutes=90)
+    _age(store, "waiting", hours=2)
+    _age(store, "stale", hours=25)
+
+    assert store.prune() == 2
+    assert list(store.store) == ["waiting", "fresh"]
+    assert store.pending_hitl()[0].job_id == "waiting"
+
+
+def test_eviction_drops_least_recently_written_jobs_first():
+    store = JobMemoryStore(max_jobs=3)
+    store.put("hitl", JobState(job_id="hitl", status="pending_hitl"))
+    store.put("a", JobState(job_id="a"))
+    store.put("b", JobState(job_id="b"))
+    job_a = store.peek("a")
+    assert job_a is not None
+    store.put("a", job_a)  # Rewritten: now newer than "b"
+    store.put("c", JobState(job_id="c"))
+    store.put("d", JobState(job_id="d"))
+
+    # The HITL job is the oldest entry but is spared while others can go
+    assert list(store.store) == ["hitl", "c", "d"]
+    assert len(store._indexed) == len(store) == 3
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = JobManager()
+    monkeypatch.setattr(job_manager_module, "_job_manager", manager)
+    return manager
+
+
+async def test_jobs_helpers_share_instances_with_the_manager(manager):
+    job_id = await jobs_module.create_job("write a skill", user_id="alice")
+    job = await manager.get_job(job_id)
+    assert job is not None
+
+    assert jobs_module.JOBS[job_id] is job
+    assert await jobs_module.get_job(job_id) is job
+    assert [cached.job_id for cached in manager.memory.find(user_id="alice")] == [job_id]
+
+    await jobs_module.update_job(job_id, {"status": "pending_hitl"})
+    await jobs_module.deliver_hitl_response(job_id, {"answer": "yes"})
+    assert job.hitl_event is not None and job.hitl_event.is_set()
+    assert job.hitl_response == {"answer": "yes"}
+    assert manager.memory.pending_hitl() == [job]
+
+    assert jobs_module.JOBS.pop(job_id) is job
+    assert job_id not in jobs_module.JOBS
+    assert job_id not in manager.memory
+    assert await manager.get_job(job_id) is None
+    assert datetime.now(UTC) - job.updated_at < timedelta(minutes=1)
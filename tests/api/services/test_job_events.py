@@ -0,0 +1,112 @@
+"""Tests for the job event relay between API processes and workers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from skill_fleet.api.cache_redis import LocalRedisServer, RedisInvalidationBus, RespClient
+from skill_fleet.api.schemas.models import JobState
+from skill_fleet.api.services import event_registry as event_registry_module
+from skill_fleet.api.services import job_manager as job_manager_module
+from skill_fleet.api.services import jobs as jobs_module
+from skill_fleet.api.services.event_registry import EventQueueRegistry
+from skill_fleet.api.services.job_events import JOB_EVENTS_CHANNEL, JobEventRelay
+from skill_fleet.api.services.job_manager import JobManager
+from skill_fleet.core.workflows.streaming import WorkflowEvent, WorkflowEventType
+
+
+@pytest.fixture
+async def client():
+    async with LocalRedisServer() as server:
+        client = RespClient.from_url(server.url)
+        yield client
+        await client.close()
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = JobManager()
+    monkeypatch.setattr(job_manager_module, "_job_manager", manager)
+    monkeypatch.setattr(event_registry_module, "_event_registry", EventQueueRegistry())
+    return manager
+
+
+@pytest.fixture
+async def peer(client):
+    """The other side of the bus (a worker or an API process)."""
+    received: list[dict] = []
+    bus = RedisInvalidationBus(client, channel=JOB_EVENTS_CHANNEL)
+
+    async def collect(message: dict) -> None:
+        received.append(message)
+
+    await bus.start(collect)
+    yield bus, received
+    await bus.stop()
+
+
+async def _eventually(predicate, timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+async def test_api_mirrors_job_state_and_events_from_workers(client, manager, peer):
+    bus, _ = peer
+    job = JobState(job_id="job-1", status="running")
+    await manager.create_job(job)
+    job.take_dirty()
+    relay = JobEventRelay(RedisInvalidationBus(client, channel=JOB_EVENTS_CHANNEL), origin="api")
+    await relay.start()
+    try:
+        await bus.publish(
+            {
+                "kind": "job",
+                "job_id": "job-1",
+                "origin": "worker",
+                "values": {"status": "pending_hitl", "hitl_data": {"questions": ["Scope?"]}},
+            }
+        )
+        event = WorkflowEvent(WorkflowEventType.HITL_REQUIRED, "understanding", "Need input")
+        await bus.publish(
+            {"kind": "event", "job_id": "job-1", "origin": "worker", "event": event.to_dict()}
+        )
+
+        await _eventually(lambda: relay.get_stats()["received"] == 2)
+        assert (job.status, job.hitl_data) == ("pending_hitl", {"questions": ["Scope?"]})
+        assert job.dirty_fields == frozenset()  # Persisted by the worker, not here
+        queue = await event_registry_module.get_event_registry().get("job-1")
+        relayed = queue.get_nowait()
+        assert (relayed.event_type, relayed.message) == (event.event_type, "Need input")
+    finally:
+        await relay.stop()
+
+
+async def test_worker_publishes_its_jobs_and_receives_hitl_answers(client, manager, peer):
+    bus, received = peer
+    await manager.create_job(JobState(job_id="job-1"))
+    relay = JobEventRelay(
+        RedisInvalidationBus(client, channel=JOB_EVENTS_CHANNEL),
+        origin="worker",
+        runs_job=lambda job_id: job_id == "job-1",
+    )
+    await relay.start()
+    try:
+        await manager.update_job("job-1", {"status": "pending_hitl", "hitl_type": "clarify"})
+        queue = await event_registry_module.get_event_registry().register("job-1")
+        await queue.put(WorkflowEvent(WorkflowEventType.PROGRESS, "understanding", "Thinking"))
+
+        await _eventually(lambda: len(received) == 2)
+        assert received[0]["kind"] == "job" and received[0]["origin"] == "worker"
+        assert received[0]["values"] == {"status": "pending_hitl", "hitl_type": "clarify"}
+        assert received[1]["event"]["message"] == "Thinking"
+
+        waiter = asyncio.create_task(jobs_module.wait_for_hitl_response("job-1", timeout=2))
+        await bus.publish(
+            {"kind": "hitl_response", "job_id": "job-1", "origin": "api", "response": {"a": 1}}
+        )
+        assert await waiter == {"a": 1}
+    finally:
+        await relay.stop()
@@ -0,0 +1,476 @@
+"""Tests for the write-behind job persistence queue."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from uuid import UUID, uuid4
+
+import pytest
+
+from skill_fleet.api.schemas.models import JobState
+from skill_fleet.api.services.job_manager import JobManager
+from skill_fleet.api.services.job_persistence import JobWriteBehindQueue
+
+
+class RecordingWriter:
+    def __init__(self, failures: int = 0):
+        self.batches: list[list[tuple[str, str, str | None]]] = []
+        self.failures = failures
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, jobs: list[JobState]) -> None:
+        await self.release.wait()
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("database unavailable")
+        self.batches.append([(job.job_id, job.status, job.progress_message) for job in jobs])
+
+
+async def test_updates_are_coalesced_per_job_and_batched():
+    writer = RecordingWriter()
+    queue = JobWriteBehindQueue(writer, flush_interval=0.05, max_batch=2)
+    queue.start()
+    jobs = [JobState(job_id=f"job-{i}", status="running") for i in range(3)]
+
+    for step in range(5):
+        for job in jobs:
+            job.progress_message = f"step {step}"
+            await queue.enqueue(job)
+    await asyncio.sleep(0.2)
+    await queue.stop()
+
+    assert [len(batch) for batch in writer.batches] == [2, 1]
+    written = [row for batch in writer.batches for row in batch]
+    assert {row[2] for row in written} == {"step 4"}
+    stats = queue.get_stats()
+    assert (stats["enqueued"], stats["coalesced"], stats["flushed"]) == (15, 12, 3)
+    assert stats["depth"] == 0
+
+
+async def test_persist_waits_for_commit_and_surfaces_failures():
+    writer = RecordingWriter(failures=1)
+    queue = JobWriteBehindQueue(writer, flush_interval=10, max_retries=2, retry_backoff=0)
+    queue.start()
+
+    await asyncio.wait_for(queue.persist(JobState(job_id="done", status="completed")), 1)
+    assert writer.batches == [[("done", "completed", None)]]
+    assert queue.get_stats()["retries"] == 1
+
+    writer.failures = 2
+    with pytest.raises(RuntimeError, match="database unavailable"):
+        await asyncio.wait_for(queue.persist(JobState(job_id="lost", status="failed")), 1)
+    assert queue.get_stats()["failed_batches"] == 1
+    assert len(queue) == 1  # Requeued for the next flush
+
+    await queue.stop()
+    assert writer.batches[-1] == [("lost", "failed", None)]
+
+
+async def test_stop_lets_the_batch_in_flight_commit():
+    writer = RecordingWriter()
+    writer.release.clear()
+    queue = JobWriteBehindQueue(writer, flush_interval=10)
+    queue.start()
+
+    persisted = asyncio.create_task(queue.persist(JobState(job_id="done", status="completed")))
+    await asyncio.sleep(0.05)  # The flusher is now blocked writing the batch
+    stopping = asyncio.create_task(queue.stop())
+    await asyncio.sleep(0.05)
+    assert not stopping.done()
+
+    writer.release.set()
+    await asyncio.wait_for(stopping, 1)
+    await asyncio.wait_for(persisted, 1)
+    assert writer.batches == [[("done", "completed", None)]]
+
+
+async def test_cancelled_batch_write_is_requeued():
+    writer = RecordingWriter()
+    writer.release.clear()
+    queue = JobWriteBehindQueue(writer, flush_interval=10)
+
+    waiter = asyncio.create_task(queue.persist(JobState(job_id="done", status="completed")))
+    await asyncio.sleep(0.05)  # persist() flushes inline without a running flusher
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert len(queue) == 1
+    assert queue.get_stats()["failed_batches"] == 1
+
+    writer.release.set()
+    await queue.stop()
+    assert writer.batches == [[("done", "completed", None)]]
+
+
+async def test_enqueue_applies_backpressure_when_full():
+    writer = RecordingWriter()
+    writer.release.clear()
+    queue = JobWriteBehindQueue(writer, flush_interval=10, max_pending=2)
+    queue.start()
+
+    await queue.enqueue(JobState(job_id="a"))
+    await queue.enqueue(JobState(job_id="b"))
+    blocked = asyncio.create_task(queue.enqueue(JobState(job_id="c")))
+    await asyncio.sleep(0.05)
+    assert blocked.done()  # The flusher took a and b, freeing space
+    assert queue.get_stats()["backpressure_waits"] == 1
+
+    await queue.enqueue(JobState(job_id="d"))
+    blocked = asyncio.create_task(queue.enqueue(JobState(job_id="e")))
+    await asyncio.sleep(0.05)
+    assert not blocked.done()  # Previous batch still in flight
+
+    writer.release.set()
+    await asyncio.wait_for(blocked, 1)
+    await queue.stop()
+    assert sorted(job_id for batch in writer.batches for job_id, *_ in batch) == list("abcde")
+
+
+@pytest.fixture
+def job_database(tmp_path):
+    from skill_fleet.infrastructure.db import database
+
+    previous = database.get_database_state().database_url
+    database.init_database(database_url=f"sqlite:///{tmp_path / 'jobs.db'}", env="test")
+    database.init_db()
+    yield
+    database.close_db()
+    database.init_database(database_url=previous, env="test")
+
+
+async def test_job_manager_writes_batches_on_the_async_engine(job_database):
+    from skill_fleet.infrastructure.db.database import close_async_db
+    from skill_fleet.infrastructure.db.repositories import JobRepository
+    from skill_fleet.infrastructure.db.session import transactional_session
+
+    manager = JobManager()
+    manager.enable_persistence()
+    manager.start_write_behind(flush_interval=0.01)
+    job_id = str(uuid4())
+
+    await manager.create_job(JobState(job_id=job_id, task_description="write tests"))
+    await manager.update_job(job_id, {"status": "running", "progress_message": "working"})
+    await manager.update_job(job_id, {"status": "completed", "progress_message": "done"})
+
+    with transactional_session() as db:
+        row = JobRepository(db).get_by_id(UUID(job_id))
+        assert row is not None
+        assert (row.status, row.progress_message, row.task_description) == (
+            "completed",
+            "done",
+            "write tests",
+        )
+    stats = manager.get_persistence_stats()
+    assert stats["mode"] == "write_behind"
+    assert stats["durable_waits"] == 1
+    await manager.stop_write_behind()
+    await close_async_db()
+
+
+async def test_batched_insert_updates_a_row_created_concurrently(job_database):
+    from skill_fleet.infrastructure.db.database import close_async_db
+    from skill_fleet.infrastructure.db.repositories import JobRepository
+    from skill_fleet.infrastructure.db.session import transactional_session
+
+    manager = JobManager()
+    manager.enable_persistence()
+    job = JobState(job_id=str(uuid4()), task_description="mine", status="running")
+    batch_rows = manager._batch_rows
+
+    def racing_batch_rows(taken, existing):
+        # Another process (e.g. a worker) inserts the row after the existence check
+        with transactional_session() as db:
+            JobRepository(db).create(
+                obj_in={"job_id": UUID(job.job_id), "task_description": "theirs"}
+            )
+        return batch_rows(taken, existing)
+
+    manager._batch_rows = racing_batch_rows  # type: ignore[method-assign]
+    await manager._write_jobs_async([job])
+
+    with transactional_session() as db:
+        row = JobRepository(db).get_by_id(UUID(job.job_id))
+        assert row is not None
+        assert (row.task_description, row.status) == ("mine", "running")
+    assert job.dirty_fields == frozenset()
+    await close_async_db()
+
+
+async def test_get_job_loads_rows_once_off_the_event_loop(job_database):
+    from skill_fleet.infrastructure.db.repositories import JobRepository
+    from skill_fleet.infrastructure.db.session import transactional_session
+
+    manager = JobManager()
+    manager.enable_persistence()
+    job_id = str(uuid4())
+    with transactional_session() as db:
+        JobRepository(db).create(obj_in={"job_id": UUID(job_id), "task_description": "stored"})
+
+    loop_thread = threading.get_ident()
+    reads: list[int] = []
+    read_job = manager._read_job_from_db
+
+    def recording_read(requested_id):
+        reads.append(threading.get_ident())
+        return read_job(requested_id)
+
+    manager._read_job_from_db = recording_read  # type: ignore[method-assign]
+    first, second = await asyncio.gather(manager.get_job(job_id), manager.get_job(job_id))
+
+    assert first is second
+    assert first is not None
+    assert first.task_description == "stored"
+    assert len(reads) == 1
+    assert reads[0] != loop_thread
+    assert manager._loading == {}
+
+
+def test_job_state_tracks_dirty_fields():
+    job = JobState(job_id="j")
+    assert "result" in job.dirty_fields  # Never persisted yet
+
+    job.take_dirty()
+    copy = job.model_copy()
+    job.status = "running"
+    job.progress_message = "step"
+
+    assert job.dirty_fields == {"status", "progress_message"}
+    assert copy.dirty_fields == frozenset()
+    assert job.take_dirty() == {"status", "progress_message"}
+    assert job.dirty_fields == frozenset()
+
+
+@pytest.fixture
+def captured_updates():
+    from sqlalchemy import event
+
+    from skill_fleet.infrastructure.db.database import get_database_state
+
+    state = get_database_state()
+    statements: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE JOBS"):
+            statements.append(statement)
+
+    engines = (state.engine, state.async_engine.sync_engine)
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    for engine in engines:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+@pytest.mark.parametrize("write_behind", [False, True])
+async def test_updates_write_only_changed_columns(job_database, captured_updates, write_behind):
+    from skill_fleet.infrastructure.db.database import close_async_db
+    from skill_fleet.infrastructure.db.repositories import JobRepository
+    from skill_fleet.infrastructure.db.session import transactional_session
+
+    manager = JobManager()
+    manager.enable_persistence()
+    if write_behind:
+        manager.start_write_behind(flush_interval=0.01)
+    job_id = str(uuid4())
+    job = JobState(
+        job_id=job_id, result={"skill_content": "x" * 10_000}, hitl_type="clarify", hitl_data={}
+    )
+
+    await manager.create_job(job)
+    if write_behind:
+        assert manager.write_queue is not None
+        await manager.write_queue.flush()
+    await manager.update_job(job_id, {"status": "running", "hitl_type": None})
+    await manager.save_job(job)  # Nothing changed since the last write
+
+    assert len(captured_updates) == 1
+    assert "status" in captured_updates[0] and "hitl_type" in captured_updates[0]
+    assert "result" not in captured_updates[0] and "hitl_data" not in captured_updates[0]
+    with transactional_session() as db:
+        row = JobRepository(db).get_by_id(UUID(job_id))
+        assert row is not None
+        assert (row.status, row.hitl_type) == ("running", None)
+        assert row.result is not None
+        assert len(row.result["skill_content"]) == 10_000
+
+    await manager.stop_write_behind()
+    await close_async_db()
+
+
+async def test_job_summaries_are_projected_and_paginated_by_keyset(job_database):
+    from datetime import UTC, datetime, timedelta
+
+    from sqlalchemy import event
+
+    from skill_fleet.infrastructure.db.database import get_database_state
+    from skill_fleet.infrastructure.db.repositories import JobRepository
+    from skill_fleet.infrastructure.db.session import transactional_session
+
+    start = datetime.now(UTC) - timedelta(minutes=10)
+    job_ids = [str(uuid4()) for _ in range(5)]
+    with transactional_session() as db:
+        repo = JobRepository(db)
+        for i, job_id in enumerate(job_ids):
+            repo.create(
+                obj_in={
+                    "job_id": UUID(job_id),
+                    "user_id": "alice" if i % 2 == 0 else "bob",
+                    "task_description": "task",
+                    "status": "running",
+                    "result": {"skill_content": "x" * 10_000},
+                    "created_at": start + timedelta(minutes=i // 2),  # Ties on created_at
+                }
+            )
+
+    manager = JobManager()
+    manager.enable_persistence()
+    selects: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    engine = get_database_state().engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        pages, cursor = [], None
+        while True:
+            page, cursor = await manager.list_job_summaries(cursor=cursor, limit=2)
+            pages.append([row["job_id"] for row in page])
+            if cursor is None:
+                break
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    newest_first = sorted(job_ids, key=lambda job_id: (job_ids.index(job_id) // 2, job_id))[::-1]
+    assert [job_id for page in pages for job_id in page] == newest_first
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert selects
+    assert all("result" not in statement and "checkpoint" not in statement for statement in selects)
+
+    # Cached jobs are ahead of their rows; filters apply to the live status
+    await manager.get_job(job_ids[0])
+    await manager.update_job(job_ids[0], {"progress_message": "halfway"})
+    job = await manager.get_job(job_ids[2])
+    assert job is not None
+    job.status = "completed"
+    page, cursor = await manager.list_job_summaries(
+        job_ids=[job_ids[0], job_ids[2], job_ids[1], "not-a-uuid"],
+        statuses=["running"],
+        user_id="alice",
+    )
+    assert [(row["job_id"], row["progress_message"]) for row in page] == [(job_ids[0], "halfway")]
+    assert cursor is None
+
+    with pytest.raises(ValueError, match="cursor"):
+        await manager.list_job_summaries(cursor="garbage")
+
+
+async def test_job_summaries_merge_cached_jobs_before_paging(job_database):
+    from datetime import UTC, datetime, timedelta
+
+    from skill_fleet.infrastructure.db.database import close_async_db
+    from skill_fleet.infrastructure.db.repositories import JobRepository
+    from skill_fleet.infrastructure.db.session import transactional_session
+
+    start = datetime.now(UTC) - timedelta(minutes=10)
+    stored = [str(uuid4()) for _ in range(4)]
+    with transactional_session() as db:
+        repo = JobRepository(db)
+        for i, job_id in enumerate(stored):
+            repo.create(
+                obj_in={
+                    "job_id": UUID(job_id),
+                    "task_description": "task",
+                    "status": "running" if i % 2 else "pending",
+                    "created_at": start + timedelta(minutes=i),
+                }
+            )
+
+    manager = JobManager()
+    manager.enable_persistence()
+    manager.start_write_behind(flush_interval=60)  # Queued writes stay queued
+    queued = str(uuid4())
+    await manager.create_job(JobState(job_id=queued, status="running"))
+    await manager.get_job(stored[0])
+    await manager.update_job(stored[0], {"status": "running"})  # Into the filter
+    await manager.get_job(stored[3])
+    await manager.update_job(stored[3], {"status": "pending_hitl"})  # Out of the filter
+
+    page, cursor = await manager.list_job_summaries(job_ids=[queued, stored[1]])
+    assert [row["job_id"] for row in page] == [queued, stored[1]]
+
+    pages, cursor = [], None
+    while True:
+        page, cursor = await manager.list_job_summaries(
+            statuses=["running"], cursor=cursor, limit=2
+        )
+        pages.append([row["job_id"] for row in page])
+        if cursor is None:
+            break
+    assert pages == [[queued, stored[1]], [stored[0]]]
+
+    await manager.stop_write_behind()
+    await close_async_db()
+
+
+@pytest.mark.parametrize("write_behind", [False, True])
+async def test_large_payloads_are_stored_as_blobs(job_database, tmp_path, write_behind):
+    from skill_fleet.infrastructure.blobs import FileBlobStore, is_blob_ref
+    from skill_fleet.infrastructure.db.database import close_async_db
+    from skill_fleet.infrastructure.db.repositories import JobRepository
+    from skill_fleet.infrastructure.db.session import transactional_session
+
+    store = FileBlobStore(tmp_path / "blobs")
+    put = store.put
+    writer_threads: list[threading.Thread] = []
+
+    def recording_put(data: bytes) -> str:
+        writer_threads.append(threading.current_thread())
+        return put(data)
+
+    store.put = recording_put  # type: ignore[method-assign]
+    manager = JobManager()
+    manager.enable_persistence()
+    manager.enable_blob_offload(store, threshold=1024)
+    if write_behind:
+        manager.start_write_behind(flush_interval=0.01)
+    job_id = str(uuid4())
+    checkpoint = {"phase": "understanding", "outputs": {"notes": "n" * 4096}}
+    await manager.create_job(JobState(job_id=job_id, hitl_data={"questions": ["Scope?"]}))
+    await manager.update_job(job_id, {"checkpoint": checkpoint})
+    await manager.update_job(
+        job_id, {"status": "completed", "result": {"skill_content": "x" * 10_000}}
+    )
+
+    with transactional_session() as db:
+        row = JobRepository(db).get_by_id(UUID(job_id))
+        assert row is not None
+        assert row.result is not None and row.checkpoint is not None
+        assert is_blob_ref(row.result) and row.result["size"] > 10_000
+        assert is_blob_ref(row.checkpoint)
+        checkpoint_ref = row.checkpoint["$blob"]
+        assert row.hitl_data == {"questions": ["Scope?"]}  # Below the threshold
+    # Blob writes never block the event loop
+    assert writer_threads and threading.main_thread() not in writer_threads
+
+    # Another process (empty cache) materializes the payloads when loading the job
+    reader = JobManager()
+    reader.enable_persistence()
+    reader.enable_blob_offload(store, threshold=1024)
+    job = await reader.get_job(job_id)
+    assert job is not None
+    assert job.checkpoint == checkpoint
+    assert job.result is not None
+    assert len(job.result.skill_content) == 10_000
+
+    store.delete(checkpoint_ref)
+    await reader.delete_job(job_id)
+    job = await reader.get_job(job_id)
+    assert job is not None
+    assert job.checkpoint is None
+
+    await manager.stop_write_behind()
+    await close_async_db()
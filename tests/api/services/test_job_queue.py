@@ -0,0 +1,167 @@
+"""Tests for the database-backed job queue and worker pool."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from skill_fleet.api.schemas.skills import CreateSkillRequest
+from skill_fleet.api.services import job_manager as job_manager_module
+from skill_fleet.api.services.job_manager import JobManager
+from skill_fleet.api.services.job_queue import JobWorkerPool
+from skill_fleet.core.models import SkillCreationResult
+from skill_fleet.infrastructure.db.repositories import JobRepository
+from skill_fleet.infrastructure.db.session import transactional_session
+
+
+@pytest.fixture
+def job_database(tmp_path):
+    from skill_fleet.infrastructure.db import database
+
+    previous = database.get_database_state().database_url
+    database.init_database(database_url=f"sqlite:///{tmp_path / 'jobs.db'}", env="test")
+    database.init_db()
+    yield
+    database.close_db()
+    database.init_database(database_url=previous, env="test")
+
+
+def _queue_jobs(*users: str) -> list[str]:
+    job_ids = []
+    with transactional_session() as db:
+        repo = JobRepository(db)
+        for user_id in users:
+            created_at = datetime.now(UTC) - timedelta(seconds=len(users) - len(job_ids))
+            job = repo.create(
+                obj_in={
+                    "job_id": uuid4(),
+                    "user_id": user_id,
+                    "task_description": f"task for {user_id}",
+                    "created_at": created_at,
+                }
+            )
+            repo.enqueue(job.job_id, {"task_description": f"task for {user_id}"})
+            job_ids.append(str(job.job_id))
+    return job_ids
+
+
+def _claim(owner: str, limit: int = 10, lease_seconds: float = 60, per_user_limit=None):
+    with transactional_session() as db:
+        return JobRepository(db).claim_queued(
+            owner=owner, limit=limit, lease_seconds=lease_seconds, per_user_limit=per_user_limit
+        )
+
+
+def test_claims_are_exclusive_and_capped_per_user(job_database):
+    alice_1, alice_2, _, bob = _queue_jobs("alice", "alice", "alice", "bob")
+
+    first = _claim("worker-a", limit=3, per_user_limit=2)
+    assert [job["job_id"] for job in first] == [alice_1, alice_2, bob]
+    assert first[0]["attempts"] == 1
+    assert first[0]["request"] == {"task_description": "task for alice"}
+
+    # Alice is at her cap until one of her leases is released
+    assert _claim("worker-b", per_user_limit=2) == []
+    with transactional_session() as db:
+        repo = JobRepository(db)
+        assert not repo.release_lease(alice_1, "worker-b")
+        assert repo.release_lease(alice_1, "worker-a")
+        assert repo.count_queued() == 3
+    assert len(_claim("worker-b", per_user_limit=2)) == 1
+
+
+def test_expired_leases_are_reclaimed_and_renewals_detect_loss(job_database):
+    (job_id,) = _queue_jobs("alice")
+    assert len(_claim("crashed", lease_seconds=0)) == 1
+
+    reclaimed = _claim("survivor")
+    assert [(job["job_id"], job["attempts"]) for job in reclaimed] == [(job_id, 2)]
+    with transactional_session() as db:
+        repo = JobRepository(db)
+        assert not repo.renew_lease(job_id, "crashed", 60)
+        assert repo.renew_lease(job_id, "survivor", 60)
+        assert repo.release_lease(job_id, "survivor", requeue=True)
+    assert len(_claim("next")) == 1
+
+
+class FakeSkillService:
+    def __init__(self):
+        self.calls: list[str] = []
+        self.release = asyncio.Event()
+
+    async def create_skill(self, request, existing_job_id=None):
+        self.calls.append(existing_job_id)
+        await self.release.wait()
+        return SkillCreationResult(status="completed", skill_content="# Skill")
+
+
+@pytest.fixture
+def job_manager(job_database, monkeypatch):
+    manager = JobManager()
+    manager.enable_persistence()
+    monkeypatch.setattr(job_manager_module, "_job_manager", manager)
+    return manager
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+async def test_pool_runs_submitted_jobs_and_requeues_them_on_shutdown(job_manager):
+    from skill_fleet.api.services.jobs import create_job, get_job
+
+    service = FakeSkillService()
+    pool = JobWorkerPool(lambda: service, max_workers=2, poll_interval=0.05)
+    pool.start()
+    job_id = await create_job("write a skill", user_id="alice")
+    await pool.submit(job_id, CreateSkillRequest(task_description="write a skill", user_id="alice"))
+
+    await _wait_for(lambda: service.calls == [job_id])
+    job = await get_job(job_id)
+    assert job is not None
+    assert job.status == "running"
+    await pool.stop()
+    with transactional_session() as db:
+        row = JobRepository(db).get_by_id(UUID(job_id))
+        assert row is not None
+        assert row.lease_owner is None and row.lease_expires_at is not None
+
+    # A new pool (e.g. after a restart) picks the job up again and finishes it
+    service.release.set()
+    pool = JobWorkerPool(lambda: service, max_workers=2, poll_interval=0.05)
+    pool.start()
+    await _wait_for(lambda: pool.get_stats()["completed"] == 1)
+    await pool.stop()
+
+    assert service.calls == [job_id, job_id]
+    job = await get_job(job_id)
+    assert job is not None
+    assert job.status == "completed"
+    with transactional_session() as db:
+        row = JobRepository(db).get_by_id(UUID(job_id))
+        assert row is not None
+        assert (row.status, row.attempts, row.lease_expires_at) == ("completed", 2, None)
+
+
+async def test_pool_gives_up_after_max_attempts(job_manager):
+    (job_id,) = _queue_jobs("alice")
+    for owner in ("a", "b"):
+        _claim(owner, lease_seconds=0)
+
+    service = FakeSkillService()
+    pool = JobWorkerPool(lambda: service, max_workers=1, poll_interval=0.05, max_attempts=2)
+    pool.start()
+    await _wait_for(lambda: pool.get_stats()["exhausted"] == 1)
+    await pool.stop()
+
+    assert service.calls == []
+    with transactional_session() as db:
+        row = JobRepository(db).get_by_id(UUID(job_id))
+        assert row is not None
+        assert row.status == "failed" and row.error is not None
+        assert "2 attempts" in row.error
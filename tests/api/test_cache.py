@@ -0,0 +1,357 @@
+"""Tests for the sharded in-memory API cache."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from skill_fleet.api.cache import InMemoryCache
+
+if TYPE_CHECKING:
+    from skill_fleet.taxonomy.manager import TaxonomyManager
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+async def test_get_set_and_per_shard_stats():
+    cache = InMemoryCache(max_size=64, num_shards=4)
+
+    await asyncio.gather(*(cache.set(f"k{i}", i) for i in range(32)))
+    values = await asyncio.gather(*(cache.get(f"k{i}") for i in range(32)))
+    assert values == list(range(32))
+    assert await cache.get("missing") is None
+
+    stats = await cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (32, 1, 32)
+    assert len(stats["shards"]) == 4
+    assert sum(shard["size"] for shard in stats["shards"]) == 32
+    assert sum(shard["capacity"] for shard in stats["shards"]) == 64
+
+
+async def test_lru_eviction_is_bounded_by_max_size():
+    cache = InMemoryCache(max_size=8, num_shards=4)
+
+    for i in range(100):
+        await cache.set(f"k{i}", i)
+
+    stats = await cache.get_stats()
+    assert len(cache) <= 8
+    assert stats["evictions"] == 100 - len(cache)
+    assert await cache.get("k99") == 99
+
+
+async def test_expiry_purges_only_expired_entries(clock):
+    cache = InMemoryCache(max_size=100, num_shards=2)
+    await cache.set("short", 1, ttl=10)
+    await cache.set("long", 2, ttl=100)
+    await cache.set("short", 3, ttl=50)  # overwrite: the old heap item is stale
+
+    clock[0] += 20
+    assert await cache.cleanup_expired() == 0
+    clock[0] += 40
+    assert await cache.cleanup_expired() == 1
+    assert await cache.get("short") is None
+    assert await cache.get("long") == 2
+    assert (await cache.get_stats())["expirations"] == 1
+
+
+async def test_invalidate_pattern_prefix_and_glob():
+    cache = InMemoryCache(max_size=100)
+    for key in ("app:taxonomy:global", "app:taxonomy:user:a", "app:skill:x", "app:skill:y1"):
+        await cache.set(key, key)
+
+    assert await cache.invalidate_pattern("app:taxonomy:*") == 2
+    assert await cache.invalidate_pattern("app:skill:?1") == 1
+    assert await cache.get("app:skill:x") == "app:skill:x"
+    assert (await cache.get_stats())["invalidations"] == 3
+
+
+async def test_invalidate_tags_uses_reverse_index():
+    cache = InMemoryCache(max_size=100)
+    await cache.set("global", 1, tags=["taxonomy"])
+    await cache.set("user:a", 2, tags=["taxonomy", "user:a"])
+    await cache.set("user:b", 3, tags=["taxonomy", "user:b"])
+    await cache.set("other", 4)
+
+    assert await cache.invalidate_tags("user:a") == 1
+    assert await cache.invalidate_tags("taxonomy", "user:b") == 2
+    assert await cache.get("other") == 4
+    assert all(shard["tags"] == 0 for shard in (await cache.get_stats())["shards"])
+
+
+async def test_tag_index_follows_overwrite_and_eviction():
+    cache = InMemoryCache(max_size=1)
+    await cache.set("k", 1, tags=["old"])
+    await cache.set("k", 2, tags=["new"])
+
+    assert await cache.invalidate_tags("old") == 0
+    await cache.set("other", 3, tags=["new"])  # evicts "k"
+    assert await cache.invalidate_tags("new") == 1
+    assert len(cache) == 0
+
+
+async def test_cached_decorator_tags(monkeypatch):
+    from skill_fleet.api import cache as cache_module
+
+    monkeypatch.setattr(cache_module, "_cache", InMemoryCache(max_size=100))
+    calls = []
+
+    @cache_module.cached(tags=lambda user_id: ["taxonomy", f"user:{user_id}"])
+    async def user_view(user_id):
+        calls.append(user_id)
+        return {"user": user_id}
+
+    await user_view("a")
+    await user_view("a")
+    await user_view("b")
+    assert calls == ["a", "b"]
+
+    assert await cache_module.invalidate_tags("user:a") == 1
+    await user_view("a")
+    await user_view("b")
+    assert calls == ["a", "b", "a"]
+
+
+async def test_cached_taxonomy_service_invalidates_by_tag(monkeypatch):
+    from skill_fleet.api import cache as cache_module
+    from skill_fleet.api.services.cached_taxonomy import CachedTaxonomyService
+
+    cache = InMemoryCache(max_size=100)
+    monkeypatch.setattr(cache_module, "_cache", cache)
+
+    class Manager:
+        meta = {"taxonomy": {"technical": {}}}
+        metadata_cache: dict = {}
+
+        def get_mounted_skills(self, user_id: str) -> list[str]:
+            return ["technical/python"]
+
+        def get_skill_metadata(self, skill_id: str) -> dict:
+            return {"skill_id": skill_id}
+
+    service = CachedTaxonomyService(cast("TaxonomyManager", Manager()))
+    await service.get_global_taxonomy()
+    await service.get_user_taxonomy("alice")
+    await service.get_skill_metadata_cached("technical/python/async")
+    await service.get_skill_metadata_cached("technical/pythonic")
+
+    assert await service.invalidate_skill("technical/python") == 2
+    assert await service.invalidate_taxonomy() == 1
+    assert len(cache) == 1
+
+
+async def test_concurrent_misses_share_one_computation(monkeypatch):
+    from skill_fleet.api import cache as cache_module
+
+    monkeypatch.setattr(cache_module, "_cache", InMemoryCache(max_size=100))
+    calls = 0
+    release = asyncio.Event()
+
+    @cache_module.cached(ttl=60)
+    async def expensive(x):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return x * 2
+
+    waiters = [asyncio.create_task(expensive(21)) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [42] * 10
+    assert calls == 1
+    assert await expensive(21) == 42
+    assert calls == 1
+
+
+async def test_single_flight_propagates_errors_without_caching(monkeypatch):
+    from skill_fleet.api import cache as cache_module
+
+    monkeypatch.setattr(cache_module, "_cache", InMemoryCache(max_size=100))
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        *(cache_module.get_or_compute("k", failing) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert calls == 1
+    assert await cache_module.get_cache().get("k") is None
+
+
+async def test_stale_while_revalidate_serves_stale_and_refreshes_once(monkeypatch):
+    from skill_fleet.api import cache as cache_module
+
+    monkeypatch.setattr(cache_module, "_cache", InMemoryCache(max_size=100))
+    wall = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: wall[0])
+    version = 0
+
+    async def compute():
+        nonlocal version
+        version += 1
+        return version
+
+    async def get():
+        return await cache_module.get_or_compute("k", compute, ttl=10, stale_ttl=30)
+
+    assert await get() == 1
+    wall[0] += 11  # Past the fresh TTL, inside the stale window.
+
+    assert await asyncio.gather(get(), get(), get()) == [1, 1, 1]
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert version == 2
+    assert await get() == 2
+
+    stats = cache_module.get_flight_stats()
+    assert stats["stale_served"] >= 3
+    assert stats["in_flight"] == 0
+
+
+async def test_invalidation_during_compute_is_not_undone(monkeypatch):
+    from skill_fleet.api import cache as cache_module
+
+    monkeypatch.setattr(cache_module, "_cache", InMemoryCache(max_size=100))
+    version = 0
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def compute():
+        nonlocal version
+        version += 1
+        seen = version
+        started.set()
+        await release.wait()
+        return seen
+
+    async def get():
+        return await cache_module.get_or_compute("k", compute, ttl=60, tags=["taxonomy"])
+
+    before = asyncio.create_task(get())
+    await started.wait()
+    await cache_module.invalidate_tags("taxonomy")
+    after = asyncio.create_task(get())  # Starts afresh instead of joining the voided flight
+    release.set()
+
+    assert (await before, await after) == (1, 2)
+    assert await cache_module.get_cache().get("k") == 2
+    assert await get() == 2
+    assert version == 2
+
+
+async def test_invalidation_during_stale_refresh_drops_the_entry(monkeypatch):
+    from skill_fleet.api import cache as cache_module
+
+    monkeypatch.setattr(cache_module, "_cache", InMemoryCache(max_size=100))
+    wall = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: wall[0])
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def compute():
+        started.set()
+        await release.wait()
+        return "old"
+
+    async def get():
+        return await cache_module.get_or_compute("k", compute, ttl=10, stale_ttl=30)
+
+    release.set()
+    assert await get() == "old"
+    started.clear()
+    release.clear()
+    wall[0] += 11
+    assert await get() == "old"  # Stale hit starts a background refresh
+    refresh = cache_module._flights._tasks["k"]
+    await started.wait()
+
+    await cache_module.get_cache().invalidate("k")
+    release.set()
+    await refresh
+
+    assert await cache_module.get_cache().get("k") is None
+    assert "k" not in cache_module._flights
+
+
+async def test_cached_taxonomy_service_coalesces_concurrent_misses(monkeypatch):
+    from skill_fleet.api import cache as cache_module
+    from skill_fleet.api.services.cached_taxonomy import CachedTaxonomyService
+
+    monkeypatch.setattr(cache_module, "_cache", InMemoryCache(max_size=100))
+    reads = 0
+
+    class Manager:
+        metadata_cache: dict = {}
+
+        @property
+        def meta(self):
+            nonlocal reads
+            reads += 1
+            return {"taxonomy": {"technical": {}}}
+
+    service = CachedTaxonomyService(cast("TaxonomyManager", Manager()))
+    results = await asyncio.gather(*(service.get_global_taxonomy() for _ in range(20)))
+
+    assert all(result["categories"] == ["technical"] for result in results)
+    assert reads == 1
+    assert (await service.get_cache_stats())["single_flight"]["coalesced"] >= 19
+
+
+def test_estimate_size_counts_nested_values_once():
+    from skill_fleet.api.cache import estimate_size
+
+    blob = "x" * 10_000
+    assert estimate_size({"a": blob}) > 10_000
+    assert estimate_size([blob, blob]) < 2 * 10_000
+    assert estimate_size({"a": [1, 2, {"b": "c"}]}) > estimate_size({"a": []})
+
+
+async def test_byte_budget_evicts_largest_cold_entry_first():
+    cache = InMemoryCache(max_size=100, num_shards=1, max_bytes=60_000)
+
+    await cache.set("big", "x" * 30_000)
+    for i in range(3):
+        await cache.set(f"small{i}", "y" * 5_000)
+    await cache.set("new", "z" * 20_000)
+
+    assert await cache.get("big") is None
+    assert all([await cache.get(f"small{i}") for i in range(3)])
+    stats = await cache.get_stats()
+    assert stats["evictions"] == 1
+    assert 0 < stats["bytes"] <= stats["max_bytes"] == 60_000
+
+
+async def test_values_over_budget_are_not_cached_and_replace_old_value():
+    cache = InMemoryCache(max_size=10, num_shards=1, max_bytes=10_000)
+
+    await cache.set("k", "small")
+    await cache.set("k", "x" * 20_000)
+
+    assert await cache.get("k") is None
+    stats = await cache.get_stats()
+    assert (stats["rejections"], stats["bytes"], stats["size"]) == (1, 0, 0)
+
+
+async def test_byte_accounting_follows_removals():
+    cache = InMemoryCache(max_size=10, num_shards=2, max_bytes=1_000_000)
+
+    await cache.set("a", "x" * 1000, tags=["t"])
+    await cache.set("b", "y" * 1000)
+    assert (await cache.get_stats())["bytes"] > 2000
+
+    await cache.invalidate_tags("t")
+    await cache.invalidate("b")
+    assert (await cache.get_stats())["bytes"] == 0
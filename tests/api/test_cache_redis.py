@@ -0,0 +1,182 @@
+"""Tests for the Redis-backed shared cache against the in-process stand-in server."""
+
+import asyncio
+
+import pytest
+
+from skill_fleet.api.cache import CacheBackend, InMemoryCache, TieredCache
+from skill_fleet.api.cache_redis import (
+    LocalRedisServer,
+    RedisCache,
+    RedisInvalidationBus,
+    RespClient,
+    RespError,
+)
+
+
+@pytest.fixture
+async def server():
+    async with LocalRedisServer() as server:
+        yield server
+
+
+@pytest.fixture
+async def client(server):
+    client = RespClient.from_url(server.url)
+    yield client
+    await client.close()
+
+
+async def _eventually(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+def test_from_url_parses_credentials_and_db():
+    client = RespClient.from_url("redis://:s%40cret@cache.internal:6380/2")
+
+    assert (client.host, client.port, client.db, client.password) == (
+        "cache.internal",
+        6380,
+        2,
+        "s@cret",
+    )
+    with pytest.raises(ValueError):
+        RespClient.from_url("http://localhost")
+
+
+async def test_client_round_trips_and_surfaces_errors(client):
+    assert await client.execute("PING") == "PONG"
+    assert await client.execute("SET", "k", "v", "EX", 10) == "OK"
+    assert await client.pipeline(("GET", "k"), ("TTL", "k"), ("GET", "nope")) == [b"v", 10, None]
+
+    with pytest.raises(RespError):
+        await client.execute("NOSUCHCOMMAND")
+
+
+async def test_redis_cache_get_set_tags_and_patterns(client):
+    cache = RedisCache(client, default_ttl=60)
+    assert isinstance(cache, CacheBackend)
+
+    await cache.set("skill_fleet:taxonomy:global", {"a": [1, 2]}, tags=["taxonomy"])
+    await cache.set("skill_fleet:taxonomy:user:u1", {"b": 1}, tags=["taxonomy", "user:u1"])
+    await cache.set("skill_fleet:skill:x", "x", tags=["skill:x"])
+
+    assert await cache.get("skill_fleet:taxonomy:global") == {"a": [1, 2]}
+    assert await cache.get_entry("skill_fleet:skill:x") == ("x", frozenset({"skill:x"}))
+    assert await cache.get("missing") is None
+
+    assert await cache.invalidate_tags("user:u1") == 1
+    assert await cache.get("skill_fleet:taxonomy:user:u1") is None
+    assert await cache.get("skill_fleet:taxonomy:global") == {"a": [1, 2]}
+
+    assert await cache.invalidate_pattern("skill_fleet:taxonomy:*") == 1
+    assert await cache.invalidate("skill_fleet:skill:x") is True
+    assert await cache.clear() == 0
+
+    stats = await cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (3, 2)
+
+
+async def test_redis_cache_rejects_unserializable_values(client):
+    cache = RedisCache(client)
+
+    with pytest.raises(TypeError):
+        await cache.set("k", object())
+
+
+async def test_tiered_cache_fans_out_invalidations(client):
+    workers = [
+        TieredCache(RedisCache(client), l1_ttl=30, bus=RedisInvalidationBus(client))
+        for _ in range(2)
+    ]
+    first, second = workers
+    for worker in workers:
+        await worker.start()
+    try:
+        await first.set("skill_fleet:taxonomy:global", {"v": 1}, tags=["taxonomy"])
+        assert await second.get("skill_fleet:taxonomy:global") == {"v": 1}  # L2 hit
+        assert await second.get("skill_fleet:taxonomy:global") == {"v": 1}  # L1 hit
+        assert (await second.get_stats())["l1_hits"] == 1
+
+        await first.invalidate_tags("taxonomy")
+        await _eventually(lambda: len(second.l1) == 0)
+        assert await second.get("skill_fleet:taxonomy:global") is None
+
+        # Overwrites also drop other workers' L1 copies.
+        await second.set("k", "old")
+        await first.set("k", "new")
+        await _eventually(lambda: len(second.l1) == 0)
+        assert await second.get("k") == "new"
+        assert (await second.get_stats())["remote_invalidations"] >= 2
+    finally:
+        for worker in workers:
+            await worker.stop()
+
+
+async def test_tiered_cache_keeps_unserializable_values_in_l1(client):
+    cache = TieredCache(RedisCache(client), l1=InMemoryCache())
+    marker = object()
+
+    await cache.set("k", marker)
+
+    assert await cache.get("k") is marker
+    assert await cache.l2.get("k") is None
+
+
+async def test_redis_cache_degrades_to_misses_and_no_ops_when_unavailable(client):
+    cache = RedisCache(client, namespace="outage")
+    await client.execute("SET", "outage:k:corrupt", "{not json")
+    assert await cache.get("corrupt") is None
+
+    down = RedisCache(RespClient.from_url("redis://127.0.0.1:1"), namespace="outage")
+    assert await down.get("key") is None
+    assert await down.invalidate("key") is False
+    assert await down.invalidate_tags("taxonomy") == 0
+    assert await down.invalidate_pattern("taxonomy:*") == 0
+    assert await down.clear() == 0
+    stats = await down.get_stats()
+    assert stats["errors"] == 5
+    await down.client.close()
+
+
+async def _serve(handler):
+    server = await asyncio.start_server(handler, "127.0.0.1", 0)
+    return server, f"redis://127.0.0.1:{server.sockets[0].getsockname()[1]}/0"
+
+
+async def test_redis_cache_misses_when_server_stalls():
+    async def stall(reader, writer):
+        await reader.read(1024)
+        await asyncio.sleep(10)
+
+    server, url = await _serve(stall)
+    cache = RedisCache(RespClient.from_url(url, timeout=0.1))
+    try:
+        assert await asyncio.wait_for(cache.get("key"), 2) is None
+        assert await asyncio.wait_for(cache.invalidate_tags("taxonomy"), 2) == 0
+        assert (await cache.get_stats())["errors"] == 2
+    finally:
+        await cache.client.close()
+        server.close()
+
+
+async def test_redis_cache_misses_when_connection_drops_mid_reply():
+    async def truncate(reader, writer):
+        await reader.read(1024)
+        writer.write(b"$10\r\nabc")  # Bulk reply cut short
+        await writer.drain()
+        writer.close()
+
+    server, url = await _serve(truncate)
+    cache = RedisCache(RespClient.from_url(url))
+    try:
+        assert await cache.get("key") is None
+        await cache.set("key", "value")
+        assert await cache.invalidate("key") is False
+        assert (await cache.get_stats())["errors"] == 3
+    finally:
+        await cache.client.close()
+        server.close()
@@ -0,0 +1,105 @@
+"""Tests for startup cache warmup and the readiness endpoint."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from skill_fleet.api import cache as cache_module
+from skill_fleet.api import warmup
+from skill_fleet.api.cache import InMemoryCache, cache_key
+
+if TYPE_CHECKING:
+    from skill_fleet.taxonomy.manager import TaxonomyManager
+
+
+class FakeTaxonomyManager:
+    def __init__(self, fail_xml: bool = False):
+        self.meta = {"taxonomy": {"python": {}}, "domains": ["python"]}
+        self.metadata_cache: dict[str, object] = {}
+        self.xml_calls: list[str | None] = []
+        self.fail_xml = fail_xml
+
+    def ensure_all_skills_loaded(self) -> None:
+        self.metadata_cache = {"python/async": object(), "python/testing": object()}
+
+    def available_skills_xml(self, user_id: str | None = None) -> tuple[str, str]:
+        if self.fail_xml:
+            raise RuntimeError("broken skill")
+        self.xml_calls.append(user_id)
+        return "<available_skills/>", "etag"
+
+    def get_mounted_skills(self, user_id: str) -> list[str]:
+        return ["python/async"]
+
+    def get_skill_metadata(self, skill_id: str) -> dict | None:
+        if skill_id in self.metadata_cache:
+            return {"skill_id": skill_id, "name": skill_id, "description": ""}
+        return None
+
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch):
+    monkeypatch.setattr(cache_module, "_cache", InMemoryCache(max_size=100))
+    yield
+    warmup.reset_warmup_state()
+
+
+async def test_warm_caches_preloads_taxonomy_views_for_active_users():
+    manager = FakeTaxonomyManager()
+    state = warmup.WarmupState()
+
+    await warmup.warm_caches(
+        cast("TaxonomyManager", manager),
+        usage_leaders=lambda users, skills: (["alice", "bob"], ["python/async", "gone"]),
+        state=state,
+    )
+
+    assert state.status == warmup.READY and state.ready
+    steps = state.as_dict()["steps"]
+    assert steps["metadata_cache"]["items"] == 2
+    assert steps["user_taxonomies"]["items"] == 2
+    assert steps["skill_metadata"]["items"] == 1
+    assert set(manager.xml_calls) == {None, "alice", "bob"}
+
+    cache = cache_module.get_cache()
+    assert await cache.get(cache_key("taxonomy", "global")) is not None
+    assert await cache.get(cache_key("taxonomy", "user", "alice")) is not None
+    assert await cache.get(cache_key("skill", "metadata", "python/async")) is not None
+
+
+async def test_failed_steps_and_timeouts_degrade_but_still_become_ready():
+    def slow_leaders(users, skills):
+        time.sleep(0.5)
+        return [], []
+
+    state = warmup.WarmupState()
+    await warmup.warm_caches(
+        cast("TaxonomyManager", FakeTaxonomyManager(fail_xml=True)),
+        usage_leaders=slow_leaders,
+        timeout=0.2,
+        state=state,
+    )
+
+    assert state.status == warmup.DEGRADED and state.ready
+    steps = state.as_dict()["steps"]
+    assert steps["xml_fragments"]["error"] == "broken skill"
+    assert steps["usage_analytics"]["error"] == "timed out"
+    assert steps["global_taxonomy"]["status"] == warmup.READY
+
+
+def test_ready_endpoint_reflects_warmup_state(api_client):
+    warmup.reset_warmup_state()
+    response = api_client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["warmup"]["status"] == warmup.PENDING
+
+    warmup.get_warmup_state().status = warmup.READY
+    response = api_client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+    warmup.reset_warmup_state(warmup.SKIPPED)
+    assert api_client.get("/ready").status_code == 200
@@ -36,3 +36,36 @@ class TestGetJobStatus:
         assert data["job_id"] == "job-123"
         assert data["status"] == "pending_user_input"
         assert data["hitl_type"] == "clarify"
+
+
+class TestGetJobStatuses:
+    @pytest.mark.asyncio
+    async def test_batch_returns_summaries_in_pages(self, client) -> None:
+        manager = JobManager()
+        for i, status in enumerate(["running", "pending_hitl", "running"]):
+            job = JobState(job_id=f"job-{i}", status=status, result={"large": "x" * 1000})
+            job.created_at = job.created_at.replace(year=2026, month=1, day=i + 1)
+            await manager.create_job(job)
+
+        client.app.dependency_overrides[get_job_manager] = lambda: manager
+        try:
+            first = client.post("/api/v1/jobs/batch", json={"statuses": ["running"], "limit": 1})
+            cursor = first.json()["next_cursor"]
+            second = client.post(
+                "/api/v1/jobs/batch",
+                json={"statuses": ["running"], "limit": 1, "cursor": cursor},
+            )
+            by_id = client.post(
+                "/api/v1/jobs/batch", json={"job_ids": ["job-1", "job-0", "missing"]}
+            )
+            invalid = client.post("/api/v1/jobs/batch", json={"cursor": "not-a-cursor"})
+        finally:
+            client.app.dependency_overrides.clear()
+
+        assert first.status_code == 200
+        assert [job["job_id"] for job in first.json()["jobs"]] == ["job-2"]
+        assert "result" not in first.json()["jobs"][0]
+        assert [job["job_id"] for job in second.json()["jobs"]] == ["job-0"]
+        assert second.json()["next_cursor"] is None
+        assert [job["status"] for job in by_id.json()["jobs"]] == ["pending_hitl", "running"]
+        assert invalid.status_code == 400
@@ -371,3 +371,39 @@ class TestListSkills:
             assert len(data) == 2
         finally:
             _clear_overrides(client)
+
+    def test_list_skills_search_ranks_by_relevance(self, client, tmp_path):
+        from skill_fleet.taxonomy.search import SkillSearchIndex
+
+        cache = {
+            "a/csv": SimpleNamespace(
+                skill_id="a/csv", name="csv", description="Parse CSV tables.", capabilities=[]
+            ),
+            "b/pdf": SimpleNamespace(
+                skill_id="b/pdf",
+                name="pdf-tables",
+                description="Extract tables from PDF files.",
+                capabilities=["pdf_tables"],
+            ),
+            "c/pdf-forms": SimpleNamespace(
+                skill_id="c/pdf-forms", name="pdf-forms", description="Fill forms.", capabilities=[]
+            ),
+        }
+        mock_service = MagicMock()
+        mock_service.taxonomy_manager.metadata_cache = cache
+        mock_service.taxonomy_manager.search_index = SkillSearchIndex.from_metadata(cache)
+
+        _override_skill_service(client, mock_service)
+        try:
+            response = client.get("/api/v1/skills", params={"search": "pdf tables"})
+            assert response.status_code == 200
+            assert [item["skill_id"] for item in response.json()] == [
+                "b/pdf",
+                "c/pdf-forms",
+                "a/csv",
+            ]
+
+            response = client.get("/api/v1/skills", params={"search": "pd"})
+            assert [item["skill_id"] for item in response.json()] == ["b/pdf", "c/pdf-forms"]
+        finally:
+            _clear_overrides(client)
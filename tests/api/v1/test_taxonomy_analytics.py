@@ -7,7 +7,10 @@ from types import SimpleNamespace
 
 from skill_fleet.api.dependencies import get_taxonomy_manager
 from skill_fleet.common.paths import ensure_skills_root_initialized
-from skill_fleet.taxonomy.discovery import generate_available_skills_xml
+from skill_fleet.taxonomy.discovery import (
+    AvailableSkillsXmlCache,
+    generate_available_skills_xml,
+)
 from skill_fleet.taxonomy.manager import TaxonomyManager
 from skill_fleet.taxonomy.metadata import InfrastructureSkillMetadata
 
@@ -29,39 +32,29 @@ class TestTaxonomyXmlEndpoint:
         metadata_path = skill_dir / "metadata.json"
         metadata_path.write_text("{}", encoding="utf-8")
 
+        metadata_cache = {
+            "testing/xml-skill": InfrastructureSkillMetadata(
+                skill_id="testing/xml-skill",
+                version="1.0.0",
+                type="technical",
+                weight="medium",
+                load_priority="task_specific",
+                dependencies=[],
+                capabilities=[],
+                path=metadata_path,
+                name="xml-skill",
+                description="Skill used for XML endpoint testing",
+            )
+        }
+        xml_cache = AvailableSkillsXmlCache()
         manager = SimpleNamespace(
             skills_root=skills_root,
-            metadata_cache={
-                "testing/xml-skill": InfrastructureSkillMetadata(
-                    skill_id="testing/xml-skill",
-                    version="1.0.0",
-                    type="technical",
-                    weight="medium",
-                    load_priority="task_specific",
-                    dependencies=[],
-                    capabilities=[],
-                    path=metadata_path,
-                    name="xml-skill",
-                    description="Skill used for XML endpoint testing",
-                )
-            },
+            metadata_cache=metadata_cache,
             generate_available_skills_xml=lambda user_id=None: generate_available_skills_xml(
-                {
-                    "testing/xml-skill": InfrastructureSkillMetadata(
-                        skill_id="testing/xml-skill",
-                        version="1.0.0",
-                        type="technical",
-                        weight="medium",
-                        load_priority="task_specific",
-                        dependencies=[],
-                        capabilities=[],
-                        path=metadata_path,
-                        name="xml-skill",
-                        description="Skill used for XML endpoint testing",
-                    )
-                },
-                skills_root,
-                user_id=user_id,
+                metadata_cache, skills_root, user_id=user_id
+            ),
+            available_skills_xml=lambda user_id=None: xml_cache.render(
+                user_id or "*", metadata_cache
             ),
         )
 
@@ -169,6 +162,73 @@ class TestTaxonomyXmlEndpoint:
         finally:
             _clear_overrides(client)
 
+    def test_xml_endpoint_etag_revalidation(self, client, tmp_path):
+        skills_root = ensure_skills_root_initialized(tmp_path / "skills")
+        skill_dir = skills_root / "testing" / "etag-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: etag-skill\ndescription: Before edit\n---\n", encoding="utf-8"
+        )
+
+        manager = TaxonomyManager(skills_root)
+
+        _override_taxonomy_manager(client, manager)
+        try:
+            first = client.get("/api/v1/taxonomy/xml")
+            assert first.status_code == 200
+            etag = first.headers["etag"]
+
+            cached = client.get("/api/v1/taxonomy/xml", headers={"If-None-Match": etag})
+            assert cached.status_code == 304
+            assert cached.headers["etag"] == etag
+            assert cached.content == b""
+
+            (skill_dir / "SKILL.md").write_text(
+                "---\nname: etag-skill\ndescription: After & edit\n---\n", encoding="utf-8"
+            )
+            manager.apply_filesystem_changes([skill_dir])
+
+            changed = client.get("/api/v1/taxonomy/xml", headers={"If-None-Match": etag})
+            assert changed.status_code == 200
+            assert changed.headers["etag"] != etag
+            assert "<description>After &amp; edit</description>" in changed.text
+        finally:
+            _clear_overrides(client)
+
+
+class TestTaxonomyPathsEndpoint:
+    def test_queries_paths_by_prefix(self, client, tmp_path):
+        skills_root = ensure_skills_root_initialized(tmp_path / "skills")
+        for name in ("python", "rust", "ruby"):
+            skill_dir = skills_root / "languages" / name
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\n---\n", encoding="utf-8")
+
+        manager = TaxonomyManager(skills_root)
+
+        _override_taxonomy_manager(client, manager)
+        try:
+            response = client.get("/api/v1/taxonomy/paths", params={"prefix": "languages/r"})
+            assert response.status_code == 200
+            data = response.json()
+            assert [skill["path"] for skill in data["skills"]] == [
+                "languages/ruby",
+                "languages/rust",
+            ]
+            assert data["total"] == 2
+
+            branch = client.get(
+                "/api/v1/taxonomy/paths", params={"prefix": "languages", "limit": 1}
+            )
+            assert branch.json()["children"] == ["python", "ruby", "rust"]
+            assert branch.json()["total"] == 3
+            assert len(branch.json()["skills"]) == 1
+
+            rejected = client.get("/api/v1/taxonomy/paths", params={"prefix": "../etc"})
+            assert rejected.status_code == 400
+        finally:
+            _clear_overrides(client)
+
 
 class TestAnalyticsEndpoints:
     def test_returns_empty_analytics_when_usage_log_missing(self, client, tmp_path):
@@ -215,3 +215,37 @@ class TestApiFirstCliCommands:
         assert payload["recommendations"]["total_recommendations"] == 1
         assert FakeClient.captured["analytics_user_id"] is None
         assert FakeClient.captured["recommendations_user_id"] == "default"
+
+
+class TestWorkerCommand:
+    """Test the standalone workflow worker command."""
+
+    def test_worker_command_applies_overrides_and_runs_worker(self, monkeypatch):
+        captured = {}
+
+        async def fake_run_worker(settings, *, init_schema=True):
+            captured["settings"] = settings
+            captured["init_schema"] = init_schema
+
+        monkeypatch.setattr("skill_fleet.api.worker.run_worker", fake_run_worker)
+
+        runner = CliRunner()
+        result = runner.invoke(
+            app,
+            [
+                "worker",
+                "--workers",
+                "3",
+                "--per-user-limit",
+                "1",
+                "--events-url",
+                "redis://localhost:6380/0",
+                "--skip-db-init",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        settings = captured["settings"]
+        assert (settings.job_workers, settings.job_per_user_limit) == (3, 1)
+        assert settings.job_events_url == "redis://localhost:6380/0"
+        assert captured["init_schema"] is False
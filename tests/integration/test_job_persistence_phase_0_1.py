@@ -45,7 +45,7 @@ class TestJobPersistenceLifecycle:
         # DB create should be attempted
         # We check if JobRepository was instantiated and create was called
         assert mock_repo_cls.call_count > 0
-        assert mock_repo_instance.create.called or mock_repo_instance.update.called
+        assert mock_repo_instance.create.called or mock_repo_instance.update_columns.called
 
     @pytest.mark.asyncio
     async def test_retrieve_job_from_memory_first(self):
@@ -260,8 +260,7 @@ class TestMemoryCacheManagement:
         assert await store.get(job_id) is not None
 
         # Manually expire (access store directly since it's internal)
-        async with store._lock:
-            store.store[job_id] = (job, datetime.now(UTC) - timedelta(minutes=120))
+        store.store[job_id] = (job, datetime.now(UTC) - timedelta(minutes=120))
 
         # Should be expired now
         assert await store.get(job_id) is None
@@ -278,18 +277,16 @@ class TestMemoryCacheManagement:
             job = JobState(job_id=f"job-{i}", status="pending")
             await store.set(f"job-{i}", job)
 
-        # Manually expire all (access store directly with lock)
+        # Manually expire all (access store directly since it's internal)
         past = datetime.now(UTC) - timedelta(minutes=120)
-        async with store._lock:
-            for job_id in list(store.store.keys()):
-                job, _ = store.store[job_id]
-                store.store[job_id] = (job, past)
+        for job_id in list(store.store.keys()):
+            job, _ = store.store[job_id]
+            store.store[job_id] = (job, past)
 
         # Cleanup
         cleaned = await store.cleanup_expired()
         assert cleaned == 3
-        async with store._lock:
-            assert len(store.store) == 0
+        assert len(store.store) == 0
 
     @pytest.mark.asyncio
     async def test_cleanup_keeps_valid_entries(self):
@@ -78,3 +78,25 @@ def test_recommendation_engine(temp_analytics_dir):
     assert len(recs) == 1
     assert recs[0]["skill_id"] == "dep_1"
     assert "Required by" in recs[0]["reason"]
+
+
+def test_recommendation_engine_uses_transitive_dependencies(temp_analytics_dir):
+    from skill_fleet.taxonomy.dependency_graph import DependencyGraph
+
+    class GraphTaxonomy:
+        def __init__(self):
+            self.dependency_graph = DependencyGraph()
+            self.dependency_graph.set_dependencies("skill_1", ["dep_1"])
+            self.dependency_graph.set_dependencies("dep_1", ["dep_2"])
+
+    tracker = UsageTracker(temp_analytics_dir)
+    tracker.track_usage("skill_1", "user_1")
+
+    engine = AnalyticsEngine(temp_analytics_dir / "usage_log.jsonl")
+    recs = RecommendationEngine(engine, GraphTaxonomy()).recommend_skills("user_1")
+
+    assert [(rec["skill_id"], rec["priority"]) for rec in recs] == [
+        ("dep_1", "high"),
+        ("dep_2", "medium"),
+    ]
+    assert recs[1]["reason"].startswith("Indirectly required by")
@@ -0,0 +1,72 @@
+"""Tests for taxonomy context selection ahead of FindTaxonomyPathModule."""
+
+from skill_fleet.core.modules.understanding.context import (
+    estimate_tokens,
+    select_taxonomy_context,
+)
+
+
+def _large_taxonomy():
+    structure = {
+        f"domain_{i}/area_{i}": {f"topic_{i}_{j}": "available" for j in range(20)}
+        for i in range(40)
+    }
+    structure["technical_skills/databases"] = {
+        "postgres": "available",
+        "sqlite": "available",
+        "mongodb": "available",
+    }
+    skills = [f"domain_{i}/area_{i}/topic_{i}_{j}" for i in range(40) for j in range(5)]
+    skills += ["technical_skills/databases/postgres", "technical_skills/databases/sqlite"]
+    return structure, skills
+
+
+def test_small_context_passes_through_unchanged():
+    structure = {"technical": {"frontend": ["react", "vue"]}}
+    skills = ["technical/frontend/react-basics"]
+
+    context = select_taxonomy_context("Build a React library", None, structure, skills)
+
+    assert context.taxonomy_structure == structure
+    assert context.existing_skills == skills
+    assert context.tokens_after == context.tokens_before
+
+
+def test_large_context_keeps_relevant_branches_and_siblings():
+    structure, skills = _large_taxonomy()
+
+    context = select_taxonomy_context(
+        "Tune slow postgres queries",
+        {"domain": "technical", "topics": ["databases", "sqlite"]},
+        structure,
+        skills,
+        max_branches=3,
+        max_skills=5,
+    )
+
+    assert next(iter(context.taxonomy_structure)) == "technical_skills/databases"
+    assert len(context.taxonomy_structure) == 3
+    assert context.existing_skills[:2] == [
+        "technical_skills/databases/postgres",
+        "technical_skills/databases/sqlite",
+    ]
+    assert len(context.existing_skills) == 5
+    metrics = context.metrics
+    assert metrics["branches_before"] == 41
+    assert metrics["skills_before"] == 202
+    assert metrics["tokens_after"] < metrics["tokens_before"] / 10
+
+
+def test_token_budget_trims_skills_then_branches_then_children():
+    structure, skills = _large_taxonomy()
+
+    context = select_taxonomy_context(
+        "postgres indexes", None, structure, skills, max_branches=5, token_budget=40
+    )
+
+    assert context.tokens_after <= 40
+    assert list(context.taxonomy_structure) == ["technical_skills/databases"]
+    assert "postgres" in context.taxonomy_structure["technical_skills/databases"]
+    assert context.tokens_after == estimate_tokens(context.taxonomy_structure) + estimate_tokens(
+        context.existing_skills
+    )
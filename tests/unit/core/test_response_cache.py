@@ -0,0 +1,212 @@
+"""Tests for the module-level LM response cache."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import dspy
+import pytest
+
+from skill_fleet.core.modules.base import BaseModule
+from skill_fleet.dspy.response_cache import (
+    ResponseCache,
+    configure_response_cache,
+    normalize_inputs,
+    response_cache_scope,
+)
+
+
+class Echo(dspy.Signature):
+    """Echo a task."""
+
+    task: str = dspy.InputField()
+    answer: str = dspy.OutputField()
+
+
+class CountingModule(BaseModule):
+    def __init__(self):
+        super().__init__()
+        self.predict = dspy.Predict(Echo)
+        self.calls = 0
+
+    async def aforward(self, **kwargs: Any) -> dspy.Prediction:
+        self.calls += 1
+        return self._to_prediction(
+            answer=f"{kwargs['task_description']}#{self.calls}",
+            fallback=kwargs.get("fallback", False),
+        )
+
+
+class SyncModule(BaseModule):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def forward(self, **kwargs: Any) -> dspy.Prediction:
+        self.calls += 1
+        return self._to_prediction(doubled=kwargs["value"] * 2)
+
+
+def _lm(model: str = "test-model", temperature: float = 0.0) -> SimpleNamespace:
+    return SimpleNamespace(model=model, kwargs={"temperature": temperature})
+
+
+@pytest.fixture(autouse=True)
+def _no_default_cache():
+    configure_response_cache(None)
+    yield
+    configure_response_cache(None)
+
+
+def test_normalize_inputs_keeps_strings_verbatim_and_orders_keys():
+    assert normalize_inputs({"b": "  Build   a\nCLI ", "a": {3, 1}}) == {
+        "a": [1, 3],
+        "b": "  Build   a\nCLI ",
+    }
+    assert normalize_inputs(b"data") == normalize_inputs(memoryview(b"data"))
+    assert normalize_inputs(b"data") != normalize_inputs(b"other")
+
+
+async def test_identical_inputs_skip_the_module_and_metrics_are_per_module():
+    cache = ResponseCache()
+    module = CountingModule()
+
+    with dspy.context(lm=_lm()), response_cache_scope(cache):
+        first = await module.aforward(task_description="Build a CLI")
+        second = await module.aforward(task_description="Build a CLI")
+
+    assert module.calls == 1
+    assert second.answer == first.answer == "Build a CLI#1"
+    stats = cache.get_stats()
+    assert stats["modules"]["CountingModule"] == {
+        "hits": 1,
+        "near_hits": 0,
+        "misses": 1,
+        "stores": 1,
+    }
+
+
+async def test_indentation_changes_are_not_served_from_the_cache():
+    cache = ResponseCache()
+    module = CountingModule()
+    nested = "---\nname: demo\nmetadata:\n  version: 1\n---\n"
+    flattened = "---\nname: demo\nmetadata:\nversion: 1\n---\n"
+
+    with dspy.context(lm=_lm()), response_cache_scope(cache):
+        await module.aforward(task_description=nested)
+        result = await module.aforward(task_description=flattened)
+
+    assert module.calls == 2
+    assert result.answer == f"{flattened}#2"
+
+
+async def test_optimized_predictors_do_not_reuse_earlier_outputs():
+    cache = ResponseCache()
+    module = CountingModule()
+
+    with dspy.context(lm=_lm()), response_cache_scope(cache):
+        await module.aforward(task_description="task")
+        module.predict.signature = module.predict.signature.with_instructions("Be terse.")
+        await module.aforward(task_description="task")
+        module.predict.demos = [dspy.Example(task="a", answer="b")]
+        await module.aforward(task_description="task")
+        await module.aforward(task_description="task")
+
+    assert module.calls == 3
+
+
+async def test_inputs_without_a_canonical_form_are_not_cached():
+    cache = ResponseCache()
+    module = CountingModule()
+
+    with dspy.context(lm=_lm()), response_cache_scope(cache):
+        await module.aforward(task_description=object())
+        await module.aforward(task_description=object())
+
+    assert module.calls == 2
+    assert len(cache) == 0
+    assert cache.get_stats()["misses"] == 0
+
+
+def test_validation_modules_opt_out_of_the_cache():
+    from skill_fleet.core.modules.validation.compliance import ValidateComplianceModule
+    from skill_fleet.core.modules.validation.structure import ValidateStructureModule
+
+    assert not ValidateComplianceModule.response_cacheable
+    assert not ValidateStructureModule.response_cacheable
+
+
+async def test_model_and_temperature_are_part_of_the_key():
+    cache = ResponseCache()
+    module = CountingModule()
+
+    with response_cache_scope(cache):
+        for lm in (_lm(), _lm(temperature=1.0), _lm(model="other"), _lm()):
+            with dspy.context(lm=lm):
+                await module.aforward(task_description="task")
+
+    assert module.calls == 3
+
+
+async def test_fallback_results_and_calls_without_lm_are_not_cached():
+    cache = ResponseCache()
+    module = CountingModule()
+
+    with response_cache_scope(cache):
+        with dspy.context(lm=_lm()):
+            await module.aforward(task_description="t", fallback=True)
+            await module.aforward(task_description="t", fallback=True)
+        with dspy.context(lm=None):
+            await module.aforward(task_description="u")
+
+    assert module.calls == 3
+    assert len(cache) == 0
+
+
+def test_sync_forward_uses_the_process_wide_cache():
+    configure_response_cache(ResponseCache())
+    module = SyncModule()
+
+    with dspy.context(lm=_lm()):
+        assert module(value=2).doubled == 4
+        assert module.forward(value=2).doubled == 4
+
+    assert module.calls == 1
+
+
+async def test_ttl_and_size_bounds(monkeypatch):
+    from skill_fleet.dspy import response_cache as module_under_test
+
+    now = [100.0]
+    monkeypatch.setattr(module_under_test.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(max_entries=2, ttl=10)
+    module = CountingModule()
+
+    with dspy.context(lm=_lm()), response_cache_scope(cache):
+        for task in ("a", "b", "c"):
+            await module.aforward(task_description=task)
+        assert len(cache) == 2
+        await module.aforward(task_description="a")  # Evicted -> recomputed
+        assert module.calls == 4
+
+        now[0] += 11
+        await module.aforward(task_description="c")  # Expired -> recomputed
+        assert module.calls == 5
+
+
+async def test_near_duplicate_mode_reuses_similar_inputs():
+    pytest.importorskip("numpy")
+    cache = ResponseCache(near_duplicate_threshold=0.9)
+    module = CountingModule()
+
+    with dspy.context(lm=_lm()), response_cache_scope(cache):
+        await module.aforward(task_description="Build a Python CLI for managing PostgreSQL backups")
+        reused = await module.aforward(
+            task_description="Build a Python CLI for managing PostgreSQL backup"
+        )
+        await module.aforward(task_description="Write a haiku about autumn leaves")
+
+    assert module.calls == 2
+    assert reused.answer.endswith("#1")
+    assert cache.get_stats()["near_hits"] == 1
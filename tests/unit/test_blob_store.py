@@ -0,0 +1,45 @@
+"""Tests for the content-addressed blob store."""
+
+from __future__ import annotations
+
+import pytest
+
+from skill_fleet.infrastructure.blobs import (
+    BlobNotFoundError,
+    BlobStore,
+    FileBlobStore,
+    is_blob_ref,
+    load_json,
+    offload_json,
+)
+
+
+def test_blobs_are_content_addressed_and_sharded(tmp_path):
+    store = FileBlobStore(tmp_path)
+    ref = store.put(b"payload")
+
+    assert isinstance(store, BlobStore)
+    assert store.put(b"payload") == ref
+    digest = ref.removeprefix("sha256:")
+    assert (tmp_path / digest[:2] / digest[2:4] / digest).read_bytes() == b"payload"
+    assert store.get(ref) == b"payload"
+    assert store.delete(ref) and not store.exists(ref)
+    with pytest.raises(BlobNotFoundError):
+        store.get(ref)
+    with pytest.raises(ValueError, match="Invalid blob reference"):
+        store.get("sha256:../../etc/passwd")
+
+
+def test_only_large_json_values_are_offloaded(tmp_path):
+    store = FileBlobStore(tmp_path)
+    small = {"status": "ok"}
+    large = {"skill_content": "x" * 2048}
+
+    assert offload_json(small, store, threshold=1024) is small
+    assert offload_json(None, store, threshold=1024) is None
+    ref = offload_json(large, store, threshold=1024)
+    assert is_blob_ref(ref) and ref["size"] > 2048
+    assert load_json(ref, store) == large
+    assert load_json(small, store) is small
+    with pytest.raises(BlobNotFoundError):
+        load_json(ref, None)
@@ -0,0 +1,54 @@
+from skill_fleet.taxonomy.dependency_graph import DependencyGraph
+
+
+def _graph(edges: dict[str, list[str]]) -> DependencyGraph:
+    graph = DependencyGraph()
+    for skill_id, dependencies in edges.items():
+        graph.set_dependencies(skill_id, dependencies)
+    return graph
+
+
+def test_tarjan_reports_cycles_and_self_loops():
+    graph = _graph(
+        {
+            "a": ["b"],
+            "b": ["c"],
+            "c": ["a", "d"],
+            "d": [],
+            "e": ["e"],
+            "f": ["d"],
+        }
+    )
+
+    cycles = sorted(sorted(component) for component in graph.find_cycles())
+    assert cycles == [["a", "b", "c"], ["e"]]
+    # Components come out dependencies-first.
+    components = graph.strongly_connected_components()
+    assert components.index(["d"]) < next(
+        i for i, component in enumerate(components) if "a" in component
+    )
+
+
+def test_find_cycle_with_proposed_dependencies():
+    graph = _graph({"a": ["b"], "b": ["c"], "c": []})
+
+    assert graph.find_cycle("a") is None
+    assert graph.find_cycle("c", ["a"]) == ["c", "a", "b", "c"]
+    assert graph.find_cycle("new", ["a", "missing"]) is None
+    assert graph.find_cycle("new", ["new"]) == ["new", "new"]
+
+
+def test_incremental_edges_and_closures():
+    graph = _graph({"a": ["b"], "b": ["c"], "c": []})
+
+    assert graph.dependencies("a", transitive=True) == {"b", "c"}
+    assert graph.dependents("c", transitive=True) == {"a", "b"}
+
+    assert graph.add_dependency("c", "d") is None
+    assert graph.dependencies("a", transitive=True) == {"b", "c", "d"}
+    assert graph.add_dependency("d", "a") == ["d", "a", "b", "c", "d"]
+
+    graph.remove_skill("d")
+    assert "d" not in graph
+    assert graph.find_cycles() == []
+    assert graph.dependencies("a", transitive=True) == {"b", "c", "d"}
@@ -1,4 +1,11 @@
+import json
+import os
+import shutil
+import threading
+
 from skill_fleet.taxonomy import InfrastructureSkillMetadata, discovery
+from skill_fleet.taxonomy.metadata_index import SkillMetadataIndex
+from skill_fleet.taxonomy.skill_loader import load_skill_dir_metadata
 
 
 def test_ensure_all_skills_loaded_throttles_recent_scan(tmp_path, monkeypatch):
@@ -27,3 +34,145 @@ def test_ensure_all_skills_loaded_throttles_recent_scan(tmp_path, monkeypatch):
         discovery._last_discovery_scan.update(previous_scan_state)
 
     assert load_calls == [skill_dir]
+
+
+def _write_skill(skill_dir, skill_id, description):
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "metadata.json").write_text(
+        json.dumps({"skill_id": skill_id, "description": description}), encoding="utf-8"
+    )
+
+
+def _scan(skills_root, metadata_cache, loader, index):
+    discovery._last_discovery_scan.clear()
+    discovery.ensure_all_skills_loaded(skills_root, metadata_cache, loader, metadata_index=index)
+
+
+def test_metadata_index_only_reparses_changed_dirs(tmp_path):
+    skills_root = tmp_path / "skills"
+    _write_skill(skills_root / "alpha", "alpha", "first")
+    _write_skill(skills_root / "beta", "beta", "second")
+    _write_skill(skills_root / "_drafts" / "gamma", "gamma", "draft")
+    index_path = skills_root / ".cache" / "index.sqlite3"
+
+    load_calls: list = []
+
+    def loader(skill_dir):
+        load_calls.append(skill_dir.name)
+        return load_skill_dir_metadata(skill_dir)
+
+    metadata_cache: dict[str, InfrastructureSkillMetadata] = {}
+    _scan(skills_root, metadata_cache, loader, SkillMetadataIndex(index_path, skills_root))
+    assert sorted(load_calls) == ["alpha", "beta"]
+    assert set(metadata_cache) == {"alpha", "beta"}
+
+    # A fresh process hydrates from the index without parsing unchanged dirs.
+    load_calls.clear()
+    beta_meta = skills_root / "beta" / "metadata.json"
+    _write_skill(skills_root / "beta", "beta", "second, edited")
+    stat = beta_meta.stat()
+    os.utime(beta_meta, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    fresh_cache: dict[str, InfrastructureSkillMetadata] = {}
+    _scan(skills_root, fresh_cache, loader, SkillMetadataIndex(index_path, skills_root))
+    assert load_calls == ["beta"]
+    assert fresh_cache["alpha"].description == "first"
+    assert fresh_cache["alpha"].path == skills_root / "alpha" / "metadata.json"
+    assert fresh_cache["beta"].description == "second, edited"
+
+
+def test_metadata_index_evicts_removed_dirs(tmp_path):
+    skills_root = tmp_path / "skills"
+    _write_skill(skills_root / "alpha", "alpha", "first")
+    _write_skill(skills_root / "beta", "beta", "second")
+    index = SkillMetadataIndex(skills_root / ".cache" / "index.sqlite3", skills_root)
+
+    metadata_cache: dict[str, InfrastructureSkillMetadata] = {}
+    _scan(skills_root, metadata_cache, load_skill_dir_metadata, index)
+    shutil.rmtree(skills_root / "beta")
+    _scan(skills_root, metadata_cache, load_skill_dir_metadata, index)
+
+    assert set(metadata_cache) == {"alpha"}
+    reloaded = SkillMetadataIndex(index.db_path, skills_root).entries()
+    assert set(reloaded) == {"alpha"}
+
+
+def test_refresh_parses_changed_dirs_in_parallel(tmp_path):
+    skills_root = tmp_path / "skills"
+    count = 40
+    for i in range(count):
+        _write_skill(skills_root / "bulk" / f"skill{i:02d}", f"bulk/skill{i:02d}", f"skill {i}")
+    (skills_root / "bulk" / "broken").mkdir()
+    (skills_root / "bulk" / "broken" / "metadata.json").write_text("{", encoding="utf-8")
+    index = SkillMetadataIndex(skills_root / ".cache" / "index.sqlite3", skills_root)
+
+    threads: set[str] = set()
+
+    def loader(skill_dir):
+        threads.add(threading.current_thread().name)
+        return load_skill_dir_metadata(skill_dir)
+
+    metadata_cache: dict[str, InfrastructureSkillMetadata] = {}
+    report = discovery.refresh_skill_dirs(skills_root, metadata_cache, loader, index, max_workers=4)
+
+    assert report.discovered == count + 1
+    assert (report.parsed, report.failed, report.reused) == (count, 1, 0)
+    assert len(metadata_cache) == count
+    assert report.changed_ids == set(metadata_cache)
+    assert set(report.timings) == {"walk", "fingerprint", "parse", "index_write"}
+    assert all(name.startswith("skill-loader") for name in threads)
+
+    rescan = discovery.refresh_skill_dirs(skills_root, metadata_cache, loader, index)
+    assert (rescan.parsed, rescan.reused, rescan.failed) == (0, count, 1)
+    assert not rescan.changed_ids
+
+
+def test_available_skills_xml_cache_patches_changed_fragments(tmp_path, monkeypatch):
+    skills_root = tmp_path / "skills"
+    _write_skill(skills_root / "alpha", "alpha", "first")
+    _write_skill(skills_root / "beta", "beta", "second")
+    metadata_cache = {
+        name: load_skill_dir_metadata(skills_root / name) for name in ("alpha", "beta")
+    }
+
+    expected = discovery.generate_available_skills_xml(metadata_cache, skills_root)
+    rendered: list[str] = []
+    render_fragment = discovery._skill_xml_fragment
+
+    def counting_fragment(skill_id, meta):
+        rendered.append(skill_id)
+        return render_fragment(skill_id, meta)
+
+    monkeypatch.setattr(discovery, "_skill_xml_fragment", counting_fragment)
+    xml_cache = discovery.AvailableSkillsXmlCache()
+
+    xml, etag = xml_cache.render("*", metadata_cache)
+    assert xml == expected
+    assert xml_cache.render("*", metadata_cache) == (xml, etag)
+    assert sorted(rendered) == ["alpha", "beta"]
+
+    rendered.clear()
+    _write_skill(skills_root / "beta", "beta", "second <edited>")
+    metadata_cache["beta"] = load_skill_dir_metadata(skills_root / "beta")
+    xml_cache.invalidate(["beta"])
+
+    patched, patched_etag = xml_cache.render("*", metadata_cache)
+    assert rendered == ["beta"]
+    assert patched_etag != etag
+    assert "second &lt;edited&gt;" in patched
+
+
+def test_available_skills_xml_cache_bounds_view_documents(tmp_path):
+    skills_root = tmp_path / "skills"
+    _write_skill(skills_root / "alpha", "alpha", "first")
+    metadata_cache = {"alpha": load_skill_dir_metadata(skills_root / "alpha")}
+    xml_cache = discovery.AvailableSkillsXmlCache(max_documents=2)
+
+    xml_cache.render("*", metadata_cache)
+    xml_cache.render("user:a", metadata_cache)
+    assert xml_cache.get("*") is not None
+    xml_cache.render("user:b", metadata_cache)
+
+    assert xml_cache.get("user:a") is None
+    assert xml_cache.get("*") is not None
+    assert xml_cache.get("user:b") is not None
@@ -96,3 +96,97 @@ def test_dependency_validation(temp_taxonomy: Path) -> None:
     valid, missing = manager.validate_dependencies(["nonexistent/skill"])
     assert valid is False
     assert missing == ["nonexistent/skill"]
+
+
+def test_branch_structure_and_parents_come_from_path_index(temp_taxonomy: Path) -> None:
+    parent_dir = temp_taxonomy / "technical_skills" / "programming"
+    parent_dir.mkdir(parents=True)
+    (parent_dir / "metadata.json").write_text(
+        json.dumps({"skill_id": "technical_skills/programming"}), encoding="utf-8"
+    )
+    child_dir = parent_dir / "python"
+    child_dir.mkdir()
+    (child_dir / "SKILL.md").write_text("---\nname: python\n---\n", encoding="utf-8")
+    (parent_dir / "_drafts" / "wip").mkdir(parents=True)
+
+    manager = TaxonomyManager(temp_taxonomy)
+    manager.bulk_load_skills()
+
+    assert manager.skill_exists("technical_skills/programming/python") is True
+    assert manager._get_branch_structure("technical_skills/programming") == {"python": "available"}
+    parents = manager.get_parent_skills("technical_skills/programming/python/asyncio")
+    # SKILL.md-only ancestors carry no JSON metadata and are skipped.
+    assert [parent["path"] for parent in parents] == ["technical_skills/programming"]
+    assert parents[0]["metadata"]["skill_id"] == "technical_skills/programming"
+
+
+def test_circular_dependency_detection_uses_dependency_graph(temp_taxonomy: Path) -> None:
+    for skill_id, dependencies in {
+        "graph/alpha": ["graph/beta"],
+        "graph/beta": ["_core/reasoning"],
+    }.items():
+        skill_dir = temp_taxonomy / skill_id
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "metadata.json").write_text(
+            json.dumps({"skill_id": skill_id, "dependencies": dependencies}), encoding="utf-8"
+        )
+
+    manager = TaxonomyManager(temp_taxonomy)
+
+    # Dependencies missing from the graph are loaded from disk on demand.
+    assert manager.detect_circular_dependencies("graph/gamma", ["graph/alpha"]) == (False, None)
+    assert "graph/beta" in manager.dependency_graph
+
+    has_cycle, cycle = manager.detect_circular_dependencies("_core/reasoning", ["graph/alpha"])
+    assert has_cycle is True
+    assert cycle == ["_core/reasoning", "graph/alpha", "graph/beta", "_core/reasoning"]
+
+    # A caller-supplied path reports only the nodes on the cycle, in order.
+    assert manager.detect_circular_dependencies(
+        "graph/beta", [], ["graph/root", "graph/alpha", "graph/beta", "graph/gamma"]
+    ) == (True, ["graph/beta", "graph/gamma", "graph/beta"])
+
+
+def test_relevant_branches_and_search_follow_registered_skills(temp_taxonomy: Path) -> None:
+    skill_dir = temp_taxonomy / "technical_skills" / "databases" / "postgres"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "metadata.json").write_text(
+        json.dumps(
+            {
+                "skill_id": "technical_skills/databases/postgres",
+                "name": "postgres-tuning",
+                "description": "Tune PostgreSQL query plans and indexes.",
+                "capabilities": ["query_planning"],
+            }
+        ),
+        encoding="utf-8",
+    )
+    manager = TaxonomyManager(temp_taxonomy)
+
+    hits = manager.search_skills("slow postgres query plans")
+    branches = manager.get_relevant_branches("slow postgres query plans")
+
+    assert [hit.skill_id for hit in hits] == ["technical_skills/databases/postgres"]
+    assert branches == {"technical_skills/databases": {"postgres": "available"}}
+    # Nothing indexed matches: fall back to the keyword table.
+    assert list(manager.get_relevant_branches("fix this error")) == ["task_focus_areas"]
+
+
+def test_startup_ignores_index_rows_of_skills_changed_while_down(temp_taxonomy: Path) -> None:
+    import shutil
+
+    for name in ("kept", "deleted"):
+        skill_dir = temp_taxonomy / "indexed" / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "metadata.json").write_text(
+            json.dumps({"skill_id": f"indexed/{name}"}), encoding="utf-8"
+        )
+    TaxonomyManager(temp_taxonomy).bulk_load_skills()
+    shutil.rmtree(temp_taxonomy / "indexed" / "deleted")
+
+    manager = TaxonomyManager(temp_taxonomy)
+
+    assert "indexed/kept" in manager.metadata_cache
+    assert "indexed/deleted" not in manager.metadata_cache
+    assert manager.skill_exists("indexed/kept")
+    assert not manager.skill_exists("indexed/deleted")
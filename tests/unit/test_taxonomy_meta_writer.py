@@ -0,0 +1,123 @@
+import asyncio
+import json
+import threading
+
+from skill_fleet.taxonomy.manager import TaxonomyManager
+from skill_fleet.taxonomy.meta_writer import MetaWriter, flush_all
+
+
+def _write_meta(skills_root):
+    skills_root.mkdir(parents=True, exist_ok=True)
+    meta = {"version": "0.1.0", "statistics": {}}
+    (skills_root / "taxonomy_meta.json").write_text(json.dumps(meta), encoding="utf-8")
+    return skills_root
+
+
+def test_meta_writer_coalesces_updates_into_one_atomic_write(tmp_path):
+    path = tmp_path / "meta.json"
+    data = {"count": 0}
+    writer = MetaWriter(path, lambda: data, interval=60, max_pending=1000)
+
+    def bump():
+        for _ in range(100):
+            with writer.lock:
+                data["count"] += 1
+            writer.mark_dirty()
+
+    threads = [threading.Thread(target=bump) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert writer.flush() is True
+    assert writer.flush() is False
+    assert json.loads(path.read_text(encoding="utf-8")) == {"count": 400}
+    assert writer.flush_count == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["meta.json"]
+
+
+def test_meta_writer_flushes_early_when_threshold_reached(tmp_path):
+    path = tmp_path / "meta.json"
+    written = threading.Event()
+    writer = MetaWriter(path, lambda: {"ok": True}, interval=60, max_pending=3)
+    original_flush = writer.flush
+
+    def flush():
+        result = original_flush()
+        written.set()
+        return result
+
+    writer.flush = flush  # type: ignore[method-assign]
+    for _ in range(3):
+        writer.mark_dirty()
+
+    assert written.wait(timeout=5)
+    assert json.loads(path.read_text(encoding="utf-8")) == {"ok": True}
+    assert writer.pending == 0
+
+
+async def test_track_usage_is_written_behind(tmp_path):
+    skills_root = _write_meta(tmp_path / "skills")
+    manager = TaxonomyManager(skills_root, meta_flush_interval=60)
+    meta_path = skills_root / "taxonomy_meta.json"
+
+    await asyncio.gather(
+        *(manager.track_usage("docs/pdf", "user-1", success=i % 2 == 0) for i in range(20))
+    )
+
+    assert "usage_stats" not in json.loads(meta_path.read_text(encoding="utf-8"))
+    assert flush_all() >= 1
+    on_disk = json.loads(meta_path.read_text(encoding="utf-8"))
+    assert on_disk["usage_stats"]["docs/pdf"] == {"count": 20, "successes": 10}
+    assert manager.meta_writer.flush_count == 1
+
+
+def test_update_meta_is_visible_after_reload(tmp_path):
+    skills_root = _write_meta(tmp_path / "skills")
+    manager = TaxonomyManager(skills_root, meta_flush_interval=60)
+
+    manager.update_meta({"last_updated": "2026-10-16T00:00:00+00:00"})
+
+    assert manager.load_taxonomy_meta()["last_updated"] == "2026-10-16T00:00:00+00:00"
+
+
+def test_failed_write_is_retried_without_new_updates(tmp_path, monkeypatch):
+    from skill_fleet.taxonomy import meta_writer
+
+    path = tmp_path / "meta.json"
+    writer = MetaWriter(path, lambda: {"ok": True}, interval=0.05)
+    original_write = meta_writer.atomic_write_text
+    failures = [OSError("disk full")]
+
+    def flaky_write(target, payload):
+        if failures:
+            raise failures.pop()
+        original_write(target, payload)
+
+    monkeypatch.setattr(meta_writer, "atomic_write_text", flaky_write)
+    writer.mark_dirty()
+
+    for _ in range(100):
+        if path.exists():
+            break
+        threading.Event().wait(0.02)
+    assert json.loads(path.read_text(encoding="utf-8")) == {"ok": True}
+    assert writer.pending == 0
+
+
+def test_reload_does_not_hold_the_meta_lock_while_waiting_for_a_flush(tmp_path):
+    skills_root = _write_meta(tmp_path / "skills")
+    manager = TaxonomyManager(skills_root, meta_flush_interval=60)
+    writer = manager.meta_writer
+
+    with writer._flush_lock:  # A timer flush in progress
+        reload = threading.Thread(target=manager.load_taxonomy_meta)
+        reload.start()
+        reload.join(timeout=0.1)
+        assert reload.is_alive()
+        # The timer's flush needs `lock` next; it must not be held by the reload
+        assert writer.lock.acquire(timeout=1)
+        writer.lock.release()
+    reload.join(timeout=5)
+    assert not reload.is_alive()
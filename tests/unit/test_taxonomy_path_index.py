@@ -0,0 +1,81 @@
+from pathlib import Path
+
+from skill_fleet.taxonomy.metadata import InfrastructureSkillMetadata
+from skill_fleet.taxonomy.models import SkillEntry, TaxonomyIndex
+from skill_fleet.taxonomy.path_index import TaxonomyPathIndex
+
+SKILLS_ROOT = Path("/skills")
+
+
+def _metadata(skill_id: str, path: Path) -> InfrastructureSkillMetadata:
+    return InfrastructureSkillMetadata(
+        skill_id=skill_id,
+        version="1.0.0",
+        type="technical",
+        weight="medium",
+        load_priority="on_demand",
+        dependencies=[],
+        capabilities=[],
+        path=path,
+    )
+
+
+def _build() -> tuple[TaxonomyPathIndex, dict[str, InfrastructureSkillMetadata]]:
+    index = TaxonomyIndex(
+        skills={
+            "python-async": SkillEntry(
+                canonical_path="technical/programming/python/async",
+                aliases=["python/asyncio"],
+            )
+        }
+    )
+    metadata_cache = {
+        "python": _metadata("python", SKILLS_ROOT / "technical/programming/python/metadata.json"),
+        "technical/programming/rust": _metadata(
+            "technical/programming/rust", SKILLS_ROOT / "technical/programming/rust/SKILL.md"
+        ),
+        "_core/reasoning": _metadata("_core/reasoning", SKILLS_ROOT / "_core/reasoning.json"),
+    }
+    return TaxonomyPathIndex.build(index, metadata_cache, SKILLS_ROOT), metadata_cache
+
+
+def test_path_index_exact_alias_prefix_and_subtree_queries():
+    path_index, _ = _build()
+
+    assert path_index.lookup("technical/programming/python").source == "metadata_dir"
+    assert path_index.lookup("_core/reasoning").source == "skill_file"
+    assert path_index.lookup("technical/programming") is None
+    assert path_index.resolve_alias("python/asyncio") == "technical/programming/python/async"
+
+    assert path_index.children("technical/programming") == ["python", "rust"]
+    assert [entry.path for entry in path_index.iter_subtree("technical/programming/python")] == [
+        "technical/programming/python",
+        "technical/programming/python/async",
+    ]
+    assert [entry.path for entry in path_index.iter_prefix("technical/programming/r")] == [
+        "technical/programming/rust"
+    ]
+    assert [
+        entry.skill_id for entry in path_index.ancestors("technical/programming/python/async")
+    ] == ["python"]
+    assert len(path_index) == 4
+
+
+def test_path_index_update_skills_moves_and_prunes_entries():
+    path_index, metadata_cache = _build()
+
+    metadata_cache["technical/programming/rust"] = _metadata(
+        "technical/programming/rust", SKILLS_ROOT / "systems/rust/SKILL.md"
+    )
+    del metadata_cache["python"]
+    path_index.update_skills(["technical/programming/rust", "python"], metadata_cache, SKILLS_ROOT)
+
+    assert path_index.lookup("technical/programming/rust") is None
+    assert path_index.lookup("systems/rust").skill_id == "technical/programming/rust"
+    # The index-backed child keeps the intermediate branch alive.
+    assert path_index.lookup("technical/programming/python") is None
+    assert path_index.children("technical/programming") == ["python"]
+
+    path_index.set_taxonomy_index(TaxonomyIndex())
+    assert not path_index.has_branch("technical")
+    assert path_index.resolve_alias("python/asyncio") is None
@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import pytest
+
+from skill_fleet.taxonomy.metadata import InfrastructureSkillMetadata
+from skill_fleet.taxonomy.search import SkillSearchIndex, _stem, tokenize
+
+
+def _meta(skill_id, name="", description="", capabilities=()):
+    return InfrastructureSkillMetadata(
+        skill_id=skill_id,
+        version="1.0.0",
+        type="technical",
+        weight="medium",
+        load_priority="on_demand",
+        dependencies=[],
+        capabilities=list(capabilities),
+        path=Path("/skills") / skill_id / "metadata.json",
+        name=name,
+        description=description,
+    )
+
+
+@pytest.fixture
+def cache():
+    skills = [
+        _meta(
+            "technical/programming/python/async",
+            "python-async",
+            "Write asyncio coroutines and tasks in Python.",
+            ["async_programming", "event_loop"],
+        ),
+        _meta(
+            "technical/databases/postgres",
+            "postgres-tuning",
+            "Tune PostgreSQL queries and indexes.",
+            ["query_planning"],
+        ),
+        _meta(
+            "documents/pdf",
+            "pdf-tools",
+            "Extract text and tables from PDF files.",
+            ["pdf_parsing"],
+        ),
+    ]
+    return {meta.skill_id: meta for meta in skills}
+
+
+def test_tokenize_normalizes_and_stems():
+    assert tokenize("Testing the async-tasks, using Python!") == ["test", "async", "task", "python"]
+
+
+def test_singular_and_plural_forms_share_a_stem():
+    assert _stem("pipelines") == _stem("pipeline")
+    for singular, plural in [("name", "names"), ("file", "files"), ("cache", "caches")]:
+        assert _stem(plural) == _stem(singular)
+    assert _stem("matches") == _stem("match") == "match"
+    assert _stem("caching") == _stem("cache")
+    assert _stem("class") == "class"
+
+
+def test_search_ranks_name_and_capability_matches(cache):
+    index = SkillSearchIndex.from_metadata(cache)
+
+    hits = index.search("python async event loop")
+
+    assert hits[0].skill_id == "technical/programming/python/async"
+    assert [hit.skill_id for hit in index.search("pdf tables", k=1)] == ["documents/pdf"]
+    assert index.search("kubernetes") == []
+
+
+def test_update_skills_adds_changes_and_removes(cache):
+    index = SkillSearchIndex.from_metadata(cache)
+
+    cache["documents/pdf"] = _meta("documents/pdf", "pdf-forms", "Fill PDF form fields.")
+    cache["documents/docx"] = _meta("documents/docx", "docx", "Edit Word documents.")
+    del cache["technical/databases/postgres"]
+    index.update_skills(["documents/pdf", "documents/docx", "technical/databases/postgres"], cache)
+
+    assert len(index) == 3
+    assert index.search("tables") == []
+    assert index.search("word")[0].skill_id == "documents/docx"
+    assert "technical/databases/postgres" not in index
+    assert index.search("postgresql") == []
+
+
+def test_embeddings_match_related_vocabulary(cache):
+    pytest.importorskip("numpy")
+    from skill_fleet.taxonomy.search import HashingEmbedder
+
+    lexical = SkillSearchIndex.from_metadata(cache)
+    hybrid = SkillSearchIndex.from_metadata(cache, embedder=HashingEmbedder())
+
+    # "postgresdb" shares no whole term with the skill, only character trigrams.
+    assert lexical.search("postgresdb") == []
+    assert hybrid.search("postgresdb")[0].skill_id == "technical/databases/postgres"
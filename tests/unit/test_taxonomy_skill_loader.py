@@ -0,0 +1,102 @@
+import io
+from pathlib import Path
+
+import pytest
+import yaml
+
+from skill_fleet.taxonomy.skill_loader import (
+    load_skill_for_discovery,
+    parse_skill_frontmatter,
+    read_frontmatter_block,
+)
+
+_LARGE_BODY = "## Section\n\n" + ("Lorem ipsum dolor sit amet, consectetur adipiscing.\n" * 40_000)
+
+
+def _write_skill_md(path, frontmatter, body="# Skill\n"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\n{frontmatter}---\n\n{body}", encoding="utf-8")
+    return path
+
+
+def test_parse_skill_frontmatter_flat_fields(tmp_path):
+    skill_md = _write_skill_md(
+        tmp_path / "SKILL.md",
+        "name: pdf-tools\ndescription: Use when editing PDFs. Don't guess [pages].\n",
+    )
+
+    assert parse_skill_frontmatter(skill_md) == {
+        "name": "pdf-tools",
+        "description": "Use when editing PDFs. Don't guess [pages].",
+    }
+
+
+@pytest.mark.parametrize(
+    "frontmatter",
+    [
+        "name: pdf\nmetadata:\n  version: 1.0\n",
+        "name: pdf\ndescription: >\n  folded\n  text\n",
+        'name: "quoted"\n',
+        "name: pdf # trailing comment\n",
+        "name: pdf\nuser-invocable: true\n",
+        "name: pdf\nallowed-tools: [Read, Write]\n",
+    ],
+)
+def test_parse_skill_frontmatter_matches_yaml_for_structured_headers(tmp_path, frontmatter):
+    skill_md = _write_skill_md(tmp_path / "SKILL.md", frontmatter)
+
+    assert parse_skill_frontmatter(skill_md) == yaml.safe_load(frontmatter.strip())
+
+
+def test_read_frontmatter_block_handles_missing_or_unbounded_header(tmp_path):
+    no_header = tmp_path / "plain.md"
+    no_header.write_text("# Title\n---\n", encoding="utf-8")
+    unterminated = tmp_path / "open.md"
+    unterminated.write_text("---\nname: x\n" + "filler: y\n" * 100, encoding="utf-8")
+
+    assert read_frontmatter_block(no_header) is None
+    assert read_frontmatter_block(unterminated) is None
+    assert read_frontmatter_block(unterminated, max_bytes=64) is None
+    assert parse_skill_frontmatter(unterminated) == {}
+
+
+def test_load_skill_for_discovery_reads_frontmatter_only_skill(tmp_path):
+    skills_root = tmp_path / "skills"
+    _write_skill_md(
+        skills_root / "docs" / "pdf" / "SKILL.md",
+        "name: pdf\ndescription: PDF helpers\n",
+        body=_LARGE_BODY,
+    )
+
+    metadata = load_skill_for_discovery(skills_root / "docs" / "pdf", skills_root)
+
+    assert metadata.skill_id == "docs/pdf"
+    assert (metadata.name, metadata.description) == ("pdf", "PDF helpers")
+
+
+def test_parse_skill_frontmatter_reads_only_the_header_of_large_files(tmp_path, monkeypatch):
+    """Header-only reads stop at the closing marker instead of loading the ~2 MB body."""
+    skill_md = _write_skill_md(
+        tmp_path / "SKILL.md",
+        "name: big\ndescription: Large skill\n",
+        body=_LARGE_BODY,
+    )
+    content = skill_md.read_text(encoding="utf-8")
+    expected = yaml.safe_load(content[3 : content.find("---", 3)].strip())
+
+    bytes_read: list[int] = []
+
+    class CountingFileIO(io.FileIO):
+        def readinto(self, buffer):
+            count = super().readinto(buffer)
+            bytes_read.append(count or 0)
+            return count
+
+    def counting_open(path, mode="r", *args, **kwargs):
+        assert mode == "rb"
+        return io.BufferedReader(CountingFileIO(path, "rb"))
+
+    monkeypatch.setattr(Path, "open", counting_open)
+
+    assert parse_skill_frontmatter(skill_md) == expected
+    assert 0 < sum(bytes_read) <= 2 * io.DEFAULT_BUFFER_SIZE < skill_md.stat().st_size // 100
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from skill_fleet.taxonomy import manager as manager_module
+from skill_fleet.taxonomy.manager import TaxonomyManager
+from skill_fleet.taxonomy.watcher import TaxonomyWatcher
+
+
+def _write_skill(skill_dir: Path, skill_id: str, description: str) -> None:
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    metadata_path = skill_dir / "metadata.json"
+    metadata_path.write_text(
+        json.dumps({"skill_id": skill_id, "description": description}), encoding="utf-8"
+    )
+    # Force a distinct mtime even on coarse-grained filesystems.
+    stat = metadata_path.stat()
+    os.utime(metadata_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def skills_root(tmp_path: Path) -> Path:
+    root = tmp_path / "skills"
+    root.mkdir()
+    (root / "taxonomy_meta.json").write_text(json.dumps({"version": "0.1.0"}), encoding="utf-8")
+    _write_skill(root / "python" / "alpha", "python/alpha", "first")
+    return root
+
+
+def test_polling_backend_reports_added_modified_and_removed_dirs(skills_root: Path) -> None:
+    watcher = TaxonomyWatcher(skills_root, lambda _changed: None, backend="polling")
+    watcher._dir_mtimes, watcher._fingerprints = watcher._snapshot()
+
+    _write_skill(skills_root / "python" / "beta", "python/beta", "second")
+    assert skills_root / "python" / "beta" in watcher.poll_once()
+
+    _write_skill(skills_root / "python" / "alpha", "python/alpha", "edited")
+    assert watcher.poll_once() == {skills_root / "python" / "alpha"}
+
+    shutil.rmtree(skills_root / "python" / "beta")
+    assert skills_root / "python" / "beta" in watcher.poll_once()
+
+    (skills_root / "_drafts" / "gamma").mkdir(parents=True)
+    assert watcher.poll_once() == set()
+
+
+def test_apply_filesystem_changes_patches_cache_and_notifies(skills_root: Path) -> None:
+    manager = TaxonomyManager(skills_root)
+    manager.apply_filesystem_changes([skills_root])
+    assert manager.metadata_cache["python/alpha"].description == "first"
+
+    notified: list[set[str]] = []
+    manager.add_change_listener(notified.append)
+
+    _write_skill(skills_root / "python" / "beta", "python/beta", "second")
+    _write_skill(skills_root / "python" / "alpha", "python/alpha", "edited")
+    changed = manager.apply_filesystem_changes(
+        [skills_root / "python" / "alpha", skills_root / "python" / "beta"]
+    )
+
+    assert changed == {"python/alpha", "python/beta"}
+    assert manager.metadata_cache["python/alpha"].description == "edited"
+    assert notified == [{"python/alpha", "python/beta"}]
+
+    shutil.rmtree(skills_root / "python")
+    assert manager.apply_filesystem_changes([skills_root / "python"]) == {
+        "python/alpha",
+        "python/beta",
+    }
+    assert "python/alpha" not in manager.metadata_cache
+
+
+def test_rescan_swaps_cache_and_notifies(skills_root: Path, monkeypatch) -> None:
+    from skill_fleet.taxonomy import discovery
+
+    monkeypatch.setattr(discovery, "_last_discovery_scan", {})
+    manager = TaxonomyManager(skills_root)
+    manager.ensure_all_skills_loaded()
+    notified: list[set[str]] = []
+    manager.add_change_listener(notified.append)
+    before = manager.metadata_cache
+
+    _write_skill(skills_root / "python" / "beta", "python/beta", "second")
+    discovery._last_discovery_scan.clear()
+    manager.ensure_all_skills_loaded()
+
+    assert manager.metadata_cache is not before
+    assert "python/beta" not in before
+    assert manager.metadata_cache["python/beta"].description == "second"
+    assert notified == [{"python/beta"}]
+
+
+@pytest.mark.asyncio
+async def test_register_during_watcher_refresh_is_not_lost(skills_root: Path, monkeypatch) -> None:
+    manager = TaxonomyManager(skills_root)
+    manager.apply_filesystem_changes([skills_root])
+    refreshing, release = threading.Event(), threading.Event()
+    refresh = manager_module.refresh_skill_dirs
+
+    def slow_refresh(*args, **kwargs):
+        report = refresh(*args, **kwargs)
+        refreshing.set()
+        release.wait(5)
+        return report
+
+    monkeypatch.setattr(manager_module, "refresh_skill_dirs", slow_refresh)
+    _write_skill(skills_root / "python" / "beta", "python/beta", "second")
+    watcher_refresh = asyncio.create_task(
+        asyncio.to_thread(manager.apply_filesystem_changes, [skills_root / "python" / "beta"])
+    )
+    await asyncio.to_thread(refreshing.wait, 5)
+
+    registering = asyncio.create_task(
+        manager.register_skill(
+            path="python/gamma",
+            metadata={"version": "1.0.0", "type": "technical", "description": "third"},
+            content="# Gamma\n",
+            evolution={},
+        )
+    )
+    await asyncio.sleep(0.05)  # Registration now waits for the refresh
+    release.set()
+
+    assert await watcher_refresh == {"python/beta"}
+    assert await registering is True
+    assert {"python/alpha", "python/beta", "python/gamma"} <= set(manager.metadata_cache)
+    assert "python/gamma" in manager.dependency_graph
+
+
+def test_ensure_all_skills_loaded_skips_walk_while_watching(skills_root: Path, monkeypatch) -> None:
+    manager = TaxonomyManager(skills_root)
+    manager.start_watching(backend="polling", poll_interval=60)
+    try:
+        assert manager.is_watching
+        assert "python/alpha" in manager.metadata_cache
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("discovery walk should not run while watching")
+
+        monkeypatch.setattr("skill_fleet.taxonomy.manager.ensure_all_skills_loaded", _fail)
+        manager.ensure_all_skills_loaded()
+    finally:
+        manager.stop_watching()
+    assert not manager.is_watching
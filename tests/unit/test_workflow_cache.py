@@ -0,0 +1,98 @@
+"""Tests for the SQLite-backed workflow step cache."""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+from pydantic import BaseModel
+
+from skill_fleet.core.optimization import WorkflowOptimizer
+
+
+class StepOutput(BaseModel):
+    name: str
+    score: float
+
+
+@pytest.fixture
+def optimizer(tmp_path):
+    optimizer = WorkflowOptimizer(tmp_path / "cache")
+    yield optimizer
+    optimizer.close()
+
+
+def test_round_trips_json_and_models(optimizer):
+    inputs = {"task": "t", "options": {"b": 1, "a": 2}}
+    optimizer.cache_result("understand", inputs, {"plan": ["x"] * 500})
+    optimizer.cache_result("score", inputs, StepOutput(name="n", score=0.5))
+
+    assert optimizer.get_cached("understand", {"options": {"a": 2, "b": 1}, "task": "t"}) == {
+        "plan": ["x"] * 500
+    }
+    assert optimizer.get_cached("score", inputs) == StepOutput(name="n", score=0.5)
+    assert optimizer.get_cached("understand", {"task": "other"}) is None
+
+    stats = optimizer.get_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["cache_size"]) == (2, 1, 2)
+    assert stats["cache_bytes"] > 0
+
+
+def test_unserializable_results_are_not_cached(optimizer):
+    optimizer.cache_result("step", {}, object())
+
+    assert optimizer.get_cached("step", {}) is None
+    assert optimizer.get_cache_stats()["cache_size"] == 0
+
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    optimizer = WorkflowOptimizer(tmp_path, max_entries=3)
+    for i in range(3):
+        optimizer.cache_result("step", {"i": i}, i)
+    optimizer.get_cached("step", {"i": 0})
+
+    optimizer.cache_result("step", {"i": 3}, 3)
+
+    assert optimizer.get_cached("step", {"i": 1}) is None
+    assert optimizer.get_cached("step", {"i": 0}) == 0
+    stats = optimizer.get_cache_stats()
+    assert (stats["cache_size"], stats["evictions"]) == (3, 1)
+    optimizer.close()
+
+
+def test_byte_budget_and_persistence(tmp_path):
+    optimizer = WorkflowOptimizer(tmp_path, max_bytes=300)
+    optimizer.cache_result("step", {"i": 0}, "a" * 200)
+    optimizer.cache_result("step", {"i": 1}, "b" * 200)
+    optimizer.close()
+
+    reopened = WorkflowOptimizer(tmp_path, max_bytes=300)
+    stats = reopened.get_cache_stats()
+    assert stats["cache_size"] == 1
+    assert stats["cache_bytes"] <= 300
+    assert reopened.get_cached("step", {"i": 1}) == "b" * 200
+    reopened.close()
+
+
+def test_clear_cache_removes_entries_and_legacy_pickles(optimizer):
+    legacy = optimizer.cache_dir / "deadbeef.pkl"
+    legacy.write_bytes(pickle.dumps({"old": True}))
+    optimizer.cache_result("step", {}, {"v": 1})
+
+    optimizer.clear_cache()
+
+    assert not legacy.exists()
+    assert optimizer.get_cached("step", {}) is None
+    assert optimizer.get_cache_stats()["cache_bytes"] == 0
+
+
+def test_tampered_model_codec_does_not_import_modules(optimizer, monkeypatch):
+    import sys
+
+    monkeypatch.delitem(sys.modules, "antigravity", raising=False)
+    optimizer.cache_result("score", {}, StepOutput(name="n", score=0.5))
+    optimizer._conn.execute("UPDATE step_cache SET codec = 'model:antigravity:StepOutput'")
+
+    assert optimizer.get_cached("score", {}) is None
+    assert "antigravity" not in sys.modules
+    assert optimizer.get_cache_stats()["cache_size"] == 0